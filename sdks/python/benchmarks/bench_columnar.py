@@ -0,0 +1,78 @@
+"""
+Columnar batch benchmark
+
+Compares loading a transaction export as Transaction objects with loading it
+into a ColumnBatch, reporting build time and retained memory per row, and the
+time to total completed USD amounts from each.
+
+Usage:
+    python benchmarks/bench_columnar.py [--rows 200000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finaegis.columnar import TRANSACTION_COLUMNS, ColumnBuilder  # noqa: E402
+from finaegis.types import Transaction  # noqa: E402
+
+from bench_models import make_response  # noqa: E402
+
+Pages = List[List[Dict[str, Any]]]
+
+
+def build_objects(pages: Pages) -> List[Transaction]:
+    return [Transaction.from_dict(row) for page in pages for row in page]
+
+
+def build_columns(pages: Pages) -> Any:
+    builder = ColumnBuilder(TRANSACTION_COLUMNS)
+    for page in pages:
+        builder.extend(page)
+    return builder.build()
+
+
+def measure(build: Callable[[Pages], Any], pages: Pages) -> Tuple[Any, float, int]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = build(pages)
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, elapsed, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--per-page', type=int, default=100)
+    args = parser.parse_args()
+    
+    rows = make_response(args.rows)['data']
+    pages = [rows[i:i + args.per_page] for i in range(0, len(rows), args.per_page)]
+    
+    objects, object_time, object_memory = measure(build_objects, pages)
+    batch, column_time, column_memory = measure(build_columns, pages)
+    
+    start = time.perf_counter()
+    object_total = sum(t.amount for t in objects if t.status == 'completed' and t.asset_code == 'USD')
+    object_agg = time.perf_counter() - start
+    start = time.perf_counter()
+    mask = (batch['status'] == 'completed') & (batch['asset_code'] == 'USD')
+    column_total = int(batch['amount'][mask].sum())
+    column_agg = time.perf_counter() - start
+    assert object_total == column_total
+    
+    print(f"{'representation':<16}{'build us/row':>14}{'bytes/row':>12}{'aggregate ms':>14}")
+    print(f"{'objects':<16}{object_time / args.rows * 1e6:>14.3f}{object_memory / args.rows:>12.0f}{object_agg * 1e3:>14.2f}")
+    print(f"{'columns':<16}{column_time / args.rows * 1e6:>14.3f}{column_memory / args.rows:>12.0f}{column_agg * 1e3:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
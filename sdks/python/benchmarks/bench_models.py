@@ -0,0 +1,131 @@
+"""
+Model deserialization benchmark
+
+Compares parsing a page of transactions with the current slotted models against
+the previous implementation (plain dataclasses, float amounts and
+``fromisoformat(s.replace('Z', '+00:00'))`` timestamps), reporting time and
+retained memory per object. The lazy row parses with ``lazy_models`` and reads
+only ``id``, ``amount`` and ``status``, as a typical bulk scan does.
+
+Usage:
+    python benchmarks/bench_models.py [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finaegis.types import LazyTransaction, PaginatedResponse, Transaction  # noqa: E402
+
+
+@dataclass
+class LegacyTransaction:
+    """Transaction model as it was before slots and the fast parsers."""
+    id: str
+    account_uuid: str
+    type: str
+    amount: float
+    asset_code: str
+    status: str
+    reference: Optional[str]
+    created_at: datetime
+    completed_at: Optional[datetime]
+    idempotency_key: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LegacyTransaction':
+        return cls(
+            id=data['id'],
+            account_uuid=data['account_uuid'],
+            type=data['type'],
+            amount=float(data['amount']),
+            asset_code=data['asset_code'],
+            status=data['status'],
+            reference=data.get('reference'),
+            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
+            completed_at=datetime.fromisoformat(data['completed_at'].replace('Z', '+00:00')) if data.get('completed_at') else None
+        )
+
+
+def legacy_page(response: Dict[str, Any]) -> List[Any]:
+    return [LegacyTransaction.from_dict(item) for item in response['data']]
+
+
+def current_page(response: Dict[str, Any]) -> List[Any]:
+    return PaginatedResponse.from_dict(response, Transaction).data
+
+
+def lazy_scan(response: Dict[str, Any]) -> List[Any]:
+    items = PaginatedResponse.from_dict(response, LazyTransaction).data
+    for item in items:
+        item.id, item.amount, item.status
+    return items
+
+
+def make_response(rows: int) -> Dict[str, Any]:
+    return {
+        'data': [
+            {
+                'id': f'tx-{i}',
+                'account_uuid': 'acc-1',
+                'type': 'deposit',
+                'amount': 1000 + i,
+                'asset_code': 'USD',
+                'status': 'completed',
+                'reference': None,
+                'created_at': f'2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}.000000Z',
+                'completed_at': f'2024-01-01T01:{i // 60 % 60:02d}:{i % 60:02d}.000000Z',
+            }
+            for i in range(rows)
+        ],
+        'meta': {'current_page': 1, 'per_page': rows, 'total': rows, 'last_page': 1},
+    }
+
+
+def measure(parse: Callable[[Dict[str, Any]], List[Any]], response: Dict[str, Any], repeat: int) -> Dict[str, float]:
+    rows = len(response['data'])
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(response)
+        best = min(best, time.perf_counter() - start)
+        
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = parse(response)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del items
+    return {'us_per_row': best / rows * 1e6, 'bytes_per_row': retained / rows}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    response = make_response(args.rows)
+    legacy = measure(legacy_page, response, args.repeat)
+    current = measure(current_page, response, args.repeat)
+    lazy = measure(lazy_scan, response, args.repeat)
+    
+    print(f"{'implementation':<16}{'us/row':>10}{'bytes/row':>12}")
+    for name, result in (('legacy', legacy), ('current', current), ('lazy scan', lazy)):
+        print(f"{name:<16}{result['us_per_row']:>10.3f}{result['bytes_per_row']:>12.0f}")
+    print(
+        f"speedup {legacy['us_per_row'] / current['us_per_row']:.2f}x, "
+        f"memory {current['bytes_per_row'] / legacy['bytes_per_row']:.0%} of legacy"
+    )
+    print(f"lazy scan speedup {legacy['us_per_row'] / lazy['us_per_row']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
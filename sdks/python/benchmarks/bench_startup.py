@@ -0,0 +1,76 @@
+"""
+SDK startup benchmark
+
+Measures cold-start costs in fresh interpreters, as a serverless function pays
+them on every invocation: ``import finaegis``, importing the client class,
+constructing a client, and the first call into a resource. Each phase is timed
+in a new process and the median over all runs is reported.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import finaegis
+imported = time.perf_counter()
+from finaegis import FinAegis
+client_imported = time.perf_counter()
+client = FinAegis(api_key='bench-key')
+constructed = time.perf_counter()
+client.accounts
+first_resource = time.perf_counter()
+print(json.dumps({
+    'import finaegis': imported - start,
+    'import FinAegis': client_imported - imported,
+    'FinAegis()': constructed - client_imported,
+    'first resource': first_resource - constructed,
+    'modules': len(sys.modules),
+}))
+"""
+
+PHASES = ('import finaegis', 'import FinAegis', 'FinAegis()', 'first resource')
+
+
+def probe() -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'},
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+    
+    probe()  # warm the bytecode and OS file caches
+    results: List[Dict[str, float]] = [probe() for _ in range(args.runs)]
+    
+    print(f"{'phase':<18}{'median ms':>12}{'max ms':>10}")
+    for phase in PHASES:
+        timings = [result[phase] * 1000 for result in results]
+        print(f"{phase:<18}{statistics.median(timings):>12.2f}{max(timings):>10.2f}")
+    total = statistics.median(sum(result[phase] for phase in PHASES) * 1000 for result in results)
+    print(f"{'total':<18}{total:>12.2f}")
+    print(f"modules loaded: {int(statistics.median(result['modules'] for result in results))}")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
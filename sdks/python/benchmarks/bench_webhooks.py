@@ -0,0 +1,123 @@
+"""
+Webhook receiver benchmark
+
+Replays signed deliveries, a tenth of them redeliveries, and reports the
+cost per delivery of the README's hand-rolled verification, of the SDK's
+SignatureVerifier, and the throughput of a WebhookReceiver end to end
+(verify, decode, deduplicate, queue, batch and hand to a handler), called
+directly and through its WSGI app from several sender threads.
+
+Usage:
+    python benchmarks/bench_webhooks.py [--deliveries 100000] [--senders 8]
+"""
+
+import argparse
+import hashlib
+import hmac
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finaegis.webhook_receiver import SignatureVerifier, WebhookReceiver, wsgi_app  # noqa: E402
+
+SECRET = 'whsec_benchmark'
+
+Delivery = Tuple[bytes, Dict[str, str]]
+
+
+def make_deliveries(count: int) -> List[Delivery]:
+    verifier = SignatureVerifier(SECRET)
+    deliveries = []
+    for i in range(count):
+        # Every tenth delivery repeats an earlier one
+        n = i - 5 if i % 10 == 9 else i
+        body = json.dumps({
+            'event': 'transfer.completed',
+            'timestamp': '2024-01-01T00:00:00+00:00',
+            'transfer_uuid': f'tr-{n}',
+            'from_account_uuid': 'acc-1',
+            'to_account_uuid': 'acc-2',
+            'asset_code': 'USD',
+            'amount': 1000 + n,
+        }).encode()
+        deliveries.append((body, {
+            'X-Webhook-Signature': verifier.sign(body),
+            'X-Webhook-Delivery': f'dlv-{n}',
+            'X-Webhook-Event': 'transfer.completed',
+        }))
+    return deliveries
+
+
+def readme_verify(body: bytes, headers: Dict[str, str]) -> None:
+    payload = body.decode()
+    expected = 'sha256=' + hmac.new(SECRET.encode(), payload.encode(), hashlib.sha256).hexdigest()
+    assert hmac.compare_digest(headers['X-Webhook-Signature'], expected)
+    json.loads(payload)
+
+
+def time_each(func: Callable[[bytes, Dict[str, str]], object], deliveries: List[Delivery]) -> float:
+    start = time.perf_counter()
+    for body, headers in deliveries:
+        func(body, headers)
+    return time.perf_counter() - start
+
+
+def run_receiver(deliveries: List[Delivery], senders: int, through_wsgi: bool) -> Tuple[float, WebhookReceiver]:
+    receiver = WebhookReceiver(SECRET, handler=lambda batch: None, queue_size=len(deliveries))
+    app = wsgi_app(receiver)
+    
+    def send_direct(share: List[Delivery]) -> None:
+        for body, headers in share:
+            receiver.receive(body, headers)
+    
+    def send_wsgi(share: List[Delivery]) -> None:
+        for body, headers in share:
+            environ = {'REQUEST_METHOD': 'POST', 'CONTENT_LENGTH': str(len(body)), 'wsgi.input': io.BytesIO(body)}
+            environ.update({'HTTP_' + name.upper().replace('-', '_'): value for name, value in headers.items()})
+            app(environ, lambda status, response_headers: None)
+            
+    shares = [deliveries[i::senders] for i in range(senders)]
+    receiver.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=senders) as pool:
+        list(pool.map(send_wsgi if through_wsgi else send_direct, shares))
+    receiver.join()
+    elapsed = time.perf_counter() - start
+    receiver.stop()
+    return elapsed, receiver
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--deliveries', type=int, default=100_000)
+    parser.add_argument('--senders', type=int, default=8)
+    args = parser.parse_args()
+    
+    deliveries = make_deliveries(args.deliveries)
+    verifier = SignatureVerifier(SECRET)
+    
+    print(f"{'path':<28}{'us/delivery':>12}{'deliveries/s':>14}")
+    for name, func in [
+        ('readme snippet', readme_verify),
+        ('SignatureVerifier.verify', lambda body, headers: verifier.verify(body, headers['X-Webhook-Signature'])),
+    ]:
+        elapsed = time_each(func, deliveries)
+        print(f"{name:<28}{elapsed / args.deliveries * 1e6:>12.2f}{args.deliveries / elapsed:>14,.0f}")
+        
+    for name, through_wsgi in [('receiver.receive', False), ('wsgi_app', True)]:
+        elapsed, receiver = run_receiver(deliveries, args.senders, through_wsgi)
+        stats = receiver.stats
+        assert stats.processed + stats.duplicates == args.deliveries
+        label = f'{name} x{args.senders}'
+        print(f"{label:<28}{elapsed / args.deliveries * 1e6:>12.2f}{args.deliveries / elapsed:>14,.0f}"
+              f"  ({stats.duplicates} duplicates, {stats.batches} batches)")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
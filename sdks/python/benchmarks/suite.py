@@ -0,0 +1,384 @@
+"""
+SDK benchmark suite
+
+Runs offline against a local stub HTTP server and measures the hot paths a
+release can slow down:
+
+- requests per second through resource methods (request building, transport,
+  decoding and model parsing, single thread, keep-alive);
+- parse cost per 1,000 Transaction, Account and Transfer rows;
+- time and peak traced memory to walk a 100-page transaction listing;
+- cold import time, in fresh interpreters.
+
+Each metric is the best of several runs (two with ``--quick``), taken in
+rounds over the metrics of a group so that a slow spell on the machine is
+spread across them. Results can be saved as a baseline, which keeps the better
+value of two runs of the suite; a later run compared against it fails (exit
+status 1) when any metric is worse than its baseline by more than its
+tolerance: 25% by default, 40% for request rates and parse times, which are
+the noisiest on a busy or single-core machine, 50% for the sub-millisecond
+package import and 10% for peak memory. ``--tolerance`` applies one value to
+every metric. A slow spell can still push a whole run over, so regressed
+metrics are measured again (twice by default, see ``--recheck``) and only fail
+if no attempt is within tolerance. ``--quick`` runs are too noisy for that and
+cannot be saved or compared. Baselines are only comparable on the same machine
+and Python version, which are recorded in the file.
+
+Usage:
+    python benchmarks/suite.py [--quick] [--only parse.] [--json]
+    python benchmarks/suite.py --save benchmarks/baselines/reference.json
+    python benchmarks/suite.py --compare benchmarks/baselines/reference.json [--tolerance 0.3]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finaegis import FinAegis, __version__  # noqa: E402
+from finaegis.types import Account, PaginatedResponse, Transaction, Transfer  # noqa: E402
+
+import bench_startup  # noqa: E402
+
+TIMESTAMP = '2024-01-01T00:00:00.000000Z'
+
+
+@dataclass
+class Metric:
+    """One measured value."""
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+    tolerance: float = 0.25  # allowed relative change for the worse
+
+
+def account_row(i: int) -> Dict[str, Any]:
+    return {
+        'uuid': f'acc-{i}', 'user_uuid': 'user-1', 'name': f'Account {i}', 'balance': 100_000 + i,
+        'frozen': False, 'created_at': TIMESTAMP, 'updated_at': TIMESTAMP,
+    }
+
+
+def transaction_row(i: int) -> Dict[str, Any]:
+    return {
+        'id': f'tx-{i}', 'account_uuid': 'acc-1', 'type': 'deposit', 'amount': 1000 + i, 'asset_code': 'USD',
+        'status': 'completed', 'reference': None, 'created_at': TIMESTAMP, 'completed_at': TIMESTAMP,
+    }
+
+
+def transfer_row(i: int) -> Dict[str, Any]:
+    return {
+        'uuid': f'tr-{i}', 'from_account': 'acc-1', 'to_account': 'acc-2', 'amount': 500 + i, 'asset_code': 'USD',
+        'reference': None, 'status': 'completed', 'created_at': TIMESTAMP, 'completed_at': TIMESTAMP,
+    }
+
+
+def page(rows: List[Dict[str, Any]], number: int, per_page: int, total: int) -> Dict[str, Any]:
+    return {
+        'data': rows,
+        'meta': {'current_page': number, 'per_page': per_page, 'total': total, 'last_page': max(1, -(-total // per_page))},
+    }
+
+
+def list_route(make_row: Callable[[int], Dict[str, Any]], total: int) -> Callable[[Dict[str, List[str]]], Any]:
+    """Route answering any page of a listing of total rows."""
+    def respond(query: Dict[str, List[str]]) -> Any:
+        number = int(query.get('page', ['1'])[0])
+        per_page = int(query.get('per_page', ['20'])[0])
+        start = (number - 1) * per_page
+        return page([make_row(i) for i in range(start, min(start + per_page, total))], number, per_page, total)
+    return respond
+
+
+# (method, path pattern) -> payload or callable(query) building it
+ROUTES: List[Tuple[str, 're.Pattern[str]', Any]] = [
+    ('GET', re.compile(r'/accounts/[^/]+/balances'), {'data': {'USD': 100_000, 'EUR': 25_000, 'GCU': 1_000}}),
+    ('GET', re.compile(r'/accounts/[^/]+'), {'data': account_row(1)}),
+    ('GET', re.compile(r'/accounts'), list_route(account_row, 1_000)),
+    ('GET', re.compile(r'/transactions'), list_route(transaction_row, 10_000)),
+    ('POST', re.compile(r'/transfers'), {'data': transfer_row(1)}),
+    ('GET', re.compile(r'/exchange-rates/[^/]+/[^/]+'), {
+        'data': {'from_asset': 'EUR', 'to_asset': 'USD', 'rate': '1.0850', 'last_updated': TIMESTAMP},
+    }),
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answers from ROUTES, caching each encoded body by request line."""
+    
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    bodies: Dict[str, bytes] = {}
+    
+    def log_message(self, *args):
+        pass
+    
+    def _dispatch(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        key = self.command + self.path
+        body = self.bodies.get(key)
+        if body is None:
+            body = self.bodies[key] = self._render()
+        self.send_response(200 if body else 404)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _render(self) -> bytes:
+        url = urlparse(self.path)
+        path = url.path[len('/api/v2'):]
+        for method, pattern, payload in ROUTES:
+            if method == self.command and pattern.fullmatch(path):
+                if callable(payload):
+                    payload = payload(parse_qs(url.query))
+                return json.dumps(payload).encode()
+        return b''
+        
+    do_GET = do_POST = _dispatch
+
+
+def _serve(port: Any) -> None:
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    port.send(httpd.server_address[1])
+    httpd.serve_forever()
+
+
+class StubServer:
+    """
+    Keep-alive HTTP server answering the SDK's requests from ROUTES.
+    
+    It runs in its own process so that serving does not compete with the
+    measured client for the GIL.
+    """
+    
+    def __enter__(self) -> 'StubServer':
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(target=_serve, args=(sender,), daemon=True)
+        self.process.start()
+        self.base_url = f'http://127.0.0.1:{receiver.recv()}/api/v2/'
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.process.terminate()
+        self.process.join()
+
+
+def bench_requests(server: StubServer, seconds: float, repeat: int) -> List[Metric]:
+    client = FinAegis(api_key='bench-key', base_url=server.base_url, max_retries=0)
+    calls: Dict[str, Callable[[], Any]] = {
+        'accounts.get': lambda: client.accounts.get('acc-1'),
+        'accounts.get_balances': lambda: client.accounts.get_balances('acc-1'),
+        'accounts.list': lambda: client.accounts.list(per_page=20),
+        'transactions.list': lambda: client.transactions.list(per_page=100),
+        'transfers.create': lambda: client.transfers.create('acc-1', 'acc-2', 500),
+        'exchange_rates.get': lambda: client.exchange_rates.get('EUR', 'USD'),
+    }
+    for call in calls.values():
+        for _ in range(20):
+            call()
+    # Rounds over every call, so a slow spell on the machine does not land on one metric's runs only
+    best = dict.fromkeys(calls, 0.0)
+    for _ in range(repeat):
+        for name, call in calls.items():
+            count = 0
+            start = time.perf_counter()
+            deadline = start + seconds
+            while time.perf_counter() < deadline:
+                call()
+                count += 1
+            best[name] = max(best[name], count / (time.perf_counter() - start))
+    client.session.close()
+    # The stub server shares the CPU with the client, so rates are the noisiest metrics
+    return [
+        Metric(f'request.{name}', rate, 'req/s', higher_is_better=True, tolerance=0.4) for name, rate in best.items()
+    ]
+
+
+def bench_parsing(repeat: int) -> List[Metric]:
+    responses = {
+        model: page([make_row(i) for i in range(1_000)], 1, 1_000, 1_000)
+        for model, make_row in ((Transaction, transaction_row), (Account, account_row), (Transfer, transfer_row))
+    }
+    best = dict.fromkeys(responses, float('inf'))
+    for _ in range(repeat * 10):
+        for model, response in responses.items():
+            start = time.perf_counter()
+            PaginatedResponse.from_dict(response, model)
+            best[model] = min(best[model], time.perf_counter() - start)
+    return [
+        Metric(f'parse.{model.__name__.lower()}_1k', seconds * 1e3, 'ms', tolerance=0.4)
+        for model, seconds in best.items()
+    ]
+
+
+def bench_pagination(server: StubServer, repeat: int) -> List[Metric]:
+    client = FinAegis(api_key='bench-key', base_url=server.base_url, max_retries=0)
+    
+    def walk() -> int:
+        return sum(1 for _ in client.transactions.iter_all(per_page=100))
+        
+    assert walk() == 10_000  # also warms the server's body cache
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        walk()
+        best = min(best, time.perf_counter() - start)
+        
+    tracemalloc.start()
+    walk()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    client.session.close()
+    return [
+        Metric('paginate.transactions_100_pages', best * 1e3, 'ms'),
+        Metric('paginate.transactions_100_pages_peak', peak / 1024, 'KiB', tolerance=0.1),
+    ]
+
+
+def bench_import(runs: int) -> List[Metric]:
+    bench_startup.probe()  # warm the bytecode and OS file caches
+    results = [bench_startup.probe() for _ in range(runs)]
+    return [
+        # Well under a millisecond, so a small absolute change is a large relative one
+        Metric('import.finaegis', statistics.median(r['import finaegis'] for r in results) * 1e3, 'ms', tolerance=0.5),
+        Metric('import.client', statistics.median(r['import FinAegis'] for r in results) * 1e3, 'ms'),
+    ]
+
+
+def run(quick: bool, only: Optional[str]) -> List[Metric]:
+    repeat = 2 if quick else 5
+    
+    def wanted(group: str) -> bool:
+        return only is None or group.startswith(only) or only.startswith(group)
+        
+    metrics: List[Metric] = []
+    with StubServer() as server:
+        if wanted('request.'):
+            metrics += bench_requests(server, 0.2 if quick else 1.0, repeat)
+        if wanted('paginate.'):
+            metrics += bench_pagination(server, repeat)
+    if wanted('parse.'):
+        metrics += bench_parsing(repeat)
+    if wanted('import.'):
+        metrics += bench_import(5 if quick else 20)
+    return [metric for metric in metrics if only is None or metric.name.startswith(only)]
+
+
+def remeasure(metrics: List[Metric], names: List[str]) -> List[Metric]:
+    """Run the groups of ``names`` again, keeping the better value of each metric."""
+    fresh = {}
+    for group in sorted({name.split('.')[0] + '.' for name in names}):
+        fresh.update((metric.name, metric) for metric in run(False, group))
+    better = []
+    for metric in metrics:
+        again = fresh.get(metric.name, metric)
+        improved = again.value > metric.value if metric.higher_is_better else again.value < metric.value
+        better.append(again if improved else metric)
+    return better
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'sdk': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+    }
+
+
+def save(path: str, metrics: List[Metric]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump({'environment': environment(), 'metrics': [asdict(metric) for metric in metrics]}, file, indent=2)
+        file.write('\n')
+
+
+def compare(path: str, metrics: List[Metric], tolerance: Optional[float] = None) -> List[str]:
+    """
+    Print metrics against a baseline; return the names of regressed metrics.
+    
+    ``tolerance``, when given, replaces each metric's own tolerance.
+    """
+    with open(path) as file:
+        baseline = json.load(file)
+    if baseline['environment']['python'] != platform.python_version():
+        print(f"warning: baseline was recorded with Python {baseline['environment']['python']}")
+    previous = {entry['name']: entry['value'] for entry in baseline['metrics']}
+    
+    regressions = []
+    print(f"{'metric':<40}{'baseline':>12}{'current':>12}  {'unit':<7}{'change':>8}")
+    for metric in metrics:
+        base = previous.get(metric.name)
+        if base is None:
+            print(f"{metric.name:<40}{'-':>12}{metric.value:>12.2f}  {metric.unit:<7}{'new':>8}")
+            continue
+        change = metric.value / base - 1 if base else 0.0
+        worse = -change if metric.higher_is_better else change
+        flag = ''
+        if worse > (metric.tolerance if tolerance is None else tolerance):
+            regressions.append(metric.name)
+            flag = '  REGRESSION'
+        print(f"{metric.name:<40}{base:>12.2f}{metric.value:>12.2f}  {metric.unit:<7}{change:>+8.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--quick', action='store_true', help='fewer and shorter runs')
+    parser.add_argument('--only', help='only run metrics whose name starts with this prefix')
+    parser.add_argument('--save', metavar='PATH', help='write the results as a baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a saved baseline')
+    parser.add_argument('--tolerance', type=float,
+                        help="allowed relative slowdown for every metric (default: each metric's own)")
+    parser.add_argument('--recheck', type=int, default=2,
+                        help='times to re-measure regressed metrics before failing (default 2)')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+    if args.quick and (args.save or args.compare):
+        parser.error('--quick results are too noisy to save or compare; drop --quick')
+    
+    metrics = run(args.quick, args.only)
+    if args.save:
+        metrics = remeasure(metrics, [metric.name for metric in metrics])
+    
+    if args.json:
+        print(json.dumps([asdict(metric) for metric in metrics], indent=2))
+    elif not args.compare:
+        print(f"{'metric':<40}{'value':>12}  unit")
+        for metric in metrics:
+            print(f"{metric.name:<40}{metric.value:>12.2f}  {metric.unit}")
+    if args.save:
+        save(args.save, metrics)
+    if args.compare:
+        regressions = compare(args.compare, metrics, args.tolerance)
+        for _ in range(args.recheck):
+            if not regressions:
+                break
+            print(f"re-measuring {', '.join(regressions)}")
+            metrics = remeasure(metrics, regressions)
+            regressions = compare(args.compare, metrics, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed beyond tolerance: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
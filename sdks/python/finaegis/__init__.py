@@ -2,44 +2,89 @@
 FinAegis Python SDK
 
 Official Python SDK for the FinAegis API.
+
+Names are imported from their submodules on first access (PEP 562), so
+``import finaegis`` stays cheap and ``requests`` is only loaded once the
+client is used.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "1.0.0"
 
-from .client import FinAegis
-from .exceptions import (
-    FinAegisError,
-    AuthenticationError,
-    NotFoundError,
-    ValidationError,
-    RateLimitError,
-    ServerError,
-)
-from .types import (
-    Account,
-    Transaction,
-    Transfer,
-    Asset,
-    Basket,
-    ExchangeRate,
-    Webhook,
-    GCUInfo,
-)
-
-__all__ = [
-    "FinAegis",
-    "FinAegisError",
-    "AuthenticationError",
-    "NotFoundError",
-    "ValidationError",
-    "RateLimitError",
-    "ServerError",
-    "Account",
-    "Transaction",
-    "Transfer",
-    "Asset",
-    "Basket",
-    "ExchangeRate",
-    "Webhook",
-    "GCUInfo",
-]
\ No newline at end of file
+# Public name -> submodule defining it
+_EXPORTS = {
+    "FinAegis": "client",
+    "FinAegisError": "exceptions",
+    "AuthenticationError": "exceptions",
+    "NotFoundError": "exceptions",
+    "ValidationError": "exceptions",
+    "RateLimitError": "exceptions",
+    "ServerError": "exceptions",
+    "StaleRatesError": "exceptions",
+    "InvalidSignatureError": "exceptions",
+    "DeadlineExceededError": "exceptions",
+    "CircuitOpenError": "exceptions",
+    "Account": "types",
+    "Transaction": "types",
+    "Transfer": "types",
+    "Asset": "types",
+    "Basket": "types",
+    "ExchangeRate": "types",
+    "Webhook": "types",
+    "WebhookEvent": "types",
+    "WebhookDelivery": "types",
+    "GCUInfo": "types",
+    "Money": "money",
+    "deadline": "deadlines",
+    "RetryBudget": "deadlines",
+    "HedgePolicy": "hedging",
+    "CircuitBreaker": "circuit",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .client import FinAegis
+    from .exceptions import (
+        FinAegisError,
+        AuthenticationError,
+        NotFoundError,
+        ValidationError,
+        RateLimitError,
+        ServerError,
+        StaleRatesError,
+        InvalidSignatureError,
+        DeadlineExceededError,
+        CircuitOpenError,
+    )
+    from .types import (
+        Account,
+        Transaction,
+        Transfer,
+        Asset,
+        Basket,
+        ExchangeRate,
+        Webhook,
+        WebhookEvent,
+        WebhookDelivery,
+        GCUInfo,
+    )
+    from .money import Money
+    from .deadlines import deadline, RetryBudget
+    from .hedging import HedgePolicy
+    from .circuit import CircuitBreaker
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
\ No newline at end of file
@@ -0,0 +1,669 @@
+"""
+Asyncio client for the FinAegis API
+
+Requires the ``async`` extra: ``pip install finaegis[async]``.
+"""
+
+import asyncio
+import os
+import time
+from functools import partial
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Optional, Dict, Any, Union
+from urllib.parse import urljoin
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the extra
+    aiohttp = None
+
+from . import __version__
+from .cache import DEFAULT_TTLS, Cache, TTLCache
+from .circuit import CircuitBreaker, endpoint_name
+from .conditional import ConditionalStore, unconditional_headers
+from .client import FinAegis
+from .deadlines import RetryBudget, call_deadline, retry_allowed, time_left
+from .decoding import AsyncStreamedPage, JSONDecoder, get_decoder
+from .exceptions import DeadlineExceededError, ServerError, raise_for_status_code
+from .hedging import HedgePolicy
+from .idempotency import with_idempotency_key
+from .instrumentation import Instrumentation
+from .ratelimit import AdaptiveRateLimiter
+from .singleflight import AsyncSingleFlight, client_scope, request_key
+from .throttle import backoff_gated
+from .resources import LazyResource
+
+if TYPE_CHECKING:
+    from .resources import (
+        AsyncAccountsResource,
+        AsyncTransactionsResource,
+        AsyncTransfersResource,
+        AsyncAssetsResource,
+        AsyncBasketsResource,
+        AsyncWebhooksResource,
+        AsyncExchangeRatesResource,
+        AsyncGCUResource,
+    )
+
+
+class AsyncFinAegis:
+    """
+    Asyncio FinAegis API Client
+    
+    Mirrors the resource surface of :class:`FinAegis`, with every resource
+    method returning a coroutine. Connections are pooled by a shared aiohttp
+    connector and the number of in-flight requests is capped per client.
+    
+    Example:
+        >>> from finaegis.async_client import AsyncFinAegis
+        >>> async with AsyncFinAegis(api_key='your-api-key') as client:
+        ...     accounts, rates = await asyncio.gather(
+        ...         client.accounts.list(),
+        ...         client.exchange_rates.list(),
+        ...     )
+    """
+    
+    ENVIRONMENTS = FinAegis.ENVIRONMENTS
+    
+    RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+    BACKOFF_MAX = 120
+    
+    # Resources are imported and created on first access
+    accounts: 'LazyResource[AsyncAccountsResource]' = LazyResource('accounts', 'AsyncAccountsResource')
+    transactions: 'LazyResource[AsyncTransactionsResource]' = LazyResource('transactions', 'AsyncTransactionsResource')
+    transfers: 'LazyResource[AsyncTransfersResource]' = LazyResource('transfers', 'AsyncTransfersResource')
+    assets: 'LazyResource[AsyncAssetsResource]' = LazyResource('assets', 'AsyncAssetsResource')
+    baskets: 'LazyResource[AsyncBasketsResource]' = LazyResource('baskets', 'AsyncBasketsResource')
+    webhooks: 'LazyResource[AsyncWebhooksResource]' = LazyResource('webhooks', 'AsyncWebhooksResource')
+    exchange_rates: 'LazyResource[AsyncExchangeRatesResource]' = LazyResource('exchange_rates', 'AsyncExchangeRatesResource')
+    gcu: 'LazyResource[AsyncGCUResource]' = LazyResource('gcu', 'AsyncGCUResource')
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        environment: str = 'production',
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        verify_ssl: bool = True,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        max_concurrency: Optional[int] = None,
+        backoff_factor: float = 1,
+        keep_alive: bool = True,
+        keepalive_timeout: float = 15,
+        cache: Union[bool, Cache, None] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        conditional_requests: Union[bool, ConditionalStore] = False,
+        lazy_models: bool = False,
+        json_decoder: Union[str, JSONDecoder, None] = None,
+        instrumentation: Union[bool, Instrumentation, None] = None,
+        rate_limit: Union[bool, AdaptiveRateLimiter, None] = None,
+        coalesce_requests: Union[bool, AsyncSingleFlight] = False,
+        deadline: Optional[float] = None,
+        retry_budget: Union[bool, RetryBudget, None] = None,
+        hedge: Union[bool, HedgePolicy, None] = None,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = None,
+    ):
+        """
+        Initialize the asyncio FinAegis client.
+        
+        Args:
+            api_key: Your FinAegis API key. Can also be set via FINAEGIS_API_KEY env var.
+            environment: The API environment to use ('production', 'sandbox', 'local')
+            base_url: Override the base URL (optional)
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            verify_ssl: Whether to verify SSL certificates
+            max_connections: Size of the pooled connector (0 for unlimited)
+            max_connections_per_host: Per-host connection limit (0 for unlimited)
+            max_concurrency: Maximum in-flight requests (defaults to max_connections)
+            backoff_factor: Exponential backoff factor between retries
+            keep_alive: Reuse connections between requests (HTTP keep-alive)
+            keepalive_timeout: Seconds an idle pooled connection is kept open
+            cache: Cache reference data (assets, exchange rates, baskets, GCU,
+                webhook events) client-side; True for an in-process TTLCache,
+                or a Cache instance to plug in another backend
+            cache_ttls: Per-namespace TTL overrides in seconds; 0 disables
+                caching for a namespace
+            conditional_requests: Revalidate GETs with ETag/Last-Modified and
+                reuse the stored body on 304 Not Modified; True for a default
+                ConditionalStore, or pass one to size it
+            lazy_models: Parse accounts, transactions and transfers in list
+                results field by field on first access, so bulk scans only pay
+                for the fields they read
+            json_decoder: Callable decoding response bodies, or 'orjson' /
+                'json'; defaults to orjson when it is installed
+            instrumentation: Time every call and count retries, statuses and
+                bytes; True for an Instrumentation with the built-in
+                MetricsRecorder, or pass one with your own hooks. Its recorder
+                aggregates the calls of every client given the same one
+            rate_limit: Pace requests through token buckets shared by every
+                task using this client, learning the rate from the server's
+                rate limit headers and 429s; True for a default
+                AdaptiveRateLimiter. The server counts requests per API key,
+                so clients using the same key should pass the same limiter
+            coalesce_requests: Let identical GETs issued concurrently share one
+                request and its decoded result; True for a new
+                AsyncSingleFlight. One passed to several clients also merges
+                calls across them, but only between clients with the same base
+                URL and API key
+            deadline: Seconds a call may take in total, attempts and backoff
+                included; ``finaegis.deadline()`` blocks can shorten it per
+                call. None leaves calls bounded only by timeout and retries
+            retry_budget: Cap retries at a fraction of this client's calls so
+                they cannot multiply load during an outage; True for a default
+                RetryBudget. A budget passed to several clients sizes the
+                allowance from their combined calls, capping their retries
+                against a shared backend together
+            hedge: Send a second request when a read of balances, exchange
+                rates or the GCU composition is slower than its p95, and use
+                the first answer; True for a default HedgePolicy, or pass one
+                to choose the endpoints and percentile
+            circuit_breaker: Fail calls to an endpoint at once with
+                CircuitOpenError while its error rate is high; True for a
+                default CircuitBreaker. Circuits are kept per endpoint name,
+                so clients given the same breaker open and probe each
+                endpoint together
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncFinAegis requires aiohttp. Install it with: pip install finaegis[async]"
+            )
+            
+        self.api_key = api_key or os.environ.get('FINAEGIS_API_KEY')
+        if not self.api_key:
+            raise ValueError("API key is required. Pass it as a parameter or set FINAEGIS_API_KEY environment variable.")
+            
+        self.base_url = base_url or self.ENVIRONMENTS.get(environment, self.ENVIRONMENTS['production'])
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.verify_ssl = verify_ssl
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrency = max_concurrency if max_concurrency is not None else max_connections
+        self.backoff_factor = backoff_factor
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+        self.deadline = deadline
+        self.headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'User-Agent': f'FinAegis-Python-SDK/{__version__}',
+        }
+        
+        # The session and semaphore bind to the running event loop, so they
+        # are created on first use rather than here.
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Optional reference-data cache
+        if cache is True:
+            cache = TTLCache()
+        self.cache: Optional[Cache] = cache if isinstance(cache, Cache) else None
+        self.cache_ttls = dict(DEFAULT_TTLS, **(cache_ttls or {}))
+        
+        # Optional ETag/Last-Modified revalidation of GETs
+        if conditional_requests is True:
+            conditional_requests = ConditionalStore()
+        self.conditional_store: Optional[ConditionalStore] = (
+            conditional_requests if isinstance(conditional_requests, ConditionalStore) else None
+        )
+        self.lazy_models = lazy_models
+        self.json_decoder = get_decoder(json_decoder)
+        
+        if instrumentation is True:
+            instrumentation = Instrumentation()
+        self.instrumentation: Optional[Instrumentation] = (
+            instrumentation if isinstance(instrumentation, Instrumentation) else None
+        )
+        
+        if rate_limit is True:
+            rate_limit = AdaptiveRateLimiter()
+        self.rate_limiter: Optional[AdaptiveRateLimiter] = (
+            rate_limit if isinstance(rate_limit, AdaptiveRateLimiter) else None
+        )
+        
+        if coalesce_requests is True:
+            coalesce_requests = AsyncSingleFlight()
+        self.single_flight: Optional[AsyncSingleFlight] = (
+            coalesce_requests if isinstance(coalesce_requests, AsyncSingleFlight) else None
+        )
+        # Keeps calls of clients with other credentials out of a shared group
+        self._scope = client_scope(self.base_url, self.api_key)
+        
+        if retry_budget is True:
+            retry_budget = RetryBudget()
+        self.retry_budget: Optional[RetryBudget] = retry_budget if isinstance(retry_budget, RetryBudget) else None
+        
+        if hedge is True:
+            hedge = HedgePolicy()
+        self.hedge_policy: Optional[HedgePolicy] = hedge if isinstance(hedge, HedgePolicy) else None
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker: Optional[CircuitBreaker] = (
+            circuit_breaker if isinstance(circuit_breaker, CircuitBreaker) else None
+        )
+    
+    async def __aenter__(self) -> 'AsyncFinAegis':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._semaphore = None
+    
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Return the pooled session, creating it inside the running loop."""
+        if self._session is None or self._session.closed:
+            connector_kwargs: Dict[str, Any] = {
+                'limit': self.max_connections,
+                'limit_per_host': self.max_connections_per_host,
+            }
+            if self.keep_alive:
+                connector_kwargs['keepalive_timeout'] = self.keepalive_timeout
+            else:
+                connector_kwargs['force_close'] = True
+            if not self.verify_ssl:
+                connector_kwargs['ssl'] = False
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**connector_kwargs),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[_measurement_trace()] if self.instrumentation is not None else None,
+            )
+        return self._session
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore enforcing the per-client concurrency limit."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Backoff before the given retry attempt, honoring Retry-After."""
+        if retry_after is not None and retry_after.strip().isdigit():
+            return float(retry_after)
+        if attempt <= 1:
+            return 0.0
+        return min(self.BACKOFF_MAX, self.backoff_factor * (2 ** (attempt - 1)))
+    
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the FinAegis API.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            path: API endpoint path
+            params: Query parameters
+            json: JSON body data
+            idempotency_key: Key sent with POST/PUT/PATCH requests so retries
+                are deduplicated by the server (generated when omitted)
+            **kwargs: Additional arguments to pass to aiohttp
+            
+        Returns:
+            Response data as a dictionary
+            
+        Raises:
+            FinAegisError: If the request fails
+        """
+        if self.single_flight is not None and method.upper() == 'GET' and not kwargs:
+            return await self.single_flight.do(
+                request_key(path, params, self._scope),
+                lambda: self._guarded_request(method, path, params, json, idempotency_key, kwargs),
+                call_deadline(self.deadline)
+            )
+        return await self._guarded_request(method, path, params, json, idempotency_key, kwargs)
+    
+    async def _guarded_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a request through the circuit breaker and hedging policy when configured."""
+        breaker, hedge = self.circuit_breaker, self.hedge_policy
+        if breaker is None and hedge is None:
+            return await self._measured_request(method, path, params, json, idempotency_key, kwargs)
+        
+        name = endpoint_name(method, path)
+        
+        def send() -> Awaitable[Dict[str, Any]]:
+            # Each request gets its own kwargs, which _request modifies
+            return self._measured_request(method, path, params, json, idempotency_key, dict(kwargs))
+            
+        call: Callable[[], Awaitable[Dict[str, Any]]] = send
+        if hedge is not None and hedge.applies(name):
+            call = partial(hedge.async_hedge, name, send)
+        if breaker is None:
+            return await call()
+        
+        breaker.before(name)
+        failed = None
+        try:
+            result = await call()
+            failed = False
+            return result
+        except asyncio.CancelledError:
+            raise
+        except (ServerError, DeadlineExceededError, aiohttp.ClientError, asyncio.TimeoutError):
+            failed = True
+            raise
+        except Exception:
+            failed = False
+            raise
+        finally:
+            breaker.record(name, failed)
+    
+    async def _measured_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a request, reporting it to the instrumentation when configured."""
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return await self._request(method, path, params, json, idempotency_key, kwargs)
+        
+        info = instrumentation.start(method, path)
+        measurements: Dict[str, Any] = {'pool_wait': 0.0, 'bytes_sent': 0}
+        try:
+            return await self._request(method, path, params, json, idempotency_key, kwargs, measurements)
+        except Exception as error:
+            measurements['error'] = error
+            raise
+        finally:
+            status = measurements.pop('status', None)
+            instrumentation.finish(info, status, **measurements)
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        kwargs: Dict[str, Any],
+        measurements: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send a request; fills measurements with status, retries, bytes and decode time when given."""
+        url = urljoin(self.base_url, path.lstrip('/'))
+        # The same key is resent on every retry of this call
+        headers = with_idempotency_key(method, kwargs.pop('headers', None), idempotency_key)
+        
+        store_key = stored = None
+        if self.conditional_store is not None and method.upper() == 'GET':
+            store_key = self.conditional_store.key(url, params)
+            headers, stored = self.conditional_store.conditional_headers(store_key, headers)
+        if headers is not None:
+            kwargs['headers'] = headers
+        if measurements is not None:
+            # Read by the trace callbacks of _measurement_trace
+            kwargs['trace_request_ctx'] = measurements
+        session = self._get_session()
+        
+        expires = call_deadline(self.deadline)
+        budget = self.retry_budget
+        if budget is not None:
+            budget.record_call()
+        breaker = self.circuit_breaker
+        endpoint = endpoint_name(method, path) if breaker is not None else None
+        
+        limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            retry_after = None
+            if measurements is not None:
+                measurements['retries'] = attempt
+            if limiter is not None:
+                await limiter.async_acquire(method, path)
+            # Hold a concurrency slot for the attempt only, not for backoff
+            wait_start = time.perf_counter()
+            async with self._get_semaphore():
+                if measurements is not None:
+                    measurements['pool_wait'] += time.perf_counter() - wait_start
+                if expires is not None:
+                    # Cut this attempt's timeout to the time left
+                    kwargs['timeout'] = aiohttp.ClientTimeout(total=min(self.timeout, time_left(expires, path)))
+                try:
+                    async with session.request(method, url, params=params, json=json, **kwargs) as response:
+                        if measurements is not None:
+                            measurements['status'] = response.status
+                        if limiter is not None:
+                            body_retry_after = await self._body_retry_after(response)
+                            limiter.observe(method, path, response.status, response.headers, body_retry_after)
+                        retry = response.status in self.RETRY_STATUSES and attempt < self.max_retries and not (
+                            response.status == 429 and backoff_gated()
+                        )
+                        if retry:
+                            # With a limiter, the paused bucket already spaces 429 retries
+                            retry_after = '0' if limiter is not None and response.status == 429 else (
+                                response.headers.get('Retry-After')
+                            )
+                            retry = not (breaker is not None and breaker.is_open(endpoint)) and retry_allowed(
+                                self._retry_delay(attempt + 1, retry_after), expires, budget
+                            )
+                        if not retry:
+                            if response.status == 304:
+                                if stored is not None:
+                                    return self.conditional_store.not_modified_response(stored)
+                                # Resent below, once the concurrency slot is released
+                                break
+                            body = await response.read()
+                            if response.status >= 400:
+                                self._raise_error(response, body)
+                            if measurements is None:
+                                data = self.json_decoder(body) if body else {}
+                            else:
+                                measurements['bytes_received'] = len(body)
+                                decode_start = time.perf_counter()
+                                data = self.json_decoder(body) if body else {}
+                                measurements['decode_time'] = time.perf_counter() - decode_start
+                            if store_key is not None:
+                                self.conditional_store.store(store_key, response.headers, data)
+                            return data
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                    if (attempt >= self.max_retries or (breaker is not None and breaker.is_open(endpoint))
+                            or not retry_allowed(self._retry_delay(attempt + 1, None), expires, budget)):
+                        if expires is not None and time.monotonic() >= expires:
+                            raise DeadlineExceededError(f'Deadline exceeded during {method} {path}') from error
+                        raise
+                        
+            attempt += 1
+            await asyncio.sleep(self._retry_delay(attempt, retry_after))
+            
+        # A 304 with nothing stored to answer from, e.g. the caller sent its own validator
+        kwargs['headers'] = unconditional_headers(method, path, headers)
+        return await self._request(method, path, params, json, idempotency_key, kwargs, measurements)
+    
+    def stream(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        key: str = 'data',
+        chunk_size: int = 65536
+    ) -> AsyncStreamedPage:
+        """
+        GET a list endpoint and parse its array incrementally.
+        
+        Items are decoded as their bytes arrive instead of after the whole
+        body has been downloaded. Conditional requests do not apply.
+        
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            key: Top-level key of the array to stream
+            chunk_size: Socket read size in bytes
+            
+        Returns:
+            AsyncStreamedPage yielding raw item dicts
+        """
+        return AsyncStreamedPage(self._stream_chunks(path, params, chunk_size), key=key)
+    
+    async def _stream_chunks(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield body chunks of a GET, retrying only before the first chunk.
+        
+        Goes through the deadline, retry budget, rate limiter, circuit breaker
+        and instrumentation like _request; the deadline also bounds the body.
+        """
+        url = urljoin(self.base_url, path.lstrip('/'))
+        session = self._get_session()
+        expires = call_deadline(self.deadline)
+        budget = self.retry_budget
+        if budget is not None:
+            budget.record_call()
+        limiter, breaker, instrumentation = self.rate_limiter, self.circuit_breaker, self.instrumentation
+        name = endpoint_name('GET', path)
+        if breaker is not None:
+            breaker.before(name)
+        info = instrumentation.start('GET', path) if instrumentation is not None else None
+        measurements: Dict[str, Any] = {'pool_wait': 0.0, 'bytes_received': 0}
+        kwargs: Dict[str, Any] = {}
+        failed = None
+        
+        attempt = 0
+        started = False
+        try:
+            while True:
+                retry_after = None
+                measurements['retries'] = attempt
+                if limiter is not None:
+                    await limiter.async_acquire('GET', path)
+                # The slot is held while chunks are yielded, but not across backoff
+                wait_start = time.perf_counter()
+                async with self._get_semaphore():
+                    measurements['pool_wait'] += time.perf_counter() - wait_start
+                    if expires is not None:
+                        # The timeout covers reading the body too
+                        kwargs['timeout'] = aiohttp.ClientTimeout(total=min(self.timeout, time_left(expires, path)))
+                    try:
+                        async with session.get(url, params=params, **kwargs) as response:
+                            measurements['status'] = response.status
+                            if limiter is not None:
+                                body_retry_after = await self._body_retry_after(response)
+                                limiter.observe('GET', path, response.status, response.headers, body_retry_after)
+                            retry = response.status in self.RETRY_STATUSES and attempt < self.max_retries
+                            if retry:
+                                retry_after = '0' if limiter is not None and response.status == 429 else (
+                                    response.headers.get('Retry-After')
+                                )
+                                retry = not (breaker is not None and breaker.is_open(name)) and retry_allowed(
+                                    self._retry_delay(attempt + 1, retry_after), expires, budget
+                                )
+                            if not retry:
+                                if response.status >= 400:
+                                    self._raise_error(response, await response.read())
+                                failed = False
+                                async for chunk in response.content.iter_chunked(chunk_size):
+                                    started = True
+                                    measurements['bytes_received'] += len(chunk)
+                                    yield chunk
+                                return
+                    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                        if (started or attempt >= self.max_retries or (breaker is not None and breaker.is_open(name))
+                                or not retry_allowed(self._retry_delay(attempt + 1, None), expires, budget)):
+                            if expires is not None and time.monotonic() >= expires:
+                                raise DeadlineExceededError(f'Deadline exceeded during GET {path}') from error
+                            raise
+                        
+                attempt += 1
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+        except (ServerError, DeadlineExceededError, aiohttp.ClientError, asyncio.TimeoutError) as error:
+            failed = True
+            measurements['error'] = error
+            raise
+        except Exception as error:
+            failed = False
+            measurements['error'] = error
+            raise
+        finally:
+            if breaker is not None:
+                breaker.record(name, failed)
+            if info is not None:
+                status = measurements.pop('status', None)
+                instrumentation.finish(info, status, **measurements)
+    
+    async def _body_retry_after(self, response: 'aiohttp.ClientResponse') -> Optional[float]:
+        """The retry_after field of a 429 body, if any."""
+        if response.status != 429:
+            return None
+        try:
+            return self.json_decoder(await response.read()).get('retry_after')
+        except (ValueError, AttributeError):
+            return None
+    
+    def _raise_error(self, response: 'aiohttp.ClientResponse', body: bytes) -> None:
+        """Map an error response to the same exceptions as the sync client."""
+        try:
+            error_data = self.json_decoder(body)
+            message = error_data.get('message', response.reason)
+        except (ValueError, AttributeError):
+            error_data = {}
+            message = response.reason or f"HTTP {response.status} error"
+            
+        raise_for_status_code(response.status, message, error_data)
+    
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        """Make a GET request."""
+        return await self.request('GET', path, params=params, **kwargs)
+    
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        """Make a POST request."""
+        return await self.request('POST', path, json=json, **kwargs)
+    
+    async def put(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        """Make a PUT request."""
+        return await self.request('PUT', path, json=json, **kwargs)
+    
+    async def delete(self, path: str, **kwargs) -> Dict[str, Any]:
+        """Make a DELETE request."""
+        return await self.request('DELETE', path, **kwargs)
+
+
+def _measurement_trace() -> 'aiohttp.TraceConfig':
+    """Trace config adding connection-queue wait and request bytes to a call's measurements."""
+    
+    async def queued_start(session, context, params) -> None:
+        context.queued_at = time.perf_counter()
+    
+    async def queued_end(session, context, params) -> None:
+        measurements = context.trace_request_ctx
+        if measurements is not None:
+            measurements['pool_wait'] += time.perf_counter() - context.queued_at
+    
+    async def chunk_sent(session, context, params) -> None:
+        measurements = context.trace_request_ctx
+        if measurements is not None:
+            measurements['bytes_sent'] += len(params.chunk)
+    
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_queued_start.append(queued_start)
+    trace.on_connection_queued_end.append(queued_end)
+    trace.on_request_chunk_sent.append(chunk_sent)
+    return trace
\ No newline at end of file
@@ -0,0 +1,320 @@
+"""
+Webhook delivery backfill for the FinAegis SDK
+
+After a receiver outage, the events it missed are still recorded as webhook
+deliveries. A backfill pages through the delivery history of one or more
+webhooks, newest first as the API returns it, and hands every delivery created
+since a given time to the same WebhookReceiver as live traffic. Every retry
+of an event has its own delivery record, so the records of one event are
+collapsed into a single replay, and the receiver deduplicates events against
+live deliveries, so events that did arrive live are not handled twice.
+
+The history is offset-paginated and deliveries created while the backfill
+runs push older ones to later pages. Pages of a webhook are therefore fetched
+in order, each only after the previous one has arrived, so a shifted delivery
+is read twice rather than skipped; the records read twice are counted once.
+Fetching pages concurrently could serve a page before the one above it and
+miss the deliveries that moved between them. Several webhooks are backfilled
+at once.
+
+Progress is saved to a checkpoint file after events have been handled, so an
+interrupted backfill resumes where it stopped, and resuming from the saved
+page never skips a delivery for the same reason. Handlers should still be
+idempotent, because the page in progress at an interruption is handled again.
+
+A completed backfill with an ``until`` time is final. Without one, the range
+keeps growing, so running it again replays the deliveries created since the
+newest one the last run saw.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from .pagination import aiterate_pages, iterate_pages
+from .types import PaginatedResponse, WebhookEvent
+from .webhook_receiver import AsyncPendingEvents, PendingEvents, event_key
+
+if TYPE_CHECKING:
+    from .webhook_receiver import AsyncWebhookReceiver, WebhookReceiver
+
+DeliveryFetcher = Callable[[str, int], PaginatedResponse]
+AsyncDeliveryFetcher = Callable[[str, int], Awaitable[PaginatedResponse]]
+
+
+class Checkpoint:
+    """
+    Backfill progress per webhook, kept in a JSON file.
+    
+    Every save writes a temporary file and renames it over the old one, so the
+    file is never left half-written. Safe to share between threads.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: File to keep progress in; created on the first save
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path) as file:
+                self._state: Dict[str, Dict[str, Any]] = json.load(file)
+        except FileNotFoundError:
+            self._state = {}
+    
+    def get(self, webhook_id: str) -> Optional[Dict[str, Any]]:
+        """Saved progress of a webhook, if any."""
+        with self._lock:
+            state = self._state.get(webhook_id)
+            return dict(state) if state is not None else None
+    
+    def save(self, webhook_id: str, **state: Any) -> None:
+        """Record progress of a webhook and write the file."""
+        with self._lock:
+            self._state[webhook_id] = state
+            self._write()
+    
+    def clear(self, webhook_id: Optional[str] = None) -> None:
+        """Forget the progress of one webhook, or of all of them."""
+        with self._lock:
+            if webhook_id is None:
+                self._state.clear()
+            else:
+                self._state.pop(webhook_id, None)
+            self._write()
+    
+    def _write(self) -> None:
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(self._state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of backfilling one webhook."""
+    webhook_id: str
+    pages: int = 0
+    deliveries: int = 0  # delivery records read within the time range
+    accepted: int = 0  # events handed to the handler, i.e. not seen before
+    resumed_from: int = 1  # first page read
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the webhook was backfilled completely."""
+        return self.error is None
+
+
+def _key(since: Optional[datetime], until: Optional[datetime], status: Optional[str]) -> Dict[str, Any]:
+    """Parameters a saved checkpoint is only valid for."""
+    return {
+        'since': since.isoformat() if since else None,
+        'until': until.isoformat() if until else None,
+        'status': status,
+    }
+
+
+class _Scan:
+    """Where one run over a webhook's deliveries starts and what it has seen."""
+    
+    def __init__(
+        self,
+        checkpoint: Optional[Checkpoint],
+        webhook_id: str,
+        params: Dict[str, Any],
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ):
+        self.first_page: Optional[int] = 1
+        self.since = since
+        self.until = until
+        # Creation time of the newest delivery replayed by this or earlier runs
+        self.newest: Optional[datetime] = None
+        # Events already replayed, so the retry records of one event replay once
+        self.seen: Set[Hashable] = set()
+        # Delivery records already read, as shifted records are read twice
+        self.read: Set[str] = set()
+
+        state = checkpoint.get(webhook_id) if checkpoint is not None else None
+        if state is None or state.get('params') != params:
+            return
+        if state.get('newest'):
+            self.newest = datetime.fromisoformat(state['newest'])
+        if not state.get('done'):
+            self.first_page = state['page']
+        elif until is not None:
+            self.first_page = None
+        elif self.newest is not None:
+            # The range has grown since: deliveries created after the last run
+            # are on the first pages, down to the newest one it replayed
+            self.since = self.newest if since is None else max(since, self.newest)
+    
+    def save(self, checkpoint: Checkpoint, webhook_id: str, params: Dict[str, Any], page: int, done: bool) -> None:
+        """Record the progress of this run."""
+        newest = self.newest.isoformat() if self.newest is not None else None
+        checkpoint.save(webhook_id, params=params, page=page, done=done, newest=newest)
+    
+    def select(self, page: PaginatedResponse) -> Tuple[List[WebhookEvent], int, bool]:
+        """
+        New events of a newest-first page within the range.
+        
+        Returns:
+            The events, the number of delivery records in the range, and
+            whether the range ends on this page
+        """
+        events = []
+        records = 0
+        for delivery in page.data:
+            if self.since is not None and delivery.created_at < self.since:
+                return events, records, True
+            if (self.until is not None and delivery.created_at > self.until) or delivery.uuid in self.read:
+                continue
+            self.read.add(delivery.uuid)
+            records += 1
+            if self.newest is None or delivery.created_at > self.newest:
+                self.newest = delivery.created_at
+            event = delivery.to_event()
+            key = event_key(event)
+            if key not in self.seen:
+                self.seen.add(key)
+                events.append(event)
+        return events, records, not page.data or page.current_page >= page.last_page
+
+
+def backfill_deliveries(
+    fetch_page: DeliveryFetcher,
+    webhook_ids: Sequence[str],
+    receiver: 'WebhookReceiver',
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    status: Optional[str] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    max_webhooks: int = 4,
+    checkpoint_every: int = 10
+) -> List[BackfillResult]:
+    """
+    Replay the deliveries of webhooks through a receiver.
+    
+    Args:
+        fetch_page: Callable returning a page of WebhookDelivery objects for
+            ``(webhook_id, page)``, newest first
+        webhook_ids: Webhooks to backfill
+        receiver: Receiver whose handler and deduplication the events go through
+        since: Oldest delivery creation time to replay, timezone-aware (None
+            for all history)
+        until: Newest delivery creation time to replay, timezone-aware (None
+            for no limit)
+        status: Delivery status filter applied by fetch_page; a checkpoint is
+            only resumed by a run with the same since, until and status
+        checkpoint: Where progress is saved and resumed from; it is saved
+            every checkpoint_every pages and when a webhook ends or fails
+        max_webhooks: Webhooks backfilled at the same time
+        checkpoint_every: Pages between checkpoints
+        
+    Returns:
+        One BackfillResult per webhook, in input order
+    """
+    params = _key(since, until, status)
+    
+    def run(webhook_id: str) -> BackfillResult:
+        result = BackfillResult(webhook_id)
+        scan = _Scan(checkpoint, webhook_id, params, since, until)
+        first_page = scan.first_page
+        if first_page is None:
+            return result
+        result.resumed_from = first_page
+        pages = iterate_pages(lambda page: fetch_page(webhook_id, page), first_page=first_page)
+        # This backfill's events only; the receiver may also be serving live traffic
+        pending = PendingEvents()
+        resume = first_page
+        try:
+            for page in pages:
+                events, records, finished = scan.select(page)
+                result.pages += 1
+                result.deliveries += records
+                result.accepted += receiver.submit(events, pending)
+                resume = page.current_page + 1
+                if finished:
+                    break
+                if checkpoint is not None and result.pages % checkpoint_every == 0:
+                    # Only record pages whose events have been handled
+                    pending.wait()
+                    scan.save(checkpoint, webhook_id, params, resume, done=False)
+        except Exception as error:
+            result.error = error
+        finally:
+            pages.close()
+        pending.wait()
+        if checkpoint is not None:
+            scan.save(checkpoint, webhook_id, params, resume, done=result.ok)
+        return result
+        
+    with ThreadPoolExecutor(max_workers=max(1, max_webhooks), thread_name_prefix='finaegis-backfill') as executor:
+        return list(executor.map(run, webhook_ids))
+
+
+async def async_backfill_deliveries(
+    fetch_page: AsyncDeliveryFetcher,
+    webhook_ids: Sequence[str],
+    receiver: 'AsyncWebhookReceiver',
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    status: Optional[str] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    max_webhooks: int = 4,
+    checkpoint_every: int = 10
+) -> List[BackfillResult]:
+    """
+    Replay the deliveries of webhooks through a receiver (asyncio).
+    
+    Takes the same arguments as :func:`backfill_deliveries`, with a coroutine
+    page fetcher and an AsyncWebhookReceiver.
+    
+    Returns:
+        One BackfillResult per webhook, in input order
+    """
+    params = _key(since, until, status)
+    semaphore = asyncio.Semaphore(max(1, max_webhooks))
+    
+    async def run(webhook_id: str) -> BackfillResult:
+        result = BackfillResult(webhook_id)
+        scan = _Scan(checkpoint, webhook_id, params, since, until)
+        first_page = scan.first_page
+        if first_page is None:
+            return result
+        result.resumed_from = first_page
+        async with semaphore:
+            pages = aiterate_pages(lambda page: fetch_page(webhook_id, page), first_page=first_page)
+            pending = AsyncPendingEvents()
+            resume = first_page
+            try:
+                async for page in pages:
+                    events, records, finished = scan.select(page)
+                    result.pages += 1
+                    result.deliveries += records
+                    result.accepted += await receiver.submit(events, pending)
+                    resume = page.current_page + 1
+                    if finished:
+                        break
+                    if checkpoint is not None and result.pages % checkpoint_every == 0:
+                        await pending.wait()
+                        scan.save(checkpoint, webhook_id, params, resume, done=False)
+            except Exception as error:
+                result.error = error
+            finally:
+                await pages.aclose()
+            await pending.wait()
+            if checkpoint is not None:
+                scan.save(checkpoint, webhook_id, params, resume, done=result.ok)
+        return result
+        
+    return list(await asyncio.gather(*(run(webhook_id) for webhook_id in webhook_ids)))
\ No newline at end of file
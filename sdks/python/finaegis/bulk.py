@@ -0,0 +1,154 @@
+"""
+Bulk operations for the FinAegis SDK
+
+Runs one API call per item across a bounded pool of workers and reports the
+outcome of every item instead of aborting on the first failure. Rate limit
+responses pause the whole pool through a shared BackoffGate and the affected
+item is retried.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .throttle import BackoffGate, async_call_with_backoff, call_with_backoff
+
+
+@dataclass
+class BulkItemResult:
+    """Outcome of a single item in a bulk operation."""
+    index: int
+    spec: Dict[str, Any]
+    result: Any = None
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+@dataclass
+class BulkResult:
+    """Per-item report of a bulk operation, in input order."""
+    items: List[BulkItemResult] = field(default_factory=list)
+    
+    @property
+    def succeeded(self) -> List[BulkItemResult]:
+        """Items that completed successfully."""
+        return [item for item in self.items if item.ok]
+    
+    @property
+    def failed(self) -> List[BulkItemResult]:
+        """Items that raised an error."""
+        return [item for item in self.items if not item.ok]
+    
+    @property
+    def results(self) -> List[Any]:
+        """Results of the successful items."""
+        return [item.result for item in self.items if item.ok]
+    
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def run_bulk(
+    func: Callable[[Dict[str, Any]], Any],
+    specs: Iterable[Dict[str, Any]],
+    max_workers: int = 8,
+    max_rate_limit_retries: int = 10
+) -> BulkResult:
+    """
+    Call func once per spec using a bounded thread pool.
+    
+    Specs are consumed lazily, with at most ``2 * max_workers`` in flight,
+    so very large iterables are not materialized up front.
+    
+    Args:
+        func: Callable making the API call for one spec
+        specs: Iterable of item specifications
+        max_workers: Number of concurrent calls
+        max_rate_limit_retries: Rate limit retries per item before it fails
+        
+    Returns:
+        BulkResult with one entry per spec, in input order
+    """
+    workers = max(1, max_workers)
+    gate = BackoffGate()
+    report: List[BulkItemResult] = []
+    pending: Dict[Future, BulkItemResult] = {}
+    
+    def settle(done) -> None:
+        for future in done:
+            item = pending.pop(future)
+            try:
+                item.result = future.result()
+            except Exception as e:
+                item.error = e
+                
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='finaegis-bulk') as executor:
+        for index, spec in enumerate(specs):
+            if len(pending) >= workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                settle(done)
+            item = BulkItemResult(index=index, spec=spec)
+            report.append(item)
+            # Each call runs in a copy of the caller's context, so deadlines apply
+            future = executor.submit(
+                contextvars.copy_context().run,
+                call_with_backoff, lambda spec=spec: func(spec), gate, max_rate_limit_retries
+            )
+            pending[future] = item
+        settle(list(pending))
+        
+    return BulkResult(items=report)
+
+
+async def async_run_bulk(
+    func: Callable[[Dict[str, Any]], Awaitable[Any]],
+    specs: Iterable[Dict[str, Any]],
+    max_workers: int = 8,
+    max_rate_limit_retries: int = 10
+) -> BulkResult:
+    """
+    Await func once per spec with at most max_workers calls in flight.
+    
+    Args:
+        func: Coroutine function making the API call for one spec
+        specs: Iterable of item specifications
+        max_workers: Number of concurrent calls
+        max_rate_limit_retries: Rate limit retries per item before it fails
+        
+    Returns:
+        BulkResult with one entry per spec, in input order
+    """
+    workers = max(1, max_workers)
+    gate = BackoffGate()
+    report: List[BulkItemResult] = []
+    pending: Dict[asyncio.Future, BulkItemResult] = {}
+    
+    def settle(done) -> None:
+        for task in done:
+            item = pending.pop(task)
+            try:
+                item.result = task.result()
+            except Exception as e:
+                item.error = e
+                
+    for index, spec in enumerate(specs):
+        if len(pending) >= workers:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            settle(done)
+        item = BulkItemResult(index=index, spec=spec)
+        report.append(item)
+        task = asyncio.ensure_future(
+            async_call_with_backoff(lambda spec=spec: func(spec), gate, max_rate_limit_retries)
+        )
+        pending[task] = item
+    if pending:
+        done, _ = await asyncio.wait(pending)
+        settle(done)
+        
+    return BulkResult(items=report)
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Client-side caching for FinAegis reference data
+
+Assets, exchange rates, baskets, GCU composition and webhook event types change
+on the order of seconds to hours, so reading them on every call wastes a
+round-trip. When a cache is configured on the client, the resource methods that
+read this data serve it from the cache until its per-namespace TTL expires.
+
+Cached objects are shared between callers and should be treated as read-only.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Default time-to-live, in seconds, for each cached namespace
+DEFAULT_TTLS: Dict[str, float] = {
+    'assets': 3600,
+    'exchange_rates': 5,
+    'baskets': 60,
+    'gcu': 30,
+    'webhook_events': 3600,
+}
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters for one cache namespace."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Cache:
+    """
+    Interface for client cache backends.
+    
+    Keys are tuples whose first element is the namespace (e.g.
+    ``('exchange_rates', 'USD', 'EUR')``). Implement this to plug in a shared
+    backend such as Redis; :class:`TTLCache` is the in-process default.
+    """
+    
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        """Return ``(True, value)`` on a hit or ``(False, None)`` on a miss."""
+        raise NotImplementedError
+    
+    def set(self, key: CacheKey, value: Any, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+        raise NotImplementedError
+    
+    def delete(self, key: CacheKey) -> None:
+        """Remove a single entry."""
+        raise NotImplementedError
+    
+    def invalidate(self, namespace: str) -> None:
+        """Remove every entry of a namespace."""
+        raise NotImplementedError
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+
+class TTLCache(Cache):
+    """
+    Thread-safe in-process cache with per-entry TTL and LRU eviction.
+    
+    Example:
+        >>> client = FinAegis(api_key='...', cache=TTLCache(maxsize=4096))
+        >>> client.exchange_rates.get('USD', 'EUR')   # network
+        >>> client.exchange_rates.get('USD', 'EUR')   # cache hit
+        >>> client.cache.stats('exchange_rates').hits
+        1
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: Maximum number of entries before the least recently used
+                entry is evicted
+        """
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[CacheKey, Tuple[float, Any]]' = OrderedDict()
+        self._stats: Dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+    
+    def _stats_for(self, key: CacheKey) -> CacheStats:
+        namespace = str(key[0]) if key else ''
+        stats = self._stats.get(namespace)
+        if stats is None:
+            stats = self._stats[namespace] = CacheStats()
+        return stats
+    
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        with self._lock:
+            stats = self._stats_for(key)
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    stats.hits += 1
+                    return True, value
+                del self._entries[key]
+            stats.misses += 1
+            return False, None
+    
+    def set(self, key: CacheKey, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._stats_for(evicted).evictions += 1
+    
+    def delete(self, key: CacheKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def invalidate(self, namespace: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key and key[0] == namespace]:
+                del self._entries[key]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self, namespace: Optional[str] = None) -> CacheStats:
+        """
+        Get hit/miss counters.
+        
+        Args:
+            namespace: Namespace to report on; all namespaces combined if omitted
+            
+        Returns:
+            CacheStats snapshot
+        """
+        with self._lock:
+            if namespace is not None:
+                current = self._stats.get(namespace, CacheStats())
+                return CacheStats(current.hits, current.misses, current.evictions)
+            total = CacheStats()
+            for current in self._stats.values():
+                total.hits += current.hits
+                total.misses += current.misses
+                total.evictions += current.evictions
+            return total
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+Per-endpoint circuit breaking for the FinAegis SDK
+
+When the API struggles, every call to a failing endpoint would otherwise wait
+for its timeout and retries, tying up worker threads and adding load to a
+server that is already overloaded. A :class:`CircuitBreaker` tracks the
+outcome of recent calls per endpoint and, once the share of failures crosses a
+threshold, opens that endpoint's circuit: calls to it fail at once with
+CircuitOpenError, and calls already retrying stop. Other endpoints are not
+affected.
+
+After a cooldown a single probe call is let through. If it succeeds the circuit
+closes again; if it fails the circuit stays open for another cooldown.
+
+Server errors (5xx), timeouts, connection errors and exceeded deadlines count
+as failures. Any other answer, including 4xx errors, shows the server is
+healthy and counts as a success.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .exceptions import CircuitOpenError
+from .instrumentation import path_template
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """
+    Name of the endpoint a request goes to.
+    
+    The same key as instrumentation metrics use, so a tripped circuit can be
+    matched to its metrics series.
+    
+    Args:
+        method: HTTP method
+        path: Request path
+        
+    Returns:
+        e.g. ``'GET /accounts/{uuid}/balances'`` or ``'GET /exchange-rates/{from}/{to}'``
+    """
+    return f"{method.upper()} {path_template(path)}"
+
+
+@dataclass
+class CircuitBreakerStats:
+    """Counters of a CircuitBreaker over its lifetime."""
+    opened: int = 0
+    rejected: int = 0
+
+
+class _Circuit:
+    """Outcome window and state of one endpoint."""
+    
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probing = False
+        # One (second, calls, failures) slot per second of the window
+        self.seconds: List[int] = [0] * window
+        self.calls: List[int] = [0] * window
+        self.failures: List[int] = [0] * window
+    
+    def reset(self) -> None:
+        window = len(self.seconds)
+        self.seconds, self.calls, self.failures = [0] * window, [0] * window, [0] * window
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breakers, one per endpoint, shared by every call of a client.
+    
+    Example:
+        >>> client = FinAegis(api_key='...', circuit_breaker=CircuitBreaker(failure_rate=0.5))
+        >>> try:
+        ...     balances = client.accounts.get_balances(uuid)
+        ... except CircuitOpenError as error:
+        ...     balances = fallback(uuid, retry_in=error.retry_after)
+    """
+    
+    def __init__(self, failure_rate: float = 0.5, min_calls: int = 20, window: int = 10, cooldown: float = 5.0):
+        """
+        Args:
+            failure_rate: Share of failed calls in the window that opens a circuit
+            min_calls: Calls needed in the window before the rate is trusted
+            window: Length of the sliding window in seconds
+            cooldown: Seconds a circuit stays open before a probe call
+        """
+        if not 0 < failure_rate <= 1 or min_calls < 1 or window < 1 or cooldown < 0:
+            raise ValueError('failure_rate must be in (0, 1], min_calls and window >= 1 and cooldown >= 0')
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = int(window)
+        self.cooldown = cooldown
+        self.stats = CircuitBreakerStats()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+    
+    def _circuit(self, name: str) -> _Circuit:
+        circuit = self._circuits.get(name)
+        if circuit is None:
+            circuit = self._circuits[name] = _Circuit(self.window)
+        return circuit
+    
+    def before(self, name: str) -> None:
+        """
+        Admit a call to an endpoint.
+        
+        Args:
+            name: Endpoint name, see endpoint_name()
+            
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its probe in flight
+        """
+        with self._lock:
+            circuit = self._circuit(name)
+            if circuit.state == CLOSED:
+                return
+            now = time.monotonic()
+            if circuit.state == OPEN and now - circuit.opened_at >= self.cooldown:
+                circuit.state = HALF_OPEN
+            if circuit.state == HALF_OPEN and not circuit.probing:
+                circuit.probing = True
+                return
+            self.stats.rejected += 1
+            retry_after = max(circuit.opened_at + self.cooldown - now, 0.0)
+        raise CircuitOpenError(f'Circuit open for {name}; not calling the API', name, retry_after)
+    
+    def record(self, name: str, failed: Optional[bool]) -> None:
+        """
+        Record the outcome of a call admitted by before().
+        
+        Args:
+            name: Endpoint name
+            failed: Whether the call failed; None when it ended without an
+                outcome (e.g. cancelled), which only frees the probe slot
+        """
+        with self._lock:
+            circuit = self._circuit(name)
+            if circuit.state != CLOSED:
+                if not circuit.probing:
+                    # A call admitted before the circuit opened
+                    return
+                circuit.probing = False
+                if failed:
+                    circuit.state, circuit.opened_at = OPEN, time.monotonic()
+                    self.stats.opened += 1
+                elif failed is not None:
+                    circuit.state = CLOSED
+                    circuit.reset()
+                return
+            if failed is None:
+                return
+            now = int(time.monotonic())
+            slot = now % self.window
+            if circuit.seconds[slot] != now:
+                circuit.seconds[slot] = now
+                circuit.calls[slot] = circuit.failures[slot] = 0
+            circuit.calls[slot] += 1
+            if not failed:
+                return
+            circuit.failures[slot] += 1
+            oldest = now - self.window
+            calls = failures = 0
+            for second, slot_calls, slot_failures in zip(circuit.seconds, circuit.calls, circuit.failures):
+                if second > oldest:
+                    calls += slot_calls
+                    failures += slot_failures
+            if calls >= self.min_calls and failures >= calls * self.failure_rate:
+                circuit.state, circuit.opened_at = OPEN, time.monotonic()
+                self.stats.opened += 1
+    
+    def is_open(self, name: Optional[str]) -> bool:
+        """Whether calls to an endpoint are currently refused; retries in flight check this."""
+        with self._lock:
+            circuit = self._circuits.get(name) if name is not None else None
+            return circuit is not None and circuit.state != CLOSED
+    
+    def states(self) -> Dict[str, str]:
+        """State (closed, open or half_open) of every endpoint called so far."""
+        with self._lock:
+            return {name: circuit.state for name, circuit in self._circuits.items()}
\ No newline at end of file
@@ -1,29 +1,169 @@
 import os
-from typing import Optional, Dict, Any
+import socket
+import threading
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Dict, Any, List, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import MaxRetryError, ResponseError
 from urllib3.util.retry import Retry
+from urllib3.util.timeout import Timeout
 
 from . import __version__
-from .exceptions import handle_response_error
-from .resources import (
-    AccountsResource,
-    TransactionsResource,
-    TransfersResource,
-    AssetsResource,
-    BasketsResource,
-    WebhooksResource,
-    ExchangeRatesResource,
-    GCUResource,
-)
+from .cache import DEFAULT_TTLS, Cache, TTLCache
+from .circuit import CircuitBreaker, endpoint_name
+from .conditional import ConditionalStore, unconditional_headers
+from .deadlines import RetryBudget, call_deadline, retry_allowed, time_left
+from .decoding import JSONDecoder, StreamedPage, get_decoder
+from .exceptions import DeadlineExceededError, ServerError, handle_response_error
+from .hedging import HedgePolicy
+from .idempotency import with_idempotency_key
+from .instrumentation import Instrumentation
+from .ratelimit import AdaptiveRateLimiter
+from .singleflight import SingleFlight, client_scope, request_key
+from .throttle import backoff_gated
+from .resources import LazyResource
+
+if TYPE_CHECKING:
+    from .resources import (
+        AccountsResource,
+        TransactionsResource,
+        TransfersResource,
+        AssetsResource,
+        BasketsResource,
+        WebhooksResource,
+        ExchangeRatesResource,
+        GCUResource,
+    )
+
+
+# Seconds the current thread has spent waiting for pooled connections
+_pool_wait = threading.local()
+
+# Deadline and endpoint of the call the current thread is sending, read by CallRetry
+_current_call = threading.local()
+
+
+class _TimedPoolMixin:
+    """Connection pool that adds the time spent checking out a connection to _pool_wait."""
+    
+    def _get_conn(self, timeout=None):
+        start = time.perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            _pool_wait.seconds = getattr(_pool_wait, 'seconds', 0.0) + time.perf_counter() - start
+
+
+class TimedHTTPConnectionPool(_TimedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class TimedHTTPSConnectionPool(_TimedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class CallRetry(Retry):
+    """
+    Retry that respects the deadline of the call being sent, a RetryBudget and a CircuitBreaker.
+    
+    A retry whose backoff would end past the deadline, that the budget
+    refuses, or to an endpoint whose circuit has opened is not made; the call
+    ends as if its retries were exhausted. 429s of calls under a BackoffGate
+    are not retried, so the gate sees the first one.
+    """
+    
+    budget: Optional[RetryBudget] = None
+    breaker: Optional[CircuitBreaker] = None
+    
+    def new(self, **kw) -> 'CallRetry':
+        retry = super().new(**kw)
+        retry.budget = self.budget
+        retry.breaker = self.breaker
+        return retry
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429 and backoff_gated():
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
+        delay = None
+        if response is not None and retry.respect_retry_after_header:
+            delay = retry.get_retry_after(response)
+        if delay is None:
+            delay = retry.get_backoff_time()
+        if ((self.breaker is not None and self.breaker.is_open(getattr(_current_call, 'endpoint', None)))
+                or not retry_allowed(delay, getattr(_current_call, 'expires', None), self.budget)):
+            reason = error or ResponseError(
+                ResponseError.SPECIFIC_ERROR.format(status_code=response.status)
+                if response is not None else ResponseError.GENERIC_ERROR
+            )
+            raise MaxRetryError(_pool, url, reason) from reason
+        return retry
+
+
+class DeadlineTimeout(Timeout):
+    """Per-attempt timeout cut to the time left before a call's deadline."""
+    
+    def __init__(self, timeout: Optional[float], expires: float):
+        super().__init__(connect=timeout, read=timeout)
+        self.expires = expires
+    
+    def clone(self) -> 'DeadlineTimeout':
+        return DeadlineTimeout(self._read, self.expires)
+    
+    def _cap(self, value: Optional[float]) -> float:
+        left = max(self.expires - time.monotonic(), 0.001)
+        return left if value is None else min(value, left)
+    
+    @property
+    def connect_timeout(self) -> float:
+        return self._cap(super().connect_timeout)
+    
+    @property
+    def read_timeout(self) -> float:
+        return self._cap(super().read_timeout)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies custom socket options to pooled connections."""
+    
+    def __init__(
+        self,
+        socket_options: Optional[List[Tuple[int, int, int]]] = None,
+        time_pool_waits: bool = False,
+        **kwargs
+    ):
+        self.socket_options = socket_options
+        self.time_pool_waits = time_pool_waits
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        if self.time_pool_waits:
+            self.poolmanager.pool_classes_by_scheme = {
+                'http': TimedHTTPConnectionPool,
+                'https': TimedHTTPSConnectionPool,
+            }
 
 
 class FinAegis:
     """
     FinAegis API Client
     
+    A single client is safe to share across threads: requests go through a
+    thread-safe urllib3 connection pool, and the client keeps no per-request
+    state. Size the pool to the number of threads sharing the client.
+    
     Example:
         >>> from finaegis import FinAegis
         >>> client = FinAegis(api_key='your-api-key', environment='sandbox')
@@ -36,6 +176,16 @@ class FinAegis:
         'local': 'http://localhost:8000/api/v2',
     }
     
+    # Resources are imported and created on first access
+    accounts: 'LazyResource[AccountsResource]' = LazyResource('accounts', 'AccountsResource')
+    transactions: 'LazyResource[TransactionsResource]' = LazyResource('transactions', 'TransactionsResource')
+    transfers: 'LazyResource[TransfersResource]' = LazyResource('transfers', 'TransfersResource')
+    assets: 'LazyResource[AssetsResource]' = LazyResource('assets', 'AssetsResource')
+    baskets: 'LazyResource[BasketsResource]' = LazyResource('baskets', 'BasketsResource')
+    webhooks: 'LazyResource[WebhooksResource]' = LazyResource('webhooks', 'WebhooksResource')
+    exchange_rates: 'LazyResource[ExchangeRatesResource]' = LazyResource('exchange_rates', 'ExchangeRatesResource')
+    gcu: 'LazyResource[GCUResource]' = LazyResource('gcu', 'GCUResource')
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -44,6 +194,23 @@ class FinAegis:
         timeout: int = 30,
         max_retries: int = 3,
         verify_ssl: bool = True,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        tcp_keepalive: bool = False,
+        cache: Union[bool, Cache, None] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        conditional_requests: Union[bool, ConditionalStore] = False,
+        lazy_models: bool = False,
+        json_decoder: Union[str, JSONDecoder, None] = None,
+        instrumentation: Union[bool, Instrumentation, None] = None,
+        rate_limit: Union[bool, AdaptiveRateLimiter, None] = None,
+        coalesce_requests: Union[bool, SingleFlight] = False,
+        deadline: Optional[float] = None,
+        retry_budget: Union[bool, RetryBudget, None] = None,
+        hedge: Union[bool, HedgePolicy, None] = None,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = None,
     ):
         """
         Initialize the FinAegis client.
@@ -55,6 +222,59 @@ class FinAegis:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             verify_ssl: Whether to verify SSL certificates
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum connections kept open per host; set it to at
+                least the number of threads sharing this client
+            pool_block: Make threads wait for a free connection when the pool
+                is exhausted instead of opening (and later discarding) extras
+            keep_alive: Reuse connections between requests (HTTP keep-alive);
+                when False every request uses a fresh connection
+            tcp_keepalive: Enable TCP keep-alive probes on pooled sockets so
+                idle connections survive NAT and load balancer timeouts
+            cache: Cache reference data (assets, exchange rates, baskets, GCU,
+                webhook events) client-side; True for an in-process TTLCache,
+                or a Cache instance to plug in another backend
+            cache_ttls: Per-namespace TTL overrides in seconds; 0 disables
+                caching for a namespace
+            conditional_requests: Revalidate GETs with ETag/Last-Modified and
+                reuse the stored body on 304 Not Modified; True for a default
+                ConditionalStore, or pass one to size it
+            lazy_models: Parse accounts, transactions and transfers in list
+                results field by field on first access, so bulk scans only pay
+                for the fields they read
+            json_decoder: Callable decoding response bodies, or 'orjson' /
+                'json'; defaults to orjson when it is installed
+            instrumentation: Time every call and count retries, statuses and
+                bytes; True for an Instrumentation with the built-in
+                MetricsRecorder, or pass one with your own hooks. Its recorder
+                aggregates the calls of every client given the same one
+            rate_limit: Pace requests through token buckets shared by every
+                thread using this client, learning the rate from the server's
+                rate limit headers and 429s; True for a default
+                AdaptiveRateLimiter. The server counts requests per API key,
+                so clients using the same key should pass the same limiter
+            coalesce_requests: Let identical GETs issued concurrently share one
+                request and its decoded result; True for a new SingleFlight.
+                A SingleFlight passed to several clients also merges calls
+                across them, but only between clients with the same base URL
+                and API key
+            deadline: Seconds a call may take in total, attempts and backoff
+                included; ``finaegis.deadline()`` blocks can shorten it per
+                call. None leaves calls bounded only by timeout and retries
+            retry_budget: Cap retries at a fraction of this client's calls so
+                they cannot multiply load during an outage; True for a default
+                RetryBudget. A budget passed to several clients sizes the
+                allowance from their combined calls, capping their retries
+                against a shared backend together
+            hedge: Send a second request when a read of balances, exchange
+                rates or the GCU composition is slower than its p95, and use
+                the first answer; True for a default HedgePolicy, or pass one
+                to choose the endpoints and percentile
+            circuit_breaker: Fail calls to an endpoint at once with
+                CircuitOpenError while its error rate is high; True for a
+                default CircuitBreaker. Circuits are kept per endpoint name,
+                so clients given the same breaker open and probe each
+                endpoint together
         """
         self.api_key = api_key or os.environ.get('FINAEGIS_API_KEY')
         if not self.api_key:
@@ -62,7 +282,31 @@ class FinAegis:
         
         self.base_url = base_url or self.ENVIRONMENTS.get(environment, self.ENVIRONMENTS['production'])
         self.timeout = timeout
+        self.max_retries = max_retries
         self.verify_ssl = verify_ssl
+        self.deadline = deadline
+        
+        # Optional retry budget shared by every call of this client
+        if retry_budget is True:
+            retry_budget = RetryBudget()
+        self.retry_budget: Optional[RetryBudget] = retry_budget if isinstance(retry_budget, RetryBudget) else None
+        
+        # Optional hedging of slow reads and per-endpoint circuit breaking
+        if hedge is True:
+            hedge = HedgePolicy()
+        self.hedge_policy: Optional[HedgePolicy] = hedge if isinstance(hedge, HedgePolicy) else None
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker: Optional[CircuitBreaker] = (
+            circuit_breaker if isinstance(circuit_breaker, CircuitBreaker) else None
+        )
+        
+        # Optional adaptive rate limiting; it takes over 429 retries from urllib3
+        if rate_limit is True:
+            rate_limit = AdaptiveRateLimiter()
+        self.rate_limiter: Optional[AdaptiveRateLimiter] = (
+            rate_limit if isinstance(rate_limit, AdaptiveRateLimiter) else None
+        )
         
         # Setup session with retry logic
         self.session = requests.Session()
@@ -72,27 +316,66 @@ class FinAegis:
             'Accept': 'application/json',
             'User-Agent': f'FinAegis-Python-SDK/{__version__}',
         })
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
         
-        # Configure retries
-        retry_strategy = Retry(
+        # Configure retries. Writes are retried too: every POST/PUT/PATCH
+        # carries an Idempotency-Key that stays the same across retries.
+        retry_strategy = CallRetry(
             total=max_retries,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"]
+            status_forcelist=[500, 502, 503, 504] if self.rate_limiter else [429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE"],
+            # Hand the final response back so it maps to RateLimitError/ServerError
+            raise_on_status=False
+        )
+        retry_strategy.budget = self.retry_budget
+        retry_strategy.breaker = self.circuit_breaker
+        if instrumentation is True:
+            instrumentation = Instrumentation()
+        self.instrumentation: Optional[Instrumentation] = (
+            instrumentation if isinstance(instrumentation, Instrumentation) else None
+        )
+        
+        socket_options = None
+        if tcp_keepalive:
+            socket_options = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+        adapter = PooledHTTPAdapter(
+            socket_options=socket_options,
+            time_pool_waits=self.instrumentation is not None,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
-        # Initialize resources
-        self.accounts = AccountsResource(self)
-        self.transactions = TransactionsResource(self)
-        self.transfers = TransfersResource(self)
-        self.assets = AssetsResource(self)
-        self.baskets = BasketsResource(self)
-        self.webhooks = WebhooksResource(self)
-        self.exchange_rates = ExchangeRatesResource(self)
-        self.gcu = GCUResource(self)
+        # Optional reference-data cache
+        if cache is True:
+            cache = TTLCache()
+        self.cache: Optional[Cache] = cache if isinstance(cache, Cache) else None
+        self.cache_ttls = dict(DEFAULT_TTLS, **(cache_ttls or {}))
+        
+        # Optional ETag/Last-Modified revalidation of GETs
+        if conditional_requests is True:
+            conditional_requests = ConditionalStore()
+        self.conditional_store: Optional[ConditionalStore] = (
+            conditional_requests if isinstance(conditional_requests, ConditionalStore) else None
+        )
+        self.lazy_models = lazy_models
+        self.json_decoder = get_decoder(json_decoder)
+        
+        # Optional coalescing of identical concurrent GETs
+        if coalesce_requests is True:
+            coalesce_requests = SingleFlight()
+        self.single_flight: Optional[SingleFlight] = (
+            coalesce_requests if isinstance(coalesce_requests, SingleFlight) else None
+        )
+        # Keeps calls of clients with other credentials out of a shared group
+        self._scope = client_scope(self.base_url, self.api_key)
     
     def request(
         self,
@@ -100,6 +383,7 @@ class FinAegis:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -110,6 +394,8 @@ class FinAegis:
             path: API endpoint path
             params: Query parameters
             json: JSON body data
+            idempotency_key: Key sent with POST/PUT/PATCH requests so retries
+                are deduplicated by the server (generated when omitted)
             **kwargs: Additional arguments to pass to requests
             
         Returns:
@@ -118,24 +404,290 @@ class FinAegis:
         Raises:
             FinAegisError: If the request fails
         """
+        if self.single_flight is not None and method.upper() == 'GET' and not kwargs:
+            return self.single_flight.do(
+                request_key(path, params, self._scope),
+                lambda: self._guarded_request(method, path, params, json, idempotency_key, kwargs),
+                call_deadline(self.deadline)
+            )
+        return self._guarded_request(method, path, params, json, idempotency_key, kwargs)
+    
+    def _guarded_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a request through the circuit breaker and hedging policy when configured."""
+        breaker, hedge = self.circuit_breaker, self.hedge_policy
+        if breaker is None and hedge is None:
+            return self._measured_request(method, path, params, json, idempotency_key, kwargs)
+        
+        name = endpoint_name(method, path)
+        
+        def send() -> Dict[str, Any]:
+            # Each request gets its own kwargs, which _request modifies
+            return self._measured_request(method, path, params, json, idempotency_key, dict(kwargs))
+            
+        call: Callable[[], Dict[str, Any]] = send
+        if hedge is not None and hedge.applies(name):
+            call = partial(hedge.hedge, name, send)
+        if breaker is None:
+            return call()
+        
+        breaker.before(name)
+        failed = None
+        try:
+            result = call()
+            failed = False
+            return result
+        except (ServerError, DeadlineExceededError, requests.ConnectionError, requests.Timeout):
+            failed = True
+            raise
+        except Exception:
+            failed = False
+            raise
+        finally:
+            breaker.record(name, failed)
+    
+    def _measured_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a request, reporting it to the instrumentation when configured."""
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return self._request(method, path, params, json, idempotency_key, kwargs)
+        
+        info = instrumentation.start(method, path)
+        measurements: Dict[str, Any] = {}
+        _pool_wait.seconds = 0.0
+        try:
+            return self._request(method, path, params, json, idempotency_key, kwargs, measurements)
+        except Exception as error:
+            measurements['error'] = error
+            raise
+        finally:
+            status = measurements.pop('status', None)
+            instrumentation.finish(info, status, pool_wait=_pool_wait.seconds, **measurements)
+    
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        kwargs: Dict[str, Any],
+        measurements: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send a request; fills measurements with status, retries, bytes and decode time when given."""
         url = urljoin(self.base_url, path.lstrip('/'))
+        # The same key is resent on every retry of this call
+        headers = with_idempotency_key(method, kwargs.pop('headers', None), idempotency_key)
         
-        response = self.session.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json,
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-            **kwargs
-        )
+        store_key = stored = None
+        if self.conditional_store is not None and method.upper() == 'GET':
+            store_key = self.conditional_store.key(url, params)
+            headers, stored = self.conditional_store.conditional_headers(store_key, headers)
+        if headers is not None:
+            kwargs['headers'] = headers
+        
+        expires = call_deadline(self.deadline)
+        timeout = self.timeout if expires is None else DeadlineTimeout(self.timeout, expires)
+        budget = self.retry_budget
+        if budget is not None:
+            budget.record_call()
+        endpoint = endpoint_name(method, path) if self.circuit_breaker is not None else None
+        
+        limiter = self.rate_limiter
+        rate_limited = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(method, path)
+            if expires is not None:
+                time_left(expires, path)
+            _current_call.expires = expires
+            _current_call.endpoint = endpoint
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    timeout=timeout,
+                    verify=self.verify_ssl,
+                    **kwargs
+                )
+            except (requests.Timeout, requests.ConnectionError) as error:
+                if expires is not None and time.monotonic() >= expires:
+                    raise DeadlineExceededError(f'Deadline exceeded during {method} {path}') from error
+                raise
+            finally:
+                _current_call.expires = _current_call.endpoint = None
+            if limiter is None:
+                break
+            limiter.observe(method, path, response.status_code, response.headers, self._retry_after(response))
+            if (response.status_code != 429 or rate_limited >= self.max_retries or backoff_gated()
+                    or not retry_allowed(0, expires, budget)):
+                break
+            # The limiter has paused; the next acquire waits out Retry-After
+            rate_limited += 1
+        if measurements is not None:
+            retries = getattr(response.raw, 'retries', None)
+            measurements['status'] = response.status_code
+            measurements['retries'] = rate_limited + (len(retries.history) if retries is not None else 0)
+            measurements['bytes_sent'] = len(response.request.body or b'')
+            measurements['bytes_received'] = len(response.content)
+        
+        if response.status_code == 304:
+            if stored is not None:
+                return self.conditional_store.not_modified_response(stored)
+            # Nothing stored to answer from, e.g. the caller sent its own validator
+            kwargs['headers'] = unconditional_headers(method, path, headers)
+            return self._request(method, path, params, json, idempotency_key, kwargs, measurements)
         
         # Handle errors
         if not response.ok:
             handle_response_error(response)
         
         # Return JSON response
-        return response.json() if response.content else {}
+        if measurements is None:
+            data = self.json_decoder(response.content) if response.content else {}
+        else:
+            decode_start = time.perf_counter()
+            data = self.json_decoder(response.content) if response.content else {}
+            measurements['decode_time'] = time.perf_counter() - decode_start
+        if store_key is not None:
+            self.conditional_store.store(store_key, response.headers, data)
+        return data
+    
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """The retry_after field of a 429 body, if any."""
+        if response.status_code != 429 or not response.content:
+            return None
+        try:
+            return self.json_decoder(response.content).get('retry_after')
+        except (ValueError, AttributeError):
+            return None
+    
+    def stream(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        key: str = 'data',
+        chunk_size: int = 65536
+    ) -> StreamedPage:
+        """
+        GET a list endpoint and parse its array incrementally.
+        
+        Items are decoded as their bytes arrive instead of after the whole
+        body has been downloaded. Conditional requests, coalescing and hedging
+        do not apply. The deadline, retry budget, rate limiter, circuit
+        breaker and instrumentation do, and the deadline also bounds reading
+        the body; the call is reported once the page is read or closed.
+        
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            key: Top-level key of the array to stream
+            chunk_size: Socket read size in bytes
+            
+        Returns:
+            StreamedPage yielding raw item dicts
+            
+        Raises:
+            FinAegisError: If the request fails
+        """
+        url = urljoin(self.base_url, path.lstrip('/'))
+        expires = call_deadline(self.deadline)
+        timeout = self.timeout if expires is None else DeadlineTimeout(self.timeout, expires)
+        if self.retry_budget is not None:
+            self.retry_budget.record_call()
+        limiter, breaker, instrumentation = self.rate_limiter, self.circuit_breaker, self.instrumentation
+        name = endpoint_name('GET', path)
+        if breaker is not None:
+            breaker.before(name)
+        info = instrumentation.start('GET', path) if instrumentation is not None else None
+        measurements: Dict[str, Any] = {'bytes_received': 0}
+        finished = []
+        
+        def finish(error: Optional[Exception] = None) -> None:
+            if finished:
+                return
+            finished.append(True)
+            if breaker is not None:
+                breaker.record(name, isinstance(
+                    error, (ServerError, DeadlineExceededError, requests.ConnectionError, requests.Timeout)
+                ))
+            if info is not None:
+                if error is not None:
+                    measurements['error'] = error
+                status = measurements.pop('status', None)
+                instrumentation.finish(info, status, **measurements)
+                
+        def exceeded(error: Exception) -> Optional[DeadlineExceededError]:
+            if expires is None or time.monotonic() < expires or isinstance(error, DeadlineExceededError):
+                return None
+            return DeadlineExceededError(f'Deadline exceeded during GET {path}')
+            
+        _pool_wait.seconds = 0.0
+        try:
+            if limiter is not None:
+                limiter.acquire('GET', path)
+            if expires is not None:
+                time_left(expires, path)
+            _current_call.expires = expires
+            _current_call.endpoint = name if breaker is not None else None
+            try:
+                response = self.session.get(url, params=params, timeout=timeout, verify=self.verify_ssl, stream=True)
+            finally:
+                _current_call.expires = _current_call.endpoint = None
+            retries = getattr(response.raw, 'retries', None)
+            measurements['status'] = response.status_code
+            measurements['retries'] = len(retries.history) if retries is not None else 0
+            measurements['pool_wait'] = _pool_wait.seconds
+            if limiter is not None:
+                limiter.observe('GET', path, response.status_code, response.headers, self._retry_after(response))
+            if not response.ok:
+                try:
+                    handle_response_error(response)
+                finally:
+                    response.close()
+        except Exception as error:
+            deadline_error = exceeded(error)
+            finish(deadline_error or error)
+            if deadline_error is not None:
+                raise deadline_error from error
+            raise
+            
+        def chunks() -> Iterator[bytes]:
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if expires is not None:
+                        time_left(expires, path)
+                    measurements['bytes_received'] += len(chunk)
+                    yield chunk
+            except Exception as error:
+                deadline_error = exceeded(error)
+                finish(deadline_error or error)
+                if deadline_error is not None:
+                    raise deadline_error from error
+                raise
+                
+        def close() -> None:
+            response.close()
+            finish()
+            
+        return StreamedPage(chunks(), key=key, on_close=close)
     
     def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         """Make a GET request."""
@@ -0,0 +1,281 @@
+"""
+Columnar result batches for the FinAegis SDK
+
+Analytics over transactions and value histories want arrays, not lists of
+objects. A ColumnBatch is a struct-of-arrays built directly from raw response
+pages: numeric fields become NumPy arrays, timestamps become ``datetime64[us]``
+(UTC) arrays, and low-cardinality strings such as asset codes and statuses are
+dictionary-encoded into small integer codes. No model object is created per
+row, and each page is packed into arrays as soon as it arrives.
+
+Requires NumPy (``pip install finaegis[numpy]``).
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from .money import to_minor_units
+from .parsing import parse_datetime
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+# Column kinds
+INT = 'int'                # int64, e.g. amounts in minor units
+FLOAT = 'float'            # float64, NaN for nulls
+TIMESTAMP = 'timestamp'    # datetime64[us] in UTC, NaT for nulls
+CATEGORY = 'category'      # dictionary-encoded strings
+STRING = 'string'          # object array of str
+
+TRANSACTION_COLUMNS: Dict[str, str] = {
+    'id': STRING,
+    'account_uuid': CATEGORY,
+    'type': CATEGORY,
+    'amount': INT,
+    'asset_code': CATEGORY,
+    'status': CATEGORY,
+    'created_at': TIMESTAMP,
+    'completed_at': TIMESTAMP,
+}
+
+GCU_VALUE_HISTORY_COLUMNS: Dict[str, str] = {
+    'timestamp': TIMESTAMP,
+    'value': FLOAT,
+    'change': FLOAT,
+}
+
+BASKET_HISTORY_COLUMNS: Dict[str, str] = {
+    'calculated_at': TIMESTAMP,
+    'value': FLOAT,
+}
+
+Column = Union['np.ndarray', 'DictColumn']
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Columnar results require numpy. Install it with: pip install finaegis[numpy]")
+
+
+class DictColumn:
+    """
+    Dictionary-encoded string column.
+    
+    ``codes`` holds one int32 per row indexing into ``categories``; -1 marks
+    a null. Comparing with a string yields a boolean mask without decoding.
+    """
+    
+    __slots__ = ('codes', 'categories')
+    
+    def __init__(self, codes: 'np.ndarray', categories: Sequence[str]):
+        self.codes = codes
+        self.categories = list(categories)
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, (int, np.integer)):
+            code = self.codes[index]
+            return self.categories[code] if code >= 0 else None
+        return DictColumn(self.codes[index], self.categories)
+    
+    def _code(self, value: str) -> int:
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return -2  # matches no row, not even nulls
+    
+    def __eq__(self, value: Any) -> 'np.ndarray':  # type: ignore[override]
+        return self.codes == self._code(value)
+    
+    def __ne__(self, value: Any) -> 'np.ndarray':  # type: ignore[override]
+        return self.codes != self._code(value)
+        
+    __hash__ = None  # type: ignore[assignment]
+    
+    def isin(self, values: Iterable[str]) -> 'np.ndarray':
+        """Boolean mask of rows whose value is one of values."""
+        return np.isin(self.codes, [self._code(value) for value in values])
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of rows per category."""
+        valid = self.codes[self.codes >= 0]
+        totals = np.bincount(valid, minlength=len(self.categories))
+        return {category: int(total) for category, total in zip(self.categories, totals)}
+    
+    def decode(self) -> 'np.ndarray':
+        """Materialize the column as an object array of strings."""
+        lookup = np.array(self.categories + [None], dtype=object)
+        return lookup[self.codes]
+    
+    def __repr__(self) -> str:
+        return f"DictColumn(rows={len(self)}, categories={self.categories!r})"
+
+
+class ColumnBatch:
+    """
+    Struct-of-arrays result: one column per field, all of the same length.
+    
+    Example:
+        >>> batch = client.transactions.columns()
+        >>> completed = batch['status'] == 'completed'
+        >>> usd = batch['asset_code'] == 'USD'
+        >>> batch['amount'][completed & usd].sum()
+        123456789
+    """
+    
+    __slots__ = ('columns', 'length')
+    
+    def __init__(self, columns: Dict[str, Column], length: int):
+        self.columns = columns
+        self.length = length
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+    
+    @property
+    def names(self) -> List[str]:
+        """Column names in schema order."""
+        return list(self.columns)
+    
+    def filter(self, mask: 'np.ndarray') -> 'ColumnBatch':
+        """
+        Select rows with a boolean mask or index array.
+        
+        Args:
+            mask: Boolean mask or integer indices
+            
+        Returns:
+            A new ColumnBatch with the selected rows
+        """
+        columns = {name: column[mask] for name, column in self.columns.items()}
+        length = len(next(iter(columns.values()))) if columns else 0
+        return ColumnBatch(columns, length)
+    
+    def __repr__(self) -> str:
+        return f"ColumnBatch(rows={self.length}, columns={self.names!r})"
+
+
+def _has_offset(value: Optional[str]) -> bool:
+    """Whether a timestamp ends in an explicit ``+HH:MM``/``-HH:MM`` offset."""
+    return bool(value) and len(value) > 19 and value[-6] in '+-' and value[-3] == ':'
+
+
+def _timestamps(values: List[Optional[str]]) -> 'np.ndarray':
+    """Parse API timestamps into a UTC datetime64[us] array."""
+    if not any(_has_offset(value) for value in values):
+        cleaned = [value[:-1] if value and value[-1] == 'Z' else (value or 'NaT') for value in values]
+        return np.array(cleaned, dtype='datetime64[us]')
+    # NumPy does not understand offsets; normalize each value to naive UTC.
+    parsed = []
+    for value in values:
+        if not value:
+            parsed.append(np.datetime64('NaT', 'us'))
+            continue
+        moment = parse_datetime(value)
+        if moment.tzinfo is not None:
+            moment = (moment - moment.utcoffset()).replace(tzinfo=None)
+        parsed.append(np.datetime64(moment, 'us'))
+    return np.array(parsed, dtype='datetime64[us]')
+
+
+def _integers(values: List[Any]) -> 'np.ndarray':
+    try:
+        return np.array(values, dtype=np.int64)
+    except (TypeError, ValueError, OverflowError):
+        return np.array([to_minor_units(value) for value in values], dtype=np.int64)
+
+
+class ColumnBuilder:
+    """
+    Accumulates raw rows page by page into a ColumnBatch.
+    
+    Each page is converted into array chunks as soon as it is added, so the
+    raw page can be released before the next one arrives.
+    """
+    
+    def __init__(self, schema: Mapping[str, str]):
+        """
+        Args:
+            schema: Field name to column kind (INT, FLOAT, TIMESTAMP,
+                CATEGORY or STRING)
+        """
+        _require_numpy()
+        self.schema = dict(schema)
+        self.length = 0
+        self._chunks: Dict[str, List['np.ndarray']] = {name: [] for name in self.schema}
+        self._categories: Dict[str, Dict[str, int]] = {
+            name: {} for name, kind in self.schema.items() if kind == CATEGORY
+        }
+    
+    def extend(self, rows: Sequence[Mapping[str, Any]]) -> 'ColumnBuilder':
+        """
+        Add a page of raw rows.
+        
+        Args:
+            rows: Raw row dicts, e.g. the ``data`` list of a response
+            
+        Returns:
+            The builder, for chaining
+        """
+        if not rows:
+            return self
+        for name, kind in self.schema.items():
+            values = [row.get(name) for row in rows]
+            if kind == INT:
+                chunk = _integers(values)
+            elif kind == FLOAT:
+                chunk = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+            elif kind == TIMESTAMP:
+                chunk = _timestamps(values)
+            elif kind == CATEGORY:
+                lookup = self._categories[name]
+                chunk = np.array(
+                    [-1 if value is None else lookup.setdefault(value, len(lookup)) for value in values],
+                    dtype=np.int32
+                )
+            else:
+                chunk = np.array(values, dtype=object)
+            self._chunks[name].append(chunk)
+        self.length += len(rows)
+        return self
+    
+    def build(self) -> ColumnBatch:
+        """
+        Concatenate the collected pages into a ColumnBatch.
+        
+        Returns:
+            ColumnBatch with one column per schema field
+        """
+        empty = {INT: np.int64, FLOAT: np.float64, TIMESTAMP: 'datetime64[us]', CATEGORY: np.int32, STRING: object}
+        columns: Dict[str, Column] = {}
+        for name, kind in self.schema.items():
+            chunks = self._chunks[name]
+            array = np.concatenate(chunks) if chunks else np.array([], dtype=empty[kind])
+            if kind == CATEGORY:
+                columns[name] = DictColumn(array, list(self._categories[name]))
+            else:
+                columns[name] = array
+        return ColumnBatch(columns, self.length)
+
+
+def to_columns(rows: Sequence[Mapping[str, Any]], schema: Mapping[str, str]) -> ColumnBatch:
+    """
+    Build a ColumnBatch from a single list of raw rows.
+    
+    Args:
+        rows: Raw row dicts
+        schema: Field name to column kind
+        
+    Returns:
+        ColumnBatch
+    """
+    return ColumnBuilder(schema).extend(rows).build()
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Conditional GET support for the FinAegis SDK
+
+Keeps the ``ETag``/``Last-Modified`` validators of GET responses together with
+their decoded body. Later GETs of the same URL send ``If-None-Match`` /
+``If-Modified-Since``; when the server answers ``304 Not Modified`` the stored
+body is returned without downloading or decoding it again.
+
+Stored bodies are shared between callers and should be treated as read-only.
+A 304 with no stored body to answer from, e.g. to a validator the caller sent
+itself, is followed by the same request without validators.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+from .exceptions import FinAegisError
+
+# Request headers that make a GET conditional, lowercased
+VALIDATOR_HEADERS = frozenset(['if-none-match', 'if-modified-since'])
+
+
+def unconditional_headers(method: str, path: str, headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """
+    Headers to resend a request with after a 304 that no stored body answers.
+    
+    Args:
+        method: HTTP method of the request
+        path: Request path
+        headers: Headers the request was sent with
+        
+    Returns:
+        The headers without If-None-Match and If-Modified-Since
+        
+    Raises:
+        FinAegisError: If the request carried no validators, so the 304 cannot be resolved
+    """
+    if not headers or not any(name.lower() in VALIDATOR_HEADERS for name in headers):
+        raise FinAegisError(f'{method} {path} answered 304 Not Modified to an unconditional request', status_code=304)
+    return {name: value for name, value in headers.items() if name.lower() not in VALIDATOR_HEADERS}
+
+
+@dataclass
+class StoredResponse:
+    """Validators and decoded body of a cacheable GET response."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: Dict[str, Any]
+
+
+class ConditionalStore:
+    """
+    Thread-safe LRU store of response validators, keyed by URL and query.
+    
+    Example:
+        >>> client = FinAegis(api_key='...', conditional_requests=True)
+        >>> client.gcu.get_composition()   # 200, body stored with its ETag
+        >>> client.gcu.get_composition()   # 304, stored body reused
+        >>> client.conditional_store.not_modified
+        1
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: Maximum number of URLs to keep validators for
+        """
+        self.maxsize = maxsize
+        self.not_modified = 0
+        self.modified = 0
+        self._entries: 'OrderedDict[Hashable, StoredResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> Hashable:
+        """Build the store key for a URL and its query parameters."""
+        return (url, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())))
+    
+    def conditional_headers(
+        self,
+        key: Hashable,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Dict[str, str]], Optional[StoredResponse]]:
+        """
+        Add validators for a stored response to the request headers.
+        
+        Caller-supplied conditional headers are left untouched.
+        
+        Args:
+            key: Store key of the request
+            headers: Request headers
+            
+        Returns:
+            The headers to send and the stored response they refer to, if any
+        """
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None:
+                self._entries.move_to_end(key)
+        if stored is None:
+            return headers, None
+            
+        headers = dict(headers or {})
+        present = {name.lower() for name in headers}
+        if stored.etag and 'if-none-match' not in present:
+            headers['If-None-Match'] = stored.etag
+        if stored.last_modified and 'if-modified-since' not in present:
+            headers['If-Modified-Since'] = stored.last_modified
+        return headers, stored
+    
+    def not_modified_response(self, stored: StoredResponse) -> Dict[str, Any]:
+        """Record a 304 and return the stored body."""
+        with self._lock:
+            self.not_modified += 1
+        return stored.data
+    
+    def store(self, key: Hashable, response_headers: Mapping[str, str], data: Dict[str, Any]) -> None:
+        """
+        Remember a 200 response if it carries validators.
+        
+        Args:
+            key: Store key of the request
+            response_headers: Response headers (case-insensitive mapping)
+            data: Decoded response body
+        """
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        with self._lock:
+            self.modified += 1
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = StoredResponse(etag, last_modified, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Forget every stored response."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
\ No newline at end of file
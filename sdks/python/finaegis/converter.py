@@ -0,0 +1,332 @@
+"""
+Offline currency conversion for the FinAegis SDK
+
+Loads the full exchange rate table once and converts amounts in-process instead
+of calling ``/exchange-rates/{from}/{to}/convert`` per amount. Every pair,
+including cross rates with no direct quote (e.g. EUR to JPY via USD), is
+resolved up front into a dense rate matrix. Converting a batch is then a single
+vectorized multiply, using NumPy when it is installed.
+
+Amounts are integer minor units, as on the server. Results are rounded half
+away from zero, the same way the server's ``/convert`` endpoint rounds.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .exceptions import NotFoundError, StaleRatesError
+from .types import ExchangeRate
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+Codes = Union[str, Sequence[str]]
+
+
+@dataclass
+class ConversionMismatch:
+    """A sample whose local result differs from the server beyond tolerance."""
+    from_asset: str
+    to_asset: str
+    amount: int
+    local_amount: int
+    server_amount: int
+    
+    @property
+    def difference(self) -> int:
+        """Local minus server result, in minor units."""
+        return self.local_amount - self.server_amount
+
+
+def _round_half_away(value: float) -> int:
+    """Round like PHP's round(): halves go away from zero."""
+    return int(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+def _timestamp(value: datetime) -> float:
+    """POSIX timestamp of a rate update, treating naive datetimes as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class CurrencyConverter:
+    """
+    In-process converter backed by a precomputed cross-rate matrix.
+    
+    Example:
+        >>> converter = client.exchange_rates.converter(max_age=timedelta(minutes=5))
+        >>> converter.convert('EUR', 'JPY', 10_000)
+        1623400
+        >>> converter.convert_many(['USD', 'EUR', 'GBP'], 'EUR', [100, 250, 990])
+        array([  92,  250, 1155])
+    """
+    
+    def __init__(
+        self,
+        rates: Iterable[ExchangeRate],
+        max_age: Union[float, timedelta, None] = None,
+        tolerance: int = 1,
+        loader: Optional[Callable[[], Iterable[ExchangeRate]]] = None
+    ):
+        """
+        Args:
+            rates: Exchange rates to build the matrix from
+            max_age: Refuse to convert with a rate older than this many
+                seconds (or timedelta), measured from ``last_updated``. A cross
+                rate is as old as the oldest rate on its path.
+            tolerance: Maximum difference, in minor units, accepted by
+                :meth:`verify` between local and server results
+            loader: Callable returning a fresh rate table; when set, stale
+                rates trigger one reload before StaleRatesError is raised
+        """
+        if isinstance(max_age, timedelta):
+            max_age = max_age.total_seconds()
+        self.max_age = max_age
+        self.tolerance = tolerance
+        self.loader = loader
+        self.load(rates)
+    
+    def load(self, rates: Iterable[ExchangeRate]) -> None:
+        """
+        Rebuild the rate matrix from a rate table.
+        
+        Quoted pairs use their quoted rate; the reverse of a quoted pair uses
+        its inverse unless it is quoted too. Every other pair is derived from
+        the path with the fewest hops.
+        
+        Args:
+            rates: Exchange rates to build the matrix from
+        """
+        direct: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        for rate in rates:
+            value = float(rate.rate)
+            if value > 0:
+                direct[(rate.from_asset, rate.to_asset)] = (value, _timestamp(rate.last_updated))
+                
+        codes = sorted({code for pair in direct for code in pair})
+        index = {code: i for i, code in enumerate(codes)}
+        size = len(codes)
+        
+        edges: List[Dict[int, Tuple[float, float]]] = [{} for _ in range(size)]
+        for (source, target), (value, updated) in direct.items():
+            i, j = index[source], index[target]
+            edges[i][j] = (value, updated)
+            if (target, source) not in direct:
+                edges[j][i] = (1.0 / value, updated)
+                
+        matrix = [[math.nan] * size for _ in range(size)]
+        updated_at = [[-math.inf] * size for _ in range(size)]
+        for start in range(size):
+            matrix[start][start] = 1.0
+            updated_at[start][start] = math.inf
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                for target, (value, updated) in edges[current].items():
+                    if math.isnan(matrix[start][target]):
+                        matrix[start][target] = matrix[start][current] * value
+                        updated_at[start][target] = min(updated_at[start][current], updated)
+                        queue.append(target)
+                        
+        self.codes = codes
+        self._index = index
+        if np is not None:
+            self._matrix = np.array(matrix, dtype=np.float64).reshape(size, size)
+            self._updated_at = np.array(updated_at, dtype=np.float64).reshape(size, size)
+        else:
+            self._matrix = matrix
+            self._updated_at = updated_at
+    
+    def reload(self) -> None:
+        """Rebuild the rate matrix from the loader."""
+        if self.loader is None:
+            raise StaleRatesError("No rate loader configured; call load() with fresh rates.")
+        self.load(self.loader())
+    
+    def _position(self, code: str) -> int:
+        try:
+            return self._index[code]
+        except KeyError:
+            raise NotFoundError(f"No exchange rate available for asset {code}") from None
+    
+    def _lookup(self, from_asset: str, to_asset: str) -> Tuple[float, float]:
+        i, j = self._position(from_asset), self._position(to_asset)
+        value = float(self._matrix[i][j])
+        if math.isnan(value):
+            raise NotFoundError(f"No exchange rate path from {from_asset} to {to_asset}")
+        return value, float(self._updated_at[i][j])
+    
+    def _is_stale(self, oldest: float) -> bool:
+        if self.max_age is None:
+            return False
+        now = datetime.now(timezone.utc).timestamp()
+        return now - oldest > self.max_age
+    
+    def _stale_error(self, description: str) -> StaleRatesError:
+        return StaleRatesError(f"Exchange rate for {description} is older than {self.max_age} seconds")
+    
+    def rate(self, from_asset: str, to_asset: str) -> float:
+        """
+        Get the direct or derived rate between two assets.
+        
+        Args:
+            from_asset: Source asset code
+            to_asset: Target asset code
+            
+        Returns:
+            Units of to_asset per unit of from_asset
+            
+        Raises:
+            NotFoundError: If no rate path connects the assets
+            StaleRatesError: If the rate is older than max_age
+        """
+        value, oldest = self._lookup(from_asset, to_asset)
+        if self._is_stale(oldest):
+            if self.loader is None:
+                raise self._stale_error(f'{from_asset}/{to_asset}')
+            self.reload()
+            value, oldest = self._lookup(from_asset, to_asset)
+            if self._is_stale(oldest):
+                raise self._stale_error(f'{from_asset}/{to_asset}')
+        return value
+    
+    def convert(self, from_asset: str, to_asset: str, amount: int) -> int:
+        """
+        Convert an amount in minor units.
+        
+        Args:
+            from_asset: Source asset code
+            to_asset: Target asset code
+            amount: Amount in minor units of from_asset
+            
+        Returns:
+            Amount in minor units of to_asset
+        """
+        return _round_half_away(amount * self.rate(from_asset, to_asset))
+    
+    def convert_many(self, from_asset: Codes, to_asset: Codes, amounts: Sequence[int]) -> Any:
+        """
+        Convert a batch of amounts in one vectorized call.
+        
+        Either asset argument may be a single code applied to every amount or
+        a sequence of codes aligned with amounts, e.g. to value a ledger of
+        mixed currencies in one reporting currency.
+        
+        Args:
+            from_asset: Source asset code, or one code per amount
+            to_asset: Target asset code, or one code per amount
+            amounts: Amounts in minor units
+            
+        Returns:
+            Converted amounts in minor units, as an int64 NumPy array when
+            NumPy is installed and a list of ints otherwise
+            
+        Raises:
+            NotFoundError: If any pair has no rate path
+            StaleRatesError: If any rate used is older than max_age
+        """
+        count = len(amounts)
+        sources, targets = self._positions(from_asset, count), self._positions(to_asset, count)
+        if self._is_stale(self._oldest(sources, targets)):
+            if self.loader is None:
+                raise self._stale_error('one or more pairs')
+            self.reload()
+            sources, targets = self._positions(from_asset, count), self._positions(to_asset, count)
+            if self._is_stale(self._oldest(sources, targets)):
+                raise self._stale_error('one or more pairs')
+                
+        if np is None:
+            rates = [self._matrix[i][j] for i, j in zip(sources, targets)]
+            missing = next((n for n, value in enumerate(rates) if math.isnan(value)), None)
+        else:
+            rates = self._matrix[sources, targets]
+            gaps = np.flatnonzero(np.isnan(rates))
+            missing = int(gaps[0]) if len(gaps) else None
+        if missing is not None:
+            raise NotFoundError(
+                f"No exchange rate path from {self.codes[sources[missing]]} to {self.codes[targets[missing]]}"
+            )
+            
+        if np is None:
+            return [_round_half_away(amount * value) for amount, value in zip(amounts, rates)]
+        values = np.asarray(amounts, dtype=np.float64) * rates
+        return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(np.int64)
+    
+    def _positions(self, codes: Codes, count: int) -> Any:
+        """Matrix positions for one code or a sequence of codes."""
+        if isinstance(codes, str):
+            position = self._position(codes)
+            return [position] * count if np is None else np.full(count, position, dtype=np.intp)
+        if len(codes) != count:
+            raise ValueError("Asset code sequences must have one entry per amount")
+        if np is None:
+            return [self._position(code) for code in codes]
+        unique, inverse = np.unique(np.asarray(codes, dtype=str), return_inverse=True)
+        lookup = np.array([self._position(str(code)) for code in unique], dtype=np.intp)
+        return lookup[inverse.reshape(-1)]
+    
+    def _oldest(self, sources: Any, targets: Any) -> float:
+        """Timestamp of the oldest rate used by a batch of pairs."""
+        if not len(sources):
+            return math.inf
+        if np is None:
+            return min(self._updated_at[i][j] for i, j in zip(sources, targets))
+        return float(self._updated_at[sources, targets].min())
+    
+    def _mismatch(self, sample: Tuple[str, str, int], server: Dict[str, Any]) -> Optional[ConversionMismatch]:
+        from_asset, to_asset, amount = sample
+        local = self.convert(from_asset, to_asset, amount)
+        remote = int(server['to_amount'])
+        if abs(local - remote) <= self.tolerance:
+            return None
+        return ConversionMismatch(from_asset, to_asset, amount, local, remote)
+    
+    def verify(self, exchange_rates: Any, samples: Iterable[Tuple[str, str, int]]) -> List[ConversionMismatch]:
+        """
+        Compare local conversions with the server's ``/convert`` endpoint.
+        
+        Args:
+            exchange_rates: ExchangeRatesResource to query, e.g.
+                ``client.exchange_rates``
+            samples: ``(from_asset, to_asset, amount)`` tuples to check
+            
+        Returns:
+            Samples differing by more than ``tolerance`` minor units; an empty
+            list means the converter agrees with the server
+        """
+        mismatches = []
+        for sample in samples:
+            from_asset, to_asset, amount = sample
+            mismatch = self._mismatch(sample, exchange_rates.convert(from_asset, to_asset, amount))
+            if mismatch is not None:
+                mismatches.append(mismatch)
+        return mismatches
+    
+    async def averify(
+        self,
+        exchange_rates: Any,
+        samples: Iterable[Tuple[str, str, int]]
+    ) -> List[ConversionMismatch]:
+        """
+        Compare local conversions with the server's ``/convert`` endpoint (asyncio).
+        
+        Args:
+            exchange_rates: AsyncExchangeRatesResource to query
+            samples: ``(from_asset, to_asset, amount)`` tuples to check
+            
+        Returns:
+            Samples differing by more than ``tolerance`` minor units
+        """
+        mismatches = []
+        for sample in samples:
+            from_asset, to_asset, amount = sample
+            mismatch = self._mismatch(sample, await exchange_rates.convert(from_asset, to_asset, amount))
+            if mismatch is not None:
+                mismatches.append(mismatch)
+        return mismatches
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+Call deadlines and retry budgets for the FinAegis SDK
+
+Without a deadline, a call may take up to ``timeout`` per attempt plus backoff
+between ``max_retries`` retries, which for the defaults is more than two
+minutes. A deadline bounds the whole call instead: every attempt's timeout is
+cut to the time left, no retry is started whose backoff would end past the
+deadline, and a call that runs out of time raises DeadlineExceededError.
+
+Deadlines come from the client (``FinAegis(deadline=2.0)`` bounds every call)
+or from the caller's context, so a request handler can bound all the SDK calls
+it makes, however deep, without passing arguments through:
+    
+    >>> with deadline(1.5):
+    ...     account = client.accounts.get(uuid)
+    ...     balances = client.accounts.get_balances(uuid)
+
+The context is a contextvar, so it follows the current thread and asyncio
+task. Nested deadlines can only shorten the outer one.
+
+A RetryBudget caps retries at a fraction of the calls a client makes. When a
+dependency fails, every call would otherwise retry up to ``max_retries``
+times and multiply the load on a server that is already struggling; with a
+budget, retries beyond the allowance fail immediately with the last error.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from .exceptions import DeadlineExceededError
+
+# Absolute time.monotonic() by which calls in the current context must finish
+_deadline: 'ContextVar[Optional[float]]' = ContextVar('finaegis_deadline', default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bound every SDK call made in this block to finish within seconds from now.
+    
+    Args:
+        seconds: Time budget of the block, retries and backoff included
+        
+    Yields:
+        The absolute deadline, on the time.monotonic() clock
+    """
+    expires = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires = min(expires, outer)
+    token = _deadline.set(expires)
+    try:
+        yield expires
+    finally:
+        _deadline.reset(token)
+
+
+def call_deadline(default: Optional[float] = None) -> Optional[float]:
+    """
+    Deadline of a call starting now.
+    
+    Args:
+        default: Client default budget in seconds, if any
+        
+    Returns:
+        The earlier of the context deadline and now + default, on the
+        time.monotonic() clock, or None when neither is set
+    """
+    expires = _deadline.get()
+    if default is not None:
+        own = time.monotonic() + default
+        expires = own if expires is None else min(expires, own)
+    return expires
+
+
+def time_left(expires: float, path: str) -> float:
+    """
+    Seconds left before a deadline.
+    
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    left = expires - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceededError(f'Deadline exceeded before {path} could complete')
+    return left
+
+
+@dataclass
+class RetryBudgetStats:
+    """Counters of a RetryBudget over its lifetime."""
+    calls: int = 0
+    retries: int = 0
+    refused: int = 0
+
+
+class RetryBudget:
+    """
+    Allowance of retries relative to recent traffic, shared by all calls of a client.
+    
+    Over a sliding window, retries are allowed while they stay below
+    ``ratio`` times the calls made plus a floor of ``min_per_second`` per
+    second, so low-traffic clients can still retry. Safe to share between
+    threads, tasks and clients.
+    
+    Example:
+        >>> client = FinAegis(api_key='...', retry_budget=RetryBudget(ratio=0.1))
+    """
+    
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 5.0, window: int = 10):
+        """
+        Args:
+            ratio: Retries allowed per call, e.g. 0.1 for 10% of traffic
+            min_per_second: Retries always allowed per second of the window
+            window: Length of the sliding window in seconds
+        """
+        if ratio < 0 or min_per_second < 0 or window < 1:
+            raise ValueError('ratio and min_per_second must be >= 0 and window >= 1')
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = int(window)
+        self.stats = RetryBudgetStats()
+        self._lock = threading.Lock()
+        # One (second, calls, retries) slot per second of the window
+        self._seconds: List[int] = [0] * self.window
+        self._calls: List[int] = [0] * self.window
+        self._retries: List[int] = [0] * self.window
+    
+    def _slot(self, now: float) -> int:
+        second = int(now)
+        slot = second % self.window
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._calls[slot] = self._retries[slot] = 0
+        return slot
+    
+    def _totals(self, now: float) -> Tuple[int, int]:
+        oldest = int(now) - self.window
+        calls = retries = 0
+        for second, slot_calls, slot_retries in zip(self._seconds, self._calls, self._retries):
+            if second > oldest:
+                calls += slot_calls
+                retries += slot_retries
+        return calls, retries
+    
+    def record_call(self) -> None:
+        """Count a call (its first attempt) toward the allowance."""
+        with self._lock:
+            self._calls[self._slot(time.monotonic())] += 1
+            self.stats.calls += 1
+    
+    def try_retry(self) -> bool:
+        """Take one retry from the allowance; False when it is spent."""
+        with self._lock:
+            now = time.monotonic()
+            slot = self._slot(now)
+            calls, retries = self._totals(now)
+            if retries + 1 > calls * self.ratio + self.min_per_second * self.window:
+                self.stats.refused += 1
+                return False
+            self._retries[slot] += 1
+            self.stats.retries += 1
+            return True
+
+
+def retry_allowed(delay: float, expires: Optional[float], budget: Optional[RetryBudget]) -> bool:
+    """
+    Whether a call may retry after waiting delay seconds.
+    
+    A retry must start before the deadline and is taken from the budget,
+    which is only charged when the deadline allows the retry.
+    """
+    if expires is not None and time.monotonic() + delay >= expires:
+        return False
+    return budget is None or budget.try_retry()
\ No newline at end of file
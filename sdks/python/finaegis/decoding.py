@@ -0,0 +1,267 @@
+"""
+JSON decoding for the FinAegis SDK
+
+Response bodies are decoded by a pluggable decoder: ``orjson`` when it is
+installed, the standard library otherwise, or any callable taking bytes.
+
+For large list pages there is also an incremental mode. ArrayStreamParser is
+fed the body chunk by chunk as it comes off the socket and returns each item of
+the ``data`` array as soon as it is complete, so callers can start processing a
+page before it has fully arrived. The other top-level fields (``meta``,
+``links``) are collected into an envelope available once the body ends.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+JSONDecoder = Callable[[bytes], Any]
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_scan = json.JSONDecoder().raw_decode
+
+# Parser states
+_START, _KEY, _VALUE, _ITEMS, _END = range(5)
+
+
+def get_decoder(decoder: Union[str, JSONDecoder, None] = None) -> JSONDecoder:
+    """
+    Resolve the JSON decoder to use for response bodies.
+    
+    Args:
+        decoder: A callable taking bytes, ``'orjson'``, ``'json'``, or None
+            for orjson when installed and the standard library otherwise
+            
+    Returns:
+        Callable decoding a response body
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == 'orjson' or (decoder is None and orjson is not None):
+        if orjson is None:
+            raise ImportError("orjson is not installed. Install it with: pip install finaegis[speedups]")
+        return orjson.loads
+    if decoder in (None, 'json'):
+        return json.loads
+    raise ValueError(f"Unknown JSON decoder: {decoder!r}")
+
+
+class ArrayStreamParser:
+    """
+    Incremental parser yielding the items of one top-level array.
+    
+    Example:
+        >>> parser = ArrayStreamParser('data')
+        >>> parser.feed(b'{"data": [{"id": 1}, {"id"')
+        [{'id': 1}]
+        >>> parser.feed(b': 2}], "meta": {"total": 2}}')
+        [{'id': 2}]
+        >>> parser.close()
+        {'data': [], 'meta': {'total': 2}}
+    """
+    
+    def __init__(self, key: str = 'data'):
+        """
+        Args:
+            key: Top-level key of the array to stream
+        """
+        self.key = key
+        self.envelope: Dict[str, Any] = {}
+        self._text = ''
+        self._state = _START
+        self._member: Optional[str] = None
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+    
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Add the next chunk of the body.
+        
+        Args:
+            chunk: Raw bytes as received
+            
+        Returns:
+            Array items completed by this chunk, in order
+        """
+        self._text += self._utf8.decode(chunk)
+        return self._advance()
+    
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish parsing.
+        
+        Returns:
+            The top-level object without the streamed items
+            
+        Raises:
+            ValueError: If the body was truncated or is not a JSON object
+        """
+        self._text += self._utf8.decode(b'', final=True)
+        self._advance()
+        if self._state != _END:
+            raise ValueError("Truncated or malformed JSON response body")
+        return self.envelope
+    
+    def _value(self, pos: int) -> Optional[tuple]:
+        """Decode the complete value at pos, or None if more input is needed."""
+        text = self._text
+        try:
+            value, end = _scan(text, pos)
+        except ValueError:
+            return None
+        # A number at the very end of the buffer may continue in the next chunk
+        if end == len(text) and text[pos] not in '{["':
+            return None
+        return value, end
+    
+    def _advance(self) -> List[Any]:
+        items: List[Any] = []
+        text = self._text
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos >= len(text):
+                break
+            char = text[pos]
+            if self._state == _ITEMS:
+                if char == ',':
+                    pos += 1
+                elif char == ']':
+                    pos += 1
+                    self._state = _KEY
+                else:
+                    decoded = self._value(pos)
+                    if decoded is None:
+                        break
+                    items.append(decoded[0])
+                    pos = decoded[1]
+            elif self._state == _KEY:
+                if char == ',':
+                    pos += 1
+                    continue
+                if char == '}':
+                    pos += 1
+                    self._state = _END
+                    continue
+                decoded = self._value(pos)
+                if decoded is None:
+                    break
+                key, end = decoded
+                colon = _WHITESPACE.match(text, end).end()
+                start = _WHITESPACE.match(text, colon + 1).end()
+                if start >= len(text):
+                    break
+                if not isinstance(key, str) or text[colon] != ':':
+                    raise ValueError("Malformed JSON response body")
+                if key == self.key and text[start] == '[':
+                    self.envelope[key] = []
+                    self._state = _ITEMS
+                    pos = start + 1
+                else:
+                    self._member = key
+                    self._state = _VALUE
+                    pos = start
+            elif self._state == _VALUE:
+                decoded = self._value(pos)
+                if decoded is None:
+                    break
+                self.envelope[self._member] = decoded[0]
+                self._state = _KEY
+                pos = decoded[1]
+            elif self._state == _START:
+                if char != '{':
+                    raise ValueError("Expected a JSON object response body")
+                pos += 1
+                self._state = _KEY
+            else:
+                raise ValueError("Unexpected data after JSON response body")
+        self._text = text[pos:]
+        return items
+
+
+class StreamedPage:
+    """
+    Items of a list response, parsed as the body streams in.
+    
+    Iterate to receive the raw item dicts; once iteration finishes,
+    ``envelope`` holds the remaining top-level fields such as ``meta``. Use
+    as a context manager so the connection is released even if iteration
+    stops early.
+    """
+    
+    def __init__(
+        self,
+        chunks: Iterator[bytes],
+        key: str = 'data',
+        on_close: Optional[Callable[[], None]] = None
+    ):
+        """
+        Args:
+            chunks: Body chunks as received from the socket
+            key: Top-level key of the streamed array
+            on_close: Called once to release the underlying response
+        """
+        self.envelope: Optional[Dict[str, Any]] = None
+        self._chunks = chunks
+        self._parser = ArrayStreamParser(key)
+        self._on_close = on_close
+    
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            for chunk in self._chunks:
+                yield from self._parser.feed(chunk)
+            self.envelope = self._parser.close()
+        finally:
+            self.close()
+    
+    def close(self) -> None:
+        """Release the underlying response."""
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+    
+    def __enter__(self) -> 'StreamedPage':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AsyncStreamedPage:
+    """Asyncio counterpart of :class:`StreamedPage`."""
+    
+    def __init__(self, chunks: AsyncIterator[bytes], key: str = 'data'):
+        """
+        Args:
+            chunks: Async iterator of body chunks; closed when the page is
+            key: Top-level key of the streamed array
+        """
+        self.envelope: Optional[Dict[str, Any]] = None
+        self._chunks = chunks
+        self._parser = ArrayStreamParser(key)
+    
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        try:
+            async for chunk in self._chunks:
+                for item in self._parser.feed(chunk):
+                    yield item
+            self.envelope = self._parser.close()
+        finally:
+            await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Release the underlying response."""
+        aclose = getattr(self._chunks, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+    
+    async def __aenter__(self) -> 'AsyncStreamedPage':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
\ No newline at end of file
@@ -2,8 +2,10 @@
 FinAegis SDK Exceptions
 """
 
-from typing import Optional, Dict, Any
-import requests
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+if TYPE_CHECKING:
+    import requests
 
 
 class FinAegisError(Exception):
@@ -53,7 +55,31 @@ class ServerError(FinAegisError):
     pass
 
 
-def handle_response_error(response: requests.Response) -> None:
+class StaleRatesError(FinAegisError):
+    """Raised when offline conversion would use exchange rates older than allowed."""
+    pass
+
+
+class InvalidSignatureError(FinAegisError):
+    """Raised when a webhook delivery's signature does not match its body."""
+    pass
+
+
+class DeadlineExceededError(FinAegisError):
+    """Raised when a call cannot complete before its deadline."""
+    pass
+
+
+class CircuitOpenError(FinAegisError):
+    """Raised without calling the API while the circuit breaker of an endpoint is open."""
+    
+    def __init__(self, message: str, endpoint: str, retry_after: float):
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+def handle_response_error(response: 'requests.Response') -> None:
     """
     Handle API response errors and raise appropriate exceptions.
     
@@ -70,8 +96,27 @@ def handle_response_error(response: requests.Response) -> None:
         error_data = {}
         message = response.reason or f"HTTP {response.status_code} error"
     
-    status_code = response.status_code
+    raise_for_status_code(response.status_code, message, error_data)
+
+
+def raise_for_status_code(
+    status_code: int,
+    message: Optional[str],
+    error_data: Dict[str, Any]
+) -> None:
+    """
+    Raise the exception matching an API error status code.
+    
+    Shared by the sync and async clients so both map errors identically.
     
+    Args:
+        status_code: HTTP status code of the response
+        message: Error message from the response body or reason phrase
+        error_data: Decoded error response body
+        
+    Raises:
+        FinAegisError: Appropriate error based on status code
+    """
     if status_code == 401:
         raise AuthenticationError(
             message="Authentication failed. Check your API key.",
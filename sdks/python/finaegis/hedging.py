@@ -0,0 +1,240 @@
+"""
+Hedged requests for the FinAegis SDK
+
+The tail latency of reads such as account balances, exchange rates and the GCU
+composition is set by the occasional slow backend response rather than by the
+typical one. With hedging, a call that has not been answered after the
+``percentile`` latency of its endpoint (p95 by default) sends a second,
+identical request, and the call returns whichever answer arrives first. Only
+about ``1 - percentile`` of calls are hedged, so the extra load stays small
+while the slowest responses stop setting the p99.
+
+Hedging applies to GETs only, which are idempotent, and by default only to the
+endpoints in DEFAULT_HEDGED_ENDPOINTS. The delay is learned per endpoint from
+recent latencies; until ``min_samples`` calls have been seen, calls are not
+hedged unless a fixed ``delay`` is configured.
+
+A sync client runs both requests of a hedged call on a thread pool, and the
+losing request finishes in the background; an async client cancels it.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Awaitable, Callable, Deque, Dict, Iterable, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Endpoint names (see circuit.endpoint_name) hedged unless configured otherwise
+DEFAULT_HEDGED_ENDPOINTS = (
+    'GET /accounts/{uuid}/balances',
+    'GET /exchange-rates/{from}/{to}',
+    'GET /gcu/composition',
+)
+
+
+def _matches(name: str, pattern: str) -> bool:
+    """Match an endpoint name against a pattern one path segment at a time."""
+    segments, pattern_segments = name.split('/'), pattern.split('/')
+    return len(segments) == len(pattern_segments) and all(
+        fnmatchcase(segment, part) for segment, part in zip(segments, pattern_segments)
+    )
+
+
+@dataclass
+class HedgeStats:
+    """Counters of a HedgePolicy over its lifetime."""
+    calls: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of calls that sent a second request."""
+        return self.hedged / self.calls if self.calls else 0.0
+
+
+class HedgePolicy:
+    """
+    Which calls to hedge and after how long, shared by every call of a client.
+    
+    Example:
+        >>> client = FinAegis(api_key='...', hedge=HedgePolicy(percentile=0.9))
+        >>> client.accounts.get_balances(uuid)
+        >>> client.hedge_policy.stats.hedge_rate
+        0.1
+    """
+    
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        endpoints: Iterable[str] = DEFAULT_HEDGED_ENDPOINTS,
+        delay: Optional[float] = None,
+        min_delay: float = 0.005,
+        min_samples: int = 20,
+        window: int = 500,
+        max_workers: int = 32,
+    ):
+        """
+        Args:
+            percentile: Latency percentile of an endpoint after which a call is hedged
+            endpoints: Endpoint names to hedge, e.g. ``'GET /accounts/{uuid}/balances'``,
+                or patterns whose wildcards match within a single path segment,
+                e.g. ``'GET /accounts/*'``
+            delay: Fixed hedge delay in seconds instead of the learned percentile
+            min_delay: Lower bound of the learned delay
+            min_samples: Latencies needed before an endpoint is hedged
+            window: Recent latencies kept per endpoint
+            max_workers: Threads running the requests of hedged calls on a sync client
+        """
+        if not 0 < percentile < 1:
+            raise ValueError('percentile must be between 0 and 1')
+        self.percentile = percentile
+        self.endpoints = tuple(endpoints)
+        self.delay = delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_workers = max_workers
+        self.stats = HedgeStats()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def applies(self, name: str) -> bool:
+        """Whether calls to an endpoint are hedged."""
+        return name.startswith('GET ') and any(_matches(name, pattern) for pattern in self.endpoints)
+    
+    def observe(self, name: str, seconds: float) -> None:
+        """Record the latency of a successful request to an endpoint."""
+        with self._lock:
+            latencies = self._latencies.get(name)
+            if latencies is None:
+                latencies = self._latencies[name] = deque(maxlen=self.window)
+            latencies.append(seconds)
+    
+    def delay_for(self, name: str) -> Optional[float]:
+        """Seconds after which a call to an endpoint is hedged; None while there are too few samples."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            latencies = sorted(self._latencies.get(name, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        index = min(len(latencies) - 1, int(self.percentile * len(latencies)))
+        return max(self.min_delay, latencies[index])
+    
+    def _timed(self, name: str, func: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        result = func()
+        self.observe(name, time.perf_counter() - start)
+        return result
+    
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='finaegis-hedge')
+            return self._executor
+    
+    def _submit(self, name: str, func: Callable[[], T]) -> 'Future[T]':
+        # Each request runs in a copy of the caller's context, so deadlines apply
+        return self._get_executor().submit(contextvars.copy_context().run, self._timed, name, func)
+    
+    def hedge(self, name: str, func: Callable[[], T]) -> T:
+        """
+        Call func, calling it a second time if the first call is slow.
+        
+        Args:
+            name: Endpoint name, used to learn its latency
+            func: Zero-argument callable sending the request
+            
+        Returns:
+            The result of whichever call succeeded first
+            
+        Raises:
+            Exception: What the first call raised, if neither succeeded
+        """
+        self._count('calls')
+        delay = self.delay_for(name)
+        if delay is None:
+            return self._timed(name, func)
+        
+        primary = self._submit(name, func)
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+        hedge = self._submit(name, func)
+        self._count('hedged')
+        
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: f is hedge):
+                if future.exception() is None:
+                    if future is hedge:
+                        self._count('hedge_wins')
+                    return future.result()
+        return primary.result()
+    
+    async def async_hedge(self, name: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await func(), awaiting it a second time if the first call is slow.
+        
+        The losing request is cancelled.
+        
+        Args:
+            name: Endpoint name, used to learn its latency
+            func: Zero-argument coroutine function sending the request
+            
+        Returns:
+            The result of whichever call succeeded first
+            
+        Raises:
+            Exception: What the first call raised, if neither succeeded
+        """
+        async def timed() -> T:
+            start = time.perf_counter()
+            result = await func()
+            self.observe(name, time.perf_counter() - start)
+            return result
+            
+        self._count('calls')
+        delay = self.delay_for(name)
+        if delay is None:
+            return await timed()
+        
+        primary = asyncio.ensure_future(timed())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+            hedge = asyncio.ensure_future(timed())
+            self._count('hedged')
+            pending.add(hedge)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: t is hedge):
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._count('hedge_wins')
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def close(self) -> None:
+        """Shut down the thread pool of sync hedged calls, if one was started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
\ No newline at end of file
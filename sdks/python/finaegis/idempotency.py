@@ -0,0 +1,48 @@
+"""
+Idempotency keys for FinAegis write requests
+
+The API deduplicates POST/PUT/PATCH requests carrying the same
+``Idempotency-Key`` header, replaying the original response instead of
+executing the write again. The SDK sends one key per logical write and reuses
+it for every retry of that write, so retries never move money twice.
+"""
+
+import uuid
+from typing import Dict, Optional
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENT_METHODS = frozenset(['POST', 'PUT', 'PATCH'])
+
+
+def new_idempotency_key() -> str:
+    """Generate a fresh idempotency key."""
+    return str(uuid.uuid4())
+
+
+def with_idempotency_key(
+    method: str,
+    headers: Optional[Dict[str, str]],
+    idempotency_key: Optional[str] = None
+) -> Optional[Dict[str, str]]:
+    """
+    Return request headers carrying an idempotency key for write methods.
+    
+    An explicit key wins, then a key already present in ``headers``; otherwise
+    a new key is generated. Headers of other methods are returned unchanged.
+    
+    Args:
+        method: HTTP method of the request
+        headers: Caller-supplied request headers
+        idempotency_key: Key to send, if chosen by the caller
+        
+    Returns:
+        Headers to send with the request
+    """
+    if method.upper() not in IDEMPOTENT_METHODS:
+        return headers
+    headers = dict(headers or {})
+    if idempotency_key is not None:
+        headers[IDEMPOTENCY_HEADER] = idempotency_key
+    elif not any(name.lower() == IDEMPOTENCY_HEADER.lower() for name in headers):
+        headers[IDEMPOTENCY_HEADER] = new_idempotency_key()
+    return headers
\ No newline at end of file
@@ -0,0 +1,523 @@
+"""
+Request instrumentation for the FinAegis SDK
+
+When a client is created with ``instrumentation=True`` (or an
+:class:`Instrumentation` instance), every API call is timed and reported to a
+list of hooks. The built-in :class:`MetricsRecorder` keeps latency histograms
+per method and path template (``GET /accounts/{uuid}/balances``), splits each
+call into connection-pool wait, network and JSON decode time, and counts
+retries, status codes and bytes transferred. Exporters forward the same
+measurements to Prometheus or OpenTelemetry when those packages are installed.
+
+Clients without instrumentation skip all of this; the request path only checks
+a single attribute.
+"""
+
+import re
+import threading
+import time
+import warnings
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover - exercised only without prometheus_client
+    prometheus_client = None
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover - exercised only without opentelemetry
+    otel_metrics = None
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0, float('inf'),
+)
+
+# Collection -> names of the path parameters that follow it
+_ROUTE_PARAMS: Dict[str, Tuple[str, ...]] = {
+    'accounts': ('uuid',),
+    'transfers': ('uuid',),
+    'transactions': ('id',),
+    'webhooks': ('id',),
+    'assets': ('code',),
+    'baskets': ('code',),
+    'exchange-rates': ('from', 'to'),
+}
+
+# Fixed sub-paths that sit where a collection expects a parameter
+_STATIC_SEGMENTS = frozenset(['refresh', 'events', 'compose', 'decompose'])
+
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$')
+
+
+@lru_cache(maxsize=4096)
+def path_template(path: str) -> str:
+    """
+    Replace the identifiers in an API path with named placeholders.
+    
+    Keeps metric labels low-cardinality: ``/accounts/7b1e.../balances``
+    becomes ``/accounts/{uuid}/balances``. Unknown paths fall back to
+    replacing numeric and UUID segments with ``{id}``.
+    
+    Args:
+        path: Request path, with or without a leading slash or query string
+        
+    Returns:
+        The path template
+    """
+    segments = [segment for segment in path.split('?', 1)[0].split('/') if segment]
+    template = []
+    params: Sequence[str] = ()
+    for segment in segments:
+        if params and segment not in _STATIC_SEGMENTS:
+            template.append('{' + params[0] + '}')
+            params = params[1:]
+            continue
+        params = _ROUTE_PARAMS.get(segment, ())
+        template.append('{id}' if _ID_SEGMENT.match(segment) else segment)
+    return '/' + '/'.join(template)
+
+
+@dataclass
+class RequestInfo:
+    """An API call about to be made, passed to ``before_request`` hooks."""
+    method: str
+    path: str
+    template: str
+    started_at: float = field(default_factory=time.perf_counter)
+    
+    @property
+    def endpoint(self) -> str:
+        """Metric key such as ``GET /accounts/{uuid}``."""
+        return f"{self.method} {self.template}"
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Measurements of one completed API call, passed to ``after_request`` hooks.
+    
+    ``duration`` is the wall time of the whole call, retries included.
+    ``decode_time`` is spent parsing the JSON body and ``network_time`` is
+    the rest, which includes ``pool_wait`` (time spent waiting for a pooled
+    connection or a concurrency slot) and any retry backoff.
+    """
+    method: str
+    path: str
+    template: str
+    status: Optional[int]
+    duration: float
+    decode_time: float = 0.0
+    pool_wait: float = 0.0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: Optional[BaseException] = None
+    
+    @property
+    def network_time(self) -> float:
+        """Time not spent decoding the response."""
+        return self.duration - self.decode_time
+    
+    @property
+    def endpoint(self) -> str:
+        """Metric key such as ``GET /accounts/{uuid}``."""
+        return f"{self.method} {self.template}"
+    
+    @property
+    def outcome(self) -> str:
+        """Status code, else the error class name, else ``'unknown'``."""
+        if self.status is not None:
+            return str(self.status)
+        if self.error is not None:
+            return type(self.error).__name__
+        return 'unknown'
+
+
+class RequestHook:
+    """
+    Interface for instrumentation hooks.
+    
+    Subclass and override either method. Both run on the thread (or event
+    loop) making the request, so they should be fast and must not block.
+    """
+    
+    def before_request(self, info: RequestInfo) -> None:
+        """Called before the request is sent."""
+    
+    def after_request(self, metrics: RequestMetrics) -> None:
+        """Called once the call has finished, successfully or not."""
+
+
+class _CallbackHook(RequestHook):
+    """Hook wrapping plain functions."""
+    
+    def __init__(
+        self,
+        before: Optional[Callable[[RequestInfo], None]],
+        after: Optional[Callable[[RequestMetrics], None]]
+    ):
+        self._before = before
+        self._after = after
+    
+    def before_request(self, info: RequestInfo) -> None:
+        if self._before is not None:
+            self._before(info)
+    
+    def after_request(self, metrics: RequestMetrics) -> None:
+        if self._after is not None:
+            self._after(metrics)
+
+
+class Histogram:
+    """
+    Thread-safe fixed-bucket histogram of durations in seconds.
+    
+    Quantiles are estimated by linear interpolation inside the bucket that
+    contains them, as Prometheus' ``histogram_quantile`` does.
+    """
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets: Increasing bucket upper bounds; the last should be inf
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float) -> None:
+        """Record one duration."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[min(index, len(self.counts) - 1)] += 1
+            self.count += 1
+            self.sum += value
+    
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values."""
+        return self.sum / self.count if self.count else 0.0
+    
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+        
+        Args:
+            q: Quantile between 0 and 1, e.g. 0.99
+            
+        Returns:
+            Estimated value in seconds, 0.0 when empty
+        """
+        with self._lock:
+            counts = list(self.counts)
+            total = self.count
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                if upper == float('inf'):
+                    return lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-2] if len(self.buckets) > 1 else 0.0
+    
+    def summary(self) -> Dict[str, float]:
+        """Count, mean and p50/p95/p99 estimates."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
+class EndpointStats:
+    """Metrics recorded for one method and path template."""
+    
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.network = Histogram(buckets)
+        self.decode = Histogram(buckets)
+        self.pool_wait = Histogram(buckets)
+        self.statuses: Dict[Optional[int], int] = {}
+        self.errors: Dict[str, int] = {}
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+    
+    def record(self, metrics: RequestMetrics) -> None:
+        self.latency.observe(metrics.duration)
+        self.network.observe(metrics.network_time)
+        self.decode.observe(metrics.decode_time)
+        self.pool_wait.observe(metrics.pool_wait)
+        with self._lock:
+            self.statuses[metrics.status] = self.statuses.get(metrics.status, 0) + 1
+            if metrics.error is not None:
+                name = type(metrics.error).__name__
+                self.errors[name] = self.errors.get(name, 0) + 1
+            self.retries += metrics.retries
+            self.bytes_sent += metrics.bytes_sent
+            self.bytes_received += metrics.bytes_received
+    
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {
+                'statuses': dict(self.statuses),
+                'errors': dict(self.errors),
+                'retries': self.retries,
+                'bytes_sent': self.bytes_sent,
+                'bytes_received': self.bytes_received,
+            }
+        return {
+            'latency': self.latency.summary(),
+            'network': self.network.summary(),
+            'decode': self.decode.summary(),
+            'pool_wait': self.pool_wait.summary(),
+            **counters,
+        }
+
+
+class MetricsRecorder(RequestHook):
+    """
+    In-process metrics, keyed by endpoint (``'GET /accounts/{uuid}'``).
+    
+    Example:
+        >>> client = FinAegis(api_key='...', instrumentation=True)
+        >>> client.accounts.list()
+        >>> client.instrumentation.metrics.snapshot()['GET /accounts']['latency']['p95']
+        0.084
+    """
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+    
+    def after_request(self, metrics: RequestMetrics) -> None:
+        stats = self.endpoints.get(metrics.endpoint)
+        if stats is None:
+            with self._lock:
+                stats = self.endpoints.setdefault(metrics.endpoint, EndpointStats(self.buckets))
+        stats.record(metrics)
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summaries of every endpoint seen so far.
+        
+        Returns:
+            Endpoint to a dict of histogram summaries (``latency``,
+            ``network``, ``decode``, ``pool_wait``) and counters
+            (``statuses``, ``errors``, ``retries``, ``bytes_sent``,
+            ``bytes_received``)
+        """
+        with self._lock:
+            endpoints = dict(self.endpoints)
+        return {endpoint: stats.summary() for endpoint, stats in sorted(endpoints.items())}
+    
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self.endpoints = {}
+
+
+class Instrumentation:
+    """
+    Dispatches request measurements to hooks.
+    
+    A :class:`MetricsRecorder` is installed by default and available as
+    ``metrics``. Hooks that raise are reported with a warning and do not
+    affect the request.
+    
+    Example:
+        >>> instrumentation = Instrumentation()
+        >>> instrumentation.add_hook(PrometheusExporter())
+        >>> client = FinAegis(api_key='...', instrumentation=instrumentation)
+    """
+    
+    def __init__(self, hooks: Sequence[RequestHook] = (), metrics: bool = True):
+        """
+        Args:
+            hooks: Additional hooks to call for every request
+            metrics: Install the built-in MetricsRecorder
+        """
+        self.metrics: Optional[MetricsRecorder] = MetricsRecorder() if metrics else None
+        self.hooks: List[RequestHook] = ([self.metrics] if self.metrics else []) + list(hooks)
+    
+    def add_hook(
+        self,
+        hook: Optional[RequestHook] = None,
+        before: Optional[Callable[[RequestInfo], None]] = None,
+        after: Optional[Callable[[RequestMetrics], None]] = None
+    ) -> RequestHook:
+        """
+        Register a hook object, or plain functions for either phase.
+        
+        Args:
+            hook: RequestHook instance
+            before: Function called with a RequestInfo before each request
+            after: Function called with RequestMetrics after each request
+            
+        Returns:
+            The registered hook, for :meth:`remove_hook`
+        """
+        if hook is None:
+            hook = _CallbackHook(before, after)
+        self.hooks.append(hook)
+        return hook
+    
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Unregister a hook."""
+        self.hooks.remove(hook)
+    
+    def start(self, method: str, path: str) -> RequestInfo:
+        """Create the RequestInfo for a call and run the ``before_request`` hooks."""
+        info = RequestInfo(method.upper(), path, path_template(path))
+        for hook in self.hooks:
+            try:
+                hook.before_request(info)
+            except Exception as error:
+                warnings.warn(f"Instrumentation hook {hook!r} failed: {error!r}", RuntimeWarning)
+        return info
+    
+    def finish(self, info: RequestInfo, status: Optional[int], **measurements: Any) -> RequestMetrics:
+        """
+        Build the RequestMetrics for a finished call and run the ``after_request`` hooks.
+        
+        Args:
+            info: Value returned by :meth:`start`
+            status: Final HTTP status, None if no response was received
+            **measurements: RequestMetrics fields such as ``decode_time``,
+                ``retries`` or ``error``
+                
+        Returns:
+            The reported RequestMetrics
+        """
+        metrics = RequestMetrics(
+            info.method,
+            info.path,
+            info.template,
+            status,
+            time.perf_counter() - info.started_at,
+            **measurements
+        )
+        for hook in self.hooks:
+            try:
+                hook.after_request(metrics)
+            except Exception as error:
+                warnings.warn(f"Instrumentation hook {hook!r} failed: {error!r}", RuntimeWarning)
+        return metrics
+
+
+class PrometheusExporter(RequestHook):
+    """
+    Export request metrics through ``prometheus_client``.
+    
+    Records ``finaegis_request_duration_seconds``,
+    ``finaegis_request_decode_seconds`` and
+    ``finaegis_request_pool_wait_seconds`` histograms, plus
+    ``finaegis_requests_total`` (by status), ``finaegis_request_retries_total``
+    and ``finaegis_response_bytes_total`` counters, all labelled by ``method``
+    and ``endpoint`` template.
+    """
+    
+    def __init__(self, registry: Any = None, namespace: str = 'finaegis', buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            registry: CollectorRegistry to register with (the default registry
+                when omitted)
+            namespace: Metric name prefix
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        if prometheus_client is None:
+            raise ImportError(
+                "PrometheusExporter requires prometheus_client. Install it with: pip install prometheus-client"
+            )
+        options: Dict[str, Any] = {'namespace': namespace, 'labelnames': ('method', 'endpoint')}
+        if registry is not None:
+            options['registry'] = registry
+        self.duration = prometheus_client.Histogram(
+            'request_duration_seconds', 'FinAegis API call duration', buckets=buckets, **options
+        )
+        self.decode = prometheus_client.Histogram(
+            'request_decode_seconds', 'FinAegis response decode time', buckets=buckets, **options
+        )
+        self.pool_wait = prometheus_client.Histogram(
+            'request_pool_wait_seconds', 'Time waiting for a pooled connection', buckets=buckets, **options
+        )
+        self.retries = prometheus_client.Counter('request_retries_total', 'FinAegis API retries', **options)
+        self.received = prometheus_client.Counter('response_bytes_total', 'FinAegis response bytes', **options)
+        options['labelnames'] = ('method', 'endpoint', 'status')
+        self.requests = prometheus_client.Counter('requests_total', 'FinAegis API calls', **options)
+    
+    def after_request(self, metrics: RequestMetrics) -> None:
+        labels = (metrics.method, metrics.template)
+        self.duration.labels(*labels).observe(metrics.duration)
+        self.decode.labels(*labels).observe(metrics.decode_time)
+        self.pool_wait.labels(*labels).observe(metrics.pool_wait)
+        if metrics.retries:
+            self.retries.labels(*labels).inc(metrics.retries)
+        if metrics.bytes_received:
+            self.received.labels(*labels).inc(metrics.bytes_received)
+        self.requests.labels(*labels, metrics.outcome).inc()
+
+
+class OpenTelemetryExporter(RequestHook):
+    """
+    Export request metrics through the OpenTelemetry metrics API.
+    
+    Records ``finaegis.client.duration``, ``finaegis.client.decode_time`` and
+    ``finaegis.client.pool_wait`` histograms (seconds) and
+    ``finaegis.client.retries`` and ``finaegis.client.response_size``
+    counters, with ``http.request.method``, ``http.route`` and
+    ``http.response.status_code`` attributes.
+    """
+    
+    def __init__(self, meter: Any = None):
+        """
+        Args:
+            meter: Meter to create instruments on (one from the global meter
+                provider when omitted)
+        """
+        if otel_metrics is None:
+            raise ImportError(
+                "OpenTelemetryExporter requires opentelemetry-api. Install it with: pip install opentelemetry-api"
+            )
+        meter = meter or otel_metrics.get_meter('finaegis')
+        self.duration = meter.create_histogram('finaegis.client.duration', unit='s')
+        self.decode = meter.create_histogram('finaegis.client.decode_time', unit='s')
+        self.pool_wait = meter.create_histogram('finaegis.client.pool_wait', unit='s')
+        self.retries = meter.create_counter('finaegis.client.retries')
+        self.received = meter.create_counter('finaegis.client.response_size', unit='By')
+    
+    def after_request(self, metrics: RequestMetrics) -> None:
+        attributes: Dict[str, Any] = {'http.request.method': metrics.method, 'http.route': metrics.template}
+        if metrics.status is not None:
+            attributes['http.response.status_code'] = metrics.status
+        if metrics.status is None:
+            attributes['error.type'] = metrics.outcome
+        elif metrics.error is not None:
+            attributes['error.type'] = type(metrics.error).__name__
+        self.duration.record(metrics.duration, attributes)
+        self.decode.record(metrics.decode_time, attributes)
+        self.pool_wait.record(metrics.pool_wait, attributes)
+        if metrics.retries:
+            self.retries.add(metrics.retries, attributes)
+        if metrics.bytes_received:
+            self.received.add(metrics.bytes_received, attributes)
\ No newline at end of file
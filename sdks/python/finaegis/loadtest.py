@@ -0,0 +1,540 @@
+"""
+Load generation for the FinAegis SDK
+
+Drives an API through a FinAegis (or AsyncFinAegis) client at a target request
+rate and reports what the SDK does under that load. Requests are issued
+open-loop: arrival times are fixed in advance from the rate, whether or not
+earlier requests have finished, and each latency is measured from the time its
+request was due. A client that falls behind therefore shows up as growing
+latency instead of a quietly lower rate.
+
+The operation mix is weighted, e.g. ``balances=40,transfer=20,rate=30,
+list_accounts=10``. The report gives p50/p95/p99/p99.9 latency overall and per
+operation, errors by exception class, retries, client CPU time per request,
+garbage collector pauses and, for the sync client, connections opened.
+
+Run from the command line against any base URL, or against a local
+:class:`~finaegis.testing.FakeServer` started in a separate process:
+    
+    python -m finaegis.loadtest --fake --rate 1000 --duration 30
+    python -m finaegis.loadtest --base-url https://sandbox.finaegis.org/api/v2 \\
+        --accounts acc-1,acc-2 --rate 200 --mix balances=80,rate=20
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import math
+import multiprocessing
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .instrumentation import Instrumentation, RequestMetrics
+
+if TYPE_CHECKING:
+    from .async_client import AsyncFinAegis
+    from .client import FinAegis
+
+QUANTILES: Tuple[float, ...] = (0.5, 0.95, 0.99, 0.999)
+
+RATE_PAIRS: Tuple[Tuple[str, str], ...] = (('EUR', 'USD'), ('USD', 'EUR'), ('GBP', 'USD'), ('USD', 'GCU'))
+
+
+@dataclass
+class Targets:
+    """Accounts and currency pairs the operations pick from."""
+    accounts: Sequence[str]
+    rate_pairs: Sequence[Tuple[str, str]] = RATE_PAIRS
+    amount: int = 1  # minor units moved per transfer
+    rng: random.Random = field(default_factory=random.Random)
+    
+    def account(self) -> str:
+        return self.rng.choice(self.accounts)
+    
+    def pair(self) -> Tuple[str, str]:
+        return tuple(self.rng.sample(self.accounts, 2))
+    
+    def rate_pair(self) -> Tuple[str, str]:
+        return self.rng.choice(self.rate_pairs)
+
+    def check(self, mix: Dict[str, float]) -> None:
+        """
+        Check there are enough accounts for every operation in ``mix``.
+        
+        Raises:
+            ValueError: If an operation needs more accounts than there are
+        """
+        for name in mix:
+            needed = ACCOUNTS_NEEDED.get(name, 0)
+            if len(self.accounts) < needed:
+                raise ValueError(
+                    f"{name!r} needs at least {needed} account{'s' if needed > 1 else ''}, "
+                    f'got {len(self.accounts)}'
+                )
+
+
+# Operation name -> call on a client; returns a coroutine for AsyncFinAegis
+OPERATIONS: Dict[str, Callable[[Any, Targets], Any]] = {
+    'balances': lambda client, targets: client.accounts.get_balances(targets.account()),
+    'transfer': lambda client, targets: client.transfers.create(*targets.pair(), targets.amount),
+    'rate': lambda client, targets: client.exchange_rates.get(*targets.rate_pair()),
+    'list_accounts': lambda client, targets: client.accounts.list(per_page=20),
+    'list_transactions': lambda client, targets: client.accounts.get_transactions(targets.account(), per_page=20),
+}
+
+# Operation name -> distinct accounts it draws from
+ACCOUNTS_NEEDED: Dict[str, int] = {'balances': 1, 'transfer': 2, 'list_transactions': 1}
+
+DEFAULT_MIX: Dict[str, float] = {'balances': 40, 'transfer': 20, 'rate': 30, 'list_accounts': 5, 'list_transactions': 5}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    Parse an operation mix such as ``'balances=40,transfer=20'``.
+    
+    Raises:
+        ValueError: If an operation is unknown or a weight is not positive
+    """
+    mix = {}
+    for part in filter(None, (part.strip() for part in text.split(','))):
+        name, _, weight = part.partition('=')
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}; choose from {', '.join(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+        if mix[name] <= 0:
+            raise ValueError(f'Weight of {name!r} must be positive')
+    if not mix:
+        raise ValueError('The mix is empty')
+    return mix
+
+
+def schedule(
+    rate: float,
+    duration: float,
+    mix: Dict[str, float],
+    poisson: bool = False,
+    seed: Optional[int] = None
+) -> List[Tuple[float, str]]:
+    """
+    Arrival offsets, in seconds from the start, and the operation of each.
+    
+    Args:
+        rate: Target requests per second
+        duration: Seconds to generate load for
+        mix: Operation name -> relative weight
+        poisson: Draw exponential gaps instead of spacing arrivals evenly
+        seed: Seed for reproducible operation choices and gaps
+    """
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    arrivals = []
+    offset = 0.0
+    while True:
+        offset = offset + rng.expovariate(rate) if poisson else len(arrivals) / rate
+        if offset >= duration:
+            return arrivals
+        arrivals.append((offset, rng.choices(names, weights)[0]))
+
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values (0 when empty)."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class _GCTimer:
+    """Counts garbage collections and their pauses while installed."""
+    
+    def __init__(self):
+        self.collections = 0
+        self.total = 0.0
+        self.longest = 0.0
+        self._started = 0.0
+    
+    def __call__(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == 'start':
+            self._started = time.perf_counter()
+        else:
+            pause = time.perf_counter() - self._started
+            self.collections += 1
+            self.total += pause
+            self.longest = max(self.longest, pause)
+    
+    def __enter__(self) -> '_GCTimer':
+        gc.callbacks.append(self)
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        gc.callbacks.remove(self)
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run; latencies are in seconds from each request's due time."""
+    target_rate: float
+    elapsed: float = 0.0
+    cpu_time: float = 0.0  # process CPU seconds, all threads
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    errors: Counter = field(default_factory=Counter)  # exception class name -> count
+    retries: Optional[int] = None  # None when the client has no instrumentation
+    connections: Optional[int] = None  # connections opened; None for the async client
+    gc_collections: int = 0
+    gc_pause_total: float = 0.0
+    gc_pause_max: float = 0.0
+    max_dispatch_lag: float = 0.0  # how late the generator itself issued a request
+    
+    @property
+    def completed(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+    
+    @property
+    def achieved_rate(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+    
+    @property
+    def cpu_per_request(self) -> float:
+        return self.cpu_time / self.completed if self.completed else 0.0
+    
+    def quantiles(self, operation: Optional[str] = None) -> Dict[str, float]:
+        """Latency percentiles of one operation, or of all of them."""
+        if operation is None:
+            values = sorted(value for values in self.latencies.values() for value in values)
+        else:
+            values = sorted(self.latencies.get(operation, ()))
+        return {f'p{q * 100:g}': percentile(values, q) for q in QUANTILES}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary as plain data, e.g. for JSON output."""
+        return {
+            'target_rate': self.target_rate,
+            'achieved_rate': self.achieved_rate,
+            'completed': self.completed,
+            'elapsed': self.elapsed,
+            'latency': self.quantiles(),
+            'operations': {
+                name: {'count': len(values), 'latency': self.quantiles(name)}
+                for name, values in sorted(self.latencies.items())
+            },
+            'errors': dict(self.errors),
+            'retries': self.retries,
+            'connections': self.connections,
+            'cpu_per_request': self.cpu_per_request,
+            'gc': {
+                'collections': self.gc_collections,
+                'pause_total': self.gc_pause_total,
+                'pause_max': self.gc_pause_max,
+            },
+            'max_dispatch_lag': self.max_dispatch_lag,
+        }
+    
+    def format(self) -> str:
+        """Human-readable report."""
+        lines = [
+            f'target {self.target_rate:,.0f} req/s, achieved {self.achieved_rate:,.0f} req/s '
+            f'({self.completed:,} requests in {self.elapsed:.1f}s)',
+            '',
+            f"{'operation':<20}{'count':>9}" + ''.join(f'{name:>10}' for name in self.quantiles()),
+        ]
+        rows = [(name, len(values), self.quantiles(name)) for name, values in sorted(self.latencies.items())]
+        rows.append(('all', self.completed, self.quantiles()))
+        for name, count, quantiles in rows:
+            lines.append(f'{name:<20}{count:>9,}' + ''.join(f'{value * 1e3:>8.1f}ms' for value in quantiles.values()))
+        lines.append('')
+        errors = ', '.join(f'{name} {count:,}' for name, count in self.errors.most_common()) or 'none'
+        lines.append(f'errors: {errors}')
+        if self.retries is not None:
+            lines.append(f'retries: {self.retries:,}')
+        if self.connections is not None:
+            lines.append(f'connections opened: {self.connections:,}')
+        lines.append(f'client CPU: {self.cpu_per_request * 1e6:,.0f}us per request')
+        lines.append(
+            f'gc: {self.gc_collections:,} collections, {self.gc_pause_total * 1e3:,.1f}ms total, '
+            f'{self.gc_pause_max * 1e3:.1f}ms longest'
+        )
+        lines.append(f'generator lag: {self.max_dispatch_lag * 1e3:.1f}ms max')
+        return '\n'.join(lines)
+
+
+class _Recorder:
+    """Thread-safe collection of per-request outcomes and retries."""
+    
+    def __init__(self, report: LoadReport):
+        self.report = report
+        self.lock = threading.Lock()
+    
+    def record(self, name: str, due: float, error: Optional[BaseException]) -> None:
+        latency = time.perf_counter() - due
+        with self.lock:
+            self.report.latencies.setdefault(name, []).append(latency)
+            if error is not None:
+                self.report.errors[type(error).__name__] += 1
+    
+    def count_retries(self, metrics: RequestMetrics) -> None:
+        if metrics.retries:
+            with self.lock:
+                self.report.retries += metrics.retries
+
+
+def _connections_opened(client: 'FinAegis') -> int:
+    """Connections the sync client's urllib3 pools have opened so far."""
+    total = 0
+    # The same adapter is usually mounted for both http:// and https://
+    for adapter in {id(adapter): adapter for adapter in client.session.adapters.values()}.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            total += pools[key].num_connections
+    return total
+
+
+class _Run:
+    """Shared start and finish bookkeeping of the sync and async runners."""
+    
+    def __init__(self, client: Any, rate: float, arrivals: List[Tuple[float, str]]):
+        self.client = client
+        self.arrivals = arrivals
+        self.report = LoadReport(target_rate=rate)
+        self.recorder = _Recorder(self.report)
+        self.hook = None
+        if client.instrumentation is not None:
+            self.report.retries = 0
+            self.hook = client.instrumentation.add_hook(after=self.recorder.count_retries)
+        self.gc_timer = _GCTimer()
+    
+    def __enter__(self) -> '_Run':
+        self.gc_timer.__enter__()
+        self.cpu_started = time.process_time()
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        report = self.report
+        report.elapsed = time.perf_counter() - self.started
+        report.cpu_time = time.process_time() - self.cpu_started
+        self.gc_timer.__exit__()
+        report.gc_collections = self.gc_timer.collections
+        report.gc_pause_total = self.gc_timer.total
+        report.gc_pause_max = self.gc_timer.longest
+        if self.hook is not None:
+            self.client.instrumentation.remove_hook(self.hook)
+
+
+def run_load(
+    client: 'FinAegis',
+    targets: Targets,
+    rate: float,
+    duration: float,
+    mix: Optional[Dict[str, float]] = None,
+    workers: int = 64,
+    poisson: bool = False,
+    seed: Optional[int] = None
+) -> LoadReport:
+    """
+    Drive a sync client at a target request rate.
+    
+    A generator thread hands each request to a pool of ``workers`` threads at
+    its due time; when every worker is busy, requests queue and the wait counts
+    toward their latency. Give the client at least ``workers`` pooled
+    connections (``pool_maxsize``) so requests do not queue for a connection.
+    
+    Args:
+        client: Client to drive
+        targets: Accounts and currency pairs to use
+        rate: Target requests per second
+        duration: Seconds to generate load for
+        mix: Operation name -> relative weight (DEFAULT_MIX when omitted)
+        workers: Threads sending requests
+        poisson: Poisson arrivals instead of evenly spaced ones
+        seed: Seed for reproducible runs
+        
+    Returns:
+        LoadReport of the run
+        
+    Raises:
+        ValueError: If ``targets`` has too few accounts for the mix
+    """
+    targets.check(mix or DEFAULT_MIX)
+    arrivals = schedule(rate, duration, mix or DEFAULT_MIX, poisson, seed)
+    connections_before = _connections_opened(client)
+    
+    with _Run(client, rate, arrivals) as run:
+        recorder = run.recorder
+        
+        def send(name: str, due: float) -> None:
+            try:
+                OPERATIONS[name](client, targets)
+            except Exception as error:
+                recorder.record(name, due, error)
+            else:
+                recorder.record(name, due, None)
+                
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='finaegis-load') as pool:
+            for offset, name in arrivals:
+                due = run.started + offset
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    run.report.max_dispatch_lag = max(run.report.max_dispatch_lag, -delay)
+                pool.submit(send, name, due)
+                
+    run.report.connections = _connections_opened(client) - connections_before
+    return run.report
+
+
+async def async_run_load(
+    client: 'AsyncFinAegis',
+    targets: Targets,
+    rate: float,
+    duration: float,
+    mix: Optional[Dict[str, float]] = None,
+    workers: int = 256,
+    poisson: bool = False,
+    seed: Optional[int] = None
+) -> LoadReport:
+    """
+    Drive an async client at a target request rate.
+    
+    Each request is started as a task at its due time; at most ``workers``
+    are in flight and the rest wait, with the wait counted toward their
+    latency. Takes the same arguments as :func:`run_load`.
+    
+    Returns:
+        LoadReport of the run
+        
+    Raises:
+        ValueError: If ``targets`` has too few accounts for the mix
+    """
+    targets.check(mix or DEFAULT_MIX)
+    arrivals = schedule(rate, duration, mix or DEFAULT_MIX, poisson, seed)
+    slots = asyncio.Semaphore(workers)
+    
+    with _Run(client, rate, arrivals) as run:
+        recorder = run.recorder
+        
+        async def send(name: str, due: float) -> None:
+            async with slots:
+                try:
+                    await OPERATIONS[name](client, targets)
+                except Exception as error:
+                    recorder.record(name, due, error)
+                else:
+                    recorder.record(name, due, None)
+                    
+        tasks = []
+        for offset, name in arrivals:
+            due = run.started + offset
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                run.report.max_dispatch_lag = max(run.report.max_dispatch_lag, -delay)
+            tasks.append(asyncio.ensure_future(send(name, due)))
+        await asyncio.gather(*tasks)
+        
+    return run.report
+
+
+def _serve_fake(pipe: Any, accounts: int, latency: float) -> None:
+    """Run a seeded FakeServer until the parent closes the pipe."""
+    from .testing import FakeServer
+    
+    with FakeServer(latency=latency) as server:
+        uuids = [
+            server.ledger.create_account('loadtest', f'Load {i}', initial_balance=10 ** 12)['uuid']
+            for i in range(accounts)
+        ]
+        pipe.send((server.base_url, uuids))
+        try:
+            pipe.recv()
+        except EOFError:
+            pass
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m finaegis.loadtest',
+        description='Drive the FinAegis API through the SDK at a target request rate.'
+    )
+    parser.add_argument('--base-url', default=os.getenv('FINAEGIS_BASE_URL'), help='API base URL')
+    parser.add_argument('--api-key', default=os.getenv('FINAEGIS_API_KEY'), help='API key')
+    parser.add_argument('--fake', action='store_true', help='run against a local FakeServer process')
+    parser.add_argument('--fake-latency', type=float, default=0.0, help='FakeServer latency in ms')
+    parser.add_argument('--accounts', help='comma-separated account UUIDs (listed from the API when omitted)')
+    parser.add_argument('--rate', type=float, default=1000, help='target requests per second (default 1000)')
+    parser.add_argument('--duration', type=float, default=10, help='seconds of load (default 10)')
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help=f"weighted operations, e.g. balances=40,transfer=20 (from: {', '.join(OPERATIONS)})")
+    parser.add_argument('--workers', type=int, help='sender threads, or in-flight requests with --async')
+    parser.add_argument('--async', dest='use_async', action='store_true', help='use AsyncFinAegis')
+    parser.add_argument('--retries', type=int, default=0, help='client max_retries (default 0)')
+    parser.add_argument('--amount', type=int, default=1, help='minor units per transfer (default 1)')
+    parser.add_argument('--poisson', action='store_true', help='Poisson arrivals instead of evenly spaced')
+    parser.add_argument('--seed', type=int, help='seed for reproducible runs')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+    
+    fake = None
+    accounts = args.accounts.split(',') if args.accounts else None
+    if accounts is not None:
+        try:
+            Targets(accounts).check(args.mix)
+        except ValueError as error:
+            parser.error(f'--accounts: {error}')
+    if args.fake:
+        receiver, sender = multiprocessing.Pipe()
+        fake = multiprocessing.Process(target=_serve_fake, args=(sender, 100, args.fake_latency / 1e3), daemon=True)
+        fake.start()
+        args.base_url, accounts = receiver.recv()
+    elif not args.base_url:
+        parser.error('--base-url (or FINAEGIS_BASE_URL) is required unless --fake is given')
+        
+    workers = args.workers or (256 if args.use_async else 64)
+    options = dict(
+        api_key=args.api_key or 'loadtest', base_url=args.base_url, max_retries=args.retries,
+        instrumentation=Instrumentation(metrics=False)
+    )
+    try:
+        if args.use_async:
+            report = asyncio.run(_main_async(args, options, accounts, workers))
+        else:
+            from .client import FinAegis
+            client = FinAegis(pool_maxsize=workers, **options)
+            targets = Targets(accounts or [a.uuid for a in client.accounts.list(per_page=100).data],
+                              amount=args.amount, rng=random.Random(args.seed))
+            report = run_load(client, targets, args.rate, args.duration, args.mix, workers, args.poisson, args.seed)
+            client.session.close()
+    finally:
+        if fake is not None:
+            fake.terminate()
+            fake.join()
+            
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+
+
+async def _main_async(
+    args: argparse.Namespace,
+    options: Dict[str, Any],
+    accounts: Optional[List[str]],
+    workers: int
+) -> LoadReport:
+    from .async_client import AsyncFinAegis
+    
+    async with AsyncFinAegis(max_connections=workers, **options) as client:
+        if accounts is None:
+            accounts = [account.uuid for account in (await client.accounts.list(per_page=100)).data]
+        targets = Targets(accounts, amount=args.amount, rng=random.Random(args.seed))
+        return await async_run_load(
+            client, targets, args.rate, args.duration, args.mix, workers, args.poisson, args.seed
+        )
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+Exact money handling for the FinAegis SDK
+
+The API stores and moves money as integer minor units (cents for USD, satoshis
+for BTC), so the models keep amounts as plain ``int``. Summing and comparing
+ints is exact and as fast as Python arithmetic gets, and parsing costs a single
+``int()`` per field. :class:`Money` pairs an amount with its asset's decimals
+for display and for conversion to and from major units.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import total_ordering
+from typing import TYPE_CHECKING, Any, Iterable, Union
+
+if TYPE_CHECKING:
+    from .types import Asset
+
+
+def to_minor_units(value: Any) -> int:
+    """
+    Parse an API amount in minor units without going through float.
+    
+    Args:
+        value: Amount as an int, integral string, Decimal or float
+        
+    Returns:
+        Amount as an int
+        
+    Raises:
+        ValueError: If the value is not a whole number of minor units
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            value = Decimal(value)
+    elif isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"Amount {value!r} is not a whole number of minor units")
+        return int(value)
+    exact = Decimal(value)
+    if exact != exact.to_integral_value():
+        raise ValueError(f"Amount {value!r} is not a whole number of minor units")
+    return int(exact)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """Parse an API decimal (price or rate) exactly, without going through float."""
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    return Decimal(value)
+
+
+@total_ordering
+@dataclass(frozen=True)
+class Money:
+    """
+    An amount of an asset in integer minor units.
+    
+    Arithmetic and comparisons are exact and refuse to mix assets.
+    
+    Example:
+        >>> usd = client.assets.get('USD')
+        >>> total = usd.money(sum(t.amount for t in client.transactions.iter_all()))
+        >>> str(total)
+        '1234567.89 USD'
+    """
+    minor: int
+    asset_code: str
+    decimals: int = 2
+    
+    @classmethod
+    def of(cls, minor: int, asset: 'Asset') -> 'Money':
+        """Wrap a minor-unit amount using the decimals of an Asset."""
+        return cls(minor, asset.code, asset.decimals)
+    
+    @classmethod
+    def from_major(cls, value: Union[str, int, Decimal], asset_code: str, decimals: int = 2) -> 'Money':
+        """
+        Build Money from an amount in major units, e.g. ``'12.34'``.
+        
+        Args:
+            value: Amount in major units; floats are rejected
+            asset_code: Asset code
+            decimals: Decimal places of the asset
+            
+        Returns:
+            Money object
+            
+        Raises:
+            TypeError: If value is a float
+            ValueError: If the amount has more decimal places than the asset
+        """
+        if isinstance(value, float):
+            raise TypeError("Pass major-unit amounts as str or Decimal, not float")
+        return cls(to_minor_units(Decimal(value).scaleb(decimals)), asset_code, decimals)
+    
+    @property
+    def amount(self) -> Decimal:
+        """Amount in major units."""
+        return Decimal(self.minor).scaleb(-self.decimals)
+    
+    def _check(self, other: 'Money') -> None:
+        if self.asset_code != other.asset_code or self.decimals != other.decimals:
+            raise ValueError(f"Cannot combine {self.asset_code} with {other.asset_code}")
+    
+    def __add__(self, other: 'Money') -> 'Money':
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return Money(self.minor + other.minor, self.asset_code, self.decimals)
+    
+    def __radd__(self, other: Any) -> 'Money':
+        if other == 0:  # lets sum() start from its default of 0
+            return self
+        return NotImplemented
+    
+    def __sub__(self, other: 'Money') -> 'Money':
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return Money(self.minor - other.minor, self.asset_code, self.decimals)
+    
+    def __neg__(self) -> 'Money':
+        return Money(-self.minor, self.asset_code, self.decimals)
+    
+    def __lt__(self, other: 'Money') -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return self.minor < other.minor
+    
+    def __str__(self) -> str:
+        return f"{self.amount:.{self.decimals}f} {self.asset_code}"
+
+
+def total(amounts: Iterable[int], asset: 'Asset') -> Money:
+    """
+    Sum minor-unit amounts of one asset exactly.
+    
+    Args:
+        amounts: Amounts in minor units, e.g. ``t.amount for t in transactions``
+        asset: Asset the amounts are denominated in
+        
+    Returns:
+        Money object holding the total
+    """
+    return Money.of(sum(amounts), asset)
\ No newline at end of file
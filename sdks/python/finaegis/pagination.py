@@ -0,0 +1,339 @@
+"""
+Pagination helpers for the FinAegis SDK
+
+Iterators here walk every page of a list endpoint lazily, yielding one item at
+a time. While the caller consumes a page, the next page is already being
+fetched in the background, and at most two pages are held in memory.
+
+The streamed iterators parse each page's items while its body is still
+arriving, trading page prefetch for a shorter time to the first item.
+
+The export helpers are for full-collection dumps: once the first page reveals
+``last_page``, the remaining pages are fetched concurrently by a bounded
+worker pool that slows down as a whole when the server rate limits it.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+
+from .decoding import AsyncStreamedPage, StreamedPage
+from .throttle import BackoffGate, async_call_with_backoff, call_with_backoff
+from .types import PaginatedResponse
+
+PageFetcher = Callable[[int], PaginatedResponse]
+AsyncPageFetcher = Callable[[int], Awaitable[PaginatedResponse]]
+PageStreamer = Callable[[int], StreamedPage]
+AsyncPageStreamer = Callable[[int], AsyncStreamedPage]
+
+
+def _has_next(page: PaginatedResponse) -> bool:
+    """Whether another page follows the given one."""
+    return bool(page.data) and page.current_page < page.last_page
+
+
+def _streamed_has_next(envelope: Optional[Dict[str, Any]], count: int) -> bool:
+    """Whether another page follows a streamed page of count items."""
+    meta = PaginatedResponse.from_dict(envelope or {})
+    return count > 0 and meta.current_page < meta.last_page
+
+
+def iterate_pages(
+    fetch_page: PageFetcher,
+    prefetch: bool = True,
+    first_page: int = 1
+) -> Iterator[PaginatedResponse]:
+    """
+    Lazily iterate over every page of a paginated endpoint.
+    
+    A page is only requested once the previous one has arrived, so pages are
+    fetched in order even with prefetch.
+    
+    Args:
+        fetch_page: Callable returning the PaginatedResponse for a page number
+        prefetch: Fetch the next page in a background thread while the
+            current page is being consumed
+        first_page: Page to start from
+            
+    Yields:
+        PaginatedResponse objects in page order
+    """
+    if not prefetch:
+        page = fetch_page(first_page)
+        yield page
+        while _has_next(page):
+            page = fetch_page(page.current_page + 1)
+            yield page
+        return
+        
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='finaegis-prefetch')
+    pending = None
+    try:
+        page = fetch_page(first_page)
+        while True:
+            # The fetch runs in a copy of the caller's context, so deadlines apply
+            pending = executor.submit(
+                contextvars.copy_context().run, fetch_page, page.current_page + 1
+            ) if _has_next(page) else None
+            yield page
+            if pending is None:
+                return
+            page = pending.result()
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+
+def iterate_items(fetch_page: PageFetcher, prefetch: bool = True) -> Iterator[Any]:
+    """
+    Lazily iterate over every item of a paginated endpoint.
+    
+    Args:
+        fetch_page: Callable returning the PaginatedResponse for a page number
+        prefetch: Fetch the next page in the background
+        
+    Yields:
+        Items from every page, one at a time
+    """
+    for page in iterate_pages(fetch_page, prefetch=prefetch):
+        yield from page.data
+
+
+async def aiterate_pages(
+    fetch_page: AsyncPageFetcher,
+    prefetch: bool = True,
+    first_page: int = 1
+) -> AsyncIterator[PaginatedResponse]:
+    """
+    Lazily iterate over every page of a paginated endpoint (asyncio).
+    
+    Args:
+        fetch_page: Coroutine function returning the PaginatedResponse for a page number
+        prefetch: Schedule the next page fetch while the current page is consumed
+        first_page: Page to start from
+        
+    Yields:
+        PaginatedResponse objects in page order
+    """
+    pending: Optional[asyncio.Future] = None
+    try:
+        page = await fetch_page(first_page)
+        while True:
+            if _has_next(page):
+                next_page = fetch_page(page.current_page + 1)
+                pending = asyncio.ensure_future(next_page) if prefetch else next_page
+            else:
+                pending = None
+            yield page
+            if pending is None:
+                return
+            page = await pending
+            pending = None
+    finally:
+        if isinstance(pending, asyncio.Future):
+            pending.cancel()
+        elif pending is not None:
+            pending.close()
+
+
+async def aiterate_items(fetch_page: AsyncPageFetcher, prefetch: bool = True) -> AsyncIterator[Any]:
+    """
+    Lazily iterate over every item of a paginated endpoint (asyncio).
+    
+    Args:
+        fetch_page: Coroutine function returning the PaginatedResponse for a page number
+        prefetch: Schedule the next page fetch while the current page is consumed
+        
+    Yields:
+        Items from every page, one at a time
+    """
+    pages = aiterate_pages(fetch_page, prefetch=prefetch)
+    try:
+        async for page in pages:
+            for item in page.data:
+                yield item
+    finally:
+        await pages.aclose()
+
+
+def iterate_streamed_items(
+    stream_page: PageStreamer,
+    item_class: Optional[type] = None
+) -> Iterator[Any]:
+    """
+    Iterate over every item of a paginated endpoint, parsing while pages stream in.
+    
+    Args:
+        stream_page: Callable opening the StreamedPage for a page number
+        item_class: Model class to build items with; raw dicts when omitted
+        
+    Yields:
+        Items from every page, one at a time
+    """
+    number = 1
+    while True:
+        count = 0
+        with stream_page(number) as page:
+            for item in page:
+                count += 1
+                yield item_class.from_dict(item) if item_class else item
+        if not _streamed_has_next(page.envelope, count):
+            return
+        number += 1
+
+
+async def aiterate_streamed_items(
+    stream_page: AsyncPageStreamer,
+    item_class: Optional[type] = None
+) -> AsyncIterator[Any]:
+    """
+    Iterate over every item of a paginated endpoint, parsing while pages stream in (asyncio).
+    
+    Args:
+        stream_page: Callable returning the AsyncStreamedPage for a page number
+        item_class: Model class to build items with; raw dicts when omitted
+        
+    Yields:
+        Items from every page, one at a time
+    """
+    number = 1
+    while True:
+        count = 0
+        async with stream_page(number) as page:
+            async for item in page:
+                count += 1
+                yield item_class.from_dict(item) if item_class else item
+        if not _streamed_has_next(page.envelope, count):
+            return
+        number += 1
+
+
+def export_pages(
+    fetch_page: PageFetcher,
+    max_workers: int = 8,
+    ordered: bool = True,
+    max_rate_limit_retries: int = 10,
+    first_page: int = 1
+) -> Iterator[PaginatedResponse]:
+    """
+    Fetch every page of a paginated endpoint concurrently.
+    
+    The first page is fetched alone to learn ``last_page``; the rest are
+    fetched by a pool of ``max_workers`` threads. At most ``2 * max_workers``
+    pages are requested ahead of the consumer, so memory stays bounded. A
+    RateLimitError on any page pauses the whole pool for ``retry_after``
+    seconds and the page is retried.
+    
+    Args:
+        fetch_page: Callable returning the PaginatedResponse for a page number
+        max_workers: Number of concurrent page requests
+        ordered: Yield pages in page order; when False, pages are yielded as
+            soon as they arrive and carry their number in ``current_page``
+        max_rate_limit_retries: Rate limit retries per page before failing
+        first_page: Page to start from, e.g. to resume an interrupted export
+        
+    Yields:
+        PaginatedResponse objects
+    """
+    first = fetch_page(first_page)
+    yield first
+    last_page = first.last_page
+    if not first.data or last_page <= first_page:
+        return
+        
+    gate = BackoffGate()
+    window = max(1, max_workers) * 2
+    
+    def fetch(page: int) -> PaginatedResponse:
+        return call_with_backoff(lambda: fetch_page(page), gate, max_rate_limit_retries)
+        
+    # Pages are fetched in copies of the caller's context, so deadlines apply
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='finaegis-export')
+    pending: Dict[int, Future] = {}
+    try:
+        next_page = first_page + 1
+        if ordered:
+            next_yield = first_page + 1
+            while next_yield <= last_page:
+                while next_page <= last_page and next_page < next_yield + window:
+                    pending[next_page] = executor.submit(contextvars.copy_context().run, fetch, next_page)
+                    next_page += 1
+                page = pending.pop(next_yield).result()
+                next_yield += 1
+                yield page
+        else:
+            while pending or next_page <= last_page:
+                while next_page <= last_page and len(pending) < window:
+                    pending[next_page] = executor.submit(contextvars.copy_context().run, fetch, next_page)
+                    next_page += 1
+                done, _ = wait(pending.values(), return_when=FIRST_COMPLETED)
+                for number in [n for n, future in pending.items() if future in done]:
+                    yield pending.pop(number).result()
+    finally:
+        for future in pending.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aexport_pages(
+    fetch_page: AsyncPageFetcher,
+    max_workers: int = 8,
+    ordered: bool = True,
+    max_rate_limit_retries: int = 10,
+    first_page: int = 1
+) -> AsyncIterator[PaginatedResponse]:
+    """
+    Fetch every page of a paginated endpoint concurrently (asyncio).
+    
+    Behaves like :func:`export_pages`, with ``max_workers`` bounding the
+    number of page requests in flight.
+    
+    Args:
+        fetch_page: Coroutine function returning the PaginatedResponse for a page number
+        max_workers: Number of concurrent page requests
+        ordered: Yield pages in page order instead of as they arrive
+        max_rate_limit_retries: Rate limit retries per page before failing
+        first_page: Page to start from, e.g. to resume an interrupted export
+        
+    Yields:
+        PaginatedResponse objects
+    """
+    first = await fetch_page(first_page)
+    yield first
+    last_page = first.last_page
+    if not first.data or last_page <= first_page:
+        return
+        
+    gate = BackoffGate()
+    window = max(1, max_workers)
+    
+    def fetch(page: int) -> 'asyncio.Future':
+        return asyncio.ensure_future(
+            async_call_with_backoff(lambda: fetch_page(page), gate, max_rate_limit_retries)
+        )
+        
+    pending: Dict[int, asyncio.Future] = {}
+    try:
+        next_page = first_page + 1
+        if ordered:
+            next_yield = first_page + 1
+            while next_yield <= last_page:
+                while next_page <= last_page and len(pending) < window:
+                    pending[next_page] = fetch(next_page)
+                    next_page += 1
+                page = await pending.pop(next_yield)
+                next_yield += 1
+                yield page
+        else:
+            while pending or next_page <= last_page:
+                while next_page <= last_page and len(pending) < window:
+                    pending[next_page] = fetch(next_page)
+                    next_page += 1
+                done, _ = await asyncio.wait(pending.values(), return_when=asyncio.FIRST_COMPLETED)
+                for number in [n for n, task in pending.items() if task in done]:
+                    yield pending.pop(number).result()
+    finally:
+        for task in pending.values():
+            task.cancel()
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""
+Fast field parsers shared by the FinAegis models
+"""
+
+import sys
+from dataclasses import fields
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Type, TypeVar
+
+T = TypeVar('T')
+
+_fromisoformat = datetime.fromisoformat
+
+if sys.version_info >= (3, 11):
+    def parse_datetime(value: str) -> datetime:
+        """Parse an API timestamp such as ``2024-01-01T00:00:00.000000Z``."""
+        return _fromisoformat(value)
+else:
+    def parse_datetime(value: str) -> datetime:
+        """Parse an API timestamp such as ``2024-01-01T00:00:00.000000Z``."""
+        if value[-1:] == 'Z':
+            return _fromisoformat(value[:-1] + '+00:00')
+        return _fromisoformat(value)
+
+
+def parse_optional_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API timestamp that may be null or empty."""
+    return parse_datetime(value) if value else None
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    Recreate a dataclass with ``__slots__``.
+    
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10. Slotted
+    instances have no per-object ``__dict__``, so they are smaller and their
+    attributes are faster to read.
+    
+    Args:
+        cls: Class produced by ``@dataclass``
+        
+    Returns:
+        A new class with the same fields, methods and generated dunders
+    """
+    names = tuple(field.name for field in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+_UNSET = object()
+
+
+class _LazyField:
+    """
+    Descriptor reading one field of a lazy model from its raw dict.
+    
+    Expensive conversions run on first access and their result is kept; plain
+    fields and cheap conversions are read from the raw dict on every access,
+    which is faster than caching them.
+    """
+    
+    __slots__ = ('name', 'convert', 'cache')
+    
+    def __init__(self, name: str, convert: Optional[Callable[[Mapping[str, Any]], Any]], cache: bool):
+        self.name = name
+        self.convert = convert or itemgetter(name)
+        self.cache = cache
+    
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        parsed = obj._parsed
+        if parsed is not None:
+            value = parsed.get(self.name, _UNSET)
+            if value is not _UNSET:
+                return value
+        value = self.convert(obj._raw)
+        if self.cache:
+            if parsed is None:
+                parsed = obj._parsed = {}
+            parsed[self.name] = value
+        return value
+    
+    def __set__(self, obj: Any, value: Any) -> None:
+        parsed = getattr(obj, '_parsed', None)
+        if parsed is None:
+            parsed = obj._parsed = {}
+        parsed[self.name] = value
+
+
+def lazy_model(
+    cls: Type[T],
+    converters: Dict[str, Callable[[Mapping[str, Any]], Any]],
+    cached: Iterable[str] = ()
+) -> Type[T]:
+    """
+    Build a lazy subclass of a slotted model.
+    
+    ``from_dict`` on the subclass only keeps the raw dict; fields are read
+    from it when accessed, and fields listed in ``cached`` are converted once,
+    on first access. Instances pass ``isinstance`` checks for the parent and
+    compare, print and serialize like eagerly parsed ones. Constructing the
+    subclass directly, or through ``dataclasses.replace``, takes the parent's
+    arguments and keeps every field as given.
+    
+    Args:
+        cls: Slotted dataclass to subclass
+        converters: Per-field functions taking the raw dict; fields without
+            one are read from the raw dict unchanged
+        cached: Fields whose converted value is kept after first access,
+            typically timestamps
+            
+    Returns:
+        The lazy subclass
+    """
+    name = f'Lazy{cls.__name__}'
+    names = tuple(field.name for field in fields(cls))
+    namespace: Dict[str, Any] = {
+        '__slots__': ('_raw', '_parsed'),
+        '__doc__': f"Lazily parsed {cls.__name__}.",
+        '__module__': cls.__module__,
+        '__qualname__': name,
+    }
+    cached = set(cached)
+    for field_name in names:
+        namespace[field_name] = _LazyField(field_name, converters.get(field_name), field_name in cached)
+        
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        # The parent's __init__ assigns every field, so nothing is read from _raw
+        self._raw = {}
+        self._parsed = {}
+        parent_init(self, *args, **kwargs)
+        
+    def __eq__(self: Any, other: Any) -> bool:
+        if not isinstance(other, cls):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in names)
+        
+    def from_dict(lazy_cls: Type[T], data: Dict[str, Any]) -> T:
+        obj = new(lazy_cls)
+        obj._raw = data
+        obj._parsed = None
+        return obj
+        
+    new = object.__new__
+    parent_init = cls.__init__
+    namespace['__init__'] = __init__
+    namespace['__eq__'] = __eq__
+    namespace['__hash__'] = None
+    namespace['from_dict'] = classmethod(from_dict)
+    return type(name, (cls,), namespace)
\ No newline at end of file
@@ -0,0 +1,261 @@
+"""
+Adaptive client-side rate limiting for the FinAegis SDK
+
+The API enforces separate limits for money-moving writes ("transaction") and
+everything else ("query"), and reports them in ``X-RateLimit-Limit``,
+``X-RateLimit-Window``, ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset``
+headers. A client configured with an :class:`AdaptiveRateLimiter` sends through
+one token bucket per endpoint class, shared by every thread or task using the
+client, so outgoing requests are spaced evenly instead of arriving in bursts.
+
+Each bucket learns its rate from the server:
+
+- the limit and window headers set the ceiling;
+- the remaining budget until the reset caps the rate for the current window;
+- a 429 halves the rate and pauses the bucket for ``Retry-After`` seconds;
+- successful calls recover the rate gradually toward the ceiling.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+# Starting (limit, window seconds) per endpoint class, replaced by the
+# server's headers on the first response
+DEFAULT_LIMITS: Dict[str, Tuple[int, float]] = {
+    'transaction': (30, 60),
+    'query': (100, 60),
+}
+
+_TRANSACTION_ACTIONS = ('deposit', 'withdraw', 'compose', 'decompose')
+
+_BUDGET_HEADERS = ('X-RateLimit-', 'X-RateLimit-Transaction-')
+
+
+def endpoint_class(method: str, path: str) -> str:
+    """
+    Classify a request into the server's rate limit classes.
+    
+    Args:
+        method: HTTP method
+        path: Request path
+        
+    Returns:
+        ``'transaction'`` for writes that move money, ``'query'`` otherwise
+    """
+    if method.upper() in ('GET', 'HEAD', 'OPTIONS'):
+        return 'query'
+    path = path.strip('/')
+    if path.startswith('transfers') or path.rsplit('/', 1)[-1] in _TRANSACTION_ACTIONS:
+        return 'transaction'
+    return 'query'
+
+
+def _header(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                continue
+    return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose rate can change while in use.
+    
+    Tokens may go negative: each caller reserves the next free slot and
+    sleeps until it, which spaces concurrent callers ``1 / rate`` apart.
+    """
+    
+    def __init__(self, rate: float, burst: float = 1.0):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens saved up while idle
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+    
+    def reserve(self) -> float:
+        """
+        Take one token.
+        
+        Returns:
+            Seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            # Tokens are counted from _updated, which a pause moves into the future
+            delay = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                delay += -self._tokens / self.rate
+            return delay
+    
+    def paused_for(self) -> float:
+        """Seconds left in the current pause."""
+        with self._lock:
+            return max(0.0, self._paused_until - time.monotonic())
+    
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens accrued so far."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+    
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for seconds, then resume without a burst."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = self._paused_until
+    
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self.reserve()
+        while delay > 0:
+            time.sleep(delay)
+            # A pause that started while we slept also applies to us
+            delay = self.paused_for()
+    
+    async def async_acquire(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        delay = self.reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.paused_for()
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-endpoint-class token buckets that track the server's rate limits.
+    
+    One limiter can be shared by several clients using the same API key.
+    
+    Example:
+        >>> client = FinAegis(api_key='...', rate_limit=True)
+        >>> client.transfers.create_many(specs, max_workers=32)  # paced, not rejected
+        >>> client.rate_limiter.rates()
+        {'transaction': 0.5, 'query': 1.6666666666666667}
+    """
+    
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Tuple[int, float]]] = None,
+        burst: float = 5,
+        decrease: float = 0.5,
+        recovery: float = 0.05,
+        min_rate: float = 0.05,
+        classify: Callable[[str, str], str] = endpoint_class
+    ):
+        """
+        Args:
+            limits: Starting ``(limit, window_seconds)`` per endpoint class
+            burst: Requests that may be sent back to back after an idle period
+            decrease: Factor applied to the rate after a 429
+            recovery: Fraction of the ceiling regained per successful call
+            min_rate: Lowest rate, in requests per second, ever used
+            classify: Maps ``(method, path)`` to an endpoint class
+        """
+        self.limits = dict(DEFAULT_LIMITS, **(limits or {}))
+        self.burst = burst
+        self.decrease = decrease
+        self.recovery = recovery
+        self.min_rate = min_rate
+        self.classify = classify
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._ceilings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def bucket(self, name: str) -> TokenBucket:
+        """Return the bucket of an endpoint class, creating it on first use."""
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            limit, window = self.limits.get(name, self.limits['query'])
+            with self._lock:
+                bucket = self._buckets.get(name)
+                if bucket is None:
+                    self._ceilings[name] = limit / window
+                    bucket = self._buckets[name] = TokenBucket(limit / window, self.burst)
+        return bucket
+    
+    def acquire(self, method: str, path: str) -> None:
+        """Block until a request to path may be sent."""
+        self.bucket(self.classify(method, path)).acquire()
+    
+    async def async_acquire(self, method: str, path: str) -> None:
+        """Wait until a request to path may be sent (asyncio)."""
+        await self.bucket(self.classify(method, path)).async_acquire()
+    
+    def observe(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        headers: Mapping[str, str],
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Adjust the bucket of a request from its response.
+        
+        Args:
+            method: HTTP method of the request
+            path: Request path
+            status: Response status code
+            headers: Response headers (case-insensitive mapping)
+            retry_after: Delay from the response body when there is no
+                ``Retry-After`` header
+        """
+        name = self.classify(method, path)
+        bucket = self.bucket(name)
+        limit = _header(headers, 'X-RateLimit-Limit')
+        window = _header(headers, 'X-RateLimit-Window')
+        
+        with self._lock:
+            ceiling = self._ceilings[name]
+            # A bucket that is not backing off follows the advertised limit
+            rate = bucket.rate if bucket.rate < ceiling else float('inf')
+            if limit and window:
+                ceiling = self._ceilings[name] = limit / window
+            rate = min(rate, ceiling)
+            if status == 429:
+                rate *= self.decrease
+            else:
+                rate = min(ceiling, rate + ceiling * self.recovery)
+                # Spread what is left of each budget (per window, and the
+                # hourly transaction budget) until it resets
+                for prefix in _BUDGET_HEADERS:
+                    remaining = _header(headers, prefix + 'Remaining')
+                    reset = _header(headers, prefix + 'Reset')
+                    if remaining is not None and reset is not None:
+                        seconds_left = reset - time.time()
+                        if seconds_left > 0:
+                            rate = min(rate, remaining / seconds_left)
+            bucket.set_rate(max(self.min_rate, rate))
+            
+        if status == 429:
+            delay = _header(headers, 'Retry-After')
+            if delay is None:
+                delay = retry_after
+            bucket.pause(delay if delay is not None else 1 / bucket.rate)
+    
+    def rates(self) -> Dict[str, float]:
+        """Current rate, in requests per second, of every endpoint class in use."""
+        return {name: bucket.rate for name, bucket in self._buckets.items()}
\ No newline at end of file
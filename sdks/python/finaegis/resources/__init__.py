@@ -1,23 +1,86 @@
 """
 FinAegis SDK Resources
+
+Resource classes are imported from their modules on first access (PEP 562).
 """
 
-from .accounts import AccountsResource
-from .transactions import TransactionsResource
-from .transfers import TransfersResource
-from .assets import AssetsResource
-from .baskets import BasketsResource
-from .webhooks import WebhooksResource
-from .exchange_rates import ExchangeRatesResource
-from .gcu import GCUResource
-
-__all__ = [
-    'AccountsResource',
-    'TransactionsResource',
-    'TransfersResource',
-    'AssetsResource',
-    'BasketsResource',
-    'WebhooksResource',
-    'ExchangeRatesResource',
-    'GCUResource',
-]
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Generic, List, Optional, TypeVar
+
+# Public name -> module defining it
+_EXPORTS = {
+    'AccountsResource': 'accounts',
+    'TransactionsResource': 'transactions',
+    'TransfersResource': 'transfers',
+    'AssetsResource': 'assets',
+    'BasketsResource': 'baskets',
+    'WebhooksResource': 'webhooks',
+    'ExchangeRatesResource': 'exchange_rates',
+    'GCUResource': 'gcu',
+    'AsyncAccountsResource': 'accounts',
+    'AsyncTransactionsResource': 'transactions',
+    'AsyncTransfersResource': 'transfers',
+    'AsyncAssetsResource': 'assets',
+    'AsyncBasketsResource': 'baskets',
+    'AsyncWebhooksResource': 'webhooks',
+    'AsyncExchangeRatesResource': 'exchange_rates',
+    'AsyncGCUResource': 'gcu',
+}
+
+__all__ = list(_EXPORTS) + ['LazyResource']
+
+if TYPE_CHECKING:
+    from .accounts import AccountsResource, AsyncAccountsResource
+    from .transactions import TransactionsResource, AsyncTransactionsResource
+    from .transfers import TransfersResource, AsyncTransfersResource
+    from .assets import AssetsResource, AsyncAssetsResource
+    from .baskets import BasketsResource, AsyncBasketsResource
+    from .webhooks import WebhooksResource, AsyncWebhooksResource
+    from .exchange_rates import ExchangeRatesResource, AsyncExchangeRatesResource
+    from .gcu import GCUResource, AsyncGCUResource
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+R = TypeVar('R')
+
+
+class LazyResource(Generic[R]):
+    """
+    Client attribute that imports and creates its resource on first access.
+    
+    The resource object is then stored on the client instance, which shadows
+    this descriptor, so later accesses are plain attribute reads. Resource
+    modules a program never touches are never imported.
+    """
+    
+    def __init__(self, module: str, class_name: str):
+        """
+        Args:
+            module: Module name within ``finaegis.resources``
+            class_name: Resource class in that module
+        """
+        self.module = module
+        self.class_name = class_name
+        self.name = class_name
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, client: Any, owner: Optional[type] = None) -> R:
+        if client is None:
+            return self  # type: ignore[return-value]
+        resource_class = getattr(import_module(f'.{self.module}', __package__), self.class_name)
+        # setdefault keeps one resource per client if threads race here
+        return client.__dict__.setdefault(self.name, resource_class(client))
\ No newline at end of file
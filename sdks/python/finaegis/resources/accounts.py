@@ -2,9 +2,16 @@
 Accounts resource for the FinAegis SDK
 """
 
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Iterator, AsyncIterator
 from ..types import Account, Transaction, Transfer, PaginatedResponse
-from .base import BaseResource
+from ..idempotency import new_idempotency_key
+from ..pagination import (
+    aexport_pages, aiterate_items, aiterate_streamed_items, export_pages, iterate_items, iterate_streamed_items
+)
+from .base import AsyncBaseResource, BaseResource
+
+if TYPE_CHECKING:
+    from ..columnar import ColumnBatch
 
 
 class AccountsResource(BaseResource):
@@ -22,7 +29,44 @@ class AccountsResource(BaseResource):
             PaginatedResponse containing Account objects
         """
         response = self._get('/accounts', params={'page': page, 'per_page': per_page})
-        return PaginatedResponse.from_dict(response, Account)
+        return PaginatedResponse.from_dict(response, self._model(Account))
+    
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> Iterator[Account]:
+        """
+        Iterate over all accounts, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Iterator yielding Account objects
+        """
+        return iterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
+    def export(
+        self,
+        per_page: int = 100,
+        max_workers: int = 8,
+        ordered: bool = True
+    ) -> Iterator[PaginatedResponse]:
+        """
+        Export all accounts, fetching the remaining pages concurrently.
+        
+        Args:
+            per_page: Items per page
+            max_workers: Number of concurrent page requests
+            ordered: Yield pages in page order; when False, pages are yielded
+                as they arrive and carry their number in ``current_page``
+            
+        Returns:
+            Iterator yielding PaginatedResponse pages of Account objects
+        """
+        return export_pages(
+            lambda page: self.list(page=page, per_page=per_page),
+            max_workers=max_workers,
+            ordered=ordered
+        )
     
     def create(
         self,
@@ -125,7 +169,13 @@ class AccountsResource(BaseResource):
         response = self._get(f'/accounts/{uuid}/balances')
         return response['data']
     
-    def deposit(self, uuid: str, amount: int, asset_code: str = 'USD') -> Transaction:
+    def deposit(
+        self,
+        uuid: str,
+        amount: int,
+        asset_code: str = 'USD',
+        idempotency_key: Optional[str] = None
+    ) -> Transaction:
         """
         Deposit funds to an account.
         
@@ -133,17 +183,28 @@ class AccountsResource(BaseResource):
             uuid: Account UUID
             amount: Amount in cents
             asset_code: Asset code (default: USD)
+            idempotency_key: Key deduplicating retries of this deposit
+                (generated when omitted)
             
         Returns:
-            Transaction object
+            Transaction object, with the idempotency key that was sent
         """
+        idempotency_key = idempotency_key or new_idempotency_key()
         response = self._post(f'/accounts/{uuid}/deposit', {
             'amount': amount,
             'asset_code': asset_code
-        })
-        return Transaction.from_dict(response['data'])
+        }, idempotency_key=idempotency_key)
+        transaction = Transaction.from_dict(response['data'])
+        transaction.idempotency_key = idempotency_key
+        return transaction
     
-    def withdraw(self, uuid: str, amount: int, asset_code: str = 'USD') -> Transaction:
+    def withdraw(
+        self,
+        uuid: str,
+        amount: int,
+        asset_code: str = 'USD',
+        idempotency_key: Optional[str] = None
+    ) -> Transaction:
         """
         Withdraw funds from an account.
         
@@ -151,15 +212,20 @@ class AccountsResource(BaseResource):
             uuid: Account UUID
             amount: Amount in cents
             asset_code: Asset code (default: USD)
+            idempotency_key: Key deduplicating retries of this withdraw
+                (generated when omitted)
             
         Returns:
-            Transaction object
+            Transaction object, with the idempotency key that was sent
         """
+        idempotency_key = idempotency_key or new_idempotency_key()
         response = self._post(f'/accounts/{uuid}/withdraw', {
             'amount': amount,
             'asset_code': asset_code
-        })
-        return Transaction.from_dict(response['data'])
+        }, idempotency_key=idempotency_key)
+        transaction = Transaction.from_dict(response['data'])
+        transaction.idempotency_key = idempotency_key
+        return transaction
     
     def get_transactions(self, uuid: str, page: int = 1, per_page: int = 20) -> PaginatedResponse:
         """
@@ -177,7 +243,63 @@ class AccountsResource(BaseResource):
             f'/accounts/{uuid}/transactions',
             params={'page': page, 'per_page': per_page}
         )
-        return PaginatedResponse.from_dict(response, Transaction)
+        return PaginatedResponse.from_dict(response, self._model(Transaction))
+    
+    def iter_transactions(
+        self,
+        uuid: str,
+        per_page: int = 100,
+        prefetch: bool = True,
+        stream: bool = False
+    ) -> Iterator[Transaction]:
+        """
+        Iterate over an account's full transaction history, fetching pages lazily.
+        
+        Args:
+            uuid: Account UUID
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            stream: Parse each page while it downloads instead of prefetching
+                the next one; prefetch is ignored
+            
+        Returns:
+            Iterator yielding Transaction objects
+        """
+        if stream:
+            return iterate_streamed_items(
+                lambda page: self.client.stream(
+                    f'/accounts/{uuid}/transactions', params={'page': page, 'per_page': per_page}
+                ),
+                self._model(Transaction)
+            )
+        return iterate_items(lambda page: self.get_transactions(uuid, page=page, per_page=per_page), prefetch=prefetch)
+    
+    def transaction_columns(self, uuid: str, per_page: int = 100, max_workers: int = 8) -> 'ColumnBatch':
+        """
+        Load an account's full transaction history into a columnar batch.
+        
+        Pages are fetched concurrently and packed into NumPy columns as they
+        arrive, without creating a Transaction object per row. Requires numpy.
+        
+        Args:
+            uuid: Account UUID
+            per_page: Items per page
+            max_workers: Number of concurrent page requests
+            
+        Returns:
+            ColumnBatch with TRANSACTION_COLUMNS
+        """
+        from ..columnar import TRANSACTION_COLUMNS, ColumnBuilder
+        builder = ColumnBuilder(TRANSACTION_COLUMNS)
+        pages = export_pages(lambda page: self._raw_transactions_page(uuid, page, per_page), max_workers=max_workers)
+        for page in pages:
+            builder.extend(page.data)
+        return builder.build()
+    
+    def _raw_transactions_page(self, uuid: str, page: int, per_page: int) -> PaginatedResponse:
+        """Fetch one page of an account's transactions as a PaginatedResponse of raw dicts."""
+        response = self._get(f'/accounts/{uuid}/transactions', params={'page': page, 'per_page': per_page})
+        return PaginatedResponse.from_dict(response)
     
     def get_transfers(self, uuid: str, page: int = 1, per_page: int = 20) -> PaginatedResponse:
         """
@@ -195,4 +317,338 @@ class AccountsResource(BaseResource):
             f'/accounts/{uuid}/transfers',
             params={'page': page, 'per_page': per_page}
         )
-        return PaginatedResponse.from_dict(response, Transfer)
\ No newline at end of file
+        return PaginatedResponse.from_dict(response, self._model(Transfer))
+    
+    def iter_transfers(self, uuid: str, per_page: int = 100, prefetch: bool = True) -> Iterator[Transfer]:
+        """
+        Iterate over an account's full transfer history, fetching pages lazily.
+        
+        Args:
+            uuid: Account UUID
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Iterator yielding Transfer objects
+        """
+        return iterate_items(lambda page: self.get_transfers(uuid, page=page, per_page=per_page), prefetch=prefetch)
+
+
+class AsyncAccountsResource(AsyncBaseResource):
+    """Manage accounts in the FinAegis platform (asyncio)."""
+    
+    async def list(self, page: int = 1, per_page: int = 20) -> PaginatedResponse:
+        """
+        List all accounts.
+        
+        Args:
+            page: Page number
+            per_page: Items per page
+            
+        Returns:
+            PaginatedResponse containing Account objects
+        """
+        response = await self._get('/accounts', params={'page': page, 'per_page': per_page})
+        return PaginatedResponse.from_dict(response, self._model(Account))
+    
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> AsyncIterator[Account]:
+        """
+        Iterate over all accounts, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Async iterator yielding Account objects
+        """
+        return aiterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
+    def export(
+        self,
+        per_page: int = 100,
+        max_workers: int = 8,
+        ordered: bool = True
+    ) -> AsyncIterator[PaginatedResponse]:
+        """
+        Export all accounts, fetching the remaining pages concurrently.
+        
+        Args:
+            per_page: Items per page
+            max_workers: Number of concurrent page requests
+            ordered: Yield pages in page order; when False, pages are yielded
+                as they arrive and carry their number in ``current_page``
+            
+        Returns:
+            Async iterator yielding PaginatedResponse pages of Account objects
+        """
+        return aexport_pages(
+            lambda page: self.list(page=page, per_page=per_page),
+            max_workers=max_workers,
+            ordered=ordered
+        )
+    
+    async def create(
+        self,
+        user_uuid: str,
+        name: str,
+        initial_balance: Optional[int] = None
+    ) -> Account:
+        """
+        Create a new account.
+        
+        Args:
+            user_uuid: UUID of the user
+            name: Account name
+            initial_balance: Initial balance in cents
+            
+        Returns:
+            Created Account object
+        """
+        data = {
+            'user_uuid': user_uuid,
+            'name': name,
+        }
+        if initial_balance is not None:
+            data['initial_balance'] = initial_balance
+            
+        response = await self._post('/accounts', data)
+        return Account.from_dict(response['data'])
+    
+    async def get(self, uuid: str) -> Account:
+        """
+        Get account details.
+        
+        Args:
+            uuid: Account UUID
+            
+        Returns:
+            Account object
+        """
+        response = await self._get(f'/accounts/{uuid}')
+        return Account.from_dict(response['data'])
+    
+    async def delete(self, uuid: str) -> Dict[str, str]:
+        """
+        Delete an account.
+        
+        Args:
+            uuid: Account UUID
+            
+        Returns:
+            Success message
+        """
+        return await self._delete(f'/accounts/{uuid}')
+    
+    async def freeze(self, uuid: str, reason: str, authorized_by: Optional[str] = None) -> Dict[str, str]:
+        """
+        Freeze an account.
+        
+        Args:
+            uuid: Account UUID
+            reason: Reason for freezing
+            authorized_by: Who authorized the freeze
+            
+        Returns:
+            Success message
+        """
+        data = {'reason': reason}
+        if authorized_by:
+            data['authorized_by'] = authorized_by
+            
+        return await self._post(f'/accounts/{uuid}/freeze', data)
+    
+    async def unfreeze(self, uuid: str, reason: str, authorized_by: Optional[str] = None) -> Dict[str, str]:
+        """
+        Unfreeze an account.
+        
+        Args:
+            uuid: Account UUID
+            reason: Reason for unfreezing
+            authorized_by: Who authorized the unfreeze
+            
+        Returns:
+            Success message
+        """
+        data = {'reason': reason}
+        if authorized_by:
+            data['authorized_by'] = authorized_by
+            
+        return await self._post(f'/accounts/{uuid}/unfreeze', data)
+    
+    async def get_balances(self, uuid: str) -> Dict[str, Any]:
+        """
+        Get account balances for all assets.
+        
+        Args:
+            uuid: Account UUID
+            
+        Returns:
+            Dictionary containing balance information
+        """
+        response = await self._get(f'/accounts/{uuid}/balances')
+        return response['data']
+    
+    async def deposit(
+        self,
+        uuid: str,
+        amount: int,
+        asset_code: str = 'USD',
+        idempotency_key: Optional[str] = None
+    ) -> Transaction:
+        """
+        Deposit funds to an account.
+        
+        Args:
+            uuid: Account UUID
+            amount: Amount in cents
+            asset_code: Asset code (default: USD)
+            idempotency_key: Key deduplicating retries of this deposit
+                (generated when omitted)
+            
+        Returns:
+            Transaction object, with the idempotency key that was sent
+        """
+        idempotency_key = idempotency_key or new_idempotency_key()
+        response = await self._post(f'/accounts/{uuid}/deposit', {
+            'amount': amount,
+            'asset_code': asset_code
+        }, idempotency_key=idempotency_key)
+        transaction = Transaction.from_dict(response['data'])
+        transaction.idempotency_key = idempotency_key
+        return transaction
+    
+    async def withdraw(
+        self,
+        uuid: str,
+        amount: int,
+        asset_code: str = 'USD',
+        idempotency_key: Optional[str] = None
+    ) -> Transaction:
+        """
+        Withdraw funds from an account.
+        
+        Args:
+            uuid: Account UUID
+            amount: Amount in cents
+            asset_code: Asset code (default: USD)
+            idempotency_key: Key deduplicating retries of this withdraw
+                (generated when omitted)
+            
+        Returns:
+            Transaction object, with the idempotency key that was sent
+        """
+        idempotency_key = idempotency_key or new_idempotency_key()
+        response = await self._post(f'/accounts/{uuid}/withdraw', {
+            'amount': amount,
+            'asset_code': asset_code
+        }, idempotency_key=idempotency_key)
+        transaction = Transaction.from_dict(response['data'])
+        transaction.idempotency_key = idempotency_key
+        return transaction
+    
+    async def get_transactions(self, uuid: str, page: int = 1, per_page: int = 20) -> PaginatedResponse:
+        """
+        Get account transaction history.
+        
+        Args:
+            uuid: Account UUID
+            page: Page number
+            per_page: Items per page
+            
+        Returns:
+            PaginatedResponse containing Transaction objects
+        """
+        response = await self._get(
+            f'/accounts/{uuid}/transactions',
+            params={'page': page, 'per_page': per_page}
+        )
+        return PaginatedResponse.from_dict(response, self._model(Transaction))
+    
+    def iter_transactions(
+        self,
+        uuid: str,
+        per_page: int = 100,
+        prefetch: bool = True,
+        stream: bool = False
+    ) -> AsyncIterator[Transaction]:
+        """
+        Iterate over an account's full transaction history, fetching pages lazily.
+        
+        Args:
+            uuid: Account UUID
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            stream: Parse each page while it downloads instead of prefetching
+                the next one; prefetch is ignored
+            
+        Returns:
+            Async iterator yielding Transaction objects
+        """
+        if stream:
+            return aiterate_streamed_items(
+                lambda page: self.client.stream(
+                    f'/accounts/{uuid}/transactions', params={'page': page, 'per_page': per_page}
+                ),
+                self._model(Transaction)
+            )
+        return aiterate_items(lambda page: self.get_transactions(uuid, page=page, per_page=per_page), prefetch=prefetch)
+    
+    async def transaction_columns(self, uuid: str, per_page: int = 100, max_workers: int = 8) -> 'ColumnBatch':
+        """
+        Load an account's full transaction history into a columnar batch.
+        
+        Pages are fetched concurrently and packed into NumPy columns as they
+        arrive, without creating a Transaction object per row. Requires numpy.
+        
+        Args:
+            uuid: Account UUID
+            per_page: Items per page
+            max_workers: Number of concurrent page requests
+            
+        Returns:
+            ColumnBatch with TRANSACTION_COLUMNS
+        """
+        from ..columnar import TRANSACTION_COLUMNS, ColumnBuilder
+        builder = ColumnBuilder(TRANSACTION_COLUMNS)
+        pages = aexport_pages(lambda page: self._raw_transactions_page(uuid, page, per_page), max_workers=max_workers)
+        async for page in pages:
+            builder.extend(page.data)
+        return builder.build()
+    
+    async def _raw_transactions_page(self, uuid: str, page: int, per_page: int) -> PaginatedResponse:
+        """Fetch one page of an account's transactions as a PaginatedResponse of raw dicts."""
+        response = await self._get(f'/accounts/{uuid}/transactions', params={'page': page, 'per_page': per_page})
+        return PaginatedResponse.from_dict(response)
+    
+    async def get_transfers(self, uuid: str, page: int = 1, per_page: int = 20) -> PaginatedResponse:
+        """
+        Get account transfer history.
+        
+        Args:
+            uuid: Account UUID
+            page: Page number
+            per_page: Items per page
+            
+        Returns:
+            PaginatedResponse containing Transfer objects
+        """
+        response = await self._get(
+            f'/accounts/{uuid}/transfers',
+            params={'page': page, 'per_page': per_page}
+        )
+        return PaginatedResponse.from_dict(response, self._model(Transfer))
+    
+    def iter_transfers(self, uuid: str, per_page: int = 100, prefetch: bool = True) -> AsyncIterator[Transfer]:
+        """
+        Iterate over an account's full transfer history, fetching pages lazily.
+        
+        Args:
+            uuid: Account UUID
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Async iterator yielding Transfer objects
+        """
+        return aiterate_items(lambda page: self.get_transfers(uuid, page=page, per_page=per_page), prefetch=prefetch)
\ No newline at end of file
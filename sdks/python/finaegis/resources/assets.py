@@ -2,9 +2,10 @@
 Assets resource for the FinAegis SDK
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, AsyncIterator
 from ..types import Asset, PaginatedResponse
-from .base import BaseResource
+from ..pagination import aiterate_items, iterate_items
+from .base import AsyncBaseResource, BaseResource
 
 
 class AssetsResource(BaseResource):
@@ -24,18 +25,36 @@ class AssetsResource(BaseResource):
         response = self._get('/assets', params={'page': page, 'per_page': per_page})
         return PaginatedResponse.from_dict(response, Asset)
     
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> Iterator[Asset]:
+        """
+        Iterate over all assets, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Iterator yielding Asset objects
+        """
+        return iterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
     def get(self, code: str) -> Asset:
         """
         Get asset details.
         
+        Served from the client cache when caching is enabled.
+        
         Args:
             code: Asset code
             
         Returns:
             Asset object
         """
-        response = self._get(f'/assets/{code}')
-        return Asset.from_dict(response['data'])
+        def load() -> Asset:
+            response = self._get(f'/assets/{code}')
+            return Asset.from_dict(response['data'])
+        
+        return self._cached('assets', (code,), load)
     
     def create(
         self,
@@ -62,6 +81,7 @@ class AssetsResource(BaseResource):
             'type': asset_type,
             'decimals': decimals
         })
+        self._invalidate('assets')
         return Asset.from_dict(response['data'])
     
     def update(
@@ -96,6 +116,7 @@ class AssetsResource(BaseResource):
             data['is_active'] = is_active
             
         response = self._put(f'/assets/{code}', data)
+        self._invalidate('assets')
         return Asset.from_dict(response['data'])
     
     def delete(self, code: str) -> Dict[str, str]:
@@ -108,4 +129,132 @@ class AssetsResource(BaseResource):
         Returns:
             Success message
         """
-        return self._delete(f'/assets/{code}')
\ No newline at end of file
+        response = self._delete(f'/assets/{code}')
+        self._invalidate('assets')
+        return response
+
+
+class AsyncAssetsResource(AsyncBaseResource):
+    """Manage assets in the FinAegis platform (asyncio)."""
+    
+    async def list(self, page: int = 1, per_page: int = 20) -> PaginatedResponse:
+        """
+        List all assets.
+        
+        Args:
+            page: Page number
+            per_page: Items per page
+            
+        Returns:
+            PaginatedResponse containing Asset objects
+        """
+        response = await self._get('/assets', params={'page': page, 'per_page': per_page})
+        return PaginatedResponse.from_dict(response, Asset)
+    
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> AsyncIterator[Asset]:
+        """
+        Iterate over all assets, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Async iterator yielding Asset objects
+        """
+        return aiterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
+    async def get(self, code: str) -> Asset:
+        """
+        Get asset details.
+        
+        Served from the client cache when caching is enabled.
+        
+        Args:
+            code: Asset code
+            
+        Returns:
+            Asset object
+        """
+        async def load() -> Asset:
+            response = await self._get(f'/assets/{code}')
+            return Asset.from_dict(response['data'])
+        
+        return await self._cached('assets', (code,), load)
+    
+    async def create(
+        self,
+        code: str,
+        name: str,
+        asset_type: str,
+        decimals: int = 2
+    ) -> Asset:
+        """
+        Create a new asset.
+        
+        Args:
+            code: Asset code (e.g., 'USD', 'EUR')
+            name: Asset name
+            asset_type: Type of asset ('fiat', 'crypto', 'commodity')
+            decimals: Number of decimal places
+            
+        Returns:
+            Created Asset object
+        """
+        response = await self._post('/assets', {
+            'code': code,
+            'name': name,
+            'type': asset_type,
+            'decimals': decimals
+        })
+        self._invalidate('assets')
+        return Asset.from_dict(response['data'])
+    
+    async def update(
+        self,
+        code: str,
+        name: Optional[str] = None,
+        asset_type: Optional[str] = None,
+        decimals: Optional[int] = None,
+        is_active: Optional[bool] = None
+    ) -> Asset:
+        """
+        Update an asset.
+        
+        Args:
+            code: Asset code
+            name: New asset name
+            asset_type: New asset type
+            decimals: New decimal places
+            is_active: Whether the asset is active
+            
+        Returns:
+            Updated Asset object
+        """
+        data: Dict[str, Any] = {}
+        if name is not None:
+            data['name'] = name
+        if asset_type is not None:
+            data['type'] = asset_type
+        if decimals is not None:
+            data['decimals'] = decimals
+        if is_active is not None:
+            data['is_active'] = is_active
+            
+        response = await self._put(f'/assets/{code}', data)
+        self._invalidate('assets')
+        return Asset.from_dict(response['data'])
+    
+    async def delete(self, code: str) -> Dict[str, str]:
+        """
+        Delete an asset.
+        
+        Args:
+            code: Asset code
+            
+        Returns:
+            Success message
+        """
+        response = await self._delete(f'/assets/{code}')
+        self._invalidate('assets')
+        return response
\ No newline at end of file
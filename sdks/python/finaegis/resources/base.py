@@ -2,9 +2,12 @@
 Base resource class for all API resources
 """
 
-from typing import TYPE_CHECKING, Dict, Any, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from ..types import LAZY_MODELS
 
 if TYPE_CHECKING:
+    from ..async_client import AsyncFinAegis
     from ..client import FinAegis
 
 
@@ -14,13 +17,41 @@ class BaseResource:
     def __init__(self, client: 'FinAegis'):
         self.client = client
     
+    def _cached(self, namespace: str, key: Tuple[Hashable, ...], loader: Callable[[], Any]) -> Any:
+        """Return loader() through the client cache when caching is enabled."""
+        cache = self.client.cache
+        ttl = self.client.cache_ttls.get(namespace)
+        if cache is None or not ttl:
+            return loader()
+        hit, value = cache.get((namespace,) + key)
+        if hit:
+            return value
+        value = loader()
+        cache.set((namespace,) + key, value, ttl)
+        return value
+    
+    def _invalidate(self, *namespaces: str) -> None:
+        """Drop cached entries made stale by a write."""
+        if self.client.cache is not None:
+            for namespace in namespaces:
+                self.client.cache.invalidate(namespace)
+    
+    def _model(self, model: type) -> type:
+        """Model class for list items, honouring the client's lazy_models option."""
+        return LAZY_MODELS.get(model, model) if self.client.lazy_models else model
+    
     def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a GET request."""
         return self.client.get(path, params=params)
     
-    def _post(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _post(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Make a POST request."""
-        return self.client.post(path, json=data)
+        return self.client.post(path, json=data, idempotency_key=idempotency_key)
     
     def _put(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a PUT request."""
@@ -28,4 +59,60 @@ class BaseResource:
     
     def _delete(self, path: str) -> Dict[str, Any]:
         """Make a DELETE request."""
-        return self.client.delete(path)
\ No newline at end of file
+        return self.client.delete(path)
+
+
+class AsyncBaseResource:
+    """Base class for all asyncio API resources."""
+    
+    def __init__(self, client: 'AsyncFinAegis'):
+        self.client = client
+    
+    async def _cached(
+        self,
+        namespace: str,
+        key: Tuple[Hashable, ...],
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Await loader() through the client cache when caching is enabled."""
+        cache = self.client.cache
+        ttl = self.client.cache_ttls.get(namespace)
+        if cache is None or not ttl:
+            return await loader()
+        hit, value = cache.get((namespace,) + key)
+        if hit:
+            return value
+        value = await loader()
+        cache.set((namespace,) + key, value, ttl)
+        return value
+    
+    def _invalidate(self, *namespaces: str) -> None:
+        """Drop cached entries made stale by a write."""
+        if self.client.cache is not None:
+            for namespace in namespaces:
+                self.client.cache.invalidate(namespace)
+    
+    def _model(self, model: type) -> type:
+        """Model class for list items, honouring the client's lazy_models option."""
+        return LAZY_MODELS.get(model, model) if self.client.lazy_models else model
+    
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make a GET request."""
+        return await self.client.get(path, params=params)
+    
+    async def _post(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Make a POST request."""
+        return await self.client.post(path, json=data, idempotency_key=idempotency_key)
+    
+    async def _put(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make a PUT request."""
+        return await self.client.put(path, json=data)
+    
+    async def _delete(self, path: str) -> Dict[str, Any]:
+        """Make a DELETE request."""
+        return await self.client.delete(path)
\ No newline at end of file
@@ -2,9 +2,13 @@
 Baskets resource for the FinAegis SDK
 """
 
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Iterator, AsyncIterator
 from ..types import Basket, PaginatedResponse
-from .base import BaseResource
+from ..pagination import aiterate_items, iterate_items
+from .base import AsyncBaseResource, BaseResource
+
+if TYPE_CHECKING:
+    from ..columnar import ColumnBatch
 
 
 class BasketsResource(BaseResource):
@@ -24,18 +28,36 @@ class BasketsResource(BaseResource):
         response = self._get('/baskets', params={'page': page, 'per_page': per_page})
         return PaginatedResponse.from_dict(response, Basket)
     
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> Iterator[Basket]:
+        """
+        Iterate over all baskets, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Iterator yielding Basket objects
+        """
+        return iterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
     def get(self, code: str) -> Basket:
         """
         Get basket details.
         
+        Served from the client cache when caching is enabled.
+        
         Args:
             code: Basket code
             
         Returns:
             Basket object
         """
-        response = self._get(f'/baskets/{code}')
-        return Basket.from_dict(response['data'])
+        def load() -> Basket:
+            response = self._get(f'/baskets/{code}')
+            return Basket.from_dict(response['data'])
+        
+        return self._cached('baskets', (code,), load)
     
     def get_value(self, code: str) -> Dict[str, Any]:
         """
@@ -73,6 +95,23 @@ class BasketsResource(BaseResource):
         )
         return response['data']
     
+    def get_history_columns(self, code: str, period: str = '30d', interval: str = 'daily') -> 'ColumnBatch':
+        """
+        Get basket value history as columns (calculated_at, value).
+        
+        Requires numpy.
+        
+        Args:
+            code: Basket code
+            period: Time period ('24h', '7d', '30d', '90d', '1y', 'all')
+            interval: Data interval ('hourly', 'daily', 'weekly', 'monthly')
+            
+        Returns:
+            ColumnBatch with BASKET_HISTORY_COLUMNS
+        """
+        from ..columnar import BASKET_HISTORY_COLUMNS, to_columns
+        return to_columns(self.get_history(code, period, interval), BASKET_HISTORY_COLUMNS)
+    
     def get_performance(self, code: str) -> Dict[str, Any]:
         """
         Get basket performance metrics.
@@ -114,6 +153,7 @@ class BasketsResource(BaseResource):
             data['description'] = description
             
         response = self._post('/baskets', data)
+        self._invalidate('baskets', 'gcu')
         return Basket.from_dict(response['data'])
     
     def rebalance(self, code: str, new_composition: Dict[str, float]) -> Dict[str, Any]:
@@ -130,6 +170,7 @@ class BasketsResource(BaseResource):
         response = self._post(f'/baskets/{code}/rebalance', {
             'composition': new_composition
         })
+        self._invalidate('baskets', 'gcu')
         return response['data']
     
     def compose(self, account_uuid: str, basket_code: str, amount: int) -> Dict[str, Any]:
@@ -166,4 +207,203 @@ class BasketsResource(BaseResource):
             'basket_code': basket_code,
             'amount': amount
         })
+        return response['data']
+
+
+class AsyncBasketsResource(AsyncBaseResource):
+    """Manage basket assets in the FinAegis platform (asyncio)."""
+    
+    async def list(self, page: int = 1, per_page: int = 20) -> PaginatedResponse:
+        """
+        List all baskets.
+        
+        Args:
+            page: Page number
+            per_page: Items per page
+            
+        Returns:
+            PaginatedResponse containing Basket objects
+        """
+        response = await self._get('/baskets', params={'page': page, 'per_page': per_page})
+        return PaginatedResponse.from_dict(response, Basket)
+    
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> AsyncIterator[Basket]:
+        """
+        Iterate over all baskets, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Async iterator yielding Basket objects
+        """
+        return aiterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
+    async def get(self, code: str) -> Basket:
+        """
+        Get basket details.
+        
+        Served from the client cache when caching is enabled.
+        
+        Args:
+            code: Basket code
+            
+        Returns:
+            Basket object
+        """
+        async def load() -> Basket:
+            response = await self._get(f'/baskets/{code}')
+            return Basket.from_dict(response['data'])
+        
+        return await self._cached('baskets', (code,), load)
+    
+    async def get_value(self, code: str) -> Dict[str, Any]:
+        """
+        Get current basket value.
+        
+        Args:
+            code: Basket code
+            
+        Returns:
+            Dictionary with value information
+        """
+        response = await self._get(f'/baskets/{code}/value')
+        return response['data']
+    
+    async def get_history(
+        self,
+        code: str,
+        period: str = '30d',
+        interval: str = 'daily'
+    ) -> List[Dict[str, Any]]:
+        """
+        Get basket value history.
+        
+        Args:
+            code: Basket code
+            period: Time period ('24h', '7d', '30d', '90d', '1y', 'all')
+            interval: Data interval ('hourly', 'daily', 'weekly', 'monthly')
+            
+        Returns:
+            List of historical value data points
+        """
+        response = await self._get(
+            f'/baskets/{code}/history',
+            params={'period': period, 'interval': interval}
+        )
+        return response['data']
+    
+    async def get_history_columns(self, code: str, period: str = '30d', interval: str = 'daily') -> 'ColumnBatch':
+        """
+        Get basket value history as columns (calculated_at, value).
+        
+        Requires numpy.
+        
+        Args:
+            code: Basket code
+            period: Time period ('24h', '7d', '30d', '90d', '1y', 'all')
+            interval: Data interval ('hourly', 'daily', 'weekly', 'monthly')
+            
+        Returns:
+            ColumnBatch with BASKET_HISTORY_COLUMNS
+        """
+        from ..columnar import BASKET_HISTORY_COLUMNS, to_columns
+        return to_columns(await self.get_history(code, period, interval), BASKET_HISTORY_COLUMNS)
+    
+    async def get_performance(self, code: str) -> Dict[str, Any]:
+        """
+        Get basket performance metrics.
+        
+        Args:
+            code: Basket code
+            
+        Returns:
+            Dictionary with performance metrics
+        """
+        response = await self._get(f'/baskets/{code}/performance')
+        return response['data']
+    
+    async def create(
+        self,
+        code: str,
+        name: str,
+        composition: Dict[str, float],
+        description: Optional[str] = None
+    ) -> Basket:
+        """
+        Create a new basket.
+        
+        Args:
+            code: Basket code
+            name: Basket name
+            composition: Dictionary mapping asset codes to weights
+            description: Optional description
+            
+        Returns:
+            Created Basket object
+        """
+        data = {
+            'code': code,
+            'name': name,
+            'composition': composition
+        }
+        if description:
+            data['description'] = description
+            
+        response = await self._post('/baskets', data)
+        self._invalidate('baskets', 'gcu')
+        return Basket.from_dict(response['data'])
+    
+    async def rebalance(self, code: str, new_composition: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Rebalance a basket with new composition.
+        
+        Args:
+            code: Basket code
+            new_composition: New composition weights
+            
+        Returns:
+            Response with updated basket information
+        """
+        response = await self._post(f'/baskets/{code}/rebalance', {
+            'composition': new_composition
+        })
+        self._invalidate('baskets', 'gcu')
+        return response['data']
+    
+    async def compose(self, account_uuid: str, basket_code: str, amount: int) -> Dict[str, Any]:
+        """
+        Compose basket tokens from underlying assets.
+        
+        Args:
+            account_uuid: Account UUID
+            basket_code: Basket code
+            amount: Amount of basket tokens to create
+            
+        Returns:
+            Transaction information
+        """
+        response = await self._post(f'/accounts/{account_uuid}/baskets/compose', {
+            'basket_code': basket_code,
+            'amount': amount
+        })
+        return response['data']
+    
+    async def decompose(self, account_uuid: str, basket_code: str, amount: int) -> Dict[str, Any]:
+        """
+        Decompose basket tokens into underlying assets.
+        
+        Args:
+            account_uuid: Account UUID
+            basket_code: Basket code
+            amount: Amount of basket tokens to decompose
+            
+        Returns:
+            Transaction information
+        """
+        response = await self._post(f'/accounts/{account_uuid}/baskets/decompose', {
+            'basket_code': basket_code,
+            'amount': amount
+        })
         return response['data']
\ No newline at end of file
@@ -2,9 +2,14 @@
 Exchange rates resource for the FinAegis SDK
 """
 
-from typing import Dict, Any
+from datetime import timedelta
+from typing import TYPE_CHECKING, Dict, Any, Iterator, AsyncIterator, Union
 from ..types import ExchangeRate, PaginatedResponse
-from .base import BaseResource
+from ..pagination import aiterate_items, iterate_items
+from .base import AsyncBaseResource, BaseResource
+
+if TYPE_CHECKING:
+    from ..converter import CurrencyConverter
 
 
 class ExchangeRatesResource(BaseResource):
@@ -24,10 +29,25 @@ class ExchangeRatesResource(BaseResource):
         response = self._get('/exchange-rates', params={'page': page, 'per_page': per_page})
         return PaginatedResponse.from_dict(response, ExchangeRate)
     
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> Iterator[ExchangeRate]:
+        """
+        Iterate over all exchange rates, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Iterator yielding ExchangeRate objects
+        """
+        return iterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
     def get(self, from_asset: str, to_asset: str) -> ExchangeRate:
         """
         Get exchange rate between two assets.
         
+        Served from the client cache when caching is enabled.
+        
         Args:
             from_asset: Source asset code
             to_asset: Target asset code
@@ -35,17 +55,20 @@ class ExchangeRatesResource(BaseResource):
         Returns:
             ExchangeRate object
         """
-        response = self._get(f'/exchange-rates/{from_asset}/{to_asset}')
-        return ExchangeRate.from_dict(response['data'])
+        def load() -> ExchangeRate:
+            response = self._get(f'/exchange-rates/{from_asset}/{to_asset}')
+            return ExchangeRate.from_dict(response['data'])
+        
+        return self._cached('exchange_rates', (from_asset, to_asset), load)
     
-    def convert(self, from_asset: str, to_asset: str, amount: float) -> Dict[str, Any]:
+    def convert(self, from_asset: str, to_asset: str, amount: int) -> Dict[str, Any]:
         """
         Convert amount between two assets.
         
         Args:
             from_asset: Source asset code
             to_asset: Target asset code
-            amount: Amount to convert
+            amount: Amount to convert, in minor units of from_asset
             
         Returns:
             Dictionary with conversion details
@@ -56,12 +79,150 @@ class ExchangeRatesResource(BaseResource):
         )
         return response['data']
     
+    def converter(
+        self,
+        max_age: Union[float, timedelta, None] = None,
+        tolerance: int = 1,
+        per_page: int = 100
+    ) -> 'CurrencyConverter':
+        """
+        Load the full rate table into an offline converter.
+        
+        Conversions then run in-process, including cross rates the server
+        does not quote directly. When a rate used is older than max_age, the
+        table is reloaded once from the API.
+        
+        Args:
+            max_age: Maximum age of a rate, in seconds or as a timedelta
+            tolerance: Accepted difference, in minor units, when checking the
+                converter against the server with ``verify``
+            per_page: Page size used to load the rate table
+            
+        Returns:
+            CurrencyConverter object
+        """
+        from ..converter import CurrencyConverter
+        
+        def load() -> list:
+            return list(self.iter_all(per_page=per_page))
+        
+        return CurrencyConverter(load(), max_age=max_age, tolerance=tolerance, loader=load)
+    
     def refresh(self) -> Dict[str, Any]:
         """
         Refresh all exchange rates.
         
+        Also invalidates exchange rates held in the client cache.
+        
         Returns:
             Dictionary with refresh status
         """
         response = self._post('/exchange-rates/refresh')
+        self._invalidate('exchange_rates')
+        return response['data']
+
+
+class AsyncExchangeRatesResource(AsyncBaseResource):
+    """Manage exchange rates in the FinAegis platform (asyncio)."""
+    
+    async def list(self, page: int = 1, per_page: int = 20) -> PaginatedResponse:
+        """
+        List all exchange rates.
+        
+        Args:
+            page: Page number
+            per_page: Items per page
+            
+        Returns:
+            PaginatedResponse containing ExchangeRate objects
+        """
+        response = await self._get('/exchange-rates', params={'page': page, 'per_page': per_page})
+        return PaginatedResponse.from_dict(response, ExchangeRate)
+    
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> AsyncIterator[ExchangeRate]:
+        """
+        Iterate over all exchange rates, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Async iterator yielding ExchangeRate objects
+        """
+        return aiterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
+    async def get(self, from_asset: str, to_asset: str) -> ExchangeRate:
+        """
+        Get exchange rate between two assets.
+        
+        Served from the client cache when caching is enabled.
+        
+        Args:
+            from_asset: Source asset code
+            to_asset: Target asset code
+            
+        Returns:
+            ExchangeRate object
+        """
+        async def load() -> ExchangeRate:
+            response = await self._get(f'/exchange-rates/{from_asset}/{to_asset}')
+            return ExchangeRate.from_dict(response['data'])
+        
+        return await self._cached('exchange_rates', (from_asset, to_asset), load)
+    
+    async def convert(self, from_asset: str, to_asset: str, amount: int) -> Dict[str, Any]:
+        """
+        Convert amount between two assets.
+        
+        Args:
+            from_asset: Source asset code
+            to_asset: Target asset code
+            amount: Amount to convert, in minor units of from_asset
+            
+        Returns:
+            Dictionary with conversion details
+        """
+        response = await self._get(
+            f'/exchange-rates/{from_asset}/{to_asset}/convert',
+            params={'amount': amount}
+        )
+        return response['data']
+    
+    async def converter(
+        self,
+        max_age: Union[float, timedelta, None] = None,
+        tolerance: int = 1,
+        per_page: int = 100
+    ) -> 'CurrencyConverter':
+        """
+        Load the full rate table into an offline converter.
+        
+        The converter has no loader: once its rates are older than max_age it
+        raises StaleRatesError, and a fresh one should be awaited.
+        
+        Args:
+            max_age: Maximum age of a rate, in seconds or as a timedelta
+            tolerance: Accepted difference, in minor units, when checking the
+                converter against the server with ``averify``
+            per_page: Page size used to load the rate table
+            
+        Returns:
+            CurrencyConverter object
+        """
+        from ..converter import CurrencyConverter
+        rates = [rate async for rate in self.iter_all(per_page=per_page)]
+        return CurrencyConverter(rates, max_age=max_age, tolerance=tolerance)
+    
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Refresh all exchange rates.
+        
+        Also invalidates exchange rates held in the client cache.
+        
+        Returns:
+            Dictionary with refresh status
+        """
+        response = await self._post('/exchange-rates/refresh')
+        self._invalidate('exchange_rates')
         return response['data']
\ No newline at end of file
@@ -2,9 +2,12 @@
 GCU (Global Currency Unit) resource for the FinAegis SDK
 """
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from ..types import GCUInfo
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
+
+if TYPE_CHECKING:
+    from ..columnar import ColumnBatch
 
 
 class GCUResource(BaseResource):
@@ -14,21 +17,31 @@ class GCUResource(BaseResource):
         """
         Get GCU information.
         
+        Served from the client cache when caching is enabled.
+        
         Returns:
             GCUInfo object
         """
-        response = self._get('/gcu')
-        return GCUInfo.from_dict(response['data'])
+        def load() -> GCUInfo:
+            response = self._get('/gcu')
+            return GCUInfo.from_dict(response['data'])
+        
+        return self._cached('gcu', ('info',), load)
     
     def get_composition(self) -> GCUInfo:
         """
         Get real-time GCU composition.
         
+        Served from the client cache when caching is enabled.
+        
         Returns:
             GCUInfo object with current composition
         """
-        response = self._get('/gcu/composition')
-        return GCUInfo.from_dict(response['data'])
+        def load() -> GCUInfo:
+            response = self._get('/gcu/composition')
+            return GCUInfo.from_dict(response['data'])
+        
+        return self._cached('gcu', ('composition',), load)
     
     def get_value_history(
         self,
@@ -51,6 +64,22 @@ class GCUResource(BaseResource):
         )
         return response['data']
     
+    def get_value_history_columns(self, period: str = '30d', interval: str = 'daily') -> 'ColumnBatch':
+        """
+        Get GCU value history as columns (timestamp, value, change).
+        
+        Requires numpy.
+        
+        Args:
+            period: Time period ('24h', '7d', '30d', '90d', '1y', 'all')
+            interval: Data interval ('hourly', 'daily', 'weekly', 'monthly')
+            
+        Returns:
+            ColumnBatch with GCU_VALUE_HISTORY_COLUMNS
+        """
+        from ..columnar import GCU_VALUE_HISTORY_COLUMNS, to_columns
+        return to_columns(self.get_value_history(period, interval), GCU_VALUE_HISTORY_COLUMNS)
+    
     def get_active_polls(self) -> List[Dict[str, Any]]:
         """
         Get active governance polls.
@@ -69,4 +98,95 @@ class GCUResource(BaseResource):
             List of supported bank information
         """
         response = self._get('/gcu/supported-banks')
+        return response['data']
+
+
+class AsyncGCUResource(AsyncBaseResource):
+    """Manage GCU operations in the FinAegis platform (asyncio)."""
+    
+    async def get_info(self) -> GCUInfo:
+        """
+        Get GCU information.
+        
+        Served from the client cache when caching is enabled.
+        
+        Returns:
+            GCUInfo object
+        """
+        async def load() -> GCUInfo:
+            response = await self._get('/gcu')
+            return GCUInfo.from_dict(response['data'])
+        
+        return await self._cached('gcu', ('info',), load)
+    
+    async def get_composition(self) -> GCUInfo:
+        """
+        Get real-time GCU composition.
+        
+        Served from the client cache when caching is enabled.
+        
+        Returns:
+            GCUInfo object with current composition
+        """
+        async def load() -> GCUInfo:
+            response = await self._get('/gcu/composition')
+            return GCUInfo.from_dict(response['data'])
+        
+        return await self._cached('gcu', ('composition',), load)
+    
+    async def get_value_history(
+        self,
+        period: str = '30d',
+        interval: str = 'daily'
+    ) -> List[Dict[str, Any]]:
+        """
+        Get GCU value history.
+        
+        Args:
+            period: Time period ('24h', '7d', '30d', '90d', '1y', 'all')
+            interval: Data interval ('hourly', 'daily', 'weekly', 'monthly')
+            
+        Returns:
+            List of historical value data points
+        """
+        response = await self._get(
+            '/gcu/value-history',
+            params={'period': period, 'interval': interval}
+        )
+        return response['data']
+    
+    async def get_value_history_columns(self, period: str = '30d', interval: str = 'daily') -> 'ColumnBatch':
+        """
+        Get GCU value history as columns (timestamp, value, change).
+        
+        Requires numpy.
+        
+        Args:
+            period: Time period ('24h', '7d', '30d', '90d', '1y', 'all')
+            interval: Data interval ('hourly', 'daily', 'weekly', 'monthly')
+            
+        Returns:
+            ColumnBatch with GCU_VALUE_HISTORY_COLUMNS
+        """
+        from ..columnar import GCU_VALUE_HISTORY_COLUMNS, to_columns
+        return to_columns(await self.get_value_history(period, interval), GCU_VALUE_HISTORY_COLUMNS)
+    
+    async def get_active_polls(self) -> List[Dict[str, Any]]:
+        """
+        Get active governance polls.
+        
+        Returns:
+            List of active poll information
+        """
+        response = await self._get('/gcu/governance/active-polls')
+        return response['data']
+    
+    async def get_supported_banks(self) -> List[Dict[str, Any]]:
+        """
+        Get supported banks for GCU operations.
+        
+        Returns:
+            List of supported bank information
+        """
+        response = await self._get('/gcu/supported-banks')
         return response['data']
\ No newline at end of file
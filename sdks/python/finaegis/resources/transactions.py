@@ -2,8 +2,15 @@
 Transactions resource for the FinAegis SDK
 """
 
+from typing import TYPE_CHECKING, Iterator, AsyncIterator
 from ..types import Transaction, PaginatedResponse
-from .base import BaseResource
+from ..pagination import (
+    aexport_pages, aiterate_items, aiterate_streamed_items, export_pages, iterate_items, iterate_streamed_items
+)
+from .base import AsyncBaseResource, BaseResource
+
+if TYPE_CHECKING:
+    from ..columnar import ColumnBatch
 
 
 class TransactionsResource(BaseResource):
@@ -21,7 +28,75 @@ class TransactionsResource(BaseResource):
             PaginatedResponse containing Transaction objects
         """
         response = self._get('/transactions', params={'page': page, 'per_page': per_page})
-        return PaginatedResponse.from_dict(response, Transaction)
+        return PaginatedResponse.from_dict(response, self._model(Transaction))
+    
+    def iter_all(self, per_page: int = 100, prefetch: bool = True, stream: bool = False) -> Iterator[Transaction]:
+        """
+        Iterate over all transactions, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            stream: Parse each page while it downloads instead of prefetching
+                the next one; prefetch is ignored
+            
+        Returns:
+            Iterator yielding Transaction objects
+        """
+        if stream:
+            return iterate_streamed_items(
+                lambda page: self.client.stream('/transactions', params={'page': page, 'per_page': per_page}),
+                self._model(Transaction)
+            )
+        return iterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
+    def export(
+        self,
+        per_page: int = 100,
+        max_workers: int = 8,
+        ordered: bool = True
+    ) -> Iterator[PaginatedResponse]:
+        """
+        Export all transactions, fetching the remaining pages concurrently.
+        
+        Args:
+            per_page: Items per page
+            max_workers: Number of concurrent page requests
+            ordered: Yield pages in page order; when False, pages are yielded
+                as they arrive and carry their number in ``current_page``
+            
+        Returns:
+            Iterator yielding PaginatedResponse pages of Transaction objects
+        """
+        return export_pages(
+            lambda page: self.list(page=page, per_page=per_page),
+            max_workers=max_workers,
+            ordered=ordered
+        )
+    
+    def columns(self, per_page: int = 100, max_workers: int = 8) -> 'ColumnBatch':
+        """
+        Load all transactions into a columnar batch for analytics.
+        
+        Pages are fetched concurrently and packed into NumPy columns as they
+        arrive, without creating a Transaction object per row. Requires numpy.
+        
+        Args:
+            per_page: Items per page
+            max_workers: Number of concurrent page requests
+            
+        Returns:
+            ColumnBatch with TRANSACTION_COLUMNS
+        """
+        from ..columnar import TRANSACTION_COLUMNS, ColumnBuilder
+        builder = ColumnBuilder(TRANSACTION_COLUMNS)
+        for page in export_pages(lambda page: self._raw_page(page, per_page), max_workers=max_workers):
+            builder.extend(page.data)
+        return builder.build()
+    
+    def _raw_page(self, page: int, per_page: int) -> PaginatedResponse:
+        """Fetch one page of transactions as a PaginatedResponse of raw dicts."""
+        return PaginatedResponse.from_dict(self._get('/transactions', params={'page': page, 'per_page': per_page}))
     
     def get(self, transaction_id: str) -> Transaction:
         """
@@ -34,4 +109,103 @@ class TransactionsResource(BaseResource):
             Transaction object
         """
         response = self._get(f'/transactions/{transaction_id}')
+        return Transaction.from_dict(response['data'])
+
+
+class AsyncTransactionsResource(AsyncBaseResource):
+    """Manage transactions in the FinAegis platform (asyncio)."""
+    
+    async def list(self, page: int = 1, per_page: int = 20) -> PaginatedResponse:
+        """
+        List all transactions.
+        
+        Args:
+            page: Page number
+            per_page: Items per page
+            
+        Returns:
+            PaginatedResponse containing Transaction objects
+        """
+        response = await self._get('/transactions', params={'page': page, 'per_page': per_page})
+        return PaginatedResponse.from_dict(response, self._model(Transaction))
+    
+    def iter_all(self, per_page: int = 100, prefetch: bool = True, stream: bool = False) -> AsyncIterator[Transaction]:
+        """
+        Iterate over all transactions, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            stream: Parse each page while it downloads instead of prefetching
+                the next one; prefetch is ignored
+            
+        Returns:
+            Async iterator yielding Transaction objects
+        """
+        if stream:
+            return aiterate_streamed_items(
+                lambda page: self.client.stream('/transactions', params={'page': page, 'per_page': per_page}),
+                self._model(Transaction)
+            )
+        return aiterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
+    def export(
+        self,
+        per_page: int = 100,
+        max_workers: int = 8,
+        ordered: bool = True
+    ) -> AsyncIterator[PaginatedResponse]:
+        """
+        Export all transactions, fetching the remaining pages concurrently.
+        
+        Args:
+            per_page: Items per page
+            max_workers: Number of concurrent page requests
+            ordered: Yield pages in page order; when False, pages are yielded
+                as they arrive and carry their number in ``current_page``
+            
+        Returns:
+            Async iterator yielding PaginatedResponse pages of Transaction objects
+        """
+        return aexport_pages(
+            lambda page: self.list(page=page, per_page=per_page),
+            max_workers=max_workers,
+            ordered=ordered
+        )
+    
+    async def columns(self, per_page: int = 100, max_workers: int = 8) -> 'ColumnBatch':
+        """
+        Load all transactions into a columnar batch for analytics.
+        
+        Pages are fetched concurrently and packed into NumPy columns as they
+        arrive, without creating a Transaction object per row. Requires numpy.
+        
+        Args:
+            per_page: Items per page
+            max_workers: Number of concurrent page requests
+            
+        Returns:
+            ColumnBatch with TRANSACTION_COLUMNS
+        """
+        from ..columnar import TRANSACTION_COLUMNS, ColumnBuilder
+        builder = ColumnBuilder(TRANSACTION_COLUMNS)
+        async for page in aexport_pages(lambda page: self._raw_page(page, per_page), max_workers=max_workers):
+            builder.extend(page.data)
+        return builder.build()
+    
+    async def _raw_page(self, page: int, per_page: int) -> PaginatedResponse:
+        """Fetch one page of transactions as a PaginatedResponse of raw dicts."""
+        return PaginatedResponse.from_dict(await self._get('/transactions', params={'page': page, 'per_page': per_page}))
+    
+    async def get(self, transaction_id: str) -> Transaction:
+        """
+        Get transaction details.
+        
+        Args:
+            transaction_id: Transaction ID
+            
+        Returns:
+            Transaction object
+        """
+        response = await self._get(f'/transactions/{transaction_id}')
         return Transaction.from_dict(response['data'])
\ No newline at end of file
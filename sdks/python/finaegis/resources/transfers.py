@@ -2,9 +2,19 @@
 Transfers resource for the FinAegis SDK
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
+from ..bulk import BulkResult, async_run_bulk, run_bulk
+from ..idempotency import new_idempotency_key
 from ..types import Transfer
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
+
+
+def _with_idempotency_keys(transfers: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Give each transfer spec a stable idempotency key before it is sent."""
+    for spec in transfers:
+        spec = dict(spec)
+        spec.setdefault('idempotency_key', new_idempotency_key())
+        yield spec
 
 
 class TransfersResource(BaseResource):
@@ -17,7 +27,8 @@ class TransfersResource(BaseResource):
         amount: int,
         asset_code: str = 'USD',
         reference: Optional[str] = None,
-        workflow_enabled: bool = True
+        workflow_enabled: bool = True,
+        idempotency_key: Optional[str] = None
     ) -> Transfer:
         """
         Create a new transfer.
@@ -29,9 +40,11 @@ class TransfersResource(BaseResource):
             asset_code: Asset code (default: USD)
             reference: Optional reference for the transfer
             workflow_enabled: Whether to enable workflow processing
+            idempotency_key: Key deduplicating retries of this transfer
+                (generated when omitted)
             
         Returns:
-            Transfer object
+            Transfer object, with the idempotency key that was sent
         """
         data = {
             'from_account': from_account,
@@ -43,8 +56,43 @@ class TransfersResource(BaseResource):
         if reference:
             data['reference'] = reference
             
-        response = self._post('/transfers', data)
-        return Transfer.from_dict(response['data'])
+        idempotency_key = idempotency_key or new_idempotency_key()
+        response = self._post('/transfers', data, idempotency_key=idempotency_key)
+        transfer = Transfer.from_dict(response['data'])
+        transfer.idempotency_key = idempotency_key
+        return transfer
+    
+    def create_many(
+        self,
+        transfers: Iterable[Dict[str, Any]],
+        max_workers: int = 8,
+        max_rate_limit_retries: int = 10
+    ) -> BulkResult:
+        """
+        Create many transfers concurrently.
+        
+        Each spec takes the keyword arguments of :meth:`create`. Transfers are
+        spread across ``max_workers`` pooled connections; 429 responses pause
+        the whole batch and the affected transfer is retried. Other errors are
+        recorded per item instead of aborting the batch. Every spec gets an
+        ``idempotency_key`` (unless it has one) that is reused on retries and
+        reported back in the result's ``spec``.
+        
+        Args:
+            transfers: Iterable of transfer specs, e.g.
+                ``{'from_account': ..., 'to_account': ..., 'amount': 5000}``
+            max_workers: Number of concurrent requests
+            max_rate_limit_retries: Rate limit retries per transfer before it fails
+            
+        Returns:
+            BulkResult with a Transfer or exception for every spec, in input order
+        """
+        return run_bulk(
+            lambda spec: self.create(**spec),
+            _with_idempotency_keys(transfers),
+            max_workers=max_workers,
+            max_rate_limit_retries=max_rate_limit_retries
+        )
     
     def get(self, uuid: str) -> Transfer:
         """
@@ -57,4 +105,95 @@ class TransfersResource(BaseResource):
             Transfer object
         """
         response = self._get(f'/transfers/{uuid}')
+        return Transfer.from_dict(response['data'])
+
+
+class AsyncTransfersResource(AsyncBaseResource):
+    """Manage transfers in the FinAegis platform (asyncio)."""
+    
+    async def create(
+        self,
+        from_account: str,
+        to_account: str,
+        amount: int,
+        asset_code: str = 'USD',
+        reference: Optional[str] = None,
+        workflow_enabled: bool = True,
+        idempotency_key: Optional[str] = None
+    ) -> Transfer:
+        """
+        Create a new transfer.
+        
+        Args:
+            from_account: Source account UUID
+            to_account: Destination account UUID
+            amount: Amount in cents
+            asset_code: Asset code (default: USD)
+            reference: Optional reference for the transfer
+            workflow_enabled: Whether to enable workflow processing
+            idempotency_key: Key deduplicating retries of this transfer
+                (generated when omitted)
+            
+        Returns:
+            Transfer object, with the idempotency key that was sent
+        """
+        data = {
+            'from_account': from_account,
+            'to_account': to_account,
+            'amount': amount,
+            'asset_code': asset_code,
+            'workflow_enabled': workflow_enabled
+        }
+        if reference:
+            data['reference'] = reference
+            
+        idempotency_key = idempotency_key or new_idempotency_key()
+        response = await self._post('/transfers', data, idempotency_key=idempotency_key)
+        transfer = Transfer.from_dict(response['data'])
+        transfer.idempotency_key = idempotency_key
+        return transfer
+    
+    async def create_many(
+        self,
+        transfers: Iterable[Dict[str, Any]],
+        max_workers: int = 8,
+        max_rate_limit_retries: int = 10
+    ) -> BulkResult:
+        """
+        Create many transfers concurrently (asyncio).
+        
+        Each spec takes the keyword arguments of :meth:`create`. At most
+        ``max_workers`` transfers are in flight at once; 429 responses pause
+        the whole batch and the affected transfer is retried. Other errors are
+        recorded per item instead of aborting the batch. Every spec gets an
+        ``idempotency_key`` (unless it has one) that is reused on retries and
+        reported back in the result's ``spec``.
+        
+        Args:
+            transfers: Iterable of transfer specs, e.g.
+                ``{'from_account': ..., 'to_account': ..., 'amount': 5000}``
+            max_workers: Number of concurrent requests
+            max_rate_limit_retries: Rate limit retries per transfer before it fails
+            
+        Returns:
+            BulkResult with a Transfer or exception for every spec, in input order
+        """
+        return await async_run_bulk(
+            lambda spec: self.create(**spec),
+            _with_idempotency_keys(transfers),
+            max_workers=max_workers,
+            max_rate_limit_retries=max_rate_limit_retries
+        )
+    
+    async def get(self, uuid: str) -> Transfer:
+        """
+        Get transfer details.
+        
+        Args:
+            uuid: Transfer UUID
+            
+        Returns:
+            Transfer object
+        """
+        response = await self._get(f'/transfers/{uuid}')
         return Transfer.from_dict(response['data'])
\ No newline at end of file
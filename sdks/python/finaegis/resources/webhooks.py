@@ -2,9 +2,15 @@
 Webhooks resource for the FinAegis SDK
 """
 
-from typing import List, Optional, Dict, Any
-from ..types import Webhook, PaginatedResponse
-from .base import BaseResource
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Iterator, AsyncIterator, Sequence, Union
+from ..types import Webhook, WebhookDelivery, PaginatedResponse
+from ..pagination import aiterate_items, aiterate_streamed_items, iterate_items, iterate_streamed_items
+from .base import AsyncBaseResource, BaseResource
+
+if TYPE_CHECKING:
+    from ..backfill import BackfillResult, Checkpoint
+    from ..webhook_receiver import AsyncWebhookReceiver, WebhookReceiver
 
 
 class WebhooksResource(BaseResource):
@@ -24,6 +30,19 @@ class WebhooksResource(BaseResource):
         response = self._get('/webhooks', params={'page': page, 'per_page': per_page})
         return PaginatedResponse.from_dict(response, Webhook)
     
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> Iterator[Webhook]:
+        """
+        Iterate over all webhooks, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Iterator yielding Webhook objects
+        """
+        return iterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
     def create(
         self,
         name: str,
@@ -121,7 +140,13 @@ class WebhooksResource(BaseResource):
         """
         return self._delete(f'/webhooks/{webhook_id}')
     
-    def get_deliveries(self, webhook_id: str, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
+    def get_deliveries(
+        self,
+        webhook_id: str,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get webhook delivery history.
         
@@ -129,22 +154,403 @@ class WebhooksResource(BaseResource):
             webhook_id: Webhook ID
             page: Page number
             per_page: Items per page
+            status: Only deliveries with this status ('pending', 'delivered', 'failed')
             
         Returns:
             Paginated delivery history
         """
-        response = self._get(
-            f'/webhooks/{webhook_id}/deliveries',
-            params={'page': page, 'per_page': per_page}
-        )
+        params: Dict[str, Any] = {'page': page, 'per_page': per_page}
+        if status:
+            params['status'] = status
+        response = self._get(f'/webhooks/{webhook_id}/deliveries', params=params)
         return response
     
+    def list_deliveries(
+        self,
+        webhook_id: str,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None
+    ) -> PaginatedResponse:
+        """
+        List a webhook's deliveries, newest first.
+        
+        Args:
+            webhook_id: Webhook ID
+            page: Page number
+            per_page: Items per page
+            status: Only deliveries with this status ('pending', 'delivered', 'failed')
+            
+        Returns:
+            PaginatedResponse containing WebhookDelivery objects
+        """
+        response = self.get_deliveries(webhook_id, page=page, per_page=per_page, status=status)
+        return PaginatedResponse.from_dict(response, WebhookDelivery)
+    
+    def iter_deliveries(
+        self,
+        webhook_id: str,
+        per_page: int = 100,
+        prefetch: bool = True,
+        stream: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a webhook's full delivery history, fetching pages lazily.
+        
+        Args:
+            webhook_id: Webhook ID
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            stream: Parse each page while it downloads instead of prefetching
+                the next one; prefetch is ignored
+            
+        Returns:
+            Iterator yielding delivery dictionaries
+        """
+        if stream:
+            return iterate_streamed_items(
+                lambda page: self.client.stream(
+                    f'/webhooks/{webhook_id}/deliveries', params={'page': page, 'per_page': per_page}
+                )
+            )
+        return iterate_items(lambda page: self._deliveries_page(webhook_id, page=page, per_page=per_page), prefetch=prefetch)
+    
+    def _deliveries_page(self, webhook_id: str, page: int, per_page: int) -> PaginatedResponse:
+        """Fetch one page of deliveries wrapped as a PaginatedResponse of raw dicts."""
+        return PaginatedResponse.from_dict(self.get_deliveries(webhook_id, page=page, per_page=per_page))
+    
+    def backfill(
+        self,
+        receiver: 'WebhookReceiver',
+        webhook_ids: Optional[Sequence[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        status: Optional[str] = None,
+        checkpoint: Union[str, 'Checkpoint', None] = None,
+        per_page: int = 100,
+        max_webhooks: int = 4
+    ) -> List['BackfillResult']:
+        """
+        Replay missed deliveries through a webhook receiver.
+        
+        Deliveries created between since and until are handed to the
+        receiver's handler like live deliveries; the receiver drops those it
+        has already seen. Pages of each webhook are fetched in order, since
+        new deliveries shift older ones to later pages, and progress is saved
+        to checkpoint, so an interrupted backfill resumes where it stopped
+        when run again with the same arguments.
+        
+        Args:
+            receiver: Receiver handling live deliveries
+            webhook_ids: Webhooks to backfill (all webhooks when omitted)
+            since: Oldest delivery creation time to replay, timezone-aware
+                (all history when omitted)
+            until: Newest delivery creation time to replay, timezone-aware
+            status: Only replay deliveries with this status, e.g. 'failed'
+            checkpoint: Path of a checkpoint file, or a Checkpoint
+            per_page: Deliveries per page request
+            max_webhooks: Webhooks backfilled at the same time
+            
+        Returns:
+            BackfillResult per webhook, with the error if one failed
+        """
+        from ..backfill import Checkpoint, backfill_deliveries
+        
+        if webhook_ids is None:
+            webhook_ids = [webhook.uuid for webhook in self.iter_all()]
+        if isinstance(checkpoint, str):
+            checkpoint = Checkpoint(checkpoint)
+        return backfill_deliveries(
+            lambda webhook_id, page: self.list_deliveries(webhook_id, page=page, per_page=per_page, status=status),
+            webhook_ids,
+            receiver,
+            since=since,
+            until=until,
+            status=status,
+            checkpoint=checkpoint,
+            max_webhooks=max_webhooks
+        )
+    
     def get_events(self) -> Dict[str, List[Dict[str, str]]]:
         """
         Get available webhook events.
         
+        Served from the client cache when caching is enabled.
+        
         Returns:
             Dictionary of events grouped by category
         """
-        response = self._get('/webhooks/events')
-        return response['data']
\ No newline at end of file
+        def load() -> Dict[str, List[Dict[str, str]]]:
+            response = self._get('/webhooks/events')
+            return response['data']
+        
+        return self._cached('webhook_events', (), load)
+
+
+class AsyncWebhooksResource(AsyncBaseResource):
+    """Manage webhooks in the FinAegis platform (asyncio)."""
+    
+    async def list(self, page: int = 1, per_page: int = 20) -> PaginatedResponse:
+        """
+        List all webhooks.
+        
+        Args:
+            page: Page number
+            per_page: Items per page
+            
+        Returns:
+            PaginatedResponse containing Webhook objects
+        """
+        response = await self._get('/webhooks', params={'page': page, 'per_page': per_page})
+        return PaginatedResponse.from_dict(response, Webhook)
+    
+    def iter_all(self, per_page: int = 100, prefetch: bool = True) -> AsyncIterator[Webhook]:
+        """
+        Iterate over all webhooks, fetching pages lazily.
+        
+        Args:
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            
+        Returns:
+            Async iterator yielding Webhook objects
+        """
+        return aiterate_items(lambda page: self.list(page=page, per_page=per_page), prefetch=prefetch)
+    
+    async def create(
+        self,
+        name: str,
+        url: str,
+        events: List[str],
+        headers: Optional[Dict[str, str]] = None,
+        secret: Optional[str] = None
+    ) -> Webhook:
+        """
+        Create a new webhook.
+        
+        Args:
+            name: Webhook name
+            url: Webhook URL
+            events: List of events to subscribe to
+            headers: Optional custom headers
+            secret: Optional secret for signature verification
+            
+        Returns:
+            Created Webhook object
+        """
+        data = {
+            'name': name,
+            'url': url,
+            'events': events
+        }
+        if headers:
+            data['headers'] = headers
+        if secret:
+            data['secret'] = secret
+            
+        response = await self._post('/webhooks', data)
+        return Webhook.from_dict(response['data'])
+    
+    async def get(self, webhook_id: str) -> Webhook:
+        """
+        Get webhook details.
+        
+        Args:
+            webhook_id: Webhook ID
+            
+        Returns:
+            Webhook object
+        """
+        response = await self._get(f'/webhooks/{webhook_id}')
+        return Webhook.from_dict(response['data'])
+    
+    async def update(
+        self,
+        webhook_id: str,
+        name: Optional[str] = None,
+        url: Optional[str] = None,
+        events: Optional[List[str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        is_active: Optional[bool] = None
+    ) -> Webhook:
+        """
+        Update a webhook.
+        
+        Args:
+            webhook_id: Webhook ID
+            name: New webhook name
+            url: New webhook URL
+            events: New list of events
+            headers: New custom headers
+            is_active: Whether the webhook is active
+            
+        Returns:
+            Updated Webhook object
+        """
+        data: Dict[str, Any] = {}
+        if name is not None:
+            data['name'] = name
+        if url is not None:
+            data['url'] = url
+        if events is not None:
+            data['events'] = events
+        if headers is not None:
+            data['headers'] = headers
+        if is_active is not None:
+            data['is_active'] = is_active
+            
+        response = await self._put(f'/webhooks/{webhook_id}', data)
+        return Webhook.from_dict(response['data'])
+    
+    async def delete(self, webhook_id: str) -> Dict[str, str]:
+        """
+        Delete a webhook.
+        
+        Args:
+            webhook_id: Webhook ID
+            
+        Returns:
+            Success message
+        """
+        return await self._delete(f'/webhooks/{webhook_id}')
+    
+    async def get_deliveries(
+        self,
+        webhook_id: str,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get webhook delivery history.
+        
+        Args:
+            webhook_id: Webhook ID
+            page: Page number
+            per_page: Items per page
+            status: Only deliveries with this status ('pending', 'delivered', 'failed')
+            
+        Returns:
+            Paginated delivery history
+        """
+        params: Dict[str, Any] = {'page': page, 'per_page': per_page}
+        if status:
+            params['status'] = status
+        response = await self._get(f'/webhooks/{webhook_id}/deliveries', params=params)
+        return response
+    
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None
+    ) -> PaginatedResponse:
+        """
+        List a webhook's deliveries, newest first.
+        
+        Args:
+            webhook_id: Webhook ID
+            page: Page number
+            per_page: Items per page
+            status: Only deliveries with this status ('pending', 'delivered', 'failed')
+            
+        Returns:
+            PaginatedResponse containing WebhookDelivery objects
+        """
+        response = await self.get_deliveries(webhook_id, page=page, per_page=per_page, status=status)
+        return PaginatedResponse.from_dict(response, WebhookDelivery)
+    
+    def iter_deliveries(
+        self,
+        webhook_id: str,
+        per_page: int = 100,
+        prefetch: bool = True,
+        stream: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over a webhook's full delivery history, fetching pages lazily.
+        
+        Args:
+            webhook_id: Webhook ID
+            per_page: Items per page
+            prefetch: Fetch the next page in the background while iterating
+            stream: Parse each page while it downloads instead of prefetching
+                the next one; prefetch is ignored
+            
+        Returns:
+            Async iterator yielding delivery dictionaries
+        """
+        if stream:
+            return aiterate_streamed_items(
+                lambda page: self.client.stream(
+                    f'/webhooks/{webhook_id}/deliveries', params={'page': page, 'per_page': per_page}
+                )
+            )
+        return aiterate_items(lambda page: self._deliveries_page(webhook_id, page=page, per_page=per_page), prefetch=prefetch)
+    
+    async def _deliveries_page(self, webhook_id: str, page: int, per_page: int) -> PaginatedResponse:
+        """Fetch one page of deliveries wrapped as a PaginatedResponse of raw dicts."""
+        return PaginatedResponse.from_dict(await self.get_deliveries(webhook_id, page=page, per_page=per_page))
+    
+    async def backfill(
+        self,
+        receiver: 'AsyncWebhookReceiver',
+        webhook_ids: Optional[Sequence[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        status: Optional[str] = None,
+        checkpoint: Union[str, 'Checkpoint', None] = None,
+        per_page: int = 100,
+        max_webhooks: int = 4
+    ) -> List['BackfillResult']:
+        """
+        Replay missed deliveries through a webhook receiver.
+        
+        See :meth:`WebhooksResource.backfill`.
+        
+        Args:
+            receiver: Receiver handling live deliveries
+            webhook_ids: Webhooks to backfill (all webhooks when omitted)
+            since: Oldest delivery creation time to replay, timezone-aware
+                (all history when omitted)
+            until: Newest delivery creation time to replay, timezone-aware
+            status: Only replay deliveries with this status, e.g. 'failed'
+            checkpoint: Path of a checkpoint file, or a Checkpoint
+            per_page: Deliveries per page request
+            max_webhooks: Webhooks backfilled at the same time
+            
+        Returns:
+            BackfillResult per webhook, with the error if one failed
+        """
+        from ..backfill import Checkpoint, async_backfill_deliveries
+        
+        if webhook_ids is None:
+            webhook_ids = [webhook.uuid async for webhook in self.iter_all()]
+        if isinstance(checkpoint, str):
+            checkpoint = Checkpoint(checkpoint)
+        return await async_backfill_deliveries(
+            lambda webhook_id, page: self.list_deliveries(webhook_id, page=page, per_page=per_page, status=status),
+            webhook_ids,
+            receiver,
+            since=since,
+            until=until,
+            status=status,
+            checkpoint=checkpoint,
+            max_webhooks=max_webhooks
+        )
+    
+    async def get_events(self) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Get available webhook events.
+        
+        Served from the client cache when caching is enabled.
+        
+        Returns:
+            Dictionary of events grouped by category
+        """
+        async def load() -> Dict[str, List[Dict[str, str]]]:
+            response = await self._get('/webhooks/events')
+            return response['data']
+        
+        return await self._cached('webhook_events', (), load)
\ No newline at end of file
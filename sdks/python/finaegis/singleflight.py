@@ -0,0 +1,201 @@
+"""
+Request coalescing for the FinAegis SDK
+
+Gateways often ask for the same thing many times at once, e.g. the balances of
+a popular account or the GCU composition. With request coalescing enabled, a GET
+that is identical (same path and query) to one already in flight does not go to
+the network: it waits for the in-flight call and receives the same decoded
+result. Only concurrent calls are merged. A call that starts after the previous
+one finished makes its own request, so results are never older than the call.
+
+Coalesced results are shared between callers and should be treated as
+read-only. A caller waiting for another's request still keeps its own deadline:
+it raises DeadlineExceededError when its time runs out, while the shared
+request carries on for the others. Keys include the base URL and API key of the calling client, so a
+group shared by clients of different accounts or environments only merges
+calls made with the same credentials.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, TypeVar
+
+from .exceptions import DeadlineExceededError
+
+T = TypeVar('T')
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters of a SingleFlight group."""
+    executed: int = 0
+    coalesced: int = 0
+    
+    @property
+    def coalesce_rate(self) -> float:
+        """Fraction of calls that were served by another caller's request."""
+        calls = self.executed + self.coalesced
+        return self.coalesced / calls if calls else 0.0
+
+
+def client_scope(base_url: str, api_key: str) -> Hashable:
+    """
+    Identity of the client a call is made by, for request_key.
+    
+    Args:
+        base_url: API base URL of the client
+        api_key: API key of the client; only a digest of it is kept
+        
+    Returns:
+        Hashable value equal for clients calling the same API as the same caller
+    """
+    return (base_url.rstrip('/'), hashlib.sha256(api_key.encode()).digest())
+
+
+def request_key(path: str, params: Optional[Mapping[str, Any]] = None, scope: Hashable = None) -> Hashable:
+    """
+    Identity of a GET for coalescing.
+    
+    Args:
+        path: Request path
+        params: Query parameters, in any order
+        scope: Identity of the calling client, see client_scope(); calls with
+            different scopes are never coalesced
+        
+    Returns:
+        Hashable key equal for requests that send the same query as the same caller
+    """
+    query = tuple(sorted((name, str(value)) for name, value in params.items())) if params else ()
+    return (scope, path.strip('/'), query)
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe duplicate call suppression.
+    
+    Example:
+        >>> client = FinAegis(api_key='...', coalesce_requests=True)
+        >>> with ThreadPoolExecutor(max_workers=50) as pool:
+        ...     list(pool.map(lambda _: client.gcu.get_composition(), range(50)))
+        >>> client.single_flight.stats.coalesced
+        49
+    """
+    
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Hashable, func: Callable[[], T], expires: Optional[float] = None) -> T:
+        """
+        Call func, unless a call with the same key is already running.
+        
+        Args:
+            key: Identity of the call
+            func: Zero-argument callable to run if no call is in flight
+            expires: Deadline of this caller on the time.monotonic() clock,
+                bounding its wait for a call in flight
+            
+        Returns:
+            The result of func, from this call or the one in flight
+            
+        Raises:
+            DeadlineExceededError: If expires passes while waiting
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.stats.executed += 1
+                leader = True
+            else:
+                self.stats.coalesced += 1
+                leader = False
+                
+        if not leader:
+            if not call.done.wait(None if expires is None else max(0.0, expires - time.monotonic())):
+                raise DeadlineExceededError('Deadline exceeded waiting for a coalesced request')
+            if call.error is not None:
+                raise call.error
+            return call.result
+            
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+    
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Duplicate call suppression for coroutines on one event loop.
+    
+    The shared call runs as its own task, so cancelling one waiting caller
+    does not cancel the request for the others.
+    """
+    
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._calls: Dict[Hashable, 'asyncio.Future[Any]'] = {}
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]], expires: Optional[float] = None) -> T:
+        """
+        Await func(), unless a call with the same key is already running.
+        
+        Args:
+            key: Identity of the call
+            func: Zero-argument coroutine function to run if no call is in flight
+            expires: Deadline of this caller on the time.monotonic() clock,
+                bounding its wait for the shared call
+            
+        Returns:
+            The result of the shared call
+            
+        Raises:
+            DeadlineExceededError: If expires passes while waiting
+            Exception: Whatever the shared call raised
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.stats.executed += 1
+        else:
+            self.stats.coalesced += 1
+        if expires is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), max(0.0, expires - time.monotonic()))
+        except asyncio.TimeoutError as error:
+            raise DeadlineExceededError('Deadline exceeded waiting for a coalesced request') from error
+    
+    def _forget(self, key: Hashable, task: 'asyncio.Future[Any]') -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+    
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
\ No newline at end of file
@@ -0,0 +1,958 @@
+"""
+In-process fake FinAegis API for the FinAegis SDK
+
+FakeServer answers the ``/api/v2`` routes the SDK uses from an in-memory
+Ledger on a local port, so integration, throughput and tail-latency tests of
+FinAegis and AsyncFinAegis run on a laptop without network access:
+    
+    >>> from finaegis.testing import FakeServer
+    >>> with FakeServer(latency=0.002) as server:
+    ...     client = server.client()
+    ...     alice = client.accounts.create('user-1', 'Alice', initial_balance=10_000)
+    ...     bob = client.accounts.create('user-2', 'Bob')
+    ...     client.transfers.create(alice.uuid, bob.uuid, 2_500)
+    ...     assert server.ledger.total('USD') == 10_000
+
+The ledger moves money under one lock, so balances stay consistent however
+many transfers run at once, and a withdrawal or transfer that would overdraw
+an account fails with 422 like the real API. Unknown ids answer 404, invalid
+bodies 422 with field errors, and writes carrying an ``Idempotency-Key`` are
+executed once and replayed on retries; writes with different keys run
+concurrently, and a repeat of a key still in progress waits for its reply. Optional per-request latency, an API
+key and rate limits (429 with ``Retry-After`` and ``X-RateLimit-*`` headers,
+per endpoint class) make the client's retry, backoff and pooling behave as
+they would against production.
+
+Only what the SDK needs is modelled: amounts are minor units in every asset,
+GCU and basket values are fixed, and webhook deliveries are recorded (for
+``get_deliveries`` and backfills) but never sent.
+"""
+
+import json
+import math
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from .exceptions import FinAegisError, NotFoundError, ValidationError
+from .idempotency import IDEMPOTENCY_HEADER, IDEMPOTENT_METHODS
+from .ratelimit import endpoint_class
+
+if TYPE_CHECKING:
+    from .async_client import AsyncFinAegis
+    from .client import FinAegis
+
+# USD value of one unit of each asset the fake server knows
+USD_VALUES: Dict[str, Decimal] = {
+    'USD': Decimal('1'),
+    'EUR': Decimal('1.0850'),
+    'GBP': Decimal('1.2700'),
+    'CHF': Decimal('1.1200'),
+    'JPY': Decimal('0.0067'),
+    'GCU': Decimal('1.0234'),
+}
+
+# Weight in percent of each asset in the GCU basket
+GCU_WEIGHTS: Dict[str, float] = {'USD': 40.0, 'EUR': 30.0, 'GBP': 15.0, 'CHF': 10.0, 'JPY': 5.0}
+
+WEBHOOK_EVENTS: Dict[str, List[str]] = {
+    'account': ['account.created', 'account.frozen', 'account.unfrozen', 'account.closed'],
+    'transaction': ['transaction.created'],
+    'transfer': ['transfer.completed'],
+}
+
+MAX_PER_PAGE = 100
+
+Latency = Union[float, Callable[[str, str], float]]
+Reply = Tuple[int, Any]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+def _invalid(errors: Dict[str, str]) -> ValidationError:
+    """A 422 error with one message per invalid field, shaped like the API's."""
+    body = {'message': 'The given data was invalid.', 'errors': {name: [message] for name, message in errors.items()}}
+    return ValidationError(body['message'], status_code=422, response_data=body)
+
+
+def _refused(message: str) -> ValidationError:
+    """A 422 error for a request that is valid but not allowed, e.g. an overdraft."""
+    return ValidationError(message, status_code=422, response_data={'message': message})
+
+
+def _missing(kind: str, key: str) -> NotFoundError:
+    message = f'{kind} {key} not found.'
+    return NotFoundError(message, status_code=404, response_data={'message': message})
+
+
+def _amount(value: Any) -> int:
+    if type(value) is not int or value <= 0:
+        raise _invalid({'amount': 'The amount must be a positive integer of minor units.'})
+    return value
+
+
+def _asset(value: Any) -> str:
+    if value not in USD_VALUES:
+        raise _invalid({'asset_code': 'The selected asset code is invalid.'})
+    return value
+
+
+def exchange_rate(from_asset: str, to_asset: str) -> Decimal:
+    """Exchange rate the fake server quotes between two known assets."""
+    return (USD_VALUES[from_asset] / USD_VALUES[to_asset]).quantize(Decimal('0.00000001'))
+
+
+class Ledger:
+    """
+    In-memory accounts, balances, transactions, transfers and webhooks.
+    
+    Every method is safe to call from several threads; money only moves
+    while the ledger lock is held, so the sum of all balances of an asset
+    always equals deposits minus withdrawals. Methods return records as the
+    API serializes them and raise ValidationError (422) or NotFoundError (404)
+    with the API's error body. Listings are newest first.
+    """
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._accounts: Dict[str, Dict[str, Any]] = {}
+        self._balances: Dict[str, Dict[str, int]] = {}
+        self._transactions: List[Dict[str, Any]] = []
+        self._account_transactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._transfers: Dict[str, Dict[str, Any]] = {}
+        self._account_transfers: Dict[str, List[Dict[str, Any]]] = {}
+        self._webhooks: Dict[str, Dict[str, Any]] = {}
+        self._deliveries: Dict[str, List[Dict[str, Any]]] = {}
+        
+    # Accounts
+    
+    def create_account(self, user_uuid: str, name: str, initial_balance: Optional[int] = None) -> Dict[str, Any]:
+        """Open an account, optionally funded with a USD deposit."""
+        errors = {}
+        if not isinstance(user_uuid, str) or not user_uuid:
+            errors['user_uuid'] = 'The user uuid field is required.'
+        if not isinstance(name, str) or not name:
+            errors['name'] = 'The name field is required.'
+        if errors:
+            raise _invalid(errors)
+        if initial_balance is not None and initial_balance != 0:
+            _amount(initial_balance)
+        created_at = _now()
+        account = {
+            'uuid': str(uuid.uuid4()),
+            'user_uuid': user_uuid,
+            'name': name,
+            'balance': 0,
+            'frozen': False,
+            'created_at': created_at,
+            'updated_at': created_at,
+        }
+        with self._lock:
+            self._accounts[account['uuid']] = account
+            self._balances[account['uuid']] = {}
+            self._account_transactions[account['uuid']] = []
+            self._account_transfers[account['uuid']] = []
+            self._emit('account.created', account_uuid=account['uuid'], name=name, user_uuid=user_uuid, balance=0)
+            if initial_balance:
+                self.deposit(account['uuid'], initial_balance)
+            return dict(account)
+    
+    def account(self, account_uuid: str) -> Dict[str, Any]:
+        """An account by UUID."""
+        with self._lock:
+            return dict(self._account(account_uuid))
+    
+    def accounts(self) -> List[Dict[str, Any]]:
+        """All accounts, newest first."""
+        with self._lock:
+            return [dict(account) for account in reversed(self._accounts.values())]
+    
+    def delete_account(self, account_uuid: str) -> None:
+        """Close an account; it must be empty."""
+        with self._lock:
+            self._account(account_uuid)
+            if any(self._balances[account_uuid].values()):
+                raise _refused('Cannot delete an account with a non-zero balance.')
+            del self._accounts[account_uuid]
+            del self._balances[account_uuid]
+            self._emit('account.closed', account_uuid=account_uuid)
+    
+    def set_frozen(self, account_uuid: str, frozen: bool) -> None:
+        """Freeze or unfreeze an account; frozen accounts cannot move money."""
+        with self._lock:
+            account = self._account(account_uuid)
+            if account['frozen'] == frozen:
+                raise _refused(f"Account is {'already' if frozen else 'not'} frozen.")
+            account['frozen'] = frozen
+            account['updated_at'] = _now()
+            self._emit('account.frozen' if frozen else 'account.unfrozen', account_uuid=account_uuid)
+    
+    def balances(self, account_uuid: str) -> Dict[str, Any]:
+        """Balance per asset of an account, and their total USD value."""
+        with self._lock:
+            self._account(account_uuid)
+            balances = dict(self._balances[account_uuid])
+        total = sum(USD_VALUES[asset] * amount for asset, amount in balances.items())
+        return {
+            'account_uuid': account_uuid,
+            'balances': balances,
+            'total_value_usd': int(total.to_integral_value(ROUND_HALF_UP)),
+        }
+    
+    def total(self, asset_code: str = 'USD') -> int:
+        """Sum of every account's balance of an asset."""
+        with self._lock:
+            return sum(balances.get(asset_code, 0) for balances in self._balances.values())
+            
+    # Money movement
+    
+    def deposit(self, account_uuid: str, amount: int, asset_code: str = 'USD') -> Dict[str, Any]:
+        """Credit an account; returns the transaction."""
+        return self._post_transaction(account_uuid, 'deposit', _amount(amount), _asset(asset_code))
+    
+    def withdraw(self, account_uuid: str, amount: int, asset_code: str = 'USD') -> Dict[str, Any]:
+        """Debit an account; fails with 422 when the balance is insufficient."""
+        return self._post_transaction(account_uuid, 'withdrawal', _amount(amount), _asset(asset_code))
+    
+    def transfer(
+        self,
+        from_account: str,
+        to_account: str,
+        amount: int,
+        asset_code: str = 'USD',
+        reference: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Move an amount between two accounts atomically; returns the transfer."""
+        amount, asset_code = _amount(amount), _asset(asset_code)
+        if from_account == to_account:
+            raise _invalid({'to_account': 'The to account and from account must be different.'})
+        with self._lock:
+            source, target = self._account(from_account), self._account(to_account)
+            self._debit(source, amount, asset_code)
+            self._credit(target, amount, asset_code)
+            created_at = _now()
+            transfer = {
+                'uuid': str(uuid.uuid4()),
+                'from_account': from_account,
+                'to_account': to_account,
+                'amount': amount,
+                'asset_code': asset_code,
+                'reference': reference,
+                'status': 'completed',
+                'created_at': created_at,
+                'completed_at': created_at,
+            }
+            self._transfers[transfer['uuid']] = transfer
+            self._account_transfers[from_account].append(transfer)
+            self._account_transfers[to_account].append(transfer)
+            self._emit(
+                'transfer.completed',
+                from_account_uuid=from_account,
+                to_account_uuid=to_account,
+                amount=amount,
+                currency=asset_code,
+                from_balance_after=self._balances[from_account][asset_code],
+                to_balance_after=self._balances[to_account][asset_code]
+            )
+            return dict(transfer)
+    
+    def get_transfer(self, transfer_uuid: str) -> Dict[str, Any]:
+        """A transfer by UUID."""
+        with self._lock:
+            transfer = self._transfers.get(transfer_uuid)
+            if transfer is None:
+                raise _missing('Transfer', transfer_uuid)
+            return dict(transfer)
+    
+    def transactions(self, account_uuid: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Transactions of an account, or of all accounts, newest first."""
+        with self._lock:
+            if account_uuid is None:
+                return self._transactions[::-1]
+            self._account(account_uuid)
+            return self._account_transactions[account_uuid][::-1]
+    
+    def get_transaction(self, transaction_id: str) -> Dict[str, Any]:
+        """A transaction by id."""
+        with self._lock:
+            for transaction in reversed(self._transactions):
+                if transaction['id'] == transaction_id:
+                    return dict(transaction)
+        raise _missing('Transaction', transaction_id)
+    
+    def transfers(self, account_uuid: str) -> List[Dict[str, Any]]:
+        """Transfers from or to an account, newest first."""
+        with self._lock:
+            self._account(account_uuid)
+            return self._account_transfers[account_uuid][::-1]
+            
+    # Webhooks
+    
+    def create_webhook(
+        self,
+        name: str,
+        url: str,
+        events: List[str],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Register a webhook; events it subscribes to are recorded as deliveries."""
+        errors = {}
+        if not isinstance(name, str) or not name:
+            errors['name'] = 'The name field is required.'
+        if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
+            errors['url'] = 'The url must be a valid URL.'
+        if not isinstance(events, list) or not events:
+            errors['events'] = 'The events field is required.'
+        if errors:
+            raise _invalid(errors)
+        created_at = _now()
+        webhook = {
+            'uuid': str(uuid.uuid4()),
+            'name': name,
+            'url': url,
+            'events': list(events),
+            'headers': headers,
+            'is_active': True,
+            'created_at': created_at,
+            'updated_at': created_at,
+        }
+        with self._lock:
+            self._webhooks[webhook['uuid']] = webhook
+            self._deliveries[webhook['uuid']] = []
+            return dict(webhook)
+    
+    def webhook(self, webhook_uuid: str) -> Dict[str, Any]:
+        """A webhook by UUID."""
+        with self._lock:
+            return dict(self._webhook(webhook_uuid))
+    
+    def webhooks(self) -> List[Dict[str, Any]]:
+        """All webhooks, newest first."""
+        with self._lock:
+            return [dict(webhook) for webhook in reversed(self._webhooks.values())]
+    
+    def update_webhook(self, webhook_uuid: str, **changes: Any) -> Dict[str, Any]:
+        """Change a webhook's name, url, events, headers or is_active."""
+        with self._lock:
+            webhook = self._webhook(webhook_uuid)
+            webhook.update((key, value) for key, value in changes.items() if key in (
+                'name', 'url', 'events', 'headers', 'is_active'
+            ))
+            webhook['updated_at'] = _now()
+            return dict(webhook)
+    
+    def delete_webhook(self, webhook_uuid: str) -> None:
+        """Remove a webhook and its delivery history."""
+        with self._lock:
+            self._webhook(webhook_uuid)
+            del self._webhooks[webhook_uuid]
+            del self._deliveries[webhook_uuid]
+    
+    def deliveries(self, webhook_uuid: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Deliveries recorded for a webhook, newest first."""
+        with self._lock:
+            self._webhook(webhook_uuid)
+            deliveries = self._deliveries[webhook_uuid][::-1]
+        if status:
+            deliveries = [delivery for delivery in deliveries if delivery['status'] == status]
+        return deliveries
+        
+    # Internals; callers hold the lock
+    
+    def _account(self, account_uuid: str) -> Dict[str, Any]:
+        account = self._accounts.get(account_uuid)
+        if account is None:
+            raise _missing('Account', account_uuid)
+        return account
+    
+    def _webhook(self, webhook_uuid: str) -> Dict[str, Any]:
+        webhook = self._webhooks.get(webhook_uuid)
+        if webhook is None:
+            raise _missing('Webhook', webhook_uuid)
+        return webhook
+    
+    def _credit(self, account: Dict[str, Any], amount: int, asset_code: str) -> None:
+        if account['frozen']:
+            raise _refused(f"Account {account['uuid']} is frozen.")
+        balances = self._balances[account['uuid']]
+        balances[asset_code] = balances.get(asset_code, 0) + amount
+        if asset_code == 'USD':
+            account['balance'] = balances['USD']
+    
+    def _debit(self, account: Dict[str, Any], amount: int, asset_code: str) -> None:
+        if account['frozen']:
+            raise _refused(f"Account {account['uuid']} is frozen.")
+        available = self._balances[account['uuid']].get(asset_code, 0)
+        if available < amount:
+            message = 'Insufficient balance in account.'
+            raise ValidationError(message, status_code=422, response_data={
+                'message': message,
+                'errors': {'amount': [f'Available {asset_code} balance is {available}.']},
+            })
+        self._credit(account, -amount, asset_code)
+    
+    def _post_transaction(self, account_uuid: str, kind: str, amount: int, asset_code: str) -> Dict[str, Any]:
+        with self._lock:
+            account = self._account(account_uuid)
+            if kind == 'deposit':
+                self._credit(account, amount, asset_code)
+            else:
+                self._debit(account, amount, asset_code)
+            created_at = _now()
+            transaction = {
+                'id': str(uuid.uuid4()),
+                'account_uuid': account_uuid,
+                'type': kind,
+                'amount': amount,
+                'asset_code': asset_code,
+                'status': 'completed',
+                'reference': None,
+                'created_at': created_at,
+                'completed_at': created_at,
+            }
+            self._transactions.append(transaction)
+            self._account_transactions[account_uuid].append(transaction)
+            self._emit(
+                'transaction.created',
+                account_uuid=account_uuid,
+                type=kind,
+                amount=amount,
+                currency=asset_code,
+                balance_after=self._balances[account_uuid][asset_code]
+            )
+            return dict(transaction)
+    
+    def _emit(self, event: str, **payload: Any) -> None:
+        """Record a delivery of an event for every active webhook subscribed to it."""
+        subscribed = [
+            webhook for webhook in self._webhooks.values() if webhook['is_active'] and event in webhook['events']
+        ]
+        if not subscribed:
+            return
+        created_at = _now()
+        payload = {'event': event, 'timestamp': created_at, **payload}
+        for webhook in subscribed:
+            self._deliveries[webhook['uuid']].append({
+                'uuid': str(uuid.uuid4()),
+                'webhook_uuid': webhook['uuid'],
+                'event_type': event,
+                'payload': payload,
+                'status': 'pending',
+                'attempt_number': 1,
+                'created_at': created_at,
+            })
+
+
+def paginate(items: List[Any], query: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    One page of a listing with the API's ``meta`` block.
+    
+    Args:
+        items: Full listing, in the order pages are served
+        query: Parsed query string with optional page and per_page
+        
+    Returns:
+        Response body with data and meta
+    """
+    try:
+        page = max(1, int(query.get('page', ['1'])[0]))
+        per_page = min(MAX_PER_PAGE, max(1, int(query.get('per_page', ['15'])[0])))
+    except ValueError:
+        raise _invalid({'page': 'The page and per page must be integers.'})
+    total = len(items)
+    start = (page - 1) * per_page
+    data = items[start:start + per_page]
+    return {
+        'data': data,
+        'meta': {
+            'current_page': page,
+            'per_page': per_page,
+            'total': total,
+            'last_page': max(1, math.ceil(total / per_page)),
+            'from': start + 1 if data else None,
+            'to': start + len(data) if data else None,
+        },
+    }
+
+
+def _gcu_info() -> Dict[str, Any]:
+    basket_value = USD_VALUES['GCU']
+    composition = []
+    for asset, weight in GCU_WEIGHTS.items():
+        contribution = basket_value * Decimal(str(weight)) / 100
+        composition.append({
+            'asset_code': asset,
+            'asset_name': asset,
+            'asset_type': 'fiat',
+            'weight': weight,
+            'current_price_usd': float(USD_VALUES[asset]),
+            'value_contribution_usd': float(contribution),
+            'percentage_of_basket': weight,
+            '24h_change': 0.0,
+            '7d_change': 0.0,
+        })
+    return {
+        'basket_code': 'GCU',
+        'name': 'Global Currency Unit',
+        'total_value_usd': float(basket_value),
+        'composition': composition,
+        'last_updated': _now(),
+    }
+
+
+def _basket() -> Dict[str, Any]:
+    return {
+        'code': 'GCU',
+        'name': 'Global Currency Unit',
+        'description': 'Weighted basket of major currencies',
+        'composition': dict(GCU_WEIGHTS),
+        'value_usd': str(USD_VALUES['GCU']),
+        'is_active': True,
+        'created_at': '2024-01-01T00:00:00Z',
+        'updated_at': '2024-01-01T00:00:00Z',
+    }
+
+
+class _Window:
+    """Fixed-window request budget of one endpoint class."""
+    
+    def __init__(self, limit: int, seconds: float):
+        self.limit = limit
+        self.seconds = seconds
+        self.reset = 0.0
+        self.used = 0
+    
+    def take(self, now: float) -> bool:
+        if now >= self.reset:
+            self.reset = now + self.seconds
+            self.used = 0
+        if self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+    
+    def headers(self, now: float) -> Dict[str, str]:
+        return {
+            'X-RateLimit-Limit': str(self.limit),
+            'X-RateLimit-Window': str(self.seconds),
+            'X-RateLimit-Remaining': str(max(0, self.limit - self.used)),
+            'X-RateLimit-Reset': str(int(time.time() + self.reset - now)),
+        }
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Load tests open many connections at once
+    request_queue_size = 1024
+
+
+class FakeServer:
+    """
+    Local HTTP server emulating the FinAegis v2 API over a Ledger.
+    
+    Runs in a background thread with one thread per connection and HTTP/1.1
+    keep-alive, so pooled sync clients and the async client can both drive it
+    concurrently. Use as a context manager, or call start and stop.
+    """
+    
+    ROUTES: List[Tuple[str, str, str]] = [
+        ('GET', r'/accounts', '_list_accounts'),
+        ('POST', r'/accounts', '_create_account'),
+        ('GET', r'/accounts/(?P<uuid>[^/]+)', '_get_account'),
+        ('DELETE', r'/accounts/(?P<uuid>[^/]+)', '_delete_account'),
+        ('POST', r'/accounts/(?P<uuid>[^/]+)/(?P<action>freeze|unfreeze)', '_freeze'),
+        ('GET', r'/accounts/(?P<uuid>[^/]+)/balances', '_balances'),
+        ('POST', r'/accounts/(?P<uuid>[^/]+)/(?P<action>deposit|withdraw)', '_move'),
+        ('GET', r'/accounts/(?P<uuid>[^/]+)/transactions', '_account_transactions'),
+        ('GET', r'/accounts/(?P<uuid>[^/]+)/transfers', '_account_transfers'),
+        ('GET', r'/transactions', '_transactions'),
+        ('GET', r'/transactions/(?P<id>[^/]+)', '_get_transaction'),
+        ('POST', r'/transfers', '_create_transfer'),
+        ('GET', r'/transfers/(?P<uuid>[^/]+)', '_get_transfer'),
+        ('GET', r'/exchange-rates', '_list_rates'),
+        ('GET', r'/exchange-rates/(?P<source>[^/]+)/(?P<target>[^/]+)', '_get_rate'),
+        ('GET', r'/exchange-rates/(?P<source>[^/]+)/(?P<target>[^/]+)/convert', '_convert'),
+        ('GET', r'/baskets', '_list_baskets'),
+        ('GET', r'/baskets/(?P<code>[^/]+)', '_get_basket'),
+        ('GET', r'/baskets/(?P<code>[^/]+)/value', '_basket_value'),
+        ('GET', r'/gcu', '_gcu'),
+        ('GET', r'/gcu/composition', '_gcu'),
+        ('GET', r'/webhooks', '_list_webhooks'),
+        ('POST', r'/webhooks', '_create_webhook'),
+        ('GET', r'/webhooks/events', '_webhook_events'),
+        ('GET', r'/webhooks/(?P<uuid>[^/]+)', '_get_webhook'),
+        ('PUT', r'/webhooks/(?P<uuid>[^/]+)', '_update_webhook'),
+        ('DELETE', r'/webhooks/(?P<uuid>[^/]+)', '_delete_webhook'),
+        ('GET', r'/webhooks/(?P<uuid>[^/]+)/deliveries', '_deliveries'),
+    ]
+    
+    PREFIX = '/api/v2'
+    
+    def __init__(
+        self,
+        ledger: Optional[Ledger] = None,
+        latency: Latency = 0.0,
+        api_key: Optional[str] = None,
+        rate_limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        port: int = 0,
+        max_replies: int = 10_000
+    ):
+        """
+        Args:
+            ledger: State to serve (a new empty Ledger by default)
+            latency: Seconds to wait before answering each request, or a
+                callable ``(method, path) -> seconds``, e.g. drawing from a
+                distribution to model tail latency
+            api_key: Bearer token every request must carry (any, when None)
+            rate_limits: ``{endpoint_class: (limit, window_seconds)}`` for the
+                'transaction' and/or 'query' classes of
+                :func:`finaegis.ratelimit.endpoint_class`; requests over a
+                limit get 429 (unlimited when None)
+            port: Port to listen on (a free one by default)
+            max_replies: Replies to idempotent writes kept for replay; the
+                oldest are forgotten beyond this, bounding memory in long
+                load runs
+        """
+        self.ledger = ledger or Ledger()
+        self.latency = latency
+        self.api_key = api_key
+        self.status_counts: Counter = Counter()
+        self._windows = {name: _Window(*limit) for name, limit in (rate_limits or {}).items()}
+        self._lock = threading.Lock()
+        self.max_replies = max_replies
+        self._idempotency_lock = threading.Lock()
+        self._replies: 'OrderedDict[Tuple[str, str, str], Reply]' = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str, str], threading.Event] = {}
+        self._routes = [(method, re.compile(pattern + '$'), name) for method, pattern, name in self.ROUTES]
+        self._httpd = _HTTPServer(('127.0.0.1', port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL to create clients with."""
+        return f'http://127.0.0.1:{self._httpd.server_address[1]}{self.PREFIX}/'
+    
+    def start(self) -> 'FakeServer':
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={'poll_interval': 0.05}, name='finaegis-fake-server', daemon=True
+        )
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+    
+    def __enter__(self) -> 'FakeServer':
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+    
+    def client(self, **kwargs: Any) -> 'FinAegis':
+        """A FinAegis client for this server; kwargs are passed through."""
+        from .client import FinAegis
+        kwargs.setdefault('api_key', self.api_key or 'test-key')
+        kwargs.setdefault('max_retries', 0)
+        return FinAegis(base_url=self.base_url, **kwargs)
+    
+    def async_client(self, **kwargs: Any) -> 'AsyncFinAegis':
+        """An AsyncFinAegis client for this server; kwargs are passed through."""
+        from .async_client import AsyncFinAegis
+        kwargs.setdefault('api_key', self.api_key or 'test-key')
+        kwargs.setdefault('max_retries', 0)
+        return AsyncFinAegis(base_url=self.base_url, **kwargs)
+    
+    def handle(
+        self,
+        method: str,
+        target: str,
+        headers: Dict[str, str],
+        body: Optional[bytes]
+    ) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Answer one request without going through HTTP.
+        
+        Args:
+            method: HTTP method
+            target: Request path with query string, e.g. '/api/v2/accounts?page=2'
+            headers: Request headers (case-insensitive mapping)
+            body: Raw request body
+            
+        Returns:
+            ``(status, json_body, extra_headers)``
+        """
+        url = urlsplit(target)
+        path = url.path[len(self.PREFIX):] if url.path.startswith(self.PREFIX) else url.path
+        path = '/' + path.strip('/')
+        
+        delay = self.latency(method, path) if callable(self.latency) else self.latency
+        if delay > 0:
+            time.sleep(delay)
+        if self.api_key is not None and headers.get('Authorization') != f'Bearer {self.api_key}':
+            return 401, {'message': 'Unauthenticated.'}, {}
+            
+        extra_headers: Dict[str, str] = {}
+        window = self._windows.get(endpoint_class(method, path))
+        if window is not None:
+            with self._lock:
+                now = time.monotonic()
+                allowed = window.take(now)
+                extra_headers = window.headers(now)
+                retry_after = max(1, math.ceil(window.reset - now))
+            if not allowed:
+                extra_headers['Retry-After'] = str(retry_after)
+                return 429, {'message': 'Too Many Attempts.', 'retry_after': retry_after}, extra_headers
+                
+        key = headers.get(IDEMPOTENCY_HEADER) if method in IDEMPOTENT_METHODS else None
+        if key is None:
+            status, payload = self._dispatch(method, path, url.query, body)
+        else:
+            status, payload = self._idempotent(
+                (method, path, key), lambda: self._dispatch(method, path, url.query, body)
+            )
+        return status, payload, extra_headers
+    
+    def _idempotent(self, idempotency: Tuple[str, str, str], dispatch: Callable[[], Reply]) -> Reply:
+        """Run a keyed write once, replaying its reply; other keys are not blocked."""
+        while True:
+            with self._idempotency_lock:
+                reply = self._replies.get(idempotency)
+                if reply is not None:
+                    return reply
+                running = self._in_flight.get(idempotency)
+                if running is None:
+                    running = self._in_flight[idempotency] = threading.Event()
+                    break
+            running.wait()
+            
+        try:
+            reply = dispatch()
+        finally:
+            with self._idempotency_lock:
+                del self._in_flight[idempotency]
+                # 5xx replies are not kept, so a retry runs the write again
+                if reply is not None and reply[0] < 500:
+                    self._replies[idempotency] = reply
+                    while len(self._replies) > self.max_replies:
+                        self._replies.popitem(last=False)
+            running.set()
+        return reply
+    
+    def _dispatch(self, method: str, path: str, query_string: str, raw: Optional[bytes]) -> Reply:
+        route = None
+        for route_method, pattern, name in self._routes:
+            match = pattern.match(path)
+            if match is not None:
+                if route_method == method:
+                    route = getattr(self, name), match.groupdict()
+                    break
+                route = route or (None, None)
+        if route is None:
+            return 404, {'message': f'Route {path} not found.'}
+        handler, params = route
+        if handler is None:
+            return 405, {'message': f'The {method} method is not supported for route {path}.'}
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            return 400, {'message': 'Malformed JSON body.'}
+        if not isinstance(body, dict):
+            return 400, {'message': 'Request body must be a JSON object.'}
+        try:
+            return handler(params, parse_qs(query_string), body)
+        except FinAegisError as error:
+            return error.status_code or 500, error.response_data or {'message': str(error)}
+    
+    def _handler_class(self) -> type:
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+            
+            def log_message(self, *args):
+                pass
+            
+            def _dispatch(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else None
+                status, payload, extra_headers = server.handle(self.command, self.path, self.headers, body)
+                with server._lock:
+                    server.status_counts[status] += 1
+                raw = json.dumps(payload, separators=(',', ':')).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(raw)))
+                for name, value in extra_headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+                
+            do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+            
+        return Handler
+        
+    # Routes: (path parameters, query, JSON body) -> (status, body)
+    
+    def _list_accounts(self, params, query, body) -> Reply:
+        return 200, paginate(self.ledger.accounts(), query)
+    
+    def _create_account(self, params, query, body) -> Reply:
+        account = self.ledger.create_account(body.get('user_uuid'), body.get('name'), body.get('initial_balance'))
+        return 201, {'data': account}
+    
+    def _get_account(self, params, query, body) -> Reply:
+        return 200, {'data': self.ledger.account(params['uuid'])}
+    
+    def _delete_account(self, params, query, body) -> Reply:
+        self.ledger.delete_account(params['uuid'])
+        return 200, {'message': 'Account deleted successfully.'}
+    
+    def _freeze(self, params, query, body) -> Reply:
+        if not body.get('reason'):
+            raise _invalid({'reason': 'The reason field is required.'})
+        frozen = params['action'] == 'freeze'
+        self.ledger.set_frozen(params['uuid'], frozen)
+        return 200, {'message': f"Account {'frozen' if frozen else 'unfrozen'} successfully."}
+    
+    def _balances(self, params, query, body) -> Reply:
+        return 200, {'data': self.ledger.balances(params['uuid'])}
+    
+    def _move(self, params, query, body) -> Reply:
+        move = self.ledger.deposit if params['action'] == 'deposit' else self.ledger.withdraw
+        transaction = move(params['uuid'], body.get('amount'), body.get('asset_code', 'USD'))
+        return 201, {'data': transaction}
+    
+    def _account_transactions(self, params, query, body) -> Reply:
+        return 200, paginate(self.ledger.transactions(params['uuid']), query)
+    
+    def _account_transfers(self, params, query, body) -> Reply:
+        return 200, paginate(self.ledger.transfers(params['uuid']), query)
+    
+    def _transactions(self, params, query, body) -> Reply:
+        return 200, paginate(self.ledger.transactions(), query)
+    
+    def _get_transaction(self, params, query, body) -> Reply:
+        return 200, {'data': self.ledger.get_transaction(params['id'])}
+    
+    def _create_transfer(self, params, query, body) -> Reply:
+        errors = {name: f'The {name.replace("_", " ")} field is required.'
+                  for name in ('from_account', 'to_account') if not body.get(name)}
+        if errors:
+            raise _invalid(errors)
+        transfer = self.ledger.transfer(
+            body['from_account'],
+            body['to_account'],
+            body.get('amount'),
+            body.get('asset_code', 'USD'),
+            body.get('reference')
+        )
+        return 201, {'data': transfer}
+    
+    def _get_transfer(self, params, query, body) -> Reply:
+        return 200, {'data': self.ledger.get_transfer(params['uuid'])}
+    
+    def _rate(self, source: str, target: str) -> Dict[str, Any]:
+        if source not in USD_VALUES or target not in USD_VALUES or source == target:
+            raise _missing('Exchange rate', f'{source}/{target}')
+        return {
+            'from_asset': source,
+            'to_asset': target,
+            'rate': str(exchange_rate(source, target)),
+            'last_updated': _now(),
+        }
+    
+    def _list_rates(self, params, query, body) -> Reply:
+        rates = [self._rate(source, target) for source in USD_VALUES for target in USD_VALUES if source != target]
+        return 200, paginate(rates, query)
+    
+    def _get_rate(self, params, query, body) -> Reply:
+        return 200, {'data': self._rate(params['source'], params['target'])}
+    
+    def _convert(self, params, query, body) -> Reply:
+        quote = self._rate(params['source'], params['target'])
+        try:
+            amount = int(query.get('amount', [''])[0])
+        except ValueError:
+            raise _invalid({'amount': 'The amount must be an integer.'})
+        converted = (amount * Decimal(quote['rate'])).to_integral_value(ROUND_HALF_UP)
+        return 200, {'data': {
+            'from_asset': quote['from_asset'],
+            'to_asset': quote['to_asset'],
+            'from_amount': amount,
+            'to_amount': int(converted),
+            'rate': quote['rate'],
+        }}
+    
+    def _list_baskets(self, params, query, body) -> Reply:
+        return 200, paginate([_basket()], query)
+    
+    def _get_basket(self, params, query, body) -> Reply:
+        if params['code'] != 'GCU':
+            raise _missing('Basket', params['code'])
+        return 200, {'data': _basket()}
+    
+    def _basket_value(self, params, query, body) -> Reply:
+        info = _gcu_info() if params['code'] == 'GCU' else None
+        if info is None:
+            raise _missing('Basket', params['code'])
+        return 200, {'data': {
+            'basket_code': 'GCU',
+            'value': info['total_value_usd'],
+            'currency': 'USD',
+            'calculated_at': info['last_updated'],
+            'components': [
+                {
+                    'asset_code': part['asset_code'],
+                    'weight': part['weight'],
+                    'value': part['value_contribution_usd'],
+                    'exchange_rate': part['current_price_usd'],
+                }
+                for part in info['composition']
+            ],
+        }}
+    
+    def _gcu(self, params, query, body) -> Reply:
+        return 200, {'data': _gcu_info()}
+    
+    def _list_webhooks(self, params, query, body) -> Reply:
+        return 200, paginate(self.ledger.webhooks(), query)
+    
+    def _create_webhook(self, params, query, body) -> Reply:
+        webhook = self.ledger.create_webhook(body.get('name'), body.get('url'), body.get('events'), body.get('headers'))
+        return 201, {'data': webhook}
+    
+    def _webhook_events(self, params, query, body) -> Reply:
+        return 200, {'data': {
+            category: [{'event': event, 'description': event} for event in events]
+            for category, events in WEBHOOK_EVENTS.items()
+        }}
+    
+    def _get_webhook(self, params, query, body) -> Reply:
+        return 200, {'data': self.ledger.webhook(params['uuid'])}
+    
+    def _update_webhook(self, params, query, body) -> Reply:
+        return 200, {'data': self.ledger.update_webhook(params['uuid'], **body)}
+    
+    def _delete_webhook(self, params, query, body) -> Reply:
+        self.ledger.delete_webhook(params['uuid'])
+        return 200, {'message': 'Webhook deleted successfully.'}
+    
+    def _deliveries(self, params, query, body) -> Reply:
+        status = query.get('status', [None])[0]
+        return 200, paginate(self.ledger.deliveries(params['uuid'], status), query)
\ No newline at end of file
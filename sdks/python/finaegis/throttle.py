@@ -0,0 +1,148 @@
+"""
+Shared backoff for concurrent SDK workloads
+
+When several workers share one client, a 429 seen by any of them means the
+server wants the whole client to slow down. A BackoffGate holds a single
+"resume at" deadline that every worker waits on before sending, so the pool
+pauses together instead of each worker hammering the limit independently.
+
+Calls made under a gate are not retried on 429 by the client itself: the
+first rate limit response is raised at once so the gate can pause the pool.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from .exceptions import RateLimitError
+
+T = TypeVar('T')
+
+# Set while a call runs under a BackoffGate
+_gated: 'contextvars.ContextVar[bool]' = contextvars.ContextVar('finaegis_backoff_gated', default=False)
+
+
+def backoff_gated() -> bool:
+    """Whether the current call runs under a BackoffGate, which handles its 429s."""
+    return _gated.get()
+
+
+class BackoffGate:
+    """Pause point shared by every worker of a concurrent operation."""
+    
+    def __init__(self, default_delay: float = 1.0, max_delay: float = 60.0):
+        """
+        Args:
+            default_delay: Initial pause when the server sends no retry_after
+            max_delay: Upper bound for the exponential default pause
+        """
+        self.default_delay = default_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+        self._strikes = 0
+    
+    def remaining(self) -> float:
+        """Seconds left before workers may send again."""
+        with self._lock:
+            return max(0.0, self._resume_at - time.monotonic())
+    
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """
+        Pause all workers after a rate limit response.
+        
+        Args:
+            retry_after: Server-provided delay in seconds, if any
+        """
+        with self._lock:
+            self._strikes += 1
+            if retry_after:
+                delay = float(retry_after)
+            else:
+                delay = min(self.max_delay, self.default_delay * (2 ** (self._strikes - 1)))
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+    
+    def reset(self) -> None:
+        """Record a successful call, resetting the default backoff."""
+        with self._lock:
+            self._strikes = 0
+    
+    def wait(self) -> None:
+        """Block until the gate is open."""
+        delay = self.remaining()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self.remaining()
+    
+    async def async_wait(self) -> None:
+        """Wait until the gate is open without blocking the event loop."""
+        delay = self.remaining()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.remaining()
+
+
+def call_with_backoff(func: Callable[[], T], gate: BackoffGate, max_retries: int = 10) -> T:
+    """
+    Call func, pausing the shared gate and retrying on RateLimitError.
+    
+    Args:
+        func: Zero-argument callable making one API request
+        gate: Gate shared by all workers of the operation
+        max_retries: Rate limit retries before the error is raised
+        
+    Returns:
+        The result of func
+    """
+    attempt = 0
+    while True:
+        gate.wait()
+        token = _gated.set(True)
+        try:
+            result = func()
+        except RateLimitError as e:
+            if attempt >= max_retries:
+                raise
+            attempt += 1
+            gate.penalize(e.retry_after)
+            continue
+        finally:
+            _gated.reset(token)
+        gate.reset()
+        return result
+
+
+async def async_call_with_backoff(
+    func: Callable[[], Awaitable[T]],
+    gate: BackoffGate,
+    max_retries: int = 10
+) -> T:
+    """
+    Await func, pausing the shared gate and retrying on RateLimitError.
+    
+    Args:
+        func: Zero-argument coroutine function making one API request
+        gate: Gate shared by all workers of the operation
+        max_retries: Rate limit retries before the error is raised
+        
+    Returns:
+        The result of func
+    """
+    attempt = 0
+    while True:
+        await gate.async_wait()
+        token = _gated.set(True)
+        try:
+            result = await func()
+        except RateLimitError as e:
+            if attempt >= max_retries:
+                raise
+            attempt += 1
+            gate.penalize(e.retry_after)
+            continue
+        finally:
+            _gated.reset(token)
+        gate.reset()
+        return result
\ No newline at end of file
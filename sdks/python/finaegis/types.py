@@ -4,16 +4,21 @@ Type definitions for the FinAegis SDK
 
 from dataclasses import dataclass
 from datetime import datetime
+from decimal import Decimal
 from typing import Dict, List, Optional, Any, Union
 
+from .money import Money, to_decimal, to_minor_units
+from .parsing import lazy_model, parse_datetime, parse_optional_datetime, slotted
 
+
+@slotted
 @dataclass
 class Account:
     """Represents a FinAegis account."""
     uuid: str
     user_uuid: str
     name: str
-    balance: float
+    balance: int  # minor units
     frozen: bool
     created_at: datetime
     updated_at: datetime
@@ -24,25 +29,27 @@ class Account:
             uuid=data['uuid'],
             user_uuid=data['user_uuid'],
             name=data['name'],
-            balance=float(data['balance']),
+            balance=to_minor_units(data['balance']),
             frozen=data.get('frozen', False),
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
+            created_at=parse_datetime(data['created_at']),
+            updated_at=parse_datetime(data['updated_at'])
         )
 
 
+@slotted
 @dataclass
 class Transaction:
     """Represents a transaction."""
     id: str
     account_uuid: str
     type: str  # 'deposit' or 'withdrawal'
-    amount: float
+    amount: int  # minor units
     asset_code: str
     status: str  # 'pending', 'completed', 'failed'
     reference: Optional[str]
     created_at: datetime
     completed_at: Optional[datetime]
+    idempotency_key: Optional[str] = None  # key the SDK sent when creating it
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
@@ -50,27 +57,29 @@ class Transaction:
             id=data['id'],
             account_uuid=data['account_uuid'],
             type=data['type'],
-            amount=float(data['amount']),
+            amount=to_minor_units(data['amount']),
             asset_code=data['asset_code'],
             status=data['status'],
             reference=data.get('reference'),
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            completed_at=datetime.fromisoformat(data['completed_at'].replace('Z', '+00:00')) if data.get('completed_at') else None
+            created_at=parse_datetime(data['created_at']),
+            completed_at=parse_optional_datetime(data.get('completed_at'))
         )
 
 
+@slotted
 @dataclass
 class Transfer:
     """Represents a transfer between accounts."""
     uuid: str
     from_account: str
     to_account: str
-    amount: float
+    amount: int  # minor units
     asset_code: str
     reference: Optional[str]
     status: str  # 'pending', 'completed', 'failed'
     created_at: datetime
     completed_at: Optional[datetime]
+    idempotency_key: Optional[str] = None  # key the SDK sent when creating it
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Transfer':
@@ -78,15 +87,16 @@ class Transfer:
             uuid=data['uuid'],
             from_account=data['from_account'],
             to_account=data['to_account'],
-            amount=float(data['amount']),
+            amount=to_minor_units(data['amount']),
             asset_code=data['asset_code'],
             reference=data.get('reference'),
             status=data['status'],
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            completed_at=datetime.fromisoformat(data['completed_at'].replace('Z', '+00:00')) if data.get('completed_at') else None
+            created_at=parse_datetime(data['created_at']),
+            completed_at=parse_optional_datetime(data.get('completed_at'))
         )
 
 
+@slotted
 @dataclass
 class Asset:
     """Represents an asset."""
@@ -106,11 +116,16 @@ class Asset:
             type=data['type'],
             decimals=data['decimals'],
             is_active=data['is_active'],
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
+            created_at=parse_datetime(data['created_at']),
+            updated_at=parse_datetime(data['updated_at'])
         )
+    
+    def money(self, minor: int) -> Money:
+        """Wrap a minor-unit amount of this asset, e.g. ``usd.money(account.balance)``."""
+        return Money.of(minor, self)
 
 
+@slotted
 @dataclass
 class Basket:
     """Represents a basket asset."""
@@ -118,7 +133,7 @@ class Basket:
     name: str
     description: Optional[str]
     composition: Dict[str, float]
-    value_usd: float
+    value_usd: Decimal
     is_active: bool
     created_at: datetime
     updated_at: datetime
@@ -130,19 +145,20 @@ class Basket:
             name=data['name'],
             description=data.get('description'),
             composition=data['composition'],
-            value_usd=float(data['value_usd']),
+            value_usd=to_decimal(data['value_usd']),
             is_active=data['is_active'],
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
+            created_at=parse_datetime(data['created_at']),
+            updated_at=parse_datetime(data['updated_at'])
         )
 
 
+@slotted
 @dataclass
 class ExchangeRate:
     """Represents an exchange rate."""
     from_asset: str
     to_asset: str
-    rate: float
+    rate: Decimal
     last_updated: datetime
     
     @classmethod
@@ -150,11 +166,12 @@ class ExchangeRate:
         return cls(
             from_asset=data['from_asset'],
             to_asset=data['to_asset'],
-            rate=float(data['rate']),
-            last_updated=datetime.fromisoformat(data['last_updated'].replace('Z', '+00:00'))
+            rate=to_decimal(data['rate']),
+            last_updated=parse_datetime(data['last_updated'])
         )
 
 
+@slotted
 @dataclass
 class Webhook:
     """Represents a webhook configuration."""
@@ -176,11 +193,78 @@ class Webhook:
             events=data['events'],
             headers=data.get('headers'),
             is_active=data['is_active'],
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
+            created_at=parse_datetime(data['created_at']),
+            updated_at=parse_datetime(data['updated_at'])
         )
 
 
+@slotted
+@dataclass
+class WebhookEvent:
+    """Represents an event delivered to a webhook endpoint."""
+    event: str
+    timestamp: Optional[datetime]
+    data: Dict[str, Any]  # the full delivered payload
+    delivery_id: Optional[str] = None
+    webhook_id: Optional[str] = None
+    
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        delivery_id: Optional[str] = None,
+        webhook_id: Optional[str] = None,
+        event: Optional[str] = None
+    ) -> 'WebhookEvent':
+        return cls(
+            event=data.get('event') or event or '',
+            timestamp=parse_optional_datetime(data.get('timestamp')),
+            data=data,
+            delivery_id=delivery_id,
+            webhook_id=webhook_id
+        )
+
+
+@slotted
+@dataclass
+class WebhookDelivery:
+    """Represents one delivery attempt record of a webhook."""
+    uuid: str
+    webhook_uuid: str
+    event_type: str
+    payload: Dict[str, Any]
+    status: str
+    attempt_number: int
+    created_at: datetime
+    response_status: Optional[int] = None
+    error_message: Optional[str] = None
+    delivered_at: Optional[datetime] = None
+    next_retry_at: Optional[datetime] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WebhookDelivery':
+        return cls(
+            uuid=data['uuid'],
+            webhook_uuid=data['webhook_uuid'],
+            event_type=data['event_type'],
+            payload=data.get('payload') or {},
+            status=data['status'],
+            attempt_number=data.get('attempt_number', 1),
+            created_at=parse_datetime(data['created_at']),
+            response_status=data.get('response_status'),
+            error_message=data.get('error_message'),
+            delivered_at=parse_optional_datetime(data.get('delivered_at')),
+            next_retry_at=parse_optional_datetime(data.get('next_retry_at'))
+        )
+    
+    def to_event(self) -> WebhookEvent:
+        """The event as a live delivery of this record would have carried it."""
+        return WebhookEvent.from_dict(
+            self.payload, delivery_id=self.uuid, webhook_id=self.webhook_uuid, event=self.event_type
+        )
+
+
+@slotted
 @dataclass
 class GCUComposition:
     """Represents a GCU composition component."""
@@ -209,6 +293,7 @@ class GCUComposition:
         )
 
 
+@slotted
 @dataclass
 class GCUInfo:
     """Represents GCU information."""
@@ -225,10 +310,40 @@ class GCUInfo:
             name=data.get('name', 'Global Currency Unit'),
             total_value_usd=float(data['total_value_usd']),
             composition=[GCUComposition.from_dict(c) for c in data['composition']],
-            last_updated=datetime.fromisoformat(data['last_updated'].replace('Z', '+00:00'))
+            last_updated=parse_datetime(data['last_updated'])
         )
 
 
+# Lazily parsed variants, used when the client is created with lazy_models=True
+LazyAccount = lazy_model(Account, {
+    'balance': lambda data: to_minor_units(data['balance']),
+    'frozen': lambda data: data.get('frozen', False),
+    'created_at': lambda data: parse_datetime(data['created_at']),
+    'updated_at': lambda data: parse_datetime(data['updated_at']),
+}, cached=('created_at', 'updated_at'))
+LazyTransaction = lazy_model(Transaction, {
+    'amount': lambda data: to_minor_units(data['amount']),
+    'reference': lambda data: data.get('reference'),
+    'created_at': lambda data: parse_datetime(data['created_at']),
+    'completed_at': lambda data: parse_optional_datetime(data.get('completed_at')),
+    'idempotency_key': lambda data: None,
+}, cached=('created_at', 'completed_at'))
+LazyTransfer = lazy_model(Transfer, {
+    'amount': lambda data: to_minor_units(data['amount']),
+    'reference': lambda data: data.get('reference'),
+    'created_at': lambda data: parse_datetime(data['created_at']),
+    'completed_at': lambda data: parse_optional_datetime(data.get('completed_at')),
+    'idempotency_key': lambda data: None,
+}, cached=('created_at', 'completed_at'))
+
+LAZY_MODELS: Dict[type, type] = {
+    Account: LazyAccount,
+    Transaction: LazyTransaction,
+    Transfer: LazyTransfer,
+}
+
+
+@slotted
 @dataclass
 class PaginatedResponse:
     """Represents a paginated API response."""
@@ -239,10 +354,11 @@ class PaginatedResponse:
     last_page: int
     
     @classmethod
-    def from_dict(cls, response: Dict[str, Any], item_class: type) -> 'PaginatedResponse':
+    def from_dict(cls, response: Dict[str, Any], item_class: Optional[type] = None) -> 'PaginatedResponse':
         meta = response.get('meta', {})
+        items = response.get('data', [])
         return cls(
-            data=[item_class.from_dict(item) for item in response.get('data', [])],
+            data=list(map(item_class.from_dict, items)) if item_class else list(items),
             current_page=meta.get('current_page', 1),
             per_page=meta.get('per_page', 20),
             total=meta.get('total', 0),
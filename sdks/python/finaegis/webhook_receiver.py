@@ -0,0 +1,826 @@
+"""
+Webhook receiving for the FinAegis SDK
+
+FinAegis signs every delivery with HMAC-SHA256 over the raw request body and
+sends it as ``X-Webhook-Signature: sha256=<hex>`` (older endpoints use
+``X-FinAegis-Signature``). A receiver verifies that signature with a
+constant-time comparison on the bytes exactly as received, decodes the body
+once, drops redeliveries of an event it has already accepted, and queues the
+event for your handler. The HTTP response goes back as soon as the event is
+queued, so slow handlers never make FinAegis time out and retry.
+
+FinAegis creates a new delivery record, with a new ``X-Webhook-Delivery`` id,
+for every retry of an event, and the payload has no event id of its own. The
+receiver therefore recognises an event by its webhook (``X-Webhook-ID``) and a
+digest of its decoded payload, which includes the event name and timestamp;
+see event_key(). Backfilled delivery records of the same event get the same
+key, so live deliveries and backfills are deduplicated against each other.
+
+Handlers receive micro-batches: a worker takes the first queued event and
+collects more for up to ``batch_wait`` seconds or ``batch_size`` events, so a
+handler writing to a database can insert a whole batch in one statement.
+
+When the queue is full the receiver answers 503 without remembering the event,
+and FinAegis delivers it again later. Events are acknowledged when queued: a
+handler that raises is reported to ``on_error``, and its events are forgotten
+by the deduplication window, so a later redelivery or backfill of them is
+handled instead of dropped.
+
+Example:
+    >>> receiver = WebhookReceiver(secret='whsec_...', handler=save_events)
+    >>> app = wsgi_app(receiver)  # mount under any WSGI server
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import queue
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .decoding import JSONDecoder, get_decoder
+from .exceptions import InvalidSignatureError
+from .types import WebhookEvent
+
+SIGNATURE_HEADERS = ('X-Webhook-Signature', 'X-FinAegis-Signature')
+
+Handler = Callable[[List[WebhookEvent]], Any]
+AsyncHandler = Callable[[List[WebhookEvent]], Awaitable[Any]]
+ErrorHandler = Callable[[BaseException, List[WebhookEvent]], Any]
+
+# Marks the end of the queue for one worker
+_STOP = object()
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+class SignatureVerifier:
+    """
+    Verifies webhook signatures for one secret.
+    
+    The key is set up once and copied for every delivery, which saves the
+    HMAC key schedule on each call. Safe to share between threads.
+    """
+    
+    def __init__(self, secret: Union[str, bytes]):
+        """
+        Args:
+            secret: Secret configured on the webhook
+        """
+        key = secret.encode() if isinstance(secret, str) else secret
+        self._mac = hmac.new(key, digestmod=hashlib.sha256)
+    
+    def sign(self, body: bytes) -> str:
+        """Signature header value FinAegis would send for body."""
+        mac = self._mac.copy()
+        mac.update(body)
+        return 'sha256=' + mac.hexdigest()
+    
+    def verify(self, body: bytes, signature: Union[str, bytes, None]) -> bool:
+        """
+        Check a signature against the raw request body.
+        
+        Args:
+            body: Request body exactly as received
+            signature: Signature header value, with or without the
+                ``sha256=`` prefix
+                
+        Returns:
+            True if the signature matches
+        """
+        if not signature:
+            return False
+        if isinstance(signature, str):
+            try:
+                signature = signature.encode('ascii')
+            except UnicodeEncodeError:
+                return False
+        if signature.startswith(b'sha256='):
+            signature = signature[7:]
+        mac = self._mac.copy()
+        mac.update(body)
+        return hmac.compare_digest(mac.hexdigest().encode('ascii'), signature.lower())
+
+
+def verify_signature(body: bytes, signature: Union[str, bytes, None], secret: Union[str, bytes]) -> bool:
+    """
+    Check a webhook signature against the raw request body.
+    
+    Args:
+        body: Request body exactly as received
+        signature: ``X-Webhook-Signature`` (or ``X-FinAegis-Signature``) value
+        secret: Secret configured on the webhook
+        
+    Returns:
+        True if the signature matches
+    """
+    return SignatureVerifier(secret).verify(body, signature)
+
+
+def event_key(event: WebhookEvent) -> Hashable:
+    """
+    Identity of an event for deduplication, the same for every delivery of it.
+    
+    Args:
+        event: Delivered or backfilled event
+        
+    Returns:
+        The webhook id and a SHA-256 digest of the payload serialized with
+        sorted keys, so the key does not depend on how the body was formatted
+    """
+    canonical = json.dumps(event.data, sort_keys=True, separators=(',', ':'), default=str)
+    return (event.webhook_id, hashlib.sha256(canonical.encode()).digest())
+
+
+class DeduplicationWindow:
+    """
+    Thread-safe bounded memory of recently seen event keys.
+    
+    Keeps the last ``size`` keys, and optionally forgets keys older than
+    ``ttl`` seconds, so memory stays constant however many events arrive.
+    """
+    
+    def __init__(self, size: int = 100_000, ttl: Optional[float] = None):
+        """
+        Args:
+            size: Number of keys remembered
+            ttl: Seconds a key is remembered (None to keep it until evicted)
+        """
+        self.size = size
+        self.ttl = ttl
+        self._seen: 'OrderedDict[Hashable, float]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._seen)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            seen = self._seen.get(key)
+            return seen is not None and (self.ttl is None or time.monotonic() - seen < self.ttl)
+    
+    def add(self, key: Hashable) -> bool:
+        """
+        Remember a key.
+        
+        Returns:
+            True if the key is new, False if it was seen within the window
+        """
+        now = time.monotonic()
+        with self._lock:
+            seen = self._seen.get(key)
+            if seen is not None:
+                if self.ttl is None or now - seen < self.ttl:
+                    return False
+                del self._seen[key]
+            self._seen[key] = now
+            if len(self._seen) > self.size:
+                self._seen.popitem(last=False)
+            if self.ttl is not None:
+                # Entries are in arrival order, so expired ones are at the front
+                while self._seen:
+                    oldest, stamp = next(iter(self._seen.items()))
+                    if now - stamp < self.ttl:
+                        break
+                    del self._seen[oldest]
+            return True
+    
+    def discard(self, key: Hashable) -> None:
+        """Forget a key, so its next delivery is accepted."""
+        with self._lock:
+            self._seen.pop(key, None)
+
+
+class PendingEvents:
+    """
+    Events one caller submitted that are not handled yet.
+    
+    Lets a backfill wait for its own events without waiting for live
+    deliveries queued on the same receiver.
+    """
+    
+    def __init__(self):
+        self._count = 0
+        self._idle = threading.Condition()
+    
+    def _add(self, count: int) -> None:
+        with self._idle:
+            self._count += count
+    
+    def _done(self) -> None:
+        with self._idle:
+            self._count -= 1
+            if not self._count:
+                self._idle.notify_all()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted event has been handled; False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._count, timeout)
+
+
+class AsyncPendingEvents:
+    """Events one caller submitted to an AsyncWebhookReceiver that are not handled yet."""
+    
+    def __init__(self):
+        self._count = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+    
+    def _add(self, count: int) -> None:
+        self._count += count
+        if self._count:
+            self._idle.clear()
+    
+    def _done(self) -> None:
+        self._count -= 1
+        if not self._count:
+            self._idle.set()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    async def wait(self) -> None:
+        """Wait until every submitted event has been handled."""
+        await self._idle.wait()
+
+
+@dataclass
+class ReceiverStats:
+    """Counters of a webhook receiver."""
+    received: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    rejected: int = 0  # bad signature or body
+    overloaded: int = 0  # answered 503 because the queue was full
+    processed: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+class _ReceiverBase:
+    """Verification, parsing and deduplication shared by both receivers."""
+    
+    def __init__(
+        self,
+        secret: Union[str, bytes],
+        workers: int,
+        queue_size: int,
+        batch_size: int,
+        batch_wait: float,
+        dedupe_size: int,
+        dedupe_ttl: Optional[float],
+        json_decoder: Union[str, JSONDecoder, None],
+        max_body_size: int,
+        on_error: Optional[ErrorHandler]
+    ):
+        self.verifier = SignatureVerifier(secret)
+        self.workers = workers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.dedupe = DeduplicationWindow(dedupe_size, dedupe_ttl)
+        self.json_decoder = get_decoder(json_decoder)
+        self.max_body_size = max_body_size
+        self.on_error = on_error
+        self.stats = ReceiverStats()
+        self._stats_lock = threading.Lock()
+        # PendingEvents of submitted events, by id() of the queued event
+        self._trackers: Dict[int, Any] = {}
+    
+    def parse(self, body: bytes, headers: Mapping[str, str]) -> WebhookEvent:
+        """
+        Verify and decode one delivery.
+        
+        Args:
+            body: Request body exactly as received
+            headers: Request headers
+            
+        Returns:
+            The delivered event
+            
+        Raises:
+            InvalidSignatureError: If no signature header matches the body
+            ValueError: If the body is not a JSON object
+        """
+        signature = None
+        for name in SIGNATURE_HEADERS:
+            signature = _header(headers, name)
+            if signature is not None:
+                break
+        if not self.verifier.verify(body, signature):
+            raise InvalidSignatureError("Webhook signature does not match the request body", status_code=401)
+        data = self.json_decoder(body)
+        if not isinstance(data, dict):
+            raise ValueError("Webhook body is not a JSON object")
+        return WebhookEvent.from_dict(
+            data,
+            delivery_id=_header(headers, 'X-Webhook-Delivery') or data.get('id'),
+            webhook_id=_header(headers, 'X-Webhook-ID'),
+            event=_header(headers, 'X-Webhook-Event')
+        )
+    
+    def _count(self, **counts: int) -> None:
+        with self._stats_lock:
+            for name, value in counts.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+    
+    def _admit(self, body: bytes, headers: Mapping[str, str]) -> Union[int, WebhookEvent]:
+        """Return the event to queue, or the status to answer with right away."""
+        if len(body) > self.max_body_size:
+            self._count(received=1, rejected=1)
+            return 413
+        try:
+            event = self.parse(body, headers)
+        except InvalidSignatureError:
+            self._count(received=1, rejected=1)
+            return 401
+        except ValueError:
+            self._count(received=1, rejected=1)
+            return 400
+        if not self.dedupe.add(event_key(event)):
+            self._count(received=1, duplicates=1)
+            return 200
+        return event
+    
+    def _overloaded(self, event: WebhookEvent) -> int:
+        # Not remembered, so the redelivery is accepted
+        self.dedupe.discard(event_key(event))
+        self._count(received=1, overloaded=1)
+        return 503
+    
+    def _handled(self, batch: List[WebhookEvent]) -> None:
+        if self._trackers:
+            for event in batch:
+                tracker = self._trackers.pop(id(event), None)
+                if tracker is not None:
+                    tracker._done()
+    
+    def _failed(self, error: BaseException, batch: List[WebhookEvent]) -> None:
+        # Not remembered, so a redelivery or backfill hands the events over again
+        for event in batch:
+            self.dedupe.discard(event_key(event))
+        self._count(failed=len(batch), batches=1)
+        if self.on_error is None:
+            warnings.warn(f"Webhook handler failed on {len(batch)} events: {error!r}", RuntimeWarning)
+            return
+        try:
+            self.on_error(error, batch)
+        except Exception as hook_error:
+            warnings.warn(f"Webhook error handler failed: {hook_error!r}", RuntimeWarning)
+
+
+class WebhookReceiver(_ReceiverBase):
+    """
+    Receives webhook deliveries and hands them to a pool of worker threads.
+    
+    Example:
+        >>> def save_events(events):
+        ...     db.insert_many([event.data for event in events])
+        >>> with WebhookReceiver(secret='whsec_...', handler=save_events) as receiver:
+        ...     serve(wsgi_app(receiver))
+    """
+    
+    def __init__(
+        self,
+        secret: Union[str, bytes],
+        handler: Handler,
+        workers: int = 4,
+        queue_size: int = 10_000,
+        batch_size: int = 100,
+        batch_wait: float = 0.05,
+        dedupe_size: int = 100_000,
+        dedupe_ttl: Optional[float] = None,
+        json_decoder: Union[str, JSONDecoder, None] = None,
+        max_body_size: int = 1 << 20,
+        on_error: Optional[ErrorHandler] = None
+    ):
+        """
+        Args:
+            secret: Secret configured on the webhook
+            handler: Called from a worker thread with each batch of events
+            workers: Number of worker threads
+            queue_size: Events waiting for a worker before deliveries get 503
+            batch_size: Most events passed to one handler call
+            batch_wait: Seconds a worker waits to fill a batch (0 to hand over
+                whatever is queued)
+            dedupe_size: Number of event keys remembered for deduplication
+            dedupe_ttl: Seconds an event key is remembered (None for no limit)
+            json_decoder: Callable decoding bodies, or 'orjson' / 'json';
+                defaults to orjson when it is installed
+            max_body_size: Largest body accepted, in bytes
+            on_error: Called with the exception and batch when the handler
+                raises; a RuntimeWarning is issued when not set
+        """
+        super().__init__(
+            secret, workers, queue_size, batch_size, batch_wait,
+            dedupe_size, dedupe_ttl, json_decoder, max_body_size, on_error
+        )
+        self.handler = handler
+        self._queue: 'queue.Queue[Any]' = queue.Queue(queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lifecycle = threading.Lock()
+    
+    def __enter__(self) -> 'WebhookReceiver':
+        self.start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+    
+    @property
+    def running(self) -> bool:
+        """Whether the worker threads are running."""
+        return bool(self._threads)
+    
+    def start(self) -> None:
+        """Start the worker threads; does nothing if they are running."""
+        with self._lifecycle:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f'finaegis-webhooks-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Process the events already queued, then stop the workers.
+        
+        Args:
+            timeout: Seconds to wait for each worker (None to wait until done)
+        """
+        with self._lifecycle:
+            threads, self._threads = self._threads, []
+            for _ in threads:
+                self._queue.put(_STOP)
+            for thread in threads:
+                thread.join(timeout)
+    
+    def receive(self, body: bytes, headers: Mapping[str, str]) -> int:
+        """
+        Accept one delivery.
+        
+        Args:
+            body: Request body exactly as received
+            headers: Request headers
+            
+        Returns:
+            HTTP status to answer with: 202 when queued, 200 for a
+            redelivery, 400/401/413 for invalid deliveries, 503 when the
+            queue is full
+        """
+        result = self._admit(body, headers)
+        if isinstance(result, int):
+            return result
+        try:
+            self._queue.put_nowait(result)
+        except queue.Full:
+            return self._overloaded(result)
+        self._count(received=1, accepted=1)
+        return 202
+    
+    def submit(self, events: Iterable[WebhookEvent], pending: Optional[PendingEvents] = None) -> int:
+        """
+        Queue events obtained another way, e.g. by a backfill.
+        
+        They skip signature checks but are deduplicated against live
+        deliveries. Waits for room in the queue instead of rejecting events.
+        
+        Args:
+            events: Events to hand to the handler
+            pending: Tracks the queued events until they are handled, so the
+                caller can wait for them alone instead of calling join()
+            
+        Returns:
+            Number of events queued, i.e. not seen before
+        """
+        if not self.running:
+            self.start()
+        accepted = duplicates = 0
+        for event in events:
+            if not self.dedupe.add(event_key(event)):
+                duplicates += 1
+                continue
+            if pending is not None:
+                pending._add(1)
+                self._trackers[id(event)] = pending
+            self._queue.put(event)
+            accepted += 1
+        self._count(received=accepted + duplicates, accepted=accepted, duplicates=duplicates)
+        return accepted
+    
+    def join(self) -> None:
+        """Block until every queued event has been handled."""
+        self._queue.join()
+    
+    def _next_batch(self) -> Tuple[List[WebhookEvent], bool]:
+        item = self._queue.get()
+        if item is _STOP:
+            self._queue.task_done()
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.task_done()
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    def _work(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if not batch:
+                continue
+            try:
+                self.handler(batch)
+                self._count(processed=len(batch), batches=1)
+            except Exception as error:
+                self._failed(error, batch)
+            finally:
+                self._handled(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+
+class AsyncWebhookReceiver(_ReceiverBase):
+    """
+    Receives webhook deliveries and hands them to a pool of asyncio tasks.
+    
+    Takes the same options as WebhookReceiver; the handler is a coroutine
+    function and the workers are tasks on the running event loop.
+    """
+    
+    def __init__(
+        self,
+        secret: Union[str, bytes],
+        handler: AsyncHandler,
+        workers: int = 4,
+        queue_size: int = 10_000,
+        batch_size: int = 100,
+        batch_wait: float = 0.05,
+        dedupe_size: int = 100_000,
+        dedupe_ttl: Optional[float] = None,
+        json_decoder: Union[str, JSONDecoder, None] = None,
+        max_body_size: int = 1 << 20,
+        on_error: Optional[ErrorHandler] = None
+    ):
+        super().__init__(
+            secret, workers, queue_size, batch_size, batch_wait,
+            dedupe_size, dedupe_ttl, json_decoder, max_body_size, on_error
+        )
+        self.handler = handler
+        # The queue and tasks bind to the running event loop, so they are
+        # created by start() rather than here.
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List['asyncio.Task[None]'] = []
+    
+    async def __aenter__(self) -> 'AsyncWebhookReceiver':
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+    
+    @property
+    def running(self) -> bool:
+        """Whether the worker tasks are running."""
+        return bool(self._tasks)
+    
+    async def start(self) -> None:
+        """Start the worker tasks; does nothing if they are running."""
+        if self._tasks:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+    
+    async def stop(self) -> None:
+        """Process the events already queued, then stop the workers."""
+        tasks, self._tasks = self._tasks, []
+        for _ in tasks:
+            await self._queue.put(_STOP)
+        await asyncio.gather(*tasks)
+    
+    async def receive(self, body: bytes, headers: Mapping[str, str]) -> int:
+        """
+        Accept one delivery.
+        
+        Args:
+            body: Request body exactly as received
+            headers: Request headers
+            
+        Returns:
+            HTTP status to answer with, as for WebhookReceiver.receive
+        """
+        if not self._tasks:
+            await self.start()
+        result = self._admit(body, headers)
+        if isinstance(result, int):
+            return result
+        try:
+            self._queue.put_nowait(result)
+        except asyncio.QueueFull:
+            return self._overloaded(result)
+        self._count(received=1, accepted=1)
+        return 202
+    
+    async def submit(self, events: Iterable[WebhookEvent], pending: Optional[AsyncPendingEvents] = None) -> int:
+        """
+        Queue events obtained another way, e.g. by a backfill.
+        
+        See WebhookReceiver.submit.
+        
+        Args:
+            events: Events to hand to the handler
+            pending: Tracks the queued events until they are handled
+            
+        Returns:
+            Number of events queued, i.e. not seen before
+        """
+        if not self._tasks:
+            await self.start()
+        accepted = duplicates = 0
+        for event in events:
+            if not self.dedupe.add(event_key(event)):
+                duplicates += 1
+                continue
+            if pending is not None:
+                pending._add(1)
+                self._trackers[id(event)] = pending
+            await self._queue.put(event)
+            accepted += 1
+        self._count(received=accepted + duplicates, accepted=accepted, duplicates=duplicates)
+        return accepted
+    
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    async def _next_batch(self) -> Tuple[List[WebhookEvent], bool]:
+        item = await self._queue.get()
+        if item is _STOP:
+            self._queue.task_done()
+            return [], True
+        batch = [item]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_wait
+        while len(batch) < self.batch_size:
+            if self._queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._queue.get_nowait()
+            if item is _STOP:
+                self._queue.task_done()
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    async def _work(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = await self._next_batch()
+            if not batch:
+                continue
+            try:
+                await self.handler(batch)
+                self._count(processed=len(batch), batches=1)
+            except Exception as error:
+                self._failed(error, batch)
+            finally:
+                self._handled(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+
+def _reason(status: int) -> str:
+    return f'{status} {HTTPStatus(status).phrase}'
+
+
+# Headers read by the receiver, with their WSGI environ keys
+_ENVIRON_HEADERS = tuple(
+    (name, 'HTTP_' + name.upper().replace('-', '_'))
+    for name in SIGNATURE_HEADERS + ('X-Webhook-Delivery', 'X-Webhook-ID', 'X-Webhook-Event')
+)
+
+
+def wsgi_app(receiver: WebhookReceiver) -> Callable[[Dict[str, Any], Callable], List[bytes]]:
+    """
+    Wrap a receiver in a WSGI application.
+    
+    The application accepts POSTs on any path and starts the receiver's
+    workers on the first delivery if they are not running yet.
+    
+    Args:
+        receiver: Receiver handling the deliveries
+        
+    Returns:
+        WSGI application callable
+    """
+    def app(environ: Dict[str, Any], start_response: Callable) -> List[bytes]:
+        if environ['REQUEST_METHOD'] != 'POST':
+            start_response(_reason(405), [('Allow', 'POST'), ('Content-Length', '0')])
+            return [b'']
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > receiver.max_body_size:
+            status = 400 if length < 0 else 413
+        else:
+            if not receiver.running:
+                receiver.start()
+            body = environ['wsgi.input'].read(length) if length else b''
+            headers = {name: environ[key] for name, key in _ENVIRON_HEADERS if key in environ}
+            status = receiver.receive(body, headers)
+        start_response(_reason(status), [('Content-Length', '0')])
+        return [b'']
+        
+    return app
+
+
+def asgi_app(receiver: AsyncWebhookReceiver) -> Callable[..., Awaitable[None]]:
+    """
+    Wrap a receiver in an ASGI application.
+    
+    The application accepts POSTs on any path. With a lifespan-aware server
+    the workers start and drain with the application; otherwise they start
+    on the first delivery.
+    
+    Args:
+        receiver: Receiver handling the deliveries
+        
+    Returns:
+        ASGI 3 application
+    """
+    async def app(scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await receiver.start()
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await receiver.stop()
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['type'] != 'http':
+            return
+            
+        if scope['method'] != 'POST':
+            status = 405
+        else:
+            headers = {name.decode('latin-1'): value.decode('latin-1') for name, value in scope['headers']}
+            chunks = []
+            size = 0
+            more = True
+            while more:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    return
+                chunk = message.get('body', b'')
+                size += len(chunk)
+                chunks.append(chunk)
+                more = message.get('more_body', False)
+                if size > receiver.max_body_size:
+                    break
+            if size > receiver.max_body_size:
+                status = 413
+            else:
+                status = await receiver.receive(b''.join(chunks), headers)
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-length', b'0')],
+        })
+        await send({'type': 'http.response.body', 'body': b''})
+        
+    return app
\ No newline at end of file
@@ -40,9 +40,16 @@ setup(
             "flake8>=5.0",
             "mypy>=0.990",
             "requests-mock>=1.9.0",
+            "aiohttp>=3.8.0",
         ],
         "async": [
             "aiohttp>=3.8.0",
+        ],
+        "numpy": [
+            "numpy>=1.21",
+        ],
+        "speedups": [
+            "orjson>=3.6",
         ]
     },
     project_urls={
@@ -0,0 +1,118 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from aiohttp import web
+
+from finaegis import FinAegis
+
+BASE_URL = 'http://api.test/v2/'
+
+
+def account_payload(uuid='acc-1', balance=1000, **overrides):
+    payload = {
+        'uuid': uuid,
+        'user_uuid': 'user-1',
+        'name': 'Main',
+        'balance': balance,
+        'frozen': False,
+        'created_at': '2024-01-01T00:00:00Z',
+        'updated_at': '2024-01-01T00:00:00Z',
+    }
+    payload.update(overrides)
+    return payload
+
+
+def transaction_payload(id='tx-1', amount=500, **overrides):
+    payload = {
+        'id': id,
+        'account_uuid': 'acc-1',
+        'type': 'deposit',
+        'amount': amount,
+        'asset_code': 'USD',
+        'status': 'completed',
+        'reference': None,
+        'created_at': '2024-01-01T00:00:00.000000Z',
+        'completed_at': '2024-01-01T00:00:01.000000Z',
+    }
+    payload.update(overrides)
+    return payload
+
+
+def page_payload(items, page, per_page, total):
+    last_page = max(1, -(-total // per_page))
+    return {
+        'data': items,
+        'meta': {'current_page': page, 'per_page': per_page, 'total': total, 'last_page': last_page},
+    }
+
+
+@pytest.fixture
+def client():
+    return FinAegis(api_key='test-key', base_url=BASE_URL, max_retries=0)
+
+
+class LocalServer:
+    """Threaded HTTP server answering from a handler function.
+    
+    ``handler(method, path, headers, body)`` returns ``(status, payload)`` or
+    ``(status, payload, headers)``. Every request is recorded in ``requests``.
+    """
+    
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.connections = set()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+            
+            def log_message(self, *args):
+                pass
+            
+            def _dispatch(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                server.requests.append((self.command, self.path, dict(self.headers), body))
+                server.connections.add(self.client_address)
+                result = server.handler(self.command, self.path, self.headers, body)
+                status, payload = result[0], result[1]
+                extra_headers = result[2] if len(result) > 2 else {}
+                raw = json.dumps(payload).encode() if payload is not None else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(raw)))
+                for name, value in extra_headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+                
+            do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+            
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f'http://127.0.0.1:{self.httpd.server_address[1]}/api/v2/'
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+async def start_aiohttp_server(routes):
+    """Start an aiohttp app on a free port; returns ``(runner, base_url)``."""
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f'http://127.0.0.1:{port}/api/v2/'
\ No newline at end of file
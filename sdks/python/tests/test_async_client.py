@@ -0,0 +1,163 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from finaegis.async_client import AsyncFinAegis
+from finaegis.exceptions import NotFoundError, ValidationError
+from finaegis.types import Account, PaginatedResponse
+
+from conftest import account_payload, start_aiohttp_server
+
+ACCOUNT = account_payload()
+
+
+@pytest.mark.asyncio
+async def test_resources_return_typed_models():
+    async def list_accounts(request):
+        assert request.headers['Authorization'] == 'Bearer key'
+        assert request.query['page'] == '2'
+        return web.json_response({
+            'data': [ACCOUNT],
+            'meta': {'current_page': 2, 'per_page': 1, 'total': 2, 'last_page': 2},
+        })
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/accounts', list_accounts)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url) as client:
+            page = await client.accounts.list(page=2, per_page=1)
+    finally:
+        await runner.cleanup()
+        
+    assert isinstance(page, PaginatedResponse)
+    assert page.last_page == 2
+    assert isinstance(page.data[0], Account)
+    assert page.data[0].uuid == 'acc-1'
+
+
+@pytest.mark.asyncio
+async def test_errors_map_like_sync_client():
+    async def missing(request):
+        return web.json_response({'message': 'Account not found'}, status=404)
+    
+    async def invalid(request):
+        return web.json_response({'message': 'Invalid', 'errors': {'amount': ['required']}}, status=422)
+        
+    runner, base_url = await start_aiohttp_server([
+        web.get('/api/v2/accounts/nope', missing),
+        web.post('/api/v2/transfers', invalid),
+    ])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url) as client:
+            with pytest.raises(NotFoundError) as not_found:
+                await client.accounts.get('nope')
+            with pytest.raises(ValidationError) as invalid_error:
+                await client.transfers.create('a', 'b', 100)
+    finally:
+        await runner.cleanup()
+        
+    assert not_found.value.status_code == 404
+    assert str(not_found.value) == 'Account not found'
+    assert invalid_error.value.errors == {'amount': ['required']}
+
+
+@pytest.mark.asyncio
+async def test_error_bodies_use_the_configured_decoder():
+    decoded = []
+    
+    def decoder(body):
+        decoded.append(body)
+        return json.loads(body)
+        
+    async def missing(request):
+        return web.json_response({'message': 'Account not found'}, status=404)
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/accounts/nope', missing)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, json_decoder=decoder) as client:
+            with pytest.raises(NotFoundError) as not_found:
+                await client.accounts.get('nope')
+    finally:
+        await runner.cleanup()
+        
+    assert str(not_found.value) == 'Account not found'
+    assert len(decoded) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors_then_succeeds():
+    calls = []
+    
+    async def flaky(request):
+        calls.append(1)
+        if len(calls) < 3:
+            return web.json_response({'message': 'down'}, status=503)
+        return web.json_response({'data': ACCOUNT})
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/accounts/acc-1', flaky)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, backoff_factor=0) as client:
+            account = await client.accounts.get('acc-1')
+    finally:
+        await runner.cleanup()
+        
+    assert account.uuid == 'acc-1'
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_per_client():
+    in_flight = 0
+    peak = 0
+    
+    async def balances(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.json_response({'data': {'balances': []}})
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/accounts/{uuid}/balances', balances)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, max_concurrency=3) as client:
+            results = await asyncio.gather(*[client.accounts.get_balances(f'acc-{i}') for i in range(12)])
+    finally:
+        await runner.cleanup()
+        
+    assert len(results) == 12
+    assert peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_backoff_does_not_hold_a_concurrency_slot():
+    calls = []
+    
+    async def flaky(request):
+        calls.append(1)
+        if len(calls) == 1:
+            return web.json_response({'message': 'down'}, status=503, headers={'Retry-After': '1'})
+        return web.json_response({'data': ACCOUNT})
+        
+    async def balances(request):
+        return web.json_response({'data': {'balances': []}})
+        
+    runner, base_url = await start_aiohttp_server([
+        web.get('/api/v2/accounts/acc-1', flaky),
+        web.get('/api/v2/accounts/{uuid}/balances', balances),
+    ])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, max_concurrency=1) as client:
+            retrying = asyncio.ensure_future(client.accounts.get('acc-1'))
+            while not calls:
+                await asyncio.sleep(0.01)
+            # Served while the first call waits out its Retry-After
+            await asyncio.wait_for(client.accounts.get_balances('acc-2'), timeout=0.5)
+            assert not retrying.done()
+            account = await retrying
+    finally:
+        await runner.cleanup()
+        
+    assert account.uuid == 'acc-1'
+    assert len(calls) == 2
\ No newline at end of file
@@ -0,0 +1,258 @@
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from aiohttp import web
+
+from finaegis import FinAegis, WebhookDelivery
+from finaegis.async_client import AsyncFinAegis
+from finaegis.backfill import Checkpoint
+from finaegis.webhook_receiver import AsyncWebhookReceiver, SignatureVerifier, WebhookReceiver
+
+from conftest import BASE_URL, LocalServer, page_payload, start_aiohttp_server
+
+SECRET = 'whsec_test'
+NOW = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def delivery_payload(webhook_id, n, status='failed'):
+    created = NOW - timedelta(minutes=n)
+    return {
+        'uuid': f'{webhook_id}-dlv-{n}',
+        'webhook_uuid': webhook_id,
+        'event_type': 'transfer.completed',
+        'payload': {'event': 'transfer.completed', 'timestamp': created.isoformat(), 'transfer_uuid': f'tr-{n}'},
+        'status': status,
+        'attempt_number': 3,
+        'response_status': 503,
+        'created_at': created.isoformat().replace('+00:00', 'Z'),
+    }
+
+
+def deliveries_page(webhook_id, query, total=250):
+    """Newest-first delivery history of total deliveries, one a minute."""
+    page, per_page = int(query['page'][0]), int(query['per_page'][0])
+    rows = [delivery_payload(webhook_id, n) for n in range((page - 1) * per_page, min(page * per_page, total))]
+    return page_payload(rows, page, per_page, total)
+
+
+def test_list_deliveries_returns_models(client, requests_mock):
+    requests_mock.get(
+        BASE_URL + 'webhooks/wh-1/deliveries?page=1&per_page=20&status=failed',
+        json=page_payload([delivery_payload('wh-1', 0)], 1, 20, 1),
+    )
+    
+    page = client.webhooks.list_deliveries('wh-1', status='failed')
+    delivery = page.data[0]
+    
+    assert isinstance(delivery, WebhookDelivery)
+    assert delivery.created_at == NOW
+    event = delivery.to_event()
+    assert (event.event, event.delivery_id, event.webhook_id) == ('transfer.completed', 'wh-1-dlv-0', 'wh-1')
+
+
+def test_backfill_replays_range_and_skips_live_deliveries():
+    requested = []
+    
+    def handler(method, path, headers, body):
+        url = urlparse(path)
+        webhook_id = url.path.split('/')[-2]
+        requested.append((webhook_id, parse_qs(url.query)['page'][0]))
+        return 200, deliveries_page(webhook_id, parse_qs(url.query))
+        
+    handled = []
+    lock = threading.Lock()
+    
+    def save(events):
+        with lock:
+            handled.extend(event.delivery_id for event in events)
+            
+    receiver = WebhookReceiver(SECRET, handler=save)
+    # One of the missed events did reach the receiver live, on a later retry
+    body = json.dumps(delivery_payload('wh-1', 5)['payload']).encode()
+    live = {
+        'X-Webhook-Signature': SignatureVerifier(SECRET).sign(body),
+        'X-Webhook-Delivery': 'wh-1-retry-5',
+        'X-Webhook-ID': 'wh-1',
+    }
+    assert receiver.receive(body, live) == 202
+    
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0)
+        results = client.webhooks.backfill(
+            receiver, ['wh-1', 'wh-2'], since=NOW - timedelta(minutes=99), per_page=20, max_webhooks=2
+        )
+    receiver.stop()
+    
+    assert [result.ok for result in results] == [True, True]
+    assert [result.deliveries for result in results] == [100, 100]
+    assert [result.accepted for result in results] == [99, 100]
+    expected = {f'{w}-dlv-{n}' for w in ('wh-1', 'wh-2') for n in range(100)} - {'wh-1-dlv-5'}
+    assert sorted(handled) == sorted(expected | {'wh-1-retry-5'})
+    # Paging stops soon after the range ends instead of reading all 13 pages
+    assert max(int(page) for _, page in requested) <= 9
+
+
+def test_backfill_resumes_from_checkpoint(tmp_path):
+    failing = {'page': '4'}
+    
+    def handler(method, path, headers, body):
+        query = parse_qs(urlparse(path).query)
+        if query['page'][0] == failing['page']:
+            return 500, {'message': 'Server Error'}
+        return 200, deliveries_page('wh-1', query, total=120)
+        
+    handled = []
+    receiver = WebhookReceiver(SECRET, handler=lambda events: handled.extend(e.delivery_id for e in events), workers=1)
+    path = str(tmp_path / 'backfill.json')
+    
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0)
+        first = client.webhooks.backfill(receiver, ['wh-1'], checkpoint=path, per_page=20)[0]
+        
+        assert not first.ok
+        assert Checkpoint(path).get('wh-1')['page'] == 4
+        
+        failing['page'] = None
+        second = client.webhooks.backfill(receiver, ['wh-1'], checkpoint=path, per_page=20)[0]
+        third = client.webhooks.backfill(receiver, ['wh-1'], checkpoint=path, per_page=20)[0]
+    receiver.stop()
+    
+    assert second.ok and second.resumed_from == 4
+    assert Checkpoint(path).get('wh-1')['done']
+    # An open-ended range is rescanned down to the newest delivery already replayed
+    assert (third.pages, third.deliveries, third.accepted) == (1, 1, 0)
+    assert sorted(handled) == sorted(f'wh-1-dlv-{n}' for n in range(120))
+
+
+def test_open_ended_backfill_picks_up_new_deliveries_and_bounded_one_is_final(tmp_path):
+    history = [delivery_payload('wh-1', n) for n in range(30)]
+    
+    def handler(method, path, headers, body):
+        query = parse_qs(urlparse(path).query)
+        page, per_page = int(query['page'][0]), int(query['per_page'][0])
+        return 200, page_payload(history[(page - 1) * per_page:page * per_page], page, per_page, len(history))
+        
+    handled = []
+    receiver = WebhookReceiver(SECRET, handler=lambda events: handled.extend(e.delivery_id for e in events), workers=1)
+    open_ended, bounded = str(tmp_path / 'open.json'), str(tmp_path / 'bounded.json')
+    
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0)
+        client.webhooks.backfill(receiver, ['wh-1'], checkpoint=open_ended, per_page=10)
+        client.webhooks.backfill(receiver, ['wh-1'], until=NOW, checkpoint=bounded, per_page=10)
+        # Three events are delivered after the first runs
+        history[:0] = [delivery_payload('wh-1', -n) for n in (3, 2, 1)]
+        again = client.webhooks.backfill(receiver, ['wh-1'], checkpoint=open_ended, per_page=10)[0]
+        final = client.webhooks.backfill(receiver, ['wh-1'], until=NOW, checkpoint=bounded, per_page=10)[0]
+    receiver.stop()
+    
+    assert (again.pages, again.accepted) == (1, 3)
+    assert final.pages == 0
+    assert handled[-3:] == ['wh-1-dlv--3', 'wh-1-dlv--2', 'wh-1-dlv--1']
+    assert len(handled) == 33
+
+
+def test_retry_records_of_one_event_are_replayed_once():
+    # The server records each of the three attempts of an event with its own uuid
+    history = [dict(delivery_payload('wh-1', n // 3), uuid=f'wh-1-attempt-{n}') for n in range(30)]
+    
+    def handler(method, path, headers, body):
+        query = parse_qs(urlparse(path).query)
+        page, per_page = int(query['page'][0]), int(query['per_page'][0])
+        return 200, page_payload(history[(page - 1) * per_page:page * per_page], page, per_page, len(history))
+        
+    batches = []
+    receiver = WebhookReceiver(SECRET, handler=batches.append, workers=1, dedupe_size=1)
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0)
+        result = client.webhooks.backfill(receiver, ['wh-1'], per_page=4)[0]
+    receiver.stop()
+    
+    assert (result.deliveries, result.accepted) == (30, 10)
+    assert sorted(event.data['transfer_uuid'] for batch in batches for event in batch) == sorted(
+        f'tr-{n}' for n in range(10)
+    )
+
+
+def test_deliveries_inserted_between_page_fetches_are_not_skipped():
+    history = [delivery_payload('wh-1', n) for n in range(60)]
+    lock = threading.Lock()
+    
+    def handler(method, path, headers, body):
+        query = parse_qs(urlparse(path).query)
+        page, per_page = int(query['page'][0]), int(query['per_page'][0])
+        with lock:
+            served = page_payload(history[(page - 1) * per_page:page * per_page], page, per_page, len(history))
+            # A new delivery pushes every older one a row down for the next page
+            history.insert(0, delivery_payload('wh-1', -len(history)))
+        return 200, served
+        
+    handled = []
+    receiver = WebhookReceiver(SECRET, handler=lambda events: handled.extend(e.delivery_id for e in events), workers=1)
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0)
+        result = client.webhooks.backfill(receiver, ['wh-1'], until=NOW, per_page=10)[0]
+    receiver.stop()
+    
+    assert result.ok
+    assert sorted(handled) == sorted(f'wh-1-dlv-{n}' for n in range(60))
+    # The rows read twice after shifting are counted once
+    assert result.deliveries == 60
+
+
+def test_backfill_waits_for_its_own_events_only():
+    release = threading.Event()
+    
+    def handler(events):
+        if any(event.data.get('live') for event in events):
+            release.wait()
+            
+    receiver = WebhookReceiver(SECRET, handler=handler, workers=2, batch_size=1, batch_wait=0)
+    body = json.dumps({'event': 'account.created', 'live': True}).encode()
+    receiver.start()
+    # A slow live event keeps the receiver's queue busy throughout the backfill
+    assert receiver.receive(body, {'X-Webhook-Signature': SignatureVerifier(SECRET).sign(body)}) == 202
+    
+    def deliveries(method, path, headers, body):
+        return 200, deliveries_page('wh-1', parse_qs(urlparse(path).query), total=40)
+        
+    with LocalServer(deliveries) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0)
+        worker = threading.Thread(target=client.webhooks.backfill, args=(receiver, ['wh-1']), kwargs={'per_page': 10})
+        worker.start()
+        worker.join(5)
+        finished = not worker.is_alive()
+    release.set()
+    receiver.stop()
+    
+    assert finished
+    assert receiver.stats.processed == 41
+
+
+@pytest.mark.asyncio
+async def test_async_backfill():
+    async def deliveries(request):
+        webhook_id = request.match_info['webhook_id']
+        return web.json_response(deliveries_page(webhook_id, {k: [v] for k, v in request.query.items()}, total=90))
+        
+    handled = []
+    
+    async def save(events):
+        handled.extend(event.delivery_id for event in events)
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/webhooks/{webhook_id}/deliveries', deliveries)])
+    try:
+        receiver = AsyncWebhookReceiver(SECRET, handler=save)
+        async with AsyncFinAegis(api_key='key', base_url=base_url, max_retries=0) as client:
+            results = await client.webhooks.backfill(
+                receiver, ['wh-1', 'wh-2'], until=NOW - timedelta(minutes=10), per_page=25
+            )
+        await receiver.stop()
+    finally:
+        await runner.cleanup()
+        
+    assert [result.deliveries for result in results] == [80, 80]
+    assert len(handled) == len(set(handled)) == 160
\ No newline at end of file
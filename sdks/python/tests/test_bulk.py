@@ -0,0 +1,104 @@
+import asyncio
+import threading
+
+import pytest
+
+from finaegis.bulk import async_run_bulk, run_bulk
+from finaegis.deadlines import call_deadline, deadline
+from finaegis.exceptions import RateLimitError, ValidationError
+from finaegis.types import Transfer
+
+from conftest import BASE_URL
+
+
+def transfer_payload(uuid, amount):
+    return {
+        'uuid': uuid,
+        'from_account': 'acc-1',
+        'to_account': 'acc-2',
+        'amount': amount,
+        'asset_code': 'USD',
+        'reference': None,
+        'status': 'completed',
+        'created_at': '2024-01-01T00:00:00Z',
+        'completed_at': None,
+    }
+
+
+def test_run_bulk_reports_every_item_in_input_order():
+    def call(spec):
+        if spec['n'] % 3 == 0:
+            raise ValidationError('bad', status_code=422)
+        return spec['n'] * 2
+        
+    report = run_bulk(call, ({'n': n} for n in range(10)), max_workers=4)
+    
+    assert [item.index for item in report.items] == list(range(10))
+    assert [item.spec['n'] for item in report.failed] == [0, 3, 6, 9]
+    assert report.results == [2, 4, 8, 10, 14, 16]
+    assert all(isinstance(item.error, ValidationError) for item in report.failed)
+
+
+def test_run_bulk_retries_rate_limited_items():
+    lock = threading.Lock()
+    limited = set()
+    
+    def call(spec):
+        with lock:
+            if spec['n'] not in limited:
+                limited.add(spec['n'])
+                raise RateLimitError('slow down', status_code=429, response_data={'retry_after': 0.01})
+        return spec['n']
+        
+    report = run_bulk(call, [{'n': n} for n in range(5)], max_workers=2)
+    
+    assert not report.failed
+    assert report.results == list(range(5))
+
+
+def test_run_bulk_keeps_the_callers_deadline():
+    with deadline(30) as expires:
+        report = run_bulk(lambda spec: call_deadline(), [{'n': n} for n in range(4)], max_workers=2)
+        
+    assert report.results == [expires] * 4
+
+
+def test_create_many_posts_each_transfer(client, requests_mock):
+    amounts = iter([100, 200])
+    requests_mock.post(
+        BASE_URL + 'transfers',
+        [
+            {'json': {'data': transfer_payload('tr-1', 100)}, 'status_code': 201},
+            {'json': {'message': 'Insufficient funds'}, 'status_code': 422},
+        ],
+    )
+    
+    report = client.transfers.create_many(
+        [
+            {'from_account': 'acc-1', 'to_account': 'acc-2', 'amount': next(amounts)},
+            {'from_account': 'acc-1', 'to_account': 'acc-2', 'amount': next(amounts)},
+        ],
+        max_workers=1,
+    )
+    
+    assert len(report) == 2
+    assert isinstance(report.items[0].result, Transfer)
+    assert isinstance(report.items[1].error, ValidationError)
+    assert [request.json()['amount'] for request in requests_mock.request_history] == [100, 200]
+
+
+@pytest.mark.asyncio
+async def test_async_run_bulk_bounds_in_flight_calls():
+    in_flight = [0, 0]
+    
+    async def call(spec):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(0.001)
+        in_flight[0] -= 1
+        return spec['n']
+        
+    report = await async_run_bulk(call, [{'n': n} for n in range(20)], max_workers=5)
+    
+    assert report.results == list(range(20))
+    assert in_flight[1] <= 5
\ No newline at end of file
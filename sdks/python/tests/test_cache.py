@@ -0,0 +1,124 @@
+import time
+
+import pytest
+
+from finaegis import FinAegis
+from finaegis.cache import Cache, TTLCache
+
+from conftest import BASE_URL
+
+RATE = {'from_asset': 'USD', 'to_asset': 'EUR', 'rate': '0.92', 'last_updated': '2024-01-01T00:00:00Z'}
+ASSET = {
+    'code': 'USD',
+    'name': 'US Dollar',
+    'type': 'fiat',
+    'decimals': 2,
+    'is_active': True,
+    'created_at': '2024-01-01T00:00:00Z',
+    'updated_at': '2024-01-01T00:00:00Z',
+}
+
+
+@pytest.fixture
+def cached_client():
+    return FinAegis(api_key='key', base_url=BASE_URL, max_retries=0, cache=True)
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache()
+    cache.set(('rates', 'USD'), 1, ttl=0.01)
+    
+    assert cache.get(('rates', 'USD')) == (True, 1)
+    time.sleep(0.02)
+    assert cache.get(('rates', 'USD')) == (False, None)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set(('assets', 'A'), 'a', ttl=60)
+    cache.set(('assets', 'B'), 'b', ttl=60)
+    cache.get(('assets', 'A'))
+    cache.set(('assets', 'C'), 'c', ttl=60)
+    
+    assert cache.get(('assets', 'B')) == (False, None)
+    assert cache.get(('assets', 'A')) == (True, 'a')
+    assert cache.stats('assets').evictions == 1
+
+
+def test_reads_are_served_from_cache(cached_client, requests_mock):
+    requests_mock.get(BASE_URL + 'exchange-rates/USD/EUR', json={'data': RATE})
+    
+    first = cached_client.exchange_rates.get('USD', 'EUR')
+    second = cached_client.exchange_rates.get('USD', 'EUR')
+    
+    assert first is second
+    assert requests_mock.call_count == 1
+    stats = cached_client.cache.stats('exchange_rates')
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_refresh_invalidates_cached_rates(cached_client, requests_mock):
+    requests_mock.get(BASE_URL + 'exchange-rates/USD/EUR', json={'data': RATE})
+    requests_mock.post(BASE_URL + 'exchange-rates/refresh', json={'data': {'refreshed': True}})
+    
+    cached_client.exchange_rates.get('USD', 'EUR')
+    cached_client.exchange_rates.refresh()
+    cached_client.exchange_rates.get('USD', 'EUR')
+    
+    assert [request.method for request in requests_mock.request_history] == ['GET', 'POST', 'GET']
+
+
+def test_asset_writes_invalidate_cached_assets(cached_client, requests_mock):
+    requests_mock.get(BASE_URL + 'assets/USD', json={'data': ASSET})
+    requests_mock.put(BASE_URL + 'assets/USD', json={'data': dict(ASSET, name='Dollar')})
+    
+    cached_client.assets.get('USD')
+    cached_client.assets.update('USD', name='Dollar')
+    cached_client.assets.get('USD')
+    
+    assert requests_mock.call_count == 3
+
+
+def test_zero_ttl_disables_a_namespace(requests_mock):
+    client = FinAegis(api_key='key', base_url=BASE_URL, cache=True, cache_ttls={'exchange_rates': 0})
+    requests_mock.get(BASE_URL + 'exchange-rates/USD/EUR', json={'data': RATE})
+    
+    client.exchange_rates.get('USD', 'EUR')
+    client.exchange_rates.get('USD', 'EUR')
+    
+    assert requests_mock.call_count == 2
+
+
+def test_no_cache_by_default(client, requests_mock):
+    requests_mock.get(BASE_URL + 'exchange-rates/USD/EUR', json={'data': RATE})
+    
+    client.exchange_rates.get('USD', 'EUR')
+    client.exchange_rates.get('USD', 'EUR')
+    
+    assert client.cache is None
+    assert requests_mock.call_count == 2
+
+
+def test_custom_backend_is_pluggable(requests_mock):
+    class DictCache(Cache):
+        def __init__(self):
+            self.entries = {}
+        
+        def get(self, key):
+            return (key in self.entries, self.entries.get(key))
+        
+        def set(self, key, value, ttl):
+            self.entries[key] = value
+        
+        def invalidate(self, namespace):
+            self.entries = {k: v for k, v in self.entries.items() if k[0] != namespace}
+            
+    backend = DictCache()
+    client = FinAegis(api_key='key', base_url=BASE_URL, cache=backend)
+    requests_mock.get(BASE_URL + 'assets/USD', json={'data': ASSET})
+    
+    client.assets.get('USD')
+    client.assets.get('USD')
+    
+    assert ('assets', 'USD') in backend.entries
+    assert requests_mock.call_count == 1
\ No newline at end of file
@@ -0,0 +1,115 @@
+import time
+
+import pytest
+
+from finaegis import CircuitBreaker, CircuitOpenError, FinAegis, NotFoundError, ServerError
+from finaegis.async_client import AsyncFinAegis
+from finaegis.circuit import endpoint_name
+from finaegis.instrumentation import path_template
+
+from conftest import LocalServer, account_payload
+
+
+class FlakyHandler:
+    """Answers 503 to balance reads while failing is set, 200 otherwise."""
+    
+    def __init__(self):
+        self.failing = True
+    
+    def __call__(self, method, path, headers, body):
+        if path.endswith('/acc-404'):
+            return 404, {'message': 'Not found'}
+        if self.failing and path.endswith('/balances'):
+            return 503, {'message': 'Service unavailable'}
+        return 200, {'data': account_payload()}
+
+
+def test_endpoint_name():
+    assert endpoint_name('get', '/accounts/9f1c2d3e-aaaa/balances') == 'GET /accounts/{uuid}/balances'
+    assert endpoint_name('GET', 'exchange-rates/EUR/USD') == 'GET /exchange-rates/{from}/{to}'
+    assert endpoint_name('POST', '/accounts/acc-1/deposit') == 'POST /accounts/{uuid}/deposit'
+    assert endpoint_name('GET', '/webhooks/events') == 'GET /webhooks/events'
+    # The same key as the instrumentation metrics of the call
+    assert endpoint_name('GET', '/accounts/acc-1/transfers') == 'GET ' + path_template('/accounts/acc-1/transfers')
+
+
+def test_circuit_opens_fails_fast_and_recovers():
+    handler = FlakyHandler()
+    breaker = CircuitBreaker(failure_rate=0.5, min_calls=4, cooldown=0.2)
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='test-key', base_url=server.base_url, max_retries=0, circuit_breaker=breaker)
+        for _ in range(4):
+            with pytest.raises(ServerError):
+                client.accounts.get_balances('acc-1')
+                
+        with pytest.raises(CircuitOpenError) as error:
+            client.accounts.get_balances('acc-2')
+        assert error.value.endpoint == 'GET /accounts/{uuid}/balances'
+        assert 0 < error.value.retry_after <= 0.2
+        assert len(server.requests) == 4
+        # Other endpoints keep working, and 4xx answers count as healthy
+        assert client.accounts.get('acc-1').uuid == 'acc-1'
+        with pytest.raises(NotFoundError):
+            client.accounts.get('acc-404')
+        assert breaker.states() == {
+            'GET /accounts/{uuid}/balances': 'open',
+            'GET /accounts/{uuid}': 'closed',
+        }
+        
+        time.sleep(0.25)
+        handler.failing = False
+        client.accounts.get_balances('acc-1')
+        assert breaker.states()['GET /accounts/{uuid}/balances'] == 'closed'
+    assert (breaker.stats.opened, breaker.stats.rejected) == (1, 1)
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker(min_calls=1, cooldown=0)
+    name = 'GET /gcu/composition'
+    breaker.before(name)
+    breaker.record(name, True)
+    assert breaker.is_open(name)
+    
+    breaker.before(name)  # the probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before(name)
+    breaker.record(name, True)
+    assert breaker.states()[name] == 'open' and breaker.stats.opened == 2
+    
+    breaker.before(name)
+    breaker.record(name, None)
+    breaker.before(name)
+    breaker.record(name, False)
+    assert not breaker.is_open(name)
+
+
+def test_open_circuit_stops_retries_in_flight():
+    breaker = CircuitBreaker(min_calls=1)
+    
+    def handler(method, path, headers, body):
+        # Another caller's failure opens the circuit while this call is in flight
+        breaker.record('GET /accounts/{uuid}/balances', True)
+        return 503, {'message': 'Service unavailable'}
+        
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='test-key', base_url=server.base_url, max_retries=3, circuit_breaker=breaker)
+        with pytest.raises(ServerError):
+            client.accounts.get_balances('acc-1')
+        assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_opens_per_endpoint():
+    breaker = CircuitBreaker(min_calls=2, cooldown=60)
+    with LocalServer(FlakyHandler()) as server:
+        async with AsyncFinAegis(
+            api_key='test-key', base_url=server.base_url, max_retries=3, backoff_factor=0, circuit_breaker=breaker
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(ServerError):
+                    await client.accounts.get_balances('acc-1')
+            assert len(server.requests) == 8
+            with pytest.raises(CircuitOpenError):
+                await client.accounts.get_balances('acc-1')
+            assert (await client.accounts.get('acc-1')).uuid == 'acc-1'
+        assert len(server.requests) == 9
\ No newline at end of file
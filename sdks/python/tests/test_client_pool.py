@@ -0,0 +1,53 @@
+import logging
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+from finaegis import FinAegis
+
+from conftest import LocalServer, account_payload
+
+
+def balances_handler(method, path, headers, body):
+    uuid = path.split('/')[4]
+    return 200, {'data': {'account_uuid': uuid, 'balances': []}}
+
+
+def test_shared_client_serves_thread_pool_with_bounded_connections(caplog):
+    with LocalServer(balances_handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, pool_maxsize=4, pool_block=True)
+        with caplog.at_level(logging.WARNING, logger='urllib3.connectionpool'):
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                results = list(executor.map(
+                    lambda n: client.accounts.get_balances(f'acc-{n}'), range(200)
+                ))
+                
+    assert [result['account_uuid'] for result in results] == [f'acc-{n}' for n in range(200)]
+    assert len(server.connections) <= 4
+    assert 'Connection pool is full' not in caplog.text
+
+
+def test_pool_sized_to_threads_reuses_connections():
+    with LocalServer(balances_handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, pool_maxsize=8)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda n: client.accounts.get_balances(f'acc-{n}'), range(100)))
+            
+    assert len(server.requests) == 100
+    assert len(server.connections) <= 8
+
+
+def test_keep_alive_disabled_closes_connections():
+    with LocalServer(lambda *args: (200, {'data': account_payload()})) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, keep_alive=False)
+        client.accounts.get('acc-1')
+        client.accounts.get('acc-1')
+        
+    assert server.requests[0][2]['Connection'] == 'close'
+    assert len(server.connections) == 2
+
+
+def test_tcp_keepalive_sets_socket_option():
+    client = FinAegis(api_key='key', tcp_keepalive=True)
+    pool_kwargs = client.session.get_adapter('https://').poolmanager.connection_pool_kw
+    
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool_kwargs['socket_options']
\ No newline at end of file
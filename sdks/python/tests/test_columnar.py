@@ -0,0 +1,50 @@
+import numpy as np
+
+from finaegis.columnar import GCU_VALUE_HISTORY_COLUMNS, TRANSACTION_COLUMNS, to_columns
+
+from conftest import BASE_URL, page_payload, transaction_payload
+
+
+def test_transaction_columns_are_typed_and_dictionary_encoded():
+    rows = [
+        transaction_payload(id='a', amount=100, status='completed'),
+        transaction_payload(id='b', amount='250', status='failed', asset_code='EUR', completed_at=None),
+        transaction_payload(id='c', amount=300, status='completed'),
+    ]
+    
+    batch = to_columns(rows, TRANSACTION_COLUMNS)
+    
+    assert len(batch) == 3
+    assert batch['amount'].dtype == np.int64
+    assert batch['amount'][batch['status'] == 'completed'].sum() == 400
+    assert batch['status'].categories == ['completed', 'failed']
+    assert batch['status'].codes.dtype == np.int32
+    assert batch['asset_code'].counts() == {'USD': 2, 'EUR': 1}
+    assert not (batch['status'] == 'pending').any()
+    assert np.isnat(batch['completed_at'][1])
+    assert list(batch.filter(batch['asset_code'] == 'USD')['id']) == ['a', 'c']
+
+
+def test_history_columns_parse_floats_and_timestamps():
+    rows = [
+        {'timestamp': '2024-01-01T00:00:00+02:00', 'value': '1.2500', 'change': None},
+        {'timestamp': '2024-01-02T00:00:00+00:00', 'value': 1.5, 'change': 20.0},
+    ]
+    
+    batch = to_columns(rows, GCU_VALUE_HISTORY_COLUMNS)
+    
+    assert batch['timestamp'][0] == np.datetime64('2023-12-31T22:00:00')
+    assert np.allclose(np.diff(batch['value']) / batch['value'][:-1], [0.2])
+    assert np.isnan(batch['change'][0])
+
+
+def test_client_builds_columns_from_every_page(client, requests_mock):
+    requests_mock.get(BASE_URL + 'transactions', [
+        {'json': page_payload([transaction_payload(id='a', amount=1)], page=1, per_page=1, total=2)},
+        {'json': page_payload([transaction_payload(id='b', amount=2, status='failed')], page=2, per_page=1, total=2)},
+    ])
+    
+    batch = client.transactions.columns(per_page=1, max_workers=1)
+    
+    assert list(batch['id']) == ['a', 'b']
+    assert list(batch['status'].decode()) == ['completed', 'failed']
\ No newline at end of file
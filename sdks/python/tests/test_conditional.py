@@ -0,0 +1,138 @@
+import pytest
+from aiohttp import web
+
+from finaegis import FinAegis
+from finaegis.async_client import AsyncFinAegis
+from finaegis.conditional import ConditionalStore
+from finaegis.exceptions import FinAegisError
+
+from conftest import BASE_URL, start_aiohttp_server
+
+BALANCES = {'data': {'account_uuid': 'acc-1', 'balances': [{'asset_code': 'USD', 'balance': 1000}]}}
+
+
+@pytest.fixture
+def conditional_client():
+    return FinAegis(api_key='key', base_url=BASE_URL, max_retries=0, conditional_requests=True)
+
+
+def test_304_serves_stored_body(conditional_client, requests_mock):
+    requests_mock.get(
+        BASE_URL + 'accounts/acc-1/balances',
+        [
+            {'json': BALANCES, 'headers': {'ETag': '"v1"'}},
+            {'status_code': 304, 'headers': {'ETag': '"v1"'}},
+        ],
+    )
+    
+    first = conditional_client.accounts.get_balances('acc-1')
+    second = conditional_client.accounts.get_balances('acc-1')
+    
+    assert first == second == BALANCES['data']
+    assert requests_mock.last_request.headers['If-None-Match'] == '"v1"'
+    assert conditional_client.conditional_store.not_modified == 1
+
+
+def test_changed_resource_replaces_stored_body(conditional_client, requests_mock):
+    updated = {'data': {'account_uuid': 'acc-1', 'balances': []}}
+    requests_mock.get(
+        BASE_URL + 'accounts/acc-1/balances',
+        [
+            {'json': BALANCES, 'headers': {'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}},
+            {'json': updated, 'headers': {'ETag': '"v2"'}},
+            {'status_code': 304},
+        ],
+    )
+    
+    conditional_client.accounts.get_balances('acc-1')
+    assert conditional_client.accounts.get_balances('acc-1') == updated['data']
+    assert requests_mock.request_history[1].headers['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+    assert conditional_client.accounts.get_balances('acc-1') == updated['data']
+    assert requests_mock.last_request.headers['If-None-Match'] == '"v2"'
+
+
+def test_responses_without_validators_are_not_stored(conditional_client, requests_mock):
+    requests_mock.get(BASE_URL + 'accounts/acc-1/balances', json=BALANCES)
+    
+    conditional_client.accounts.get_balances('acc-1')
+    conditional_client.accounts.get_balances('acc-1')
+    
+    assert 'If-None-Match' not in requests_mock.last_request.headers
+    assert len(conditional_client.conditional_store) == 0
+
+
+def test_304_to_the_callers_own_validator_is_resent_without_it(requests_mock):
+    client = FinAegis(api_key='key', base_url=BASE_URL, max_retries=0)
+    requests_mock.get(
+        BASE_URL + 'accounts/acc-1/balances',
+        [{'status_code': 304}, {'json': BALANCES}, {'status_code': 304}],
+    )
+    
+    response = client.get('accounts/acc-1/balances', headers={'If-None-Match': '"v0"'})
+    
+    assert response == BALANCES
+    assert requests_mock.request_history[0].headers['If-None-Match'] == '"v0"'
+    assert 'If-None-Match' not in requests_mock.request_history[1].headers
+    # Without a validator to drop, a 304 is an error rather than an empty body
+    with pytest.raises(FinAegisError) as error:
+        client.accounts.get_balances('acc-1')
+    assert error.value.status_code == 304
+
+
+def test_query_parameters_are_part_of_the_key():
+    store = ConditionalStore()
+    
+    assert store.key('http://x/a', {'page': 1}) != store.key('http://x/a', {'page': 2})
+    assert store.key('http://x/a', {'a': 1, 'b': 2}) == store.key('http://x/a', {'b': 2, 'a': 1})
+
+
+def test_store_is_bounded():
+    store = ConditionalStore(maxsize=2)
+    for n in range(3):
+        store.store(('url', n), {'ETag': f'"{n}"'}, {})
+        
+    assert len(store) == 2
+    assert store.conditional_headers(('url', 0))[1] is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_revalidates():
+    seen = []
+    
+    async def composition(request):
+        seen.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"c1"':
+            return web.Response(status=304)
+        return web.json_response({'data': {'basket_code': 'GCU'}}, headers={'ETag': '"c1"'})
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/baskets/GCU/value', composition)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, conditional_requests=True) as client:
+            first = await client.baskets.get_value('GCU')
+            second = await client.baskets.get_value('GCU')
+    finally:
+        await runner.cleanup()
+        
+    assert first == second == {'basket_code': 'GCU'}
+    assert seen == [None, '"c1"']
+
+
+@pytest.mark.asyncio
+async def test_async_304_to_the_callers_own_validator_is_resent_without_it():
+    seen = []
+    
+    async def composition(request):
+        seen.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match'):
+            return web.Response(status=304)
+        return web.json_response({'data': {'basket_code': 'GCU'}})
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/baskets/GCU/value', composition)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, max_concurrency=1) as client:
+            response = await client.get('baskets/GCU/value', headers={'If-None-Match': '"c0"'})
+    finally:
+        await runner.cleanup()
+        
+    assert response == {'data': {'basket_code': 'GCU'}}
+    assert seen == ['"c0"', None]
\ No newline at end of file
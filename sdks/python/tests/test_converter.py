@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from finaegis import NotFoundError, StaleRatesError
+from finaegis.converter import CurrencyConverter
+from finaegis.types import ExchangeRate
+
+from conftest import BASE_URL, page_payload
+
+
+def rate(from_asset, to_asset, value, age=timedelta(0)):
+    return ExchangeRate(from_asset, to_asset, value, datetime.now(timezone.utc) - age)
+
+
+def rate_payload(from_asset, to_asset, value, age=timedelta(0)):
+    updated = datetime.now(timezone.utc) - age
+    return {
+        'from_asset': from_asset,
+        'to_asset': to_asset,
+        'rate': str(value),
+        'last_updated': updated.isoformat().replace('+00:00', 'Z'),
+    }
+
+
+def test_derives_inverse_and_cross_rates():
+    converter = CurrencyConverter([rate('USD', 'EUR', 0.9), rate('USD', 'JPY', 150.0)])
+    
+    assert converter.rate('EUR', 'USD') == pytest.approx(1 / 0.9)
+    assert converter.rate('EUR', 'JPY') == pytest.approx(150.0 / 0.9)
+    assert converter.convert('EUR', 'JPY', 900) == 150000
+
+
+def test_quoted_reverse_rate_wins_over_inverse():
+    converter = CurrencyConverter([rate('USD', 'EUR', 0.9), rate('EUR', 'USD', 1.12)])
+    
+    assert converter.rate('EUR', 'USD') == 1.12
+
+
+def test_convert_rounds_half_away_from_zero():
+    converter = CurrencyConverter([rate('USD', 'EUR', 0.5)])
+    
+    assert converter.convert('USD', 'EUR', 3) == 2
+    assert converter.convert('USD', 'EUR', -3) == -2
+
+
+def test_convert_many_matches_scalar_conversion():
+    converter = CurrencyConverter([rate('USD', 'EUR', 0.92), rate('USD', 'GBP', 0.79)])
+    amounts = [100, 12345, 0, 999999]
+    sources = ['USD', 'EUR', 'GBP', 'EUR']
+    
+    result = converter.convert_many(sources, 'USD', amounts)
+    
+    assert result.dtype == np.int64
+    assert list(result) == [converter.convert(code, 'USD', amount) for code, amount in zip(sources, amounts)]
+
+
+def test_unknown_pairs_raise_not_found():
+    converter = CurrencyConverter([rate('USD', 'EUR', 0.92), rate('GBP', 'CHF', 1.1)])
+    
+    with pytest.raises(NotFoundError):
+        converter.rate('USD', 'XAU')
+    with pytest.raises(NotFoundError):
+        converter.convert_many(['USD', 'GBP'], 'EUR', [1, 2])
+
+
+def test_cross_rate_is_as_old_as_its_oldest_leg():
+    converter = CurrencyConverter(
+        [rate('USD', 'EUR', 0.9), rate('USD', 'JPY', 150.0, age=timedelta(hours=2))],
+        max_age=timedelta(hours=1)
+    )
+    
+    assert converter.convert('USD', 'EUR', 100) == 90
+    with pytest.raises(StaleRatesError):
+        converter.convert('EUR', 'JPY', 100)
+    with pytest.raises(StaleRatesError):
+        converter.convert_many('EUR', ['USD', 'JPY'], [1, 1])
+
+
+def test_stale_rates_reload_from_loader():
+    tables = [[rate('USD', 'EUR', 0.9, age=timedelta(hours=2))], [rate('USD', 'EUR', 0.95)]]
+    converter = CurrencyConverter(tables[0], max_age=60, loader=lambda: tables[1])
+    
+    assert converter.convert('USD', 'EUR', 100) == 95
+
+
+def test_client_converter_loads_every_page_and_verifies(client, requests_mock):
+    requests_mock.get(BASE_URL + 'exchange-rates', [
+        {'json': page_payload([rate_payload('USD', 'EUR', 0.92)], page=1, per_page=1, total=2)},
+        {'json': page_payload([rate_payload('USD', 'JPY', 149.5)], page=2, per_page=1, total=2)},
+    ])
+    requests_mock.get(
+        BASE_URL + 'exchange-rates/EUR/JPY/convert',
+        json={'data': {'from_amount': 1000, 'to_amount': 162499, 'rate': '162.5'}}
+    )
+    
+    converter = client.exchange_rates.converter(per_page=1)
+    
+    assert converter.codes == ['EUR', 'JPY', 'USD']
+    assert converter.verify(client.exchange_rates, [('EUR', 'JPY', 1000)]) == []
+    converter.tolerance = 0
+    mismatch, = converter.verify(client.exchange_rates, [('EUR', 'JPY', 1000)])
+    assert mismatch.difference == 1
\ No newline at end of file
@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+
+from finaegis import DeadlineExceededError, FinAegis, RetryBudget, ServerError, deadline
+from finaegis.async_client import AsyncFinAegis
+from finaegis.deadlines import call_deadline
+from finaegis.testing import FakeServer
+
+from conftest import LocalServer
+
+
+def unavailable(method, path, headers, body):
+    return 503, {'message': 'Service unavailable'}
+
+
+@pytest.fixture
+def slow_server():
+    with FakeServer(latency=0.5) as server:
+        yield server
+
+
+def test_client_deadline_bounds_a_slow_call(slow_server):
+    client = slow_server.client(deadline=0.1, max_retries=3)
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        client.gcu.get_info()
+    assert time.monotonic() - start < 0.4
+
+
+def test_context_deadline_propagates_and_nests(slow_server):
+    assert call_deadline() is None
+    with deadline(5) as outer:
+        with deadline(10) as inner:
+            assert inner == outer
+        with deadline(0.1):
+            with pytest.raises(DeadlineExceededError):
+                slow_server.client().gcu.get_info()
+        assert call_deadline(0.5) < outer
+    assert call_deadline() is None
+
+
+def test_deadline_bounds_a_streamed_page(slow_server):
+    client = slow_server.client()
+    start = time.monotonic()
+    with deadline(0.1):
+        with pytest.raises(DeadlineExceededError):
+            list(client.stream('/transactions'))
+    assert time.monotonic() - start < 0.4
+
+
+def test_no_retry_is_started_past_the_deadline():
+    with LocalServer(unavailable) as server:
+        client = FinAegis(api_key='test-key', base_url=server.base_url, max_retries=5, deadline=1.0)
+        start = time.monotonic()
+        with pytest.raises(ServerError):
+            client.accounts.get('acc-1')
+        # The first retry is immediate, the second would back off for 2s
+        assert len(server.requests) == 2
+        assert time.monotonic() - start < 0.5
+
+
+def test_retry_budget_caps_retries_across_calls():
+    budget = RetryBudget(ratio=0, min_per_second=0.1, window=10)
+    with LocalServer(unavailable) as server:
+        client = FinAegis(api_key='test-key', base_url=server.base_url, max_retries=3, retry_budget=budget)
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                client.accounts.get('acc-1')
+        assert len(server.requests) == 3
+    assert (budget.stats.calls, budget.stats.retries, budget.stats.refused) == (2, 1, 2)
+
+
+def test_retry_budget_allowance_follows_traffic():
+    budget = RetryBudget(ratio=0.5, min_per_second=0)
+    assert not budget.try_retry()
+    for _ in range(4):
+        budget.record_call()
+    assert [budget.try_retry() for _ in range(3)] == [True, True, False]
+    with pytest.raises(ValueError):
+        RetryBudget(window=0)
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_bounds_a_slow_call(slow_server):
+    async with slow_server.async_client(max_retries=3) as client:
+        start = time.monotonic()
+        with deadline(0.1):
+            with pytest.raises(DeadlineExceededError):
+                await client.gcu.get_info()
+        assert time.monotonic() - start < 0.4
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_bounds_a_streamed_page(slow_server):
+    async with slow_server.async_client() as client:
+        start = time.monotonic()
+        with deadline(0.1):
+            with pytest.raises(DeadlineExceededError):
+                [item async for item in client.stream('/transactions')]
+        assert time.monotonic() - start < 0.4
+
+
+@pytest.mark.asyncio
+async def test_async_retry_budget_and_deadline():
+    budget = RetryBudget(ratio=0, min_per_second=0.1, window=10)
+    with LocalServer(unavailable) as server:
+        async with AsyncFinAegis(
+            api_key='test-key', base_url=server.base_url, max_retries=3, backoff_factor=0, retry_budget=budget
+        ) as client:
+            results = await asyncio.gather(
+                *(client.accounts.get('acc-1') for _ in range(2)), return_exceptions=True
+            )
+        assert all(isinstance(result, ServerError) for result in results)
+        assert len(server.requests) == 3 and budget.stats.refused == 2
+        
+        async with AsyncFinAegis(api_key='test-key', base_url=server.base_url, max_retries=5, deadline=1.0) as client:
+            with pytest.raises(ServerError):
+                await client.accounts.get('acc-1')
+        assert len(server.requests) == 5
\ No newline at end of file
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+from aiohttp import web
+
+from finaegis import FinAegis
+from finaegis.async_client import AsyncFinAegis
+from finaegis.decoding import ArrayStreamParser, get_decoder
+from finaegis.exceptions import NotFoundError
+from finaegis.types import Transaction
+
+from conftest import BASE_URL, page_payload, start_aiohttp_server, transaction_payload
+
+BODY = json.dumps({
+    'meta': {'current_page': 1, 'last_page': 1},
+    'data': [{'id': 1, 'note': 'café – "quoted" ]}'}, {'id': 2, 'amount': 12345}, [], 7],
+    'links': {'next': None},
+}, ensure_ascii=False).encode()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, len(BODY)])
+def test_parser_yields_items_across_any_chunking(chunk_size):
+    parser = ArrayStreamParser('data')
+    items = []
+    for start in range(0, len(BODY), chunk_size):
+        items.extend(parser.feed(BODY[start:start + chunk_size]))
+    envelope = parser.close()
+    
+    assert items == json.loads(BODY)['data']
+    assert envelope == {'meta': {'current_page': 1, 'last_page': 1}, 'data': [], 'links': {'next': None}}
+
+
+def test_parser_rejects_truncated_body():
+    parser = ArrayStreamParser('data')
+    parser.feed(b'{"data": [{"id": 1}')
+    
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_get_decoder_choices():
+    assert get_decoder('json') is json.loads
+    assert get_decoder(len) is len
+    with pytest.raises(ValueError):
+        get_decoder('yaml')
+
+
+def test_client_uses_configured_decoder(requests_mock):
+    seen = []
+    
+    def decode(body):
+        seen.append(body)
+        return json.loads(body)
+        
+    client = FinAegis(api_key='test-key', base_url=BASE_URL, max_retries=0, json_decoder=decode)
+    requests_mock.get(BASE_URL + 'transactions', json=page_payload([transaction_payload()], page=1, per_page=1, total=1))
+    
+    page = client.transactions.list()
+    
+    assert len(seen) == 1
+    assert page.data[0].id == 'tx-1'
+
+
+def test_streamed_iteration_walks_every_page(client, requests_mock):
+    requests_mock.get(BASE_URL + 'transactions', [
+        {'json': page_payload([transaction_payload(id='a'), transaction_payload(id='b')], page=1, per_page=2, total=3)},
+        {'json': page_payload([transaction_payload(id='c')], page=2, per_page=2, total=3)},
+    ])
+    
+    items = list(client.transactions.iter_all(per_page=2, stream=True))
+    
+    assert [item.id for item in items] == ['a', 'b', 'c']
+    assert all(isinstance(item, Transaction) for item in items)
+    assert requests_mock.request_history[1].qs['page'] == ['2']
+
+
+def test_stream_raises_mapped_errors(client, requests_mock):
+    requests_mock.get(BASE_URL + 'webhooks/missing/deliveries', status_code=404, json={'message': 'Not found'})
+    
+    with pytest.raises(NotFoundError):
+        list(client.webhooks.iter_deliveries('missing', stream=True))
+
+
+@pytest.mark.asyncio
+async def test_async_streamed_iteration_walks_every_page():
+    async def transactions(request):
+        page = int(request.query['page'])
+        items = [transaction_payload(id='a'), transaction_payload(id='b')] if page == 1 else [transaction_payload(id='c')]
+        return web.json_response(page_payload(items, page=page, per_page=2, total=3))
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/accounts/acc-1/transactions', transactions)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url) as client:
+            ids = [item.id async for item in client.accounts.iter_transactions('acc-1', per_page=2, stream=True)]
+    finally:
+        await runner.cleanup()
+        
+    assert ids == ['a', 'b', 'c']
\ No newline at end of file
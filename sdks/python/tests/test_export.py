@@ -0,0 +1,128 @@
+import threading
+import time
+
+import pytest
+
+from finaegis import FinAegis
+from finaegis.exceptions import RateLimitError
+from finaegis.pagination import aexport_pages, export_pages
+from finaegis.types import PaginatedResponse
+
+from conftest import BASE_URL, LocalServer, page_payload, transaction_payload
+
+
+def numbered_page(page, per_page=10, total=95):
+    start = (page - 1) * per_page
+    items = list(range(start, min(start + per_page, total)))
+    return PaginatedResponse.from_dict(page_payload(items, page, per_page, total))
+
+
+def test_ordered_export_reassembles_pages_in_order():
+    def fetch(page):
+        # Later pages answer first to force reordering
+        time.sleep(0.001 * (10 - page))
+        return numbered_page(page)
+        
+    pages = list(export_pages(fetch, max_workers=4))
+    
+    assert [page.current_page for page in pages] == list(range(1, 11))
+    assert [item for page in pages for item in page.data] == list(range(95))
+
+
+def test_unordered_export_yields_every_page_once():
+    pages = list(export_pages(numbered_page, max_workers=4, ordered=False))
+    
+    assert sorted(page.current_page for page in pages) == list(range(1, 11))
+    assert pages[0].current_page == 1
+
+
+def test_export_bounds_concurrency():
+    lock = threading.Lock()
+    in_flight = [0, 0]
+    
+    def fetch(page):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.005)
+        with lock:
+            in_flight[0] -= 1
+        return numbered_page(page)
+        
+    list(export_pages(fetch, max_workers=3))
+    
+    assert in_flight[1] <= 3
+
+
+def test_rate_limit_pauses_pool_and_retries_page():
+    attempts = {}
+    
+    def fetch(page):
+        attempts[page] = attempts.get(page, 0) + 1
+        if page == 3 and attempts[page] == 1:
+            raise RateLimitError('slow down', status_code=429, response_data={'retry_after': 0.05})
+        return numbered_page(page)
+        
+    started = time.monotonic()
+    pages = list(export_pages(fetch, max_workers=2))
+    
+    assert len(pages) == 10
+    assert attempts[3] == 2
+    assert time.monotonic() - started >= 0.05
+
+
+def test_rate_limit_retries_are_bounded():
+    def fetch(page):
+        if page == 2:
+            raise RateLimitError('slow down', status_code=429, response_data={'retry_after': 0.001})
+        return numbered_page(page, total=20)
+        
+    with pytest.raises(RateLimitError):
+        list(export_pages(fetch, max_workers=2, max_rate_limit_retries=2))
+
+
+def test_first_429_of_a_client_export_pauses_the_pool():
+    sent = []
+    limited = []
+    
+    def handler(method, path, headers, body):
+        page = int(path.split('page=')[1].split('&')[0])
+        sent.append(time.monotonic())
+        if page == 2 and not limited:
+            limited.append(time.monotonic())
+            # Retry-After alone would have urllib3 retry this one request itself
+            return 429, {'message': 'slow down', 'retry_after': 0.3}, {'Retry-After': '1'}
+        return 200, page_payload([transaction_payload(f'tx-{page}')], page, 1, 12)
+        
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url)
+        started = time.monotonic()
+        pages = list(client.transactions.export(per_page=1, max_workers=4))
+        elapsed = time.monotonic() - started
+        
+    assert [page.data[0].id for page in pages] == [f'tx-{n}' for n in range(1, 13)]
+    # Only requests already in flight got through during the pause
+    assert len([at for at in sent if 0 < at - limited[0] < 0.25]) <= 3
+    assert 0.3 <= elapsed < 1
+
+
+def test_transactions_export_uses_resource_pages(client, requests_mock):
+    for page in (1, 2):
+        requests_mock.get(
+            BASE_URL + f'transactions?page={page}&per_page=1',
+            json=page_payload([transaction_payload(f'tx-{page}')], page, 1, 2),
+        )
+        
+    pages = list(client.transactions.export(per_page=1, max_workers=2))
+    
+    assert [page.data[0].id for page in pages] == ['tx-1', 'tx-2']
+
+
+@pytest.mark.asyncio
+async def test_async_export_orders_pages():
+    async def fetch(page):
+        return numbered_page(page)
+        
+    pages = [page async for page in aexport_pages(fetch, max_workers=3)]
+    
+    assert [page.current_page for page in pages] == list(range(1, 11))
\ No newline at end of file
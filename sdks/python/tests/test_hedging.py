@@ -0,0 +1,79 @@
+import itertools
+import time
+
+import pytest
+
+from finaegis import HedgePolicy
+from finaegis.testing import FakeServer
+
+
+def first_request_slow(seconds):
+    """Latency function delaying only the first request to the server."""
+    counter = itertools.count()
+    return lambda method, path: seconds if next(counter) == 0 else 0
+
+
+def test_delay_is_learned_per_endpoint():
+    policy = HedgePolicy(percentile=0.9, min_samples=10)
+    name = 'GET /accounts/{uuid}/balances'
+    assert policy.applies(name)
+    assert not policy.applies('GET /accounts/*') and not policy.applies('POST /gcu/composition')
+    
+    for latency in range(1, 10):
+        policy.observe(name, latency / 100)
+    assert policy.delay_for(name) is None
+    policy.observe(name, 1.0)
+    assert policy.delay_for(name) == 1.0
+    for _ in range(90):
+        policy.observe(name, 0.02)
+    assert policy.delay_for(name) == 0.02
+    assert policy.delay_for('GET /gcu/composition') is None
+    
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=1)
+
+
+def test_wildcards_match_a_single_segment():
+    policy = HedgePolicy()
+    assert policy.applies('GET /exchange-rates/{from}/{to}')
+    assert not policy.applies('GET /exchange-rates/{from}/{to}/convert')
+    assert not policy.applies('GET /accounts/{uuid}/balances/x')
+    wildcard = HedgePolicy(endpoints=['GET /accounts/*'])
+    assert wildcard.applies('GET /accounts/{uuid}')
+    assert not wildcard.applies('GET /accounts/{uuid}/transactions')
+
+
+def test_slow_read_is_hedged():
+    with FakeServer(latency=first_request_slow(1.0)) as server:
+        account = server.ledger.create_account('user-1', 'Main', initial_balance=500)['uuid']
+        client = server.client(hedge=HedgePolicy(delay=0.05))
+        
+        start = time.monotonic()
+        assert client.accounts.get_balances(account)['balances'] == {'USD': 500}
+        assert time.monotonic() - start < 0.5
+        stats = client.hedge_policy.stats
+        assert (stats.calls, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+        
+        client.accounts.get_balances(account)
+        assert (stats.calls, stats.hedged) == (2, 1)
+
+
+def test_writes_and_other_reads_are_not_hedged():
+    with FakeServer(latency=0.1) as server:
+        account = server.ledger.create_account('user-1', 'Main')['uuid']
+        client = server.client(hedge=HedgePolicy(delay=0.01))
+        client.accounts.get(account)
+        client.accounts.deposit(account, 100)
+        assert client.hedge_policy.stats.calls == 0
+        assert sum(server.status_counts.values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_slow_read_is_hedged_and_loser_cancelled():
+    with FakeServer(latency=first_request_slow(1.0)) as server:
+        async with server.async_client(hedge=HedgePolicy(delay=0.05)) as client:
+            start = time.monotonic()
+            info = await client.gcu.get_composition()
+            assert time.monotonic() - start < 0.5
+        assert info.basket_code == 'GCU'
+        assert client.hedge_policy.stats.hedge_wins == 1
\ No newline at end of file
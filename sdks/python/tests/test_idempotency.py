@@ -0,0 +1,100 @@
+import pytest
+
+from finaegis import FinAegis
+from finaegis.exceptions import RateLimitError
+
+from conftest import BASE_URL, LocalServer, account_payload, transaction_payload
+
+TRANSFER = {
+    'uuid': 'tr-1',
+    'from_account': 'acc-1',
+    'to_account': 'acc-2',
+    'amount': 100,
+    'asset_code': 'USD',
+    'reference': None,
+    'status': 'pending',
+    'created_at': '2024-01-01T00:00:00Z',
+    'completed_at': None,
+}
+
+
+def sent_key(request):
+    return request.headers.get('Idempotency-Key')
+
+
+def test_transfer_sends_key_and_exposes_it(client, requests_mock):
+    requests_mock.post(BASE_URL + 'transfers', json={'data': TRANSFER}, status_code=201)
+    
+    transfer = client.transfers.create('acc-1', 'acc-2', 100)
+    
+    assert transfer.idempotency_key
+    assert sent_key(requests_mock.last_request) == transfer.idempotency_key
+
+
+def test_explicit_key_is_used(client, requests_mock):
+    requests_mock.post(BASE_URL + 'accounts/acc-1/deposit', json={'data': transaction_payload()})
+    
+    transaction = client.accounts.deposit('acc-1', 500, idempotency_key='deposit-2024-01-01-0001')
+    
+    assert transaction.idempotency_key == 'deposit-2024-01-01-0001'
+    assert sent_key(requests_mock.last_request) == 'deposit-2024-01-01-0001'
+
+
+def test_every_write_gets_a_key_but_reads_do_not(client, requests_mock):
+    requests_mock.post(BASE_URL + 'accounts', json={'data': account_payload()})
+    requests_mock.get(BASE_URL + 'accounts/acc-1', json={'data': account_payload()})
+    
+    client.accounts.create('user-1', 'Main')
+    client.accounts.get('acc-1')
+    
+    post, get = requests_mock.request_history
+    assert sent_key(post)
+    assert sent_key(get) is None
+
+
+def test_create_many_reuses_key_when_rate_limited(client, requests_mock):
+    requests_mock.post(
+        BASE_URL + 'transfers',
+        [
+            {'json': {'message': 'slow down', 'retry_after': 0.01}, 'status_code': 429},
+            {'json': {'data': TRANSFER}, 'status_code': 201},
+        ],
+    )
+    
+    report = client.transfers.create_many([{'from_account': 'acc-1', 'to_account': 'acc-2', 'amount': 100}])
+    
+    first, second = requests_mock.request_history
+    assert sent_key(first) == sent_key(second)
+    assert report.items[0].spec['idempotency_key'] == sent_key(first)
+    assert report.items[0].result.idempotency_key == sent_key(first)
+
+
+def test_transport_retries_resend_the_same_key():
+    attempts = []
+    
+    def handler(method, path, headers, body):
+        attempts.append(headers['Idempotency-Key'])
+        if len(attempts) == 1:
+            return 503, {'message': 'unavailable'}
+        return 200, {'data': transaction_payload()}
+        
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=2)
+        client.session.adapters['http://'].max_retries.backoff_factor = 0
+        transaction = client.accounts.withdraw('acc-1', 500)
+        
+    assert len(attempts) == 2
+    assert attempts[0] == attempts[1] == transaction.idempotency_key
+
+
+def test_exhausted_rate_limit_retries_raise_rate_limit_error():
+    def handler(method, path, headers, body):
+        return 429, {'message': 'Too many requests', 'retry_after': 0}
+        
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=1)
+        client.session.adapters['http://'].max_retries.backoff_factor = 0
+        with pytest.raises(RateLimitError) as error:
+            client.transfers.create('acc-1', 'acc-2', 100)
+            
+    assert error.value.status_code == 429
\ No newline at end of file
@@ -0,0 +1,129 @@
+import pytest
+from aiohttp import web
+
+from finaegis import FinAegis
+from finaegis.async_client import AsyncFinAegis
+from finaegis.exceptions import NotFoundError
+from finaegis.instrumentation import Histogram, Instrumentation, RequestMetrics, path_template
+
+from conftest import LocalServer, account_payload, page_payload, start_aiohttp_server, transaction_payload
+
+
+@pytest.mark.parametrize('path, template', [
+    ('/accounts/7b1e4c2a-0000-4000-8000-000000000001/balances', '/accounts/{uuid}/balances'),
+    ('accounts/acc-1', '/accounts/{uuid}'),
+    ('/accounts/acc-1/baskets/compose', '/accounts/{uuid}/baskets/compose'),
+    ('/exchange-rates/USD/EUR/convert', '/exchange-rates/{from}/{to}/convert'),
+    ('/exchange-rates/refresh', '/exchange-rates/refresh'),
+    ('/webhooks/events', '/webhooks/events'),
+    ('/custom/42/items?page=2', '/custom/{id}/items'),
+])
+def test_path_template(path, template):
+    assert path_template(path) == template
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram(buckets=(0.1, 0.2, float('inf')))
+    for value in [0.05] * 50 + [0.15] * 50:
+        histogram.observe(value)
+        
+    assert histogram.count == 100
+    assert histogram.quantile(0.5) == pytest.approx(0.1)
+    assert histogram.quantile(0.75) == pytest.approx(0.15)
+    assert histogram.mean == pytest.approx(0.1)
+
+
+def test_outcome_labels_calls_without_a_status():
+    def metrics(status, error=None):
+        return RequestMetrics('GET', '/accounts/acc-1', '/accounts/{uuid}', status, 0.1, error=error)
+        
+    assert metrics(404, NotFoundError('missing')).outcome == '404'
+    assert metrics(None, ConnectionError()).outcome == 'ConnectionError'
+    assert metrics(None).outcome == 'unknown'
+
+
+def test_sync_client_records_retries_statuses_and_timings():
+    calls = []
+    
+    def handler(method, path, headers, body):
+        calls.append(path)
+        if path.endswith('/missing'):
+            return 404, {'message': 'Account not found'}
+        if len(calls) == 1:
+            return 503, {'message': 'Unavailable'}
+        return 200, {'data': account_payload()}
+        
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=2, instrumentation=True)
+        client.accounts.get('acc-1')
+        with pytest.raises(NotFoundError):
+            client.accounts.get('missing')
+            
+    snapshot = client.instrumentation.metrics.snapshot()
+    stats = snapshot['GET /accounts/{uuid}']
+    assert stats['latency']['count'] == 2
+    assert stats['retries'] == 1
+    assert stats['statuses'] == {200: 1, 404: 1}
+    assert stats['errors'] == {'NotFoundError': 1}
+    assert stats['bytes_received'] > 0
+    assert stats['decode']['count'] == 2
+
+
+def test_streamed_pages_are_recorded_once_read():
+    def handler(method, path, headers, body):
+        return 200, page_payload([transaction_payload(id='a'), transaction_payload(id='b')], 1, 2, 2)
+        
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, instrumentation=True, circuit_breaker=True)
+        with client.stream('/transactions') as page:
+            items = list(page)
+            
+    stats = client.instrumentation.metrics.snapshot()['GET /transactions']
+    assert len(items) == 2
+    assert stats['latency']['count'] == 1
+    assert stats['statuses'] == {200: 1}
+    assert stats['bytes_received'] > 0
+
+
+def test_hooks_receive_each_call_and_failures_only_warn(requests_mock):
+    instrumentation = Instrumentation(metrics=False)
+    seen = []
+    instrumentation.add_hook(before=lambda info: seen.append(info.endpoint), after=lambda metrics: seen.append(metrics.status))
+    instrumentation.add_hook(after=lambda metrics: 1 / 0)
+    client = FinAegis(api_key='key', base_url='https://api.test/v2/', max_retries=0, instrumentation=instrumentation)
+    requests_mock.get('https://api.test/v2/accounts/acc-1', json={'data': account_payload()})
+    
+    with pytest.warns(RuntimeWarning):
+        account = client.accounts.get('acc-1')
+        
+    assert account.uuid == 'acc-1'
+    assert seen == ['GET /accounts/{uuid}', 200]
+    assert instrumentation.metrics is None
+
+
+def test_uninstrumented_client_has_no_instrumentation(client):
+    assert client.instrumentation is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_retries_and_bytes():
+    calls = []
+    
+    async def get_account(request):
+        calls.append(request.path)
+        if len(calls) == 1:
+            return web.json_response({'message': 'Busy'}, status=503, headers={'Retry-After': '0'})
+        return web.json_response({'data': account_payload()})
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/accounts/acc-1', get_account)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, instrumentation=True) as client:
+            await client.accounts.get('acc-1')
+    finally:
+        await runner.cleanup()
+        
+    stats = client.instrumentation.metrics.snapshot()['GET /accounts/{uuid}']
+    assert stats['retries'] == 1
+    assert stats['statuses'] == {200: 1}
+    assert stats['bytes_received'] > 0
+    assert stats['pool_wait']['count'] == 1
\ No newline at end of file
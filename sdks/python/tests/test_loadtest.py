@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from finaegis.instrumentation import Instrumentation
+from finaegis.loadtest import Targets, async_run_load, main, parse_mix, percentile, run_load, schedule
+from finaegis.testing import FakeServer
+
+
+def test_parse_mix():
+    assert parse_mix('balances=3, transfer') == {'balances': 3.0, 'transfer': 1.0}
+    with pytest.raises(ValueError):
+        parse_mix('teleport=1')
+    with pytest.raises(ValueError):
+        parse_mix('rate=0')
+
+
+def test_schedule_is_open_loop_and_reproducible():
+    arrivals = schedule(200, 2, {'balances': 1, 'rate': 1}, seed=3)
+    assert len(arrivals) == 400
+    assert arrivals[1][0] - arrivals[0][0] == pytest.approx(1 / 200)
+    assert arrivals == schedule(200, 2, {'balances': 1, 'rate': 1}, seed=3)
+    
+    poisson = schedule(200, 2, {'balances': 1}, poisson=True, seed=3)
+    assert 300 < len(poisson) < 500 and all(offset < 2 for offset, _ in poisson)
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 1001))
+    assert [percentile(values, q) for q in (0.5, 0.99, 0.999)] == [500, 990, 999]
+    assert percentile([], 0.5) == 0.0
+
+
+def seeded_targets(server, count=4):
+    return Targets([
+        server.ledger.create_account('user-1', f'Load {i}', initial_balance=1_000_000)['uuid'] for i in range(count)
+    ])
+
+
+def test_transfers_need_two_accounts(capsys):
+    with FakeServer() as server:
+        targets = seeded_targets(server, count=1)
+        client = server.client()
+        with pytest.raises(ValueError, match="'transfer' needs at least 2 accounts, got 1"):
+            run_load(client, targets, rate=100, duration=0.1, mix={'balances': 1, 'transfer': 1})
+        report = run_load(client, targets, rate=100, duration=0.1, mix={'balances': 1})
+        assert report.completed == 10 and not report.errors
+        
+    with pytest.raises(SystemExit):
+        main(['--base-url', 'http://localhost', '--accounts', 'acc-1', '--mix', 'transfer=1'])
+    assert '--accounts: \'transfer\' needs at least 2 accounts, got 1' in capsys.readouterr().err
+
+
+def test_run_load_reports_latency_errors_and_connections():
+    with FakeServer() as server:
+        targets = seeded_targets(server)
+        targets.rate_pairs = [('EUR', 'USD'), ('USD', 'XXX')]  # the second pair answers 404
+        client = server.client(pool_maxsize=8, instrumentation=Instrumentation(metrics=False))
+        
+        report = run_load(client, targets, rate=200, duration=0.5, mix={'transfer': 1, 'rate': 1}, workers=8, seed=1)
+        
+        assert report.completed == 100
+        assert set(report.latencies) == {'transfer', 'rate'}
+        assert 0 < report.errors['NotFoundError'] < 50
+        assert report.retries == 0 and 1 <= report.connections <= 8
+        assert report.cpu_per_request > 0
+        quantiles = report.quantiles()
+        assert list(quantiles) == ['p50', 'p95', 'p99', 'p99.9']
+        assert 0 < quantiles['p50'] <= quantiles['p99.9']
+        assert len(server.ledger.transfers(targets.accounts[0])) > 0
+        assert server.ledger.total('USD') == 4_000_000
+        assert 'errors: NotFoundError' in report.format()
+
+
+@pytest.mark.asyncio
+async def test_async_run_load():
+    with FakeServer() as server:
+        targets = seeded_targets(server)
+        async with server.async_client() as client:
+            report = await async_run_load(client, targets, rate=200, duration=0.5, seed=2)
+        assert report.completed == 100 and not report.errors
+        assert report.retries is None and report.connections is None
+
+
+def test_command_line_against_fake_server(capsys):
+    main(['--fake', '--rate', '100', '--duration', '0.3', '--mix', 'balances=1,list_accounts=1', '--json'])
+    report = json.loads(capsys.readouterr().out)
+    assert report['completed'] == 30
+    assert set(report['operations']) == {'balances', 'list_accounts'}
+    assert report['errors'] == {}
\ No newline at end of file
@@ -0,0 +1,80 @@
+from dataclasses import asdict, fields, replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from finaegis import types
+from finaegis.parsing import parse_datetime, parse_optional_datetime
+from finaegis import FinAegis
+from finaegis.types import LazyTransaction, PaginatedResponse, Transaction
+
+from conftest import BASE_URL, page_payload, transaction_payload
+
+
+def test_parse_datetime_handles_zulu_and_offsets():
+    assert parse_datetime('2024-01-02T03:04:05.000006Z') == datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+    assert parse_datetime('2024-01-02T03:04:05+02:00').utcoffset() == timedelta(hours=2)
+    assert parse_optional_datetime(None) is None
+    assert parse_optional_datetime('') is None
+
+
+def test_models_are_slotted_dataclasses():
+    for name in ('Account', 'Transaction', 'Transfer', 'Asset', 'Basket', 'ExchangeRate', 'Webhook', 'GCUInfo'):
+        cls = getattr(types, name)
+        assert cls.__slots__ == tuple(field.name for field in fields(cls))
+        
+    transaction = Transaction.from_dict(transaction_payload())
+    assert not hasattr(transaction, '__dict__')
+    assert asdict(transaction)['amount'] == 500
+
+
+def test_paginated_response_parses_items():
+    payload = page_payload([transaction_payload(id='a'), transaction_payload(id='b')], page=1, per_page=2, total=2)
+    page = PaginatedResponse.from_dict(payload, Transaction)
+    
+    assert [item.id for item in page.data] == ['a', 'b']
+    assert page.data[0].completed_at == datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+
+
+def test_lazy_model_converts_fields_on_first_access():
+    raw = transaction_payload(completed_at='not a timestamp')
+    transaction = LazyTransaction.from_dict(raw)
+    
+    assert isinstance(transaction, Transaction)
+    assert (transaction.id, transaction.amount, transaction.status) == ('tx-1', 500, 'completed')
+    assert transaction.created_at is transaction.created_at
+    with pytest.raises(ValueError):
+        transaction.completed_at
+
+
+def test_lazy_model_matches_eager_model_and_accepts_writes():
+    lazy = LazyTransaction.from_dict(transaction_payload())
+    eager = Transaction.from_dict(transaction_payload())
+    
+    assert lazy == eager
+    assert asdict(lazy) == asdict(eager)
+    lazy.idempotency_key = 'key-1'
+    assert lazy.idempotency_key == 'key-1'
+
+
+def test_lazy_model_supports_replace_and_construction():
+    lazy = LazyTransaction.from_dict(transaction_payload())
+    failed = replace(lazy, status='failed')
+    
+    assert type(failed) is LazyTransaction
+    assert failed.status == 'failed' and lazy.status == 'completed'
+    assert failed.created_at == lazy.created_at and failed.amount == 500
+    
+    eager = Transaction.from_dict(transaction_payload())
+    built = LazyTransaction(**asdict(eager))
+    assert built == eager and built.completed_at == eager.completed_at
+
+
+def test_client_lazy_models_option(requests_mock):
+    client = FinAegis(api_key='key', base_url=BASE_URL, max_retries=0, lazy_models=True)
+    page = page_payload([transaction_payload()], page=1, per_page=20, total=1)
+    requests_mock.get(BASE_URL + 'transactions', json=page)
+    requests_mock.get(BASE_URL + 'accounts/acc-1/transactions', json=page)
+    
+    assert type(client.transactions.list().data[0]) is LazyTransaction
+    assert type(client.accounts.get_transactions('acc-1').data[0]) is LazyTransaction
\ No newline at end of file
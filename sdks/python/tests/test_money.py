@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+import pytest
+
+from finaegis import Money
+from finaegis.money import to_minor_units
+from finaegis.types import Account, Asset, ExchangeRate, Transaction
+
+from conftest import account_payload, transaction_payload
+
+USD = Asset('USD', 'US Dollar', 'fiat', 2, True, None, None)
+
+
+def test_models_parse_amounts_as_exact_minor_units():
+    account = Account.from_dict(account_payload(balance='100000000000000001'))
+    transaction = Transaction.from_dict(transaction_payload(amount=1999))
+    
+    assert account.balance == 100000000000000001
+    assert transaction.amount == 1999
+    assert type(transaction.amount) is int
+
+
+def test_rates_parse_as_decimal():
+    rate = ExchangeRate.from_dict({
+        'from_asset': 'USD', 'to_asset': 'EUR', 'rate': '0.1', 'last_updated': '2024-01-01T00:00:00Z'
+    })
+    
+    assert rate.rate == Decimal('0.1')
+
+
+@pytest.mark.parametrize('value, expected', [(12, 12), ('-34', -34), ('56.00', 56), (78.0, 78), (Decimal('9'), 9)])
+def test_to_minor_units_accepts_integral_values(value, expected):
+    assert to_minor_units(value) == expected
+
+
+@pytest.mark.parametrize('value', ['12.5', 0.1])
+def test_to_minor_units_rejects_fractions(value):
+    with pytest.raises(ValueError):
+        to_minor_units(value)
+
+
+def test_money_sums_exactly_and_refuses_mixed_assets():
+    total = sum(USD.money(10) for _ in range(3))
+    
+    assert total == Money(30, 'USD')
+    assert str(total) == '0.30 USD'
+    assert Money.from_major('19.99', 'USD') > Money(1998, 'USD')
+    with pytest.raises(ValueError):
+        total + Money(1, 'EUR')
+    with pytest.raises(ValueError):
+        Money.from_major('0.001', 'USD')
\ No newline at end of file
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+
+import pytest
+
+from finaegis.deadlines import call_deadline, deadline
+from finaegis.pagination import aiterate_items, export_pages, iterate_items, iterate_pages
+from finaegis.types import PaginatedResponse, Transaction
+
+from conftest import BASE_URL, page_payload, transaction_payload
+
+
+def make_fetcher(total, per_page, calls):
+    def fetch(page):
+        calls.append(page)
+        start = (page - 1) * per_page
+        items = list(range(start, min(start + per_page, total)))
+        return PaginatedResponse.from_dict(page_payload(items, page, per_page, total))
+    return fetch
+
+
+def test_iterate_items_walks_every_page_in_order():
+    calls = []
+    items = list(iterate_items(make_fetcher(25, 10, calls)))
+    
+    assert items == list(range(25))
+    assert calls == [1, 2, 3]
+
+
+def test_iterate_items_without_prefetch_is_lazy():
+    calls = []
+    iterator = iterate_items(make_fetcher(25, 10, calls), prefetch=False)
+    
+    assert next(iterator) == 0
+    assert calls == [1]
+
+
+def test_prefetch_fetches_next_page_while_current_is_consumed():
+    fetched_second = threading.Event()
+    calls = []
+    fetch = make_fetcher(20, 10, calls)
+    
+    def fetch_and_signal(page):
+        result = fetch(page)
+        if page == 2:
+            fetched_second.set()
+        return result
+        
+    pages = iterate_pages(fetch_and_signal)
+    first = next(pages)
+    
+    assert first.current_page == 1
+    assert fetched_second.wait(timeout=2)
+    pages.close()
+
+
+def test_background_fetches_keep_the_callers_deadline():
+    seen = []
+    fetch = make_fetcher(40, 10, [])
+    
+    def fetch_under_deadline(page):
+        seen.append((page, call_deadline()))
+        return fetch(page)
+        
+    with deadline(30) as expires:
+        list(iterate_pages(fetch_under_deadline))
+        list(export_pages(fetch_under_deadline, max_workers=2))
+        
+    assert len(seen) == 8
+    assert all(value == expires for _, value in seen)
+
+
+def test_stops_on_empty_page():
+    def fetch(page):
+        return PaginatedResponse.from_dict({'data': [], 'meta': {'current_page': 1, 'last_page': 5}})
+        
+    assert list(iterate_items(fetch)) == []
+
+
+def test_transactions_iter_all_yields_typed_objects(client, requests_mock):
+    requests_mock.get(
+        BASE_URL + 'transactions?page=1&per_page=2',
+        json=page_payload([transaction_payload('tx-1'), transaction_payload('tx-2')], 1, 2, 3),
+    )
+    requests_mock.get(
+        BASE_URL + 'transactions?page=2&per_page=2',
+        json=page_payload([transaction_payload('tx-3')], 2, 2, 3),
+    )
+    
+    transactions = list(client.transactions.iter_all(per_page=2))
+    
+    assert [tx.id for tx in transactions] == ['tx-1', 'tx-2', 'tx-3']
+    assert all(isinstance(tx, Transaction) for tx in transactions)
+
+
+def test_webhook_deliveries_iterate_raw_pages(client, requests_mock):
+    requests_mock.get(
+        BASE_URL + 'webhooks/wh-1/deliveries?page=1&per_page=100',
+        json=page_payload([{'uuid': 'd-1'}], 1, 100, 1),
+    )
+    
+    assert list(client.webhooks.iter_deliveries('wh-1')) == [{'uuid': 'd-1'}]
+
+
+@pytest.mark.asyncio
+async def test_aiterate_items_prefetches_and_preserves_order():
+    calls = []
+    
+    async def fetch(page):
+        calls.append(page)
+        await asyncio.sleep(0)
+        start = (page - 1) * 10
+        items = list(range(start, min(start + 10, 25)))
+        return PaginatedResponse.from_dict(page_payload(items, page, 10, 25))
+        
+    items = [item async for item in aiterate_items(fetch)]
+    
+    assert items == list(range(25))
+    assert calls == [1, 2, 3]
\ No newline at end of file
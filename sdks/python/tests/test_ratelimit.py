@@ -0,0 +1,104 @@
+import time
+
+import pytest
+from aiohttp import web
+
+from finaegis import FinAegis
+from finaegis.async_client import AsyncFinAegis
+from finaegis.ratelimit import AdaptiveRateLimiter, TokenBucket, endpoint_class
+
+from conftest import BASE_URL, account_payload, start_aiohttp_server
+
+
+@pytest.mark.parametrize('method, path, expected', [
+    ('POST', '/transfers', 'transaction'),
+    ('POST', '/accounts/acc-1/deposit', 'transaction'),
+    ('POST', '/accounts/acc-1/baskets/compose', 'transaction'),
+    ('GET', '/transfers/tr-1', 'query'),
+    ('POST', '/webhooks', 'query'),
+])
+def test_endpoint_class(method, path, expected):
+    assert endpoint_class(method, path) == expected
+
+
+def test_bucket_spaces_callers_after_burst():
+    bucket = TokenBucket(rate=100, burst=2)
+    
+    delays = [bucket.reserve() for _ in range(4)]
+    
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.01, abs=0.002)
+    assert delays[3] == pytest.approx(0.02, abs=0.002)
+
+
+def test_pause_delays_every_reservation():
+    bucket = TokenBucket(rate=100, burst=5)
+    bucket.pause(0.5)
+    
+    first, second = bucket.reserve(), bucket.reserve()
+    
+    assert first == pytest.approx(0.51, abs=0.005)
+    assert second == pytest.approx(0.52, abs=0.005)
+
+
+def test_limiter_learns_ceiling_and_backs_off_on_429():
+    limiter = AdaptiveRateLimiter()
+    
+    limiter.observe('GET', '/accounts', 200, {'X-RateLimit-Limit': '120', 'X-RateLimit-Window': '60'})
+    assert limiter.rates()['query'] == pytest.approx(2)
+    
+    limiter.observe('POST', '/transfers', 429, {'Retry-After': '3'})
+    assert limiter.rates()['transaction'] == pytest.approx(0.25)
+    assert limiter.bucket('transaction').paused_for() == pytest.approx(3, abs=0.05)
+    assert limiter.bucket('query').paused_for() == 0
+
+
+def test_limiter_spreads_remaining_budget_until_reset():
+    limiter = AdaptiveRateLimiter()
+    
+    limiter.observe('GET', '/accounts', 200, {
+        'X-RateLimit-Limit': '100',
+        'X-RateLimit-Window': '60',
+        'X-RateLimit-Remaining': '10',
+        'X-RateLimit-Reset': str(time.time() + 50),
+    })
+    
+    assert limiter.rates()['query'] == pytest.approx(0.2, rel=0.01)
+
+
+def test_sync_client_retries_429_through_the_limiter(requests_mock):
+    limiter = AdaptiveRateLimiter(limits={'query': (6000, 60)})
+    client = FinAegis(api_key='key', base_url=BASE_URL, max_retries=2, rate_limit=limiter)
+    requests_mock.get(BASE_URL + 'accounts/acc-1', [
+        {'status_code': 429, 'json': {'message': 'Slow down', 'retry_after': 0}},
+        {'json': {'data': account_payload()}},
+    ])
+    
+    account = client.accounts.get('acc-1')
+    
+    assert account.uuid == 'acc-1'
+    assert requests_mock.call_count == 2
+    assert limiter.rates()['query'] == pytest.approx(55)  # halved, then one recovery step
+
+
+@pytest.mark.asyncio
+async def test_async_client_paces_through_the_limiter():
+    calls = []
+    
+    async def get_account(request):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return web.json_response({'message': 'Slow down'}, status=429, headers={'Retry-After': '0'})
+        return web.json_response({'data': account_payload()})
+        
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/accounts/acc-1', get_account)])
+    try:
+        limiter = AdaptiveRateLimiter(limits={'query': (6000, 60)})
+        async with AsyncFinAegis(api_key='key', base_url=base_url, rate_limit=limiter) as client:
+            account = await client.accounts.get('acc-1')
+    finally:
+        await runner.cleanup()
+        
+    assert account.uuid == 'acc-1'
+    assert len(calls) == 2
+    assert limiter.rates()['query'] == pytest.approx(55)  # halved, then one recovery step
\ No newline at end of file
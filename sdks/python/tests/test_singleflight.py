@@ -0,0 +1,201 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aiohttp import web
+
+from finaegis import FinAegis
+from finaegis.async_client import AsyncFinAegis
+from finaegis.deadlines import deadline
+from finaegis.exceptions import DeadlineExceededError, NotFoundError
+from finaegis.singleflight import SingleFlight, request_key
+
+from conftest import LocalServer, start_aiohttp_server
+
+
+def test_request_key_ignores_param_order():
+    assert request_key('/accounts', {'page': 1, 'per_page': 20}) == request_key('accounts', {'per_page': '20', 'page': '1'})
+    assert request_key('/accounts', {'page': 1}) != request_key('/accounts', {'page': 2})
+
+
+def test_shared_group_never_merges_calls_of_different_credentials():
+    def handler(method, path, headers, body):
+        time.sleep(0.2)
+        return 200, {'data': {'caller': headers['Authorization']}}
+        
+    group = SingleFlight()
+    barrier = threading.Barrier(4)
+    with LocalServer(handler) as server:
+        clients = [
+            FinAegis(api_key=key, base_url=server.base_url, max_retries=0, coalesce_requests=group)
+            for key in ('tenant-a', 'tenant-a', 'tenant-b', 'tenant-b')
+        ]
+        
+        def get(client):
+            barrier.wait()
+            return client.get('/accounts/acc-1/balances')['data']['caller']
+            
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            callers = list(pool.map(get, clients))
+            
+    assert callers == ['Bearer tenant-a', 'Bearer tenant-a', 'Bearer tenant-b', 'Bearer tenant-b']
+    assert len(server.requests) == 2 and group.stats.coalesced == 2
+
+
+def test_followers_share_the_leaders_exception():
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    
+    def failing():
+        started.set()
+        release.wait()
+        raise ValueError('boom')
+        
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(group.do, 'key', failing)
+        started.wait()
+        follower = pool.submit(group.do, 'key', lambda: 'unused')
+        while group.stats.coalesced == 0:
+            time.sleep(0.001)
+        release.set()
+        
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+                
+    assert group.stats.executed == 1
+    assert group.in_flight() == 0
+
+
+def test_follower_gives_up_at_its_own_deadline():
+    def handler(method, path, headers, body):
+        time.sleep(0.5)
+        return 200, {'data': {'USD': 1000}}
+        
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0, coalesce_requests=True)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(client.get, '/accounts/acc-1/balances')
+            while client.single_flight.in_flight() == 0:
+                time.sleep(0.001)
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                with deadline(0.1):
+                    client.get('/accounts/acc-1/balances')
+            waited = time.monotonic() - started
+            
+            assert leader.result() == {'data': {'USD': 1000}}
+            
+    assert waited < 0.3
+    assert len(server.requests) == 1
+
+
+def test_concurrent_identical_gets_share_one_request():
+    def handler(method, path, headers, body):
+        time.sleep(0.2)
+        return 200, {'data': {'USD': 1000}}
+        
+    workers = 8
+    barrier = threading.Barrier(workers)
+    
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0, coalesce_requests=True)
+        
+        def get_balances(_):
+            barrier.wait()
+            return client.accounts.get_balances('acc-1')
+            
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(get_balances, range(workers)))
+            
+        # A later call is not served from the finished one
+        client.accounts.get_balances('acc-1')
+        
+    assert results == [{'USD': 1000}] * workers
+    assert len(server.requests) == 2
+    assert client.single_flight.stats.coalesced == workers - 1
+
+
+def test_writes_and_different_queries_are_not_coalesced():
+    def handler(method, path, headers, body):
+        time.sleep(0.1)
+        return 200, {'data': {'uuid': 'acc-1'}}
+        
+    with LocalServer(handler) as server:
+        client = FinAegis(api_key='key', base_url=server.base_url, max_retries=0, coalesce_requests=True)
+        calls = [
+            lambda: client.request('GET', '/accounts', params={'page': 1}),
+            lambda: client.request('GET', '/accounts', params={'page': 2}),
+            lambda: client.request('POST', '/accounts', json={'name': 'a'}),
+            lambda: client.request('POST', '/accounts', json={'name': 'a'}),
+        ]
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            list(pool.map(lambda call: call(), calls))
+            
+    assert len(server.requests) == 4
+    assert client.single_flight.stats.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_identical_gets_share_one_request():
+    calls = []
+    
+    async def get_balances(request):
+        calls.append(request.path)
+        await asyncio.sleep(0.1)
+        return web.json_response({'data': {'USD': 1000}})
+        
+    async def missing(request):
+        calls.append(request.path)
+        await asyncio.sleep(0.1)
+        return web.json_response({'message': 'Account not found'}, status=404)
+        
+    runner, base_url = await start_aiohttp_server([
+        web.get('/api/v2/accounts/acc-1/balances', get_balances),
+        web.get('/api/v2/accounts/acc-2/balances', missing),
+    ])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, max_retries=0, coalesce_requests=True) as client:
+            results = await asyncio.gather(*(client.accounts.get_balances('acc-1') for _ in range(10)))
+            errors = await asyncio.gather(
+                *(client.accounts.get_balances('acc-2') for _ in range(3)), return_exceptions=True
+            )
+    finally:
+        await runner.cleanup()
+        
+    assert results == [{'USD': 1000}] * 10
+    assert all(isinstance(error, NotFoundError) for error in errors)
+    assert len(calls) == 2
+    assert client.single_flight.stats.coalesced == 11
+    assert client.single_flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_async_follower_gives_up_at_its_own_deadline():
+    async def get_balances(request):
+        await asyncio.sleep(0.5)
+        return web.json_response({'data': {'USD': 1000}})
+        
+    async def follow(client):
+        with deadline(0.1):
+            return await client.accounts.get_balances('acc-1')
+            
+    runner, base_url = await start_aiohttp_server([web.get('/api/v2/accounts/acc-1/balances', get_balances)])
+    try:
+        async with AsyncFinAegis(api_key='key', base_url=base_url, max_retries=0, coalesce_requests=True) as client:
+            leader = asyncio.ensure_future(client.accounts.get_balances('acc-1'))
+            await asyncio.sleep(0.01)
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                await follow(client)
+            waited = time.monotonic() - started
+            balances = await leader
+    finally:
+        await runner.cleanup()
+        
+    assert waited < 0.3
+    assert balances == {'USD': 1000}
+    assert client.single_flight.stats.coalesced == 1
\ No newline at end of file
@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import finaegis
+from finaegis import FinAegis
+from finaegis.resources import AccountsResource, LazyResource
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the names in sys.modules afterwards."""
+    script = code + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, '-c', script], cwd=ROOT, check=True, capture_output=True, text=True)
+    return set(json.loads(output.stdout))
+
+
+def test_import_does_not_load_client_dependencies():
+    modules = loaded_modules('import finaegis')
+    
+    assert 'requests' not in modules
+    assert 'numpy' not in modules
+    assert 'finaegis.client' not in modules
+
+
+def test_client_construction_does_not_import_resources():
+    modules = loaded_modules("from finaegis import FinAegis\nFinAegis(api_key='key')")
+    
+    assert 'finaegis.resources.accounts' not in modules
+    assert 'numpy' not in modules
+
+
+def test_resources_are_created_once_on_first_access():
+    client = FinAegis(api_key='key')
+    
+    assert 'accounts' not in vars(client)
+    accounts = client.accounts
+    
+    assert isinstance(accounts, AccountsResource)
+    assert accounts.client is client
+    assert client.accounts is accounts
+    assert isinstance(FinAegis.accounts, LazyResource)
+
+
+def test_lazy_package_exports():
+    assert finaegis.Money is finaegis.money.Money
+    assert 'FinAegis' in dir(finaegis)
+    with pytest.raises(AttributeError):
+        finaegis.NoSuchThing
\ No newline at end of file
@@ -0,0 +1,193 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from finaegis import AuthenticationError, NotFoundError, RateLimitError, ValidationError
+from finaegis.testing import FakeServer, Ledger
+
+
+@pytest.fixture
+def server():
+    with FakeServer() as server:
+        yield server
+
+
+def test_accounts_deposit_withdraw_and_transfer(server):
+    client = server.client()
+    alice = client.accounts.create('user-1', 'Alice', initial_balance=10_000)
+    bob = client.accounts.create('user-2', 'Bob')
+    
+    client.accounts.deposit(bob.uuid, 500, asset_code='EUR')
+    client.accounts.withdraw(alice.uuid, 1_000)
+    transfer = client.transfers.create(alice.uuid, bob.uuid, 2_500, reference='rent')
+    
+    assert transfer.status == 'completed' and transfer.reference == 'rent'
+    assert client.transfers.get(transfer.uuid).amount == 2_500
+    assert client.accounts.get(alice.uuid).balance == 6_500
+    assert client.accounts.get_balances(bob.uuid)['balances'] == {'EUR': 500, 'USD': 2_500}
+    assert [tx.type for tx in client.accounts.iter_transactions(alice.uuid)] == ['withdrawal', 'deposit']
+    assert [t.uuid for t in client.accounts.iter_transfers(bob.uuid)] == [transfer.uuid]
+    assert server.ledger.total('USD') == 9_000
+
+
+def test_errors_match_the_api(server):
+    client = server.client()
+    account = client.accounts.create('user-1', 'Main', initial_balance=100)
+    
+    with pytest.raises(NotFoundError):
+        client.accounts.get('missing')
+    with pytest.raises(ValidationError) as invalid:
+        client.accounts.deposit(account.uuid, -5)
+    assert 'amount' in invalid.value.errors
+    with pytest.raises(ValidationError) as overdraft:
+        client.accounts.withdraw(account.uuid, 101)
+    assert overdraft.value.status_code == 422
+    
+    client.accounts.freeze(account.uuid, reason='audit')
+    with pytest.raises(ValidationError):
+        client.accounts.deposit(account.uuid, 1)
+    client.accounts.unfreeze(account.uuid, reason='done')
+    assert client.accounts.get(account.uuid).balance == 100
+
+
+def test_pagination_meta(server):
+    for i in range(45):
+        server.ledger.create_account('user-1', f'Account {i}')
+    client = server.client()
+    
+    page = client.accounts.list(page=3, per_page=20)
+    assert (page.current_page, page.per_page, page.total, page.last_page) == (3, 20, 45, 3)
+    assert len(page.data) == 5
+    assert len(list(client.accounts.iter_all(per_page=10))) == 45
+
+
+def test_idempotent_writes_are_replayed(server):
+    client = server.client()
+    account = client.accounts.create('user-1', 'Main')
+    
+    first = client.accounts.deposit(account.uuid, 700, idempotency_key='key-1')
+    second = client.accounts.deposit(account.uuid, 700, idempotency_key='key-1')
+    
+    assert first.id == second.id
+    assert server.ledger.balances(account.uuid)['balances'] == {'USD': 700}
+
+
+def test_writes_with_different_keys_run_concurrently(server):
+    lock = threading.Lock()
+    running = [0, 0]
+    dispatch = server._dispatch
+    
+    def slow_dispatch(*args):
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return dispatch(*args)
+        
+    server._dispatch = slow_dispatch
+    account = server.ledger.create_account('user-1', 'Main')['uuid']
+    body = b'{"amount": 100}'
+    
+    def deposit(key):
+        headers = {'Idempotency-Key': key}
+        return server.handle('POST', f'/api/v2/accounts/{account}/deposit', headers, body)[1]['data']['id']
+        
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        ids = list(pool.map(deposit, ['key-1', 'key-2', 'key-3', 'key-1', 'key-2', 'key-3']))
+        
+    assert running[1] > 1
+    # A repeated key waits for the write in progress and gets its reply
+    assert ids[:3] == ids[3:] and len(set(ids)) == 3
+    assert server.ledger.balances(account)['balances'] == {'USD': 300}
+
+
+def test_stored_replies_are_capped():
+    with FakeServer(max_replies=2) as server:
+        client = server.client()
+        account = client.accounts.create('user-1', 'Main')
+        for key in ('key-1', 'key-2', 'key-3'):
+            client.accounts.deposit(account.uuid, 100, idempotency_key=key)
+        # The oldest reply was forgotten, so its key runs the write again
+        client.accounts.deposit(account.uuid, 100, idempotency_key='key-1')
+        client.accounts.deposit(account.uuid, 100, idempotency_key='key-3')
+        
+    assert server.ledger.balances(account.uuid)['balances'] == {'USD': 400}
+
+
+def test_concurrent_transfers_keep_the_ledger_consistent(server):
+    ledger = server.ledger
+    accounts = [ledger.create_account('user-1', f'Account {i}', initial_balance=1_000)['uuid'] for i in range(5)]
+    client = server.client(pool_maxsize=8)
+    rng = random.Random(7)
+    specs = [tuple(rng.sample(accounts, 2)) + (rng.randint(1, 400),) for _ in range(300)]
+    
+    def send(spec):
+        try:
+            client.transfers.create(*spec)
+            return True
+        except ValidationError:
+            return False
+            
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        completed = sum(pool.map(send, specs))
+        
+    balances = [ledger.balances(uuid)['balances'].get('USD', 0) for uuid in accounts]
+    assert sum(balances) == 5_000 and min(balances) >= 0
+    # Every transfer is listed for both of its accounts
+    assert completed == sum(len(ledger.transfers(uuid)) for uuid in accounts) // 2
+    assert 0 < completed < len(specs)
+
+
+def test_rate_limits_answer_429():
+    with FakeServer(rate_limits={'query': (2, 60)}) as limited:
+        client = limited.client()
+        client.exchange_rates.get('EUR', 'USD')
+        client.exchange_rates.get('USD', 'EUR')
+        with pytest.raises(RateLimitError) as error:
+            client.exchange_rates.get('GBP', 'USD')
+        assert error.value.retry_after == 60
+        assert limited.status_counts == {200: 2, 429: 1}
+
+
+def test_api_key_and_latency():
+    with FakeServer(api_key='secret', latency=lambda method, path: 0.01 if method == 'POST' else 0) as server:
+        assert server.client().gcu.get_info().basket_code == 'GCU'
+        with pytest.raises(AuthenticationError):
+            server.client(api_key='wrong').gcu.get_info()
+
+
+def test_webhook_deliveries_are_recorded(server):
+    client = server.client()
+    webhook = client.webhooks.create('ledger', 'https://example.test/hook', ['transfer.completed'])
+    alice = client.accounts.create('user-1', 'Alice', initial_balance=1_000)
+    bob = client.accounts.create('user-2', 'Bob')
+    client.transfers.create(alice.uuid, bob.uuid, 250)
+    
+    deliveries = client.webhooks.list_deliveries(webhook.uuid).data
+    assert [d.event_type for d in deliveries] == ['transfer.completed']
+    assert deliveries[0].payload['amount'] == 250
+
+
+def test_ledger_can_be_shared_and_seeded():
+    ledger = Ledger()
+    account = ledger.create_account('user-1', 'Seeded', initial_balance=42)
+    with FakeServer(ledger=ledger) as server:
+        assert server.client().accounts.get(account['uuid']).balance == 42
+
+
+@pytest.mark.asyncio
+async def test_async_client_transfers():
+    with FakeServer(latency=0.001) as server:
+        alice = server.ledger.create_account('user-1', 'Alice', initial_balance=10_000)['uuid']
+        bob = server.ledger.create_account('user-2', 'Bob')['uuid']
+        async with server.async_client() as client:
+            await asyncio.gather(*(client.transfers.create(alice, bob, 100) for _ in range(50)))
+            balances = await client.accounts.get_balances(bob)
+        assert balances['balances'] == {'USD': 5_000}
+        assert server.ledger.total('USD') == 10_000
\ No newline at end of file
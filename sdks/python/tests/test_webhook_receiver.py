@@ -0,0 +1,223 @@
+import asyncio
+import hmac
+import io
+import json
+import threading
+import time
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+from finaegis import WebhookEvent
+from finaegis.webhook_receiver import (
+    AsyncWebhookReceiver,
+    DeduplicationWindow,
+    SignatureVerifier,
+    WebhookReceiver,
+    asgi_app,
+    event_key,
+    verify_signature,
+    wsgi_app,
+)
+
+SECRET = 'whsec_test'
+
+
+def delivery(delivery_id='dlv-1', event='transfer.completed', **payload):
+    body = json.dumps(dict(payload, event=event, timestamp='2024-01-01T00:00:00Z')).encode()
+    headers = {
+        'X-Webhook-Signature': SignatureVerifier(SECRET).sign(body),
+        'X-Webhook-Delivery': delivery_id,
+        'X-Webhook-ID': 'wh-1',
+        'X-Webhook-Event': event,
+    }
+    return body, headers
+
+
+def test_verify_signature_matches_server_format():
+    body = b'{"event":"account.created","account_uuid":"acc-1"}'
+    # 'sha256=' . hash_hmac('sha256', $payload, $secret)
+    signature = 'sha256=' + hmac.new(SECRET.encode(), body, 'sha256').hexdigest()
+    
+    assert verify_signature(body, signature, SECRET)
+    assert verify_signature(body, signature[7:], SECRET)  # legacy X-FinAegis-Signature
+    assert not verify_signature(body + b' ', signature, SECRET)
+    assert not verify_signature(body, 'sha256=é', SECRET)
+    assert not verify_signature(body, None, SECRET)
+
+
+def test_deduplication_window_is_bounded():
+    window = DeduplicationWindow(size=2)
+    
+    assert window.add('a') and window.add('b')
+    assert not window.add('a')
+    assert window.add('c')  # evicts 'a'
+    assert len(window) == 2
+    assert window.add('a')
+
+
+def test_deduplication_window_forgets_expired_ids():
+    window = DeduplicationWindow(ttl=0.05)
+    window.add('a')
+    time.sleep(0.06)
+    
+    assert 'a' not in window
+    assert window.add('a')
+
+
+def test_receiver_batches_events_and_drops_redeliveries():
+    batches = []
+    receiver = WebhookReceiver(SECRET, handler=batches.append, workers=1, batch_size=10, batch_wait=0.05)
+    
+    with receiver:
+        statuses = [receiver.receive(*delivery(f'dlv-{i}', amount=i)) for i in range(5)]
+        # The server retries with a new delivery id and the same payload
+        statuses.append(receiver.receive(*delivery('dlv-5', amount=0)))
+        body, headers = delivery('dlv-9')
+        statuses.append(receiver.receive(body.replace(b'}', b' }'), headers))
+        receiver.join()
+        
+    assert statuses == [202] * 5 + [200, 401]
+    events = [event for batch in batches for event in batch]
+    assert [event.delivery_id for event in events] == [f'dlv-{i}' for i in range(5)]
+    assert len(batches) < 5
+    assert events[0].event == 'transfer.completed'
+    assert events[0].timestamp.year == 2024
+    assert events[3].data['amount'] == 3
+    assert receiver.stats.duplicates == 1
+    assert receiver.stats.rejected == 1
+    assert receiver.stats.processed == 5
+
+
+def test_full_queue_answers_503_and_accepts_the_redelivery():
+    release = threading.Event()
+    receiver = WebhookReceiver(SECRET, handler=lambda batch: release.wait(), workers=1, queue_size=1, batch_size=1)
+    
+    with receiver:
+        assert receiver.receive(*delivery('dlv-1', amount=1)) == 202
+        time.sleep(0.05)  # the worker takes dlv-1 and blocks
+        assert receiver.receive(*delivery('dlv-2', amount=2)) == 202
+        assert receiver.receive(*delivery('dlv-3', amount=3)) == 503
+        release.set()
+        receiver.join()
+        assert receiver.receive(*delivery('dlv-4', amount=3)) == 202
+        
+    assert receiver.stats.overloaded == 1
+    assert receiver.stats.processed == 3
+
+
+def test_handler_errors_go_to_on_error():
+    errors = []
+    
+    def handler(batch):
+        raise RuntimeError('database down')
+        
+    receiver = WebhookReceiver(SECRET, handler=handler, on_error=lambda error, batch: errors.append((error, batch)))
+    with receiver:
+        receiver.receive(*delivery())
+        receiver.join()
+        
+    assert str(errors[0][0]) == 'database down'
+    assert errors[0][1][0].delivery_id == 'dlv-1'
+    assert receiver.stats.failed == 1
+
+
+def test_events_of_a_failed_batch_are_handled_on_redelivery():
+    handled = []
+    
+    def handler(batch):
+        if not handled:
+            handled.append(None)
+            raise RuntimeError('database down')
+        handled.extend(event.delivery_id for event in batch)
+        
+    receiver = WebhookReceiver(SECRET, handler=handler, workers=1, on_error=lambda error, batch: None)
+    with receiver:
+        assert receiver.receive(*delivery('dlv-1')) == 202
+        receiver.join()
+        assert receiver.receive(*delivery('dlv-2')) == 202
+        assert receiver.submit([WebhookEvent.from_dict(json.loads(delivery()[0]), 'dlv-3', 'wh-1')]) == 0
+        receiver.join()
+        
+    assert handled == [None, 'dlv-2']
+    assert (receiver.stats.failed, receiver.stats.processed, receiver.stats.duplicates) == (1, 1, 1)
+
+
+def test_redeliveries_are_recognised_by_payload_not_delivery_id():
+    first, headers = delivery('dlv-1', amount=5)
+    # Key order and formatting of the body do not matter
+    reordered = {'timestamp': '2024-01-01T00:00:00Z', 'event': 'transfer.completed', 'amount': 5}
+    key = event_key(WebhookEvent.from_dict(json.loads(first), 'dlv-1', 'wh-1'))
+    assert key == event_key(WebhookEvent.from_dict(reordered, 'dlv-2', 'wh-1'))
+    
+    receiver = WebhookReceiver(SECRET, handler=lambda batch: None, workers=1)
+    with receiver:
+        assert receiver.receive(first, headers) == 202
+        assert receiver.receive(*delivery('dlv-2', amount=5)) == 200
+        assert receiver.receive(*delivery('dlv-3', amount=6)) == 202
+        other_webhook = dict(headers, **{'X-Webhook-ID': 'wh-2', 'X-Webhook-Delivery': 'dlv-4'})
+        assert receiver.receive(first, other_webhook) == 202
+    assert receiver.stats.duplicates == 1
+
+
+def test_wsgi_app():
+    batches = []
+    receiver = WebhookReceiver(SECRET, handler=batches.append, workers=1)
+    app = wsgi_app(receiver)
+    
+    def call(body, headers, method='POST'):
+        environ = {'REQUEST_METHOD': method, 'CONTENT_LENGTH': str(len(body)), 'wsgi.input': io.BytesIO(body)}
+        environ.update({'HTTP_' + name.upper().replace('-', '_'): value for name, value in headers.items()})
+        setup_testing_defaults(environ)
+        status = []
+        app(environ, lambda line, response_headers: status.append(line))
+        return status[0]
+        
+    assert call(*delivery()) == '202 Accepted'
+    assert call(*delivery('dlv-2')) == '200 OK'
+    assert call(b'{}', {'X-FinAegis-Signature': 'bad'}) == '401 Unauthorized'
+    assert call(b'', {}, method='GET') == '405 Method Not Allowed'
+    receiver.stop()
+    
+    assert batches[0][0].delivery_id == 'dlv-1'
+
+
+@pytest.mark.asyncio
+async def test_async_receiver_through_asgi_app():
+    batches = []
+    
+    async def handler(batch):
+        await asyncio.sleep(0)
+        batches.append(batch)
+        
+    receiver = AsyncWebhookReceiver(SECRET, handler=handler, batch_size=50, batch_wait=0.01)
+    app = asgi_app(receiver)
+    
+    async def call(body, headers):
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'headers': [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        }
+        messages = [
+            {'type': 'http.request', 'body': body[:10], 'more_body': True},
+            {'type': 'http.request', 'body': body[10:], 'more_body': False},
+        ]
+        sent = []
+        
+        async def receive():
+            return messages.pop(0)
+            
+        async def send(message):
+            sent.append(message)
+            
+        await app(scope, receive, send)
+        return sent[0]['status']
+        
+    statuses = [await call(*delivery(f'dlv-{i}', amount=i % 20)) for i in range(30)]
+    await receiver.join()
+    await receiver.stop()
+    
+    assert statuses == [202] * 20 + [200] * 10
+    assert sum(len(batch) for batch in batches) == 20
+    assert receiver.stats.duplicates == 10
\ No newline at end of file